@@ -0,0 +1,106 @@
+"""Per-endpoint timings through the FastAPI app, driven in process."""
+
+from fastapi import Depends
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from main import app
+from src.infrastructure.repositories import SQLiteTaskRepository
+from src.presentation.api.task_router import get_db_session, get_task_repository
+
+from .harness import measure
+from .seed import SeededTasks, new_task_payload
+
+
+async def run_api_benchmarks(
+    session_factory: async_sessionmaker,
+    seeded: SeededTasks,
+    iterations: int,
+    max_seconds: float,
+) -> dict[str, dict[str, float]]:
+    """Time every task endpoint through ``httpx.ASGITransport``.
+
+    The app runs against the seeded database with the SQLite repository,
+    whatever ``TASK_REPOSITORY`` says, so numbers compare across runs.
+    """
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    def override_get_task_repository(db: AsyncSession = Depends(get_db_session)):
+        return SQLiteTaskRepository(db)
+
+    created: list[str] = []
+
+    async def request(client: AsyncClient, method: str, url: str, **kwargs):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"{method} {url} returned {response.status_code}: {response.text}"
+            )
+        return response
+
+    overrides = {
+        get_db_session: override_get_db,
+        get_task_repository: override_get_task_repository,
+    }
+    previous = {key: app.dependency_overrides.get(key) for key in overrides}
+    app.dependency_overrides.update(overrides)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+
+            async def create(i):
+                response = await request(
+                    client, "POST", "/tasks/", json=new_task_payload(i)
+                )
+                created.append(response.json()["id"])
+
+            async def modify(i):
+                task_id = created[i % len(created)]
+                await request(
+                    client, "PUT", f"/tasks/{task_id}", json={"title": f"Updated {i}"}
+                )
+
+            async def mark_done(i):
+                task_id = created[i % len(created)]
+                await request(client, "PATCH", f"/tasks/{task_id}/done")
+
+            async def mark_pending(i):
+                task_id = created[i % len(created)]
+                await request(client, "PATCH", f"/tasks/{task_id}/pending")
+
+            async def archive(i):
+                await request(client, "PATCH", f"/tasks/{seeded.done.pop()}/archive")
+
+            operations = {
+                "POST /tasks/": create,
+                "GET /tasks/": lambda i: request(client, "GET", "/tasks/"),
+                "GET /tasks/?include_archived=false": lambda i: request(
+                    client, "GET", "/tasks/", params={"include_archived": "false"}
+                ),
+                "GET /tasks/status/false": lambda i: request(
+                    client, "GET", "/tasks/status/false"
+                ),
+                "GET /tasks/stats": lambda i: request(client, "GET", "/tasks/stats"),
+                "GET /tasks/top": lambda i: request(client, "GET", "/tasks/top"),
+                "PUT /tasks/{id}": modify,
+                "PATCH /tasks/{id}/done": mark_done,
+                "PATCH /tasks/{id}/pending": mark_pending,
+                "PATCH /tasks/{id}/archive": archive,
+            }
+
+            results = {}
+            for name, operation in operations.items():
+                results[f"api.{name}"] = await measure(
+                    operation, iterations, max_seconds
+                )
+            return results
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                app.dependency_overrides.pop(key, None)
+            else:
+                app.dependency_overrides[key] = value
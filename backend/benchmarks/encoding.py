@@ -0,0 +1,214 @@
+"""Sort-heavy queries on text versus integer timestamp and priority storage.
+
+Run from the backend directory::
+
+    python -m benchmarks.encoding --count 200000
+
+One generated dataset is loaded in the text encoding of schema version 7
+(ISO timestamp strings, priority names), then copied and converted by the
+integer-encoding migration (epoch microseconds, priority codes). Every
+query is timed against both files, so the only difference is the encoding.
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.domain.entities import Priority
+from src.infrastructure.database import Database, migrate
+from src.infrastructure.database.migrations.steps import MIGRATIONS
+from src.infrastructure.database.types import PRIORITY_CODES
+from src.infrastructure.repositories import SQLiteTaskRepository
+
+from .generate import COLUMNS, Distribution, generate_batches
+from .harness import format_table, measure
+
+INTEGER_ENCODING_VERSION = 8
+ENCODINGS = ("text", "integer")
+PRIORITY_NAMES = {code: priority.name for priority, code in PRIORITY_CODES.items()}
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def _text_row(row: tuple) -> tuple:
+    # Generated rows are already integer-encoded; the text encoding is what
+    # SQLAlchemy's DateTime and Enum types wrote before version 8.
+    *head, priority, rank, is_done, is_archived, created_at, updated_at = row
+    return (
+        *head,
+        PRIORITY_NAMES[priority],
+        rank,
+        is_done,
+        is_archived,
+        _format_micros(created_at),
+        _format_micros(updated_at),
+    )
+
+
+def _format_micros(micros: int) -> str:
+    moment = datetime(1970, 1, 1) + timedelta(microseconds=micros)
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _bind(encoding: str, moment: datetime):
+    if encoding == "integer":
+        return (moment - datetime(1970, 1, 1, tzinfo=UTC)) // timedelta(microseconds=1)
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _database(url: str) -> Database:
+    database = Database(url, pragmas={})
+    database.engine.echo = False
+    return database
+
+
+async def load_text_database(url: str, count: int, seed: int) -> None:
+    database = _database(url)
+    try:
+        await migrate(
+            database,
+            migrations=[m for m in MIGRATIONS if m.version < INTEGER_ENCODING_VERSION],
+        )
+        insert = (
+            f"INSERT INTO {{table}} ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(COLUMNS))})"
+        )
+        async with database.engine.connect() as conn:
+            for hot, archived in generate_batches(count, Distribution(), seed, now=NOW):
+                for table, rows in (("tasks", hot), ("archived_tasks", archived)):
+                    if rows:
+                        await conn.exec_driver_sql(
+                            insert.format(table=table),
+                            [_text_row(row) for row in rows],
+                        )
+                await conn.commit()
+            await conn.exec_driver_sql("ANALYZE")
+            await conn.commit()
+    finally:
+        await database.close()
+
+
+async def convert_to_integers(url: str) -> float:
+    database = _database(url)
+    try:
+        started = time.perf_counter()
+        await migrate(database)
+        elapsed = time.perf_counter() - started
+        async with database.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            # The copied tables leave their old pages free; compact so the
+            # file sizes compare.
+            await conn.exec_driver_sql("VACUUM")
+            await conn.exec_driver_sql("ANALYZE")
+        return elapsed
+    finally:
+        await database.close()
+
+
+async def run_queries(
+    url: str, encoding: str, count: int, iterations: int, max_seconds: float
+) -> dict[str, dict[str, float]]:
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    since = _bind(encoding, NOW - timedelta(days=30))
+    if encoding == "integer":
+        high, day = PRIORITY_CODES[Priority.HIGH], "created_at / 86400000000"
+    else:
+        high, day = Priority.HIGH.name, "substr(created_at, 1, 10)"
+    middle = count // 2
+
+    async def query(sql: str, **params):
+        async with engine.connect() as conn:
+            return (await conn.execute(text(sql), params)).all()
+
+    async def on_session(operation):
+        async with session_factory() as session:
+            return await operation(SQLiteTaskRepository(session))
+
+    operations = {
+        # No index covers these orders, so SQLite sorts every row.
+        "order by created_at limit 100": lambda i: query(
+            "SELECT id, created_at FROM tasks ORDER BY created_at DESC LIMIT 100"
+        ),
+        "order by priority, updated_at [median]": lambda i: query(
+            "SELECT id FROM tasks ORDER BY priority, updated_at DESC "
+            "LIMIT 1 OFFSET :middle",
+            middle=middle,
+        ),
+        "count created in last 30 days": lambda i: query(
+            "SELECT count(*) FROM tasks WHERE created_at >= :since", since=since
+        ),
+        "count high-priority days": lambda i: query(
+            f"SELECT count(DISTINCT {day}) FROM tasks WHERE priority = :high",
+            high=high,
+        ),
+        # Index-ordered lists: the difference is converting rows to views.
+        "get_by_status[pending]": lambda i: on_session(
+            lambda repository: repository.get_by_status(False, False)
+        ),
+        "get_all[active]": lambda i: on_session(
+            lambda repository: repository.get_all(include_archived=False)
+        ),
+    }
+    try:
+        return {
+            name: await measure(operation, iterations, max_seconds)
+            for name, operation in operations.items()
+        }
+    finally:
+        await engine.dispose()
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, dict[str, float]]]:
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = {encoding: Path(workdir) / f"{encoding}.db" for encoding in ENCODINGS}
+        urls = {
+            encoding: f"sqlite+aiosqlite:///{path}" for encoding, path in paths.items()
+        }
+        await load_text_database(urls["text"], args.count, args.seed)
+        shutil.copyfile(paths["text"], paths["integer"])
+        converted = await convert_to_integers(urls["integer"])
+        print(
+            f"Converted {args.count:,} tasks to the integer encoding in {converted:.1f} s"
+        )
+        for encoding in ENCODINGS:
+            results[encoding] = await run_queries(
+                urls[encoding], encoding, args.count, args.iterations, args.max_seconds
+            )
+            size = paths[encoding].stat().st_size / 2**20
+            print(
+                format_table(
+                    f"{args.count:,} {encoding}-encoded ({size:.1f} MiB)",
+                    results[encoding],
+                ),
+                end="\n\n",
+            )
+
+    print(f"{'operation':<40} {'text p50':>9} {'int p50':>9} {'speedup':>8}")
+    for name, result in results["integer"].items():
+        before = results["text"][name]["p50_ms"]
+        after = result["p50_ms"]
+        print(f"{name:<40} {before:>9.3f} {after:>9.3f} {before / after:>7.2f}x")
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--max-seconds", type=float, default=10.0)
+    asyncio.run(run(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""Generate a large synthetic task dataset straight into SQLite.
+
+Run from the backend directory::
+
+    python -m benchmarks.generate --count 5000000
+    python -m benchmarks.generate --count 1000000 --database-url \\
+        sqlite+aiosqlite:///./big.db --priorities low=6,medium=3,high=1 \\
+        --statuses pending=5,done=4,archived=1 --days 730 --seed 42
+
+The schema is created or upgraded through the migrations first. Rows are
+then written with ``executemany`` in large transactions, bypassing the
+repository. While loading, durability PRAGMAs are relaxed and the secondary
+indexes are dropped, then rebuilt once at the end. The same seed always
+produces the same tasks.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Iterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.domain.entities import Priority
+from src.infrastructure.database import Database, migrate
+from src.infrastructure.repositories.sqlite_task_repository import PRIORITY_RANK
+
+BATCH_SIZE = 100_000
+
+# The API refuses a sixth pending high-priority task; generated data
+# respects the same rule unless asked otherwise.
+MAX_PENDING_HIGH = 5
+
+COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "priority_rank",
+    "is_done",
+    "is_archived",
+    "created_at",
+    "updated_at",
+)
+
+# Relaxed for the load only: a crash mid-load leaves a database to delete.
+LOAD_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-262144",
+}
+
+STATUSES = ("pending", "done", "archived")
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Relative weights of priorities and statuses, and the creation spread."""
+
+    priorities: dict[Priority, float] = field(
+        default_factory=lambda: {
+            Priority.LOW: 5,
+            Priority.MEDIUM: 3.5,
+            Priority.HIGH: 1.5,
+        }
+    )
+    statuses: dict[str, float] = field(
+        default_factory=lambda: {"pending": 6, "done": 3, "archived": 1}
+    )
+    days: float = 365.0
+    max_pending_high: int = MAX_PENDING_HIGH
+
+
+@dataclass
+class GeneratedCounts:
+    tasks: int = 0
+    archived: int = 0
+    by_priority: dict[Priority, int] = field(
+        default_factory=lambda: dict.fromkeys(Priority, 0)
+    )
+
+
+def generate_batches(
+    count: int,
+    distribution: Distribution,
+    seed: int = 0,
+    batch_size: int = BATCH_SIZE,
+    now: datetime | None = None,
+    counts: GeneratedCounts | None = None,
+) -> Iterator[tuple[list[tuple], list[tuple]]]:
+    """Yield ``(hot_rows, archived_rows)`` batches of row tuples in ``COLUMNS`` order.
+
+    Values are already in SQLite's storage format (16-byte UUIDv7 ids,
+    priority codes, epoch-microsecond timestamps, 0/1 booleans), so no
+    per-row type processing is needed on insert.
+    """
+    rng = random.Random(seed)
+    epoch = datetime(1970, 1, 1, tzinfo=UTC)
+    end = (now or datetime.now(UTC)) - epoch
+    end = (end.days * 86_400 + end.seconds) * 1_000_000 + end.microseconds
+    spread = int(distribution.days * 86_400 * 1_000_000)
+    start = end - spread
+    # Work with positions into these lists; hashing enums per row is slow.
+    priorities = list(distribution.priorities)
+    # The stored priority code is also its rank.
+    priority_ranks = [PRIORITY_RANK[priority] for priority in priorities]
+    positions = range(len(priorities))
+    high = priorities.index(Priority.HIGH) if Priority.HIGH in priorities else -1
+    fallback = [p for p in positions if p != high]
+    statuses = [STATUSES.index(status) for status in distribution.statuses]
+    pending, archived_status = STATUSES.index("pending"), STATUSES.index("archived")
+    counts = counts if counts is not None else GeneratedCounts()
+    by_priority = [0] * len(priorities)
+    pending_high = 0
+
+    for offset in range(0, count, batch_size):
+        size = min(batch_size, count - offset)
+        batch_priorities = rng.choices(
+            positions, list(distribution.priorities.values()), k=size
+        )
+        batch_statuses = rng.choices(
+            statuses, list(distribution.statuses.values()), k=size
+        )
+        id_bytes = rng.randbytes(10 * size)
+        hot, archived = [], []
+        for i in range(size):
+            priority = batch_priorities[i]
+            status = batch_statuses[i]
+            if status == pending and priority == high:
+                if pending_high >= distribution.max_pending_high and fallback:
+                    priority = rng.choice(fallback)
+                else:
+                    pending_high += 1
+            created = start + int(rng.random() * spread)
+            # UUIDv7 bytes: creation time in ms, version 7, variant, random.
+            r = id_bytes[i * 10 : i * 10 + 10]
+            task_id = (
+                (created // 1000).to_bytes(6)
+                + bytes((0x70 | r[0] & 0x0F, r[1], 0x80 | r[2] & 0x3F))
+                + r[3:]
+            )
+            updated = created
+            if status != pending:
+                updated += int(rng.random() * (end - created))
+            row = (
+                task_id,
+                f"Task {offset + i}",
+                "Synthetic task",
+                priority_ranks[priority],
+                priority_ranks[priority],
+                status != pending,
+                status == archived_status,
+                created,
+                updated,
+            )
+            (archived if status == archived_status else hot).append(row)
+            by_priority[priority] += 1
+        counts.tasks += size
+        counts.archived += len(archived)
+        yield hot, archived
+
+    for position, number in zip(positions, by_priority):
+        counts.by_priority[priorities[position]] += number
+
+
+async def _secondary_indexes(conn: AsyncConnection) -> list[tuple[str, str]]:
+    result = await conn.execute(
+        text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' "
+            "AND tbl_name IN ('tasks', 'archived_tasks') AND sql IS NOT NULL"
+        )
+    )
+    return [(name, sql) for name, sql in result]
+
+
+async def generate(
+    database_url: str,
+    count: int,
+    distribution: Distribution,
+    seed: int = 0,
+    batch_size: int = BATCH_SIZE,
+    rebuild_indexes: bool = True,
+) -> GeneratedCounts:
+    """Migrate ``database_url`` and bulk insert ``count`` generated tasks."""
+    schema = Database(database_url, pragmas={})
+    try:
+        await migrate(schema, chunk_size=batch_size, include_heavy=True)
+    finally:
+        await schema.close()
+
+    insert = ", ".join(COLUMNS), ", ".join("?" * len(COLUMNS))
+    counts = GeneratedCounts()
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.connect() as conn:
+            for name, value in LOAD_PRAGMAS.items():
+                await conn.exec_driver_sql(f"PRAGMA {name}={value}")
+            indexes = await _secondary_indexes(conn) if rebuild_indexes else []
+            for name, _ in indexes:
+                await conn.exec_driver_sql(f"DROP INDEX {name}")
+            await conn.commit()
+
+            for hot, archived in generate_batches(
+                count, distribution, seed, batch_size, counts=counts
+            ):
+                for table, rows in (("tasks", hot), ("archived_tasks", archived)):
+                    if rows:
+                        await conn.exec_driver_sql(
+                            f"INSERT INTO {table} ({insert[0]}) VALUES ({insert[1]})",
+                            rows,
+                        )
+                await conn.commit()
+
+            for _, sql in indexes:
+                await conn.exec_driver_sql(sql)
+            await conn.exec_driver_sql("ANALYZE")
+            await conn.commit()
+    finally:
+        await engine.dispose()
+    return counts
+
+
+def _weights(value: str, choices: dict[str, object]) -> dict:
+    weights = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip().lower() not in choices:
+            raise argparse.ArgumentTypeError(
+                f"unknown {name!r}, expected one of {', '.join(choices)}"
+            )
+        weights[choices[name.strip().lower()]] = float(weight)
+    if not weights or any(weight < 0 for weight in weights.values()):
+        raise argparse.ArgumentTypeError("weights must be non-negative")
+    if not sum(weights.values()):
+        raise argparse.ArgumentTypeError("at least one weight must be positive")
+    return weights
+
+
+def main(argv: list[str] | None = None) -> int:
+    from src.infrastructure.config import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, required=True)
+    parser.add_argument("--database-url", default=settings.database_url)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--priorities",
+        type=lambda value: _weights(value, {p.value: p for p in Priority}),
+        default=Distribution().priorities,
+        help="relative weights, e.g. low=5,medium=3.5,high=1.5",
+    )
+    parser.add_argument(
+        "--statuses",
+        type=lambda value: _weights(value, {s: s for s in STATUSES}),
+        default=Distribution().statuses,
+        help="relative weights, e.g. pending=6,done=3,archived=1",
+    )
+    parser.add_argument(
+        "--days", type=float, default=365.0, help="spread of created_at into the past"
+    )
+    parser.add_argument(
+        "--max-pending-high",
+        type=int,
+        default=MAX_PENDING_HIGH,
+        help="cap on pending high-priority tasks (the API allows 5)",
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument(
+        "--keep-indexes",
+        action="store_true",
+        help="insert with the indexes in place instead of rebuilding them",
+    )
+    args = parser.parse_args(argv)
+
+    distribution = Distribution(
+        priorities=args.priorities,
+        statuses={status: args.statuses.get(status, 0) for status in STATUSES},
+        days=args.days,
+        max_pending_high=args.max_pending_high,
+    )
+    started = time.perf_counter()
+    counts = asyncio.run(
+        generate(
+            args.database_url,
+            args.count,
+            distribution,
+            args.seed,
+            args.batch_size,
+            rebuild_indexes=not args.keep_indexes,
+        )
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        f"Generated {counts.tasks} tasks ({counts.archived} archived) in "
+        f"{elapsed:.1f} s, {counts.tasks / elapsed:,.0f} rows/s"
+    )
+    for priority, number in counts.by_priority.items():
+        print(f"  {priority.value:<6} {number}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Timing, summary and baseline helpers shared by the benchmark suites."""
+
+import gc
+import json
+import math
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Awaitable, Callable
+
+Results = dict[str, dict[str, dict[str, float]]]
+
+# Metrics where a larger value is worse; throughput is the inverse of p50.
+COMPARED_METRICS = ("p50_ms", "p95_ms", "peak_kib")
+
+
+def percentile(sorted_samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted sample list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_samples)), 1)
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: list[float], peak_bytes: int) -> dict[str, float]:
+    samples = sorted(samples)
+    total = sum(samples)
+    return {
+        "iterations": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "ops_per_sec": len(samples) / total if total else 0.0,
+        "peak_kib": peak_bytes / 1024,
+    }
+
+
+async def measure(
+    operation: Callable[[int], Awaitable[object]],
+    iterations: int,
+    max_seconds: float,
+) -> dict[str, float]:
+    """Time ``operation(i)`` for up to ``iterations`` calls.
+
+    Stops early once ``max_seconds`` have been spent so the slow list
+    queries on large tables stay affordable. Peak memory comes from one
+    extra call under ``tracemalloc``, kept apart from the timed calls
+    because tracing slows allocation-heavy code down several times.
+    """
+    samples = []
+    budget_end = time.perf_counter() + max_seconds
+    gc.collect()
+    for i in range(iterations):
+        start = time.perf_counter()
+        await operation(i)
+        samples.append(time.perf_counter() - start)
+        if time.perf_counter() > budget_end:
+            break
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await operation(len(samples))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return summarize(samples, peak)
+
+
+def load_baseline(path: Path) -> Results:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, results: Results) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    merged = load_baseline(path)
+    for size, operations in results.items():
+        merged.setdefault(size, {}).update(operations)
+    path.write_text(json.dumps(merged, indent=2, sort_keys=True) + "\n")
+
+
+def find_regressions(
+    baseline: Results,
+    results: Results,
+    threshold: float,
+    min_delta_ms: float = 0.1,
+) -> list[str]:
+    """Describe every metric that grew by more than ``threshold`` (a ratio).
+
+    Timing differences below ``min_delta_ms`` are ignored, since sub-0.1 ms
+    operations jitter by more than any sensible threshold.
+    """
+    regressions = []
+    for size, operations in results.items():
+        for name, current in operations.items():
+            previous = baseline.get(size, {}).get(name)
+            if previous is None:
+                continue
+            for metric in COMPARED_METRICS:
+                before, after = previous.get(metric), current.get(metric)
+                if not before or after is None:
+                    continue
+                if metric.endswith("_ms") and after - before < min_delta_ms:
+                    continue
+                if after > before * (1 + threshold):
+                    regressions.append(
+                        f"{size} {name} {metric}: {before:.3f} -> {after:.3f} "
+                        f"(+{(after / before - 1) * 100:.0f}%)"
+                    )
+    return regressions
+
+
+def format_table(size: str, operations: dict[str, dict[str, float]]) -> str:
+    lines = [
+        f"{size} tasks",
+        f"{'operation':<40} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} "
+        f"{'p99 ms':>9} {'ops/s':>9} {'peak KiB':>10}",
+    ]
+    for name, result in operations.items():
+        lines.append(
+            f"{name:<40} {result['iterations']:>5} {result['p50_ms']:>9.3f} "
+            f"{result['p95_ms']:>9.3f} {result['p99_ms']:>9.3f} "
+            f"{result['ops_per_sec']:>9.1f} {result['peak_kib']:>10.1f}"
+        )
+    return "\n".join(lines)
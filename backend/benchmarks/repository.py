@@ -0,0 +1,86 @@
+"""Per-method timings for ``SQLiteTaskRepository``."""
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.repositories import SQLiteTaskRepository
+
+from .harness import measure
+from .seed import SeededTasks, new_task_payload
+
+
+async def run_repository_benchmarks(
+    session_factory: async_sessionmaker,
+    seeded: SeededTasks,
+    iterations: int,
+    max_seconds: float,
+) -> dict[str, dict[str, float]]:
+    """Time every repository method, each call on a fresh session like a request."""
+    created: list[Task] = []
+    lookup_ids = seeded.pending[:100]
+
+    async def on_session(operation):
+        async with session_factory() as session:
+            return await operation(SQLiteTaskRepository(session))
+
+    async def create(i):
+        payload = new_task_payload(i)
+        task = Task.create(
+            payload["title"], payload["description"], Priority(payload["priority"])
+        )
+        created.append(await on_session(lambda repository: repository.create(task)))
+
+    async def get_by_id(i):
+        task_id = lookup_ids[i % len(lookup_ids)]
+        await on_session(lambda repository: repository.get_by_id(task_id))
+
+    async def update(i):
+        task = created[i % len(created)]
+        task.update(title=f"Updated {i}")
+        await on_session(lambda repository: repository.update(task))
+
+    async def archive(i):
+        async def run(repository):
+            task = await repository.get_by_id(seeded.done.pop())
+            task.archive()
+            return await repository.archive(task)
+
+        await on_session(run)
+
+    async def delete(i):
+        task_id = created.pop().id if created else seeded.pending.pop()
+        await on_session(lambda repository: repository.delete(task_id))
+
+    operations = {
+        "create": create,
+        "get_by_id": get_by_id,
+        "get_by_ids[100]": lambda i: on_session(
+            lambda repository: repository.get_by_ids(lookup_ids)
+        ),
+        "get_all": lambda i: on_session(lambda repository: repository.get_all()),
+        "get_all[active]": lambda i: on_session(
+            lambda repository: repository.get_all(include_archived=False)
+        ),
+        "get_by_status[pending]": lambda i: on_session(
+            lambda repository: repository.get_by_status(False, False)
+        ),
+        "get_by_status[archived]": lambda i: on_session(
+            lambda repository: repository.get_by_status(True, True)
+        ),
+        "count_by_priority": lambda i: on_session(
+            lambda repository: repository.count_by_priority(Priority.HIGH)
+        ),
+        "count_by_status": lambda i: on_session(
+            lambda repository: repository.count_by_status(True, False)
+        ),
+        "update": update,
+        "archive": archive,
+        "delete": delete,
+    }
+
+    results = {}
+    for name, operation in operations.items():
+        results[f"repository.{name}"] = await measure(
+            operation, iterations, max_seconds
+        )
+    return results
@@ -0,0 +1,115 @@
+"""Repository and HTTP benchmarks with baseline regression checks.
+
+Run from the backend directory::
+
+    python -m benchmarks.run --sizes 10000 100000 1000000
+    python -m benchmarks.run --save-baseline          # record a new baseline
+    python -m benchmarks.run --threshold 0.3          # fail on >30% slowdowns
+
+Each size is seeded into a fresh SQLite file, then every repository method
+and every task endpoint is timed. The command exits with status 1 when a
+metric regresses past the threshold relative to the stored baseline.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from .api import run_api_benchmarks
+from .harness import (
+    Results,
+    find_regressions,
+    format_table,
+    load_baseline,
+    save_baseline,
+)
+from .repository import run_repository_benchmarks
+from .seed import seed_tasks
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "baseline.json"
+SUITES = ("repository", "api")
+
+
+async def run_size(size: int, args: argparse.Namespace, workdir: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{workdir}/bench-{size}.db")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        seeded = await seed_tasks(engine, size)
+        results = {}
+        if "repository" in args.suites:
+            results.update(
+                await run_repository_benchmarks(
+                    session_factory, seeded, args.iterations, args.max_seconds
+                )
+            )
+        if "api" in args.suites:
+            results.update(
+                await run_api_benchmarks(
+                    session_factory, seeded, args.iterations, args.max_seconds
+                )
+            )
+        return results
+    finally:
+        await engine.dispose()
+
+
+async def run(args: argparse.Namespace) -> Results:
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            results[str(size)] = await run_size(size, args, workdir)
+            print(format_table(f"{size:,}", results[str(size)]), end="\n\n")
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        help="time budget per operation; slow operations get fewer iterations",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.getenv("BENCHMARK_THRESHOLD", "0.25")),
+        help="allowed growth as a ratio, e.g. 0.25 for 25%%",
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+    regressions = find_regressions(baseline, results, args.threshold)
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Bulk seeding of a benchmark database."""
+
+import random
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.domain.entities import Priority
+from src.infrastructure.database import ArchivedTaskModel, Base, TaskModel
+from src.infrastructure.repositories.sqlite_task_repository import PRIORITY_RANK
+
+BATCH_SIZE = 10_000
+SAMPLE_SIZE = 2_000
+
+# Out of every ten tasks: six pending, three done, one archived.
+PENDING_SLOTS = range(0, 6)
+DONE_SLOTS = range(6, 9)
+
+# The API caps pending high-priority tasks at five.
+MAX_PENDING_HIGH = 5
+
+
+@dataclass
+class SeededTasks:
+    """Ids the benchmarks can read and write without creating tasks first.
+
+    Each list is a random sample that benchmarks consume with ``pop`` so no
+    two write benchmarks touch the same task.
+    """
+
+    count: int
+    pending: list[UUID] = field(default_factory=list)
+    done: list[UUID] = field(default_factory=list)
+
+
+def _row(task_id: UUID, priority: Priority, is_done: bool, created_at: datetime):
+    return {
+        "id": task_id,
+        "title": "Benchmark task",
+        "description": "Seeded for the benchmark suite",
+        "priority": priority,
+        "priority_rank": PRIORITY_RANK[priority],
+        "is_done": is_done,
+        "is_archived": False,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+async def seed_tasks(engine: AsyncEngine, count: int, seed: int = 0) -> SeededTasks:
+    """Create the schema and insert ``count`` tasks with executemany batches."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(seed)
+    start = datetime.now(UTC) - timedelta(seconds=count)
+    pending_ids, done_ids = [], []
+    pending_high = 0
+    hot, archived = [], []
+
+    async def flush() -> None:
+        async with engine.begin() as conn:
+            if hot:
+                await conn.execute(insert(TaskModel), hot)
+            if archived:
+                await conn.execute(insert(ArchivedTaskModel), archived)
+        hot.clear()
+        archived.clear()
+
+    for i in range(count):
+        task_id = UUID(int=rng.getrandbits(128), version=4)
+        created_at = start + timedelta(milliseconds=i)
+        slot = i % 10
+        if slot in PENDING_SLOTS:
+            if pending_high < MAX_PENDING_HIGH:
+                pending_high += 1
+                priority = Priority.HIGH
+            else:
+                priority = rng.choice((Priority.LOW, Priority.MEDIUM))
+            hot.append(_row(task_id, priority, False, created_at))
+            pending_ids.append(task_id)
+        elif slot in DONE_SLOTS:
+            hot.append(_row(task_id, rng.choice(list(Priority)), True, created_at))
+            done_ids.append(task_id)
+        else:
+            row = _row(task_id, rng.choice(list(Priority)), True, created_at)
+            row["is_archived"] = True
+            archived.append(row)
+        if len(hot) + len(archived) >= BATCH_SIZE:
+            await flush()
+    await flush()
+
+    return SeededTasks(
+        count=count,
+        pending=rng.sample(pending_ids, min(SAMPLE_SIZE, len(pending_ids))),
+        done=rng.sample(done_ids, min(SAMPLE_SIZE, len(done_ids))),
+    )
+
+
+def new_task_payload(i: int) -> dict:
+    return {
+        "title": f"New task {i}",
+        "description": f"Created by the benchmark suite ({uuid4()})",
+        "priority": Priority.MEDIUM.value if i % 2 else Priority.LOW.value,
+    }
@@ -0,0 +1,158 @@
+"""Cold start report: import time per module group and time to ready.
+
+Run from the backend directory::
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --top 15 --depth 3
+
+Both measurements run in fresh interpreters so nothing is already cached
+in ``sys.modules``. Import times come from ``python -X importtime``; the
+time to ready covers the application lifespan up to the point where it
+starts serving, against an empty SQLite file.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_LIFESPAN_SCRIPT = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def start():
+    async with main.app.router.lifespan_context(main.app):
+        ready = time.perf_counter()
+    return ready
+
+ready = asyncio.run(start())
+print()
+json.dump(
+    {
+        "import_ms": (imported - started) * 1000,
+        "lifespan_ms": (ready - imported) * 1000,
+        "modules": sorted(sys.modules),
+    },
+    sys.stdout,
+)
+"""
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the ``import time:`` lines that ``-X importtime`` writes to stderr."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        records.append(ImportRecord(module.strip(), int(self_us), int(cumulative_us)))
+    return records
+
+
+def module_group(module: str, depth: int = 3) -> str:
+    """Top-level package, except the app's own ``src.*`` modules keep ``depth`` parts."""
+    parts = module.split(".")
+    if parts[0] == "src":
+        return ".".join(parts[:depth])
+    return parts[0]
+
+
+def group_import_times(records: list[ImportRecord], depth: int = 3) -> dict[str, int]:
+    """Sum self time per module group, slowest group first (microseconds)."""
+    totals: dict[str, int] = defaultdict(int)
+    for record in records:
+        totals[module_group(record.module, depth)] += record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _environment(database_url: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", database_url)
+    return env
+
+
+def profile_imports(module: str = "main") -> list[ImportRecord]:
+    """Import ``module`` in a fresh interpreter under ``-X importtime``."""
+    with tempfile.TemporaryDirectory() as workdir:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=BACKEND_DIR,
+            env=_environment(f"sqlite+aiosqlite:///{workdir}/startup.db"),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    return parse_importtime(completed.stderr)
+
+
+def measure_startup() -> dict:
+    """Import ``main`` and run its lifespan startup in a fresh interpreter.
+
+    Returns ``import_ms``, ``lifespan_ms`` and the ``modules`` loaded by
+    the time the application was ready to serve.
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        completed = subprocess.run(
+            [sys.executable, "-c", _LIFESPAN_SCRIPT],
+            cwd=BACKEND_DIR,
+            env=_environment(f"sqlite+aiosqlite:///{workdir}/startup.db"),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    # The engine echoes SQL to stdout, so the result is the last line.
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def format_report(groups: dict[str, int], startup: dict, top: int) -> str:
+    total_us = sum(groups.values())
+    lines = [
+        f"{'module group':<40} {'self ms':>9} {'share':>7}",
+    ]
+    for group, self_us in list(groups.items())[:top]:
+        lines.append(
+            f"{group:<40} {self_us / 1000:>9.1f} {self_us / total_us * 100:>6.1f}%"
+        )
+    lines += [
+        f"{'total':<40} {total_us / 1000:>9.1f}",
+        "",
+        f"import main:   {startup['import_ms']:.1f} ms",
+        f"lifespan:      {startup['lifespan_ms']:.1f} ms",
+        f"time to ready: {startup['import_ms'] + startup['lifespan_ms']:.1f} ms",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20, help="module groups to show")
+    parser.add_argument(
+        "--depth", type=int, default=3, help="dotted parts kept for src.* groups"
+    )
+    args = parser.parse_args(argv)
+
+    groups = group_import_times(profile_imports(), args.depth)
+    print(format_report(groups, measure_startup(), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Memory footprint and construction cost of task objects.
+
+Run from the backend directory::
+
+    python -m benchmarks.task_memory --count 1000000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.domain.entities import Priority, Task, TaskView
+
+
+@dataclass
+class DictTask:
+    """The previous ``Task`` layout: a plain dataclass with a ``__dict__``."""
+
+    id: UUID
+    title: str
+    description: str
+    priority: Priority
+    is_done: bool = False
+    is_archived: bool = False
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+def build(cls, ids, timestamps):
+    return [
+        cls(ids[i], "Title", "Description", Priority.MEDIUM, False, False, ts, ts)
+        for i, ts in enumerate(timestamps)
+    ]
+
+
+def measure(cls, ids, timestamps) -> dict:
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    objects = build(cls, ids, timestamps)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    instance_size = sys.getsizeof(objects[0])
+    if hasattr(objects[0], "__dict__"):
+        instance_size += sys.getsizeof(objects[0].__dict__)
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build(cls, ids, timestamps)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    count = len(timestamps)
+    return {
+        "name": cls.__name__,
+        "instance_bytes": instance_size,
+        "allocated_bytes": allocated / count,
+        "construct_seconds": elapsed,
+        "per_object_ns": elapsed / count * 1e9,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    # Ids and timestamps are shared inputs so the numbers isolate the cost of
+    # the task object itself.
+    ids = [uuid4() for _ in range(args.count)]
+    base = datetime.now(UTC)
+    timestamps = [base + timedelta(microseconds=i) for i in range(args.count)]
+
+    print(f"{args.count:,} tasks")
+    print(
+        f"{'model':<10} {'instance B':>10} {'alloc B/task':>13} {'total s':>8} {'ns/task':>8}"
+    )
+    for cls in (DictTask, Task, TaskView):
+        result = measure(cls, ids, timestamps)
+        print(
+            f"{result['name']:<10} {result['instance_bytes']:>10} "
+            f"{result['allocated_bytes']:>13.1f} {result['construct_seconds']:>8.3f} "
+            f"{result['per_object_ns']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
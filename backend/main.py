@@ -1,23 +1,151 @@
+import asyncio
+import contextlib
+import functools
+import logging
+import time
+from uuid import UUID
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from src.infrastructure.database import database
-from src.presentation.api import task_router
+from src.domain.entities import Priority
+from src.infrastructure import index as task_indexes
+from src.infrastructure.backup import BackupInProgressError, backup_manager
+from src.infrastructure.config import settings
+from src.infrastructure.coordination import LeaderLock, run_as_leader
+from src.infrastructure.database import (
+    database,
+    database_maintenance,
+    migrate_on_startup,
+    move_archived_tasks,
+)
+from src.infrastructure.idempotency import purge_expired_keys
+from src.infrastructure.observability import tracer
+from src.infrastructure import reminders
+from src.infrastructure.reports import report_jobs
+from src.infrastructure.repositories import (
+    get_sharded_task_repository,
+    task_repository_scope,
+)
+from src.presentation.api import (
+    AdmissionMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    SQLBudgetMiddleware,
+    TracingMiddleware,
+    admin_router,
+    metrics_router,
+    report_router,
+    task_router,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def purge_idempotency_keys_periodically():
+    while True:
+        await asyncio.sleep(settings.idempotency_purge_interval_seconds)
+        try:
+            await purge_expired_keys(database)
+        except Exception:
+            logger.exception("Failed to purge expired idempotency keys")
+
+
+async def back_up_periodically():
+    while True:
+        await asyncio.sleep(settings.backup_interval_seconds)
+        try:
+            await backup_manager.run()
+        except BackupInProgressError:
+            logger.info("Skipping scheduled backup, one is already running")
+        except Exception:
+            logger.exception("Failed to start a scheduled backup")
+
+
+async def move_archived_tasks_in_background():
+    try:
+        moved = await move_archived_tasks(
+            database, settings.archive_migration_chunk_size
+        )
+    except Exception:
+        logger.exception("Failed to move archived tasks to the archive table")
+    else:
+        if moved:
+            logger.info("Moved %d archived tasks to the archive table", moved)
+
+
+async def warm_up_in_background():
+    # Runs after the app starts serving: compiles the statements every
+    # request needs and builds the task index, which falls back to the
+    # repository until it is ready.
+    try:
+        await database.warm_up()
+        async with task_repository_scope(database) as repository:
+            await repository.get_by_id(UUID(int=0))
+            await repository.count_by_priority(Priority.HIGH)
+            if settings.task_index_enabled:
+                loaded = await task_indexes.load_task_index(
+                    task_indexes.task_index, repository
+                )
+                logger.info("Loaded %d tasks into the columnar task index", loaded)
+    except Exception:
+        logger.exception("Failed to warm up the database")
+
+
+async def run_singleton_jobs() -> None:
+    """Jobs that act on the shared database once per interval."""
+    jobs = [purge_idempotency_keys_periodically()]
+    if settings.maintenance_interval_seconds > 0:
+        jobs.append(database_maintenance.run_periodically())
+    if settings.backup_interval_seconds > 0:
+        jobs.append(back_up_periodically())
+    await asyncio.gather(*jobs)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await database.create_tables()
+    started = time.perf_counter()
+    await migrate_on_startup(
+        database,
+        settings.migration_chunk_size,
+        settings.migrate_heavy_on_startup,
+    )
+    if settings.task_repository == "sharded":
+        await get_sharded_task_repository().migrate(settings.migrate_heavy_on_startup)
+    singleton_jobs = run_singleton_jobs
+    if settings.workers > 1:
+        # Only the worker holding JOBS_LOCK_FILE runs them; the others stand
+        # by and take over if it exits.
+        singleton_jobs = functools.partial(
+            run_as_leader, LeaderLock(settings.jobs_lock_file), run_singleton_jobs
+        )
+    background_tasks = [
+        asyncio.create_task(warm_up_in_background()),
+        asyncio.create_task(move_archived_tasks_in_background()),
+        asyncio.create_task(singleton_jobs()),
+    ]
+    if settings.reminders_enabled and settings.task_repository == "sqlite":
+        background_tasks.append(asyncio.create_task(reminders.reminder_scheduler.run()))
+    logger.info("Ready to serve in %.1f ms", (time.perf_counter() - started) * 1000)
     yield
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await report_jobs.close()
+    if settings.task_repository == "sharded":
+        await get_sharded_task_repository().close()
     await database.close()
+    await asyncio.to_thread(tracer.flush)
 
 
 app = FastAPI(
     title="Todo API",
     description="A Todo List API with Clean Architecture and DDD",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -28,9 +156,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(SQLBudgetMiddleware)
+if settings.admission_enabled:
+    app.add_middleware(AdmissionMiddleware)
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+app.add_middleware(MetricsMiddleware)
+if tracer.enabled:
+    app.add_middleware(TracingMiddleware)
+
 app.include_router(task_router)
+app.include_router(metrics_router)
+app.include_router(admin_router)
+app.include_router(report_router)
 
 
 @app.get("/")
 async def root():
-    return {"message": "Todo API is running"}
\ No newline at end of file
+    return {"message": "Todo API is running"}
@@ -0,0 +1,78 @@
+"""Run the API in one or more worker processes.
+
+Run from the backend directory::
+
+    python serve.py                      # one worker, like ``uvicorn main:app``
+    python serve.py --workers 4 --port 8000
+
+With several workers the launcher migrates the schema once before any
+worker starts, switches SQLite to WAL so readers do not block behind a
+writer, and gives the workers a shared ``CACHE_VERSION_FILE`` counter
+that keeps their in-process task indexes coherent.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+import uvicorn
+
+
+async def migrate_once() -> None:
+    from src.infrastructure.config import settings
+    from src.infrastructure.database import database, migrate_on_startup
+    from src.infrastructure.repositories import get_sharded_task_repository
+
+    try:
+        await migrate_on_startup(
+            database,
+            settings.migration_chunk_size,
+            settings.migrate_heavy_on_startup,
+        )
+        if settings.task_repository == "sharded":
+            await get_sharded_task_repository().migrate(
+                settings.migrate_heavy_on_startup
+            )
+    finally:
+        if settings.task_repository == "sharded":
+            await get_sharded_task_repository().close()
+        await database.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the Todo API.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WORKERS", "1")),
+        help="worker processes (default: WORKERS or 1)",
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and os.environ.get("TASK_REPOSITORY") == "memory":
+        parser.error("TASK_REPOSITORY=memory keeps tasks per process; use one worker")
+    if args.workers > 1 and os.environ.get("TASK_REPOSITORY") == "sharded":
+        # Its pending-per-priority counters, and with them the high-priority
+        # limit, live in process memory.
+        parser.error(
+            "TASK_REPOSITORY=sharded keeps its priority counters per process; "
+            "use one worker"
+        )
+
+    # Workers are spawned as fresh interpreters and read their settings
+    # from the environment inherited from here.
+    os.environ["WORKERS"] = str(args.workers)
+    if args.workers > 1:
+        asyncio.run(migrate_once())
+
+    uvicorn.run("main:app", host=args.host, port=args.port, workers=args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
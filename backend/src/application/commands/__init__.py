@@ -1,5 +1,6 @@
 from .archive_task_command import ArchiveTaskCommand
 from .create_task_command import CreateTaskCommand
+from .import_tasks_command import ImportRow, ImportTasksCommand
 from .mark_task_done_command import MarkTaskDoneCommand
 from .mark_task_pending_command import MarkTaskPendingCommand
 from .modify_task_command import ModifyTaskCommand
@@ -10,4 +11,6 @@ __all__ = [
     "MarkTaskDoneCommand",
     "MarkTaskPendingCommand",
     "ArchiveTaskCommand",
+    "ImportTasksCommand",
+    "ImportRow",
 ]
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
 
 from ...domain.entities import Priority
 
@@ -8,3 +10,4 @@ class CreateTaskCommand:
     title: str
     description: str
     priority: Priority
+    due_at: Optional[datetime] = None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import AsyncIterable, Union
+
+from .create_task_command import CreateTaskCommand
+
+# A parsed row, or the reason it could not be parsed, by source line number.
+ImportRow = tuple[int, Union[CreateTaskCommand, str]]
+
+
+@dataclass
+class ImportTasksCommand:
+    rows: AsyncIterable[ImportRow]
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -11,3 +12,5 @@ class ModifyTaskCommand:
     title: Optional[str] = None
     description: Optional[str] = None
     priority: Optional[Priority] = None
+    due_at: Optional[datetime] = None
+    clear_due_at: bool = False
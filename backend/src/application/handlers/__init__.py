@@ -1,7 +1,11 @@
 from .archive_task_handler import ArchiveTaskHandler
 from .create_task_handler import CreateTaskHandler
 from .get_all_tasks_handler import GetAllTasksHandler
+from .get_task_analytics_handler import GetTaskAnalyticsHandler
+from .get_task_stats_handler import GetTaskStatsHandler
 from .get_tasks_by_status_handler import GetTasksByStatusHandler
+from .get_top_pending_tasks_handler import GetTopPendingTasksHandler
+from .import_tasks_handler import ImportTasksHandler
 from .mark_task_done_handler import MarkTaskDoneHandler
 from .mark_task_pending_handler import MarkTaskPendingHandler
 from .modify_task_handler import ModifyTaskHandler
@@ -14,4 +18,8 @@ __all__ = [
     "ArchiveTaskHandler",
     "GetAllTasksHandler",
     "GetTasksByStatusHandler",
+    "GetTaskStatsHandler",
+    "GetTaskAnalyticsHandler",
+    "GetTopPendingTasksHandler",
+    "ImportTasksHandler",
 ]
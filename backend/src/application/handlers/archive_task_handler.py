@@ -1,11 +1,18 @@
+from typing import Sequence
+
 from src.domain.entities import Task
-from src.domain.repositories import TaskRepository
+from src.domain.repositories import TaskChangeListener, TaskRepository
 from src.application.commands import ArchiveTaskCommand
 
 
 class ArchiveTaskHandler:
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        listeners: Sequence[TaskChangeListener] = (),
+    ):
         self.repository = repository
+        self.listeners = listeners
 
     async def handle(self, command: ArchiveTaskCommand) -> Task:
         task = await self.repository.get_by_id(command.task_id)
@@ -13,4 +20,7 @@ class ArchiveTaskHandler:
             raise ValueError(f"Task with id {command.task_id} not found")
 
         task.archive()
-        return await self.repository.update(task)
+        saved = await self.repository.archive(task)
+        for listener in self.listeners:
+            listener.task_saved(saved)
+        return saved
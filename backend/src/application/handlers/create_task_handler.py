@@ -1,22 +1,40 @@
-from src.domain.entities import Priority, Task
-from src.domain.repositories import TaskRepository
+from typing import Sequence
+
+from src.domain.entities import Priority, PriorityLimitExceededError, Task
+from src.domain.repositories import TaskChangeListener, TaskRepository
 from src.application.commands import CreateTaskCommand
 
+HIGH_PRIORITY_LIMIT = 5
+HIGH_PRIORITY_LIMIT_ERROR = (
+    f"Cannot create more than {HIGH_PRIORITY_LIMIT} tasks with high priority"
+)
+
 
 class CreateTaskHandler:
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        listeners: Sequence[TaskChangeListener] = (),
+    ):
         self.repository = repository
+        self.listeners = listeners
 
     async def handle(self, command: CreateTaskCommand) -> Task:
-        if command.priority == Priority.HIGH:
-            high_priority_count = await self.repository.count_by_priority(Priority.HIGH)
-            if high_priority_count >= 5:
-                raise ValueError("Cannot create more than 5 tasks with high priority")
-
         task = Task.create(
             title=command.title,
             description=command.description,
             priority=command.priority,
+            due_at=command.due_at,
         )
 
-        return await self.repository.create(task)
+        if command.priority == Priority.HIGH:
+            # Counted and inserted atomically, so concurrent creates cannot
+            # push past the limit.
+            saved = await self.repository.create_within_limit(task, HIGH_PRIORITY_LIMIT)
+            if saved is None:
+                raise PriorityLimitExceededError(HIGH_PRIORITY_LIMIT_ERROR)
+        else:
+            saved = await self.repository.create(task)
+        for listener in self.listeners:
+            listener.task_saved(saved)
+        return saved
@@ -1,4 +1,4 @@
-from src.domain.entities import Task
+from src.domain.entities import TaskView
 from src.domain.repositories import TaskRepository
 from src.application.queries import GetAllTasksQuery
 
@@ -7,5 +7,5 @@ class GetAllTasksHandler:
     def __init__(self, repository: TaskRepository):
         self.repository = repository
 
-    async def handle(self, query: GetAllTasksQuery) -> list[Task]:
-        return await self.repository.get_all()
+    async def handle(self, query: GetAllTasksQuery) -> list[TaskView]:
+        return await self.repository.get_all(query.include_archived)
@@ -0,0 +1,13 @@
+from src.application.queries import GetTaskAnalyticsQuery
+from src.domain.entities import TaskAnalytics
+from src.domain.repositories import TaskAnalyticsSource
+
+
+class GetTaskAnalyticsHandler:
+    def __init__(self, source: TaskAnalyticsSource):
+        self.source = source
+
+    async def handle(self, query: GetTaskAnalyticsQuery) -> TaskAnalytics:
+        if query.days < 1:
+            raise ValueError("days must be at least 1")
+        return await self.source.analytics(query.days)
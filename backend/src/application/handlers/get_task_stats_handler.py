@@ -0,0 +1,32 @@
+from typing import Optional
+
+from src.domain.entities import Priority, TaskStats
+from src.domain.repositories import TaskIndex, TaskRepository
+from src.application.queries import GetTaskStatsQuery
+
+
+class GetTaskStatsHandler:
+    def __init__(self, repository: TaskRepository, index: Optional[TaskIndex] = None):
+        self.repository = repository
+        self.index = index
+
+    async def handle(self, query: GetTaskStatsQuery) -> TaskStats:
+        if self.index is not None and self.index.is_ready:
+            return TaskStats(
+                pending=self.index.count_by_status(is_done=False, is_archived=False),
+                done=self.index.count_by_status(is_done=True, is_archived=False),
+                archived=self.index.count_by_status(is_done=True, is_archived=True)
+                + self.index.count_by_status(is_done=False, is_archived=True),
+                pending_by_priority=self.index.count_pending_by_priority(),
+            )
+
+        return TaskStats(
+            pending=await self.repository.count_by_status(False, False),
+            done=await self.repository.count_by_status(True, False),
+            archived=await self.repository.count_by_status(True, True)
+            + await self.repository.count_by_status(False, True),
+            pending_by_priority={
+                priority: await self.repository.count_by_priority(priority)
+                for priority in Priority
+            },
+        )
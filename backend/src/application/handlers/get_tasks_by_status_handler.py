@@ -1,4 +1,4 @@
-from src.domain.entities import Task
+from src.domain.entities import TaskView
 from src.domain.repositories import TaskRepository
 from src.application.queries import GetTasksByStatusQuery
 
@@ -7,5 +7,5 @@ class GetTasksByStatusHandler:
     def __init__(self, repository: TaskRepository):
         self.repository = repository
 
-    async def handle(self, query: GetTasksByStatusQuery) -> list[Task]:
+    async def handle(self, query: GetTasksByStatusQuery) -> list[TaskView]:
         return await self.repository.get_by_status(query.is_done, query.is_archived)
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from src.domain.entities import TaskView
+from src.domain.repositories import TaskIndex, TaskRepository
+from src.application.queries import GetTopPendingTasksQuery
+
+
+class GetTopPendingTasksHandler:
+    def __init__(self, repository: TaskRepository, index: Optional[TaskIndex] = None):
+        self.repository = repository
+        self.index = index
+
+    async def handle(self, query: GetTopPendingTasksQuery) -> list[TaskView]:
+        if self.index is not None and self.index.is_ready:
+            task_ids = self.index.top_pending(query.limit)
+            return await self.repository.get_by_ids(task_ids)
+
+        tasks = await self.repository.get_by_status(is_done=False, is_archived=False)
+        return tasks[: query.limit]
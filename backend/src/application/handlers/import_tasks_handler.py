@@ -0,0 +1,90 @@
+import asyncio
+from typing import Optional, Sequence
+
+from src.domain.entities import ImportSummary, Priority, Task
+from src.domain.repositories import TaskChangeListener, TaskRepository
+from src.application.commands import CreateTaskCommand, ImportTasksCommand
+
+from .create_task_handler import HIGH_PRIORITY_LIMIT, HIGH_PRIORITY_LIMIT_ERROR
+
+
+class ImportTasksHandler:
+    """Creates tasks from a stream of rows in chunked transactions.
+
+    At most ``chunk_size`` tasks are held in memory, and each chunk is one
+    ``create_many`` transaction, so the write lock is only held briefly.
+    High-priority rows are inserted one at a time with
+    ``create_within_limit``, like ``POST /tasks/``, so the limit holds
+    against concurrent writers. Slots are handed out in file order; once
+    one is refused, the remaining high-priority rows fail with the same
+    error without another query. Tasks that were already stored stay
+    stored if a later chunk fails.
+    """
+
+    def __init__(
+        self,
+        repository: TaskRepository,
+        listeners: Sequence[TaskChangeListener] = (),
+        chunk_size: int = 500,
+        chunk_timeout: Optional[float] = None,
+        max_errors: int = 1000,
+    ):
+        self.repository = repository
+        self.listeners = listeners
+        self.chunk_size = chunk_size
+        self.chunk_timeout = chunk_timeout
+        self.max_errors = max_errors
+
+    async def handle(self, command: ImportTasksCommand) -> ImportSummary:
+        summary = ImportSummary(max_errors=self.max_errors)
+        high_priority_full = False
+        chunk: list[Task] = []
+
+        async for line, row in command.rows:
+            if isinstance(row, str):
+                summary.add_error(line, row)
+                continue
+            if row.priority == Priority.HIGH:
+                if not high_priority_full:
+                    high_priority_full = not await self._store_within_limit(
+                        self._new_task(row), summary
+                    )
+                if high_priority_full:
+                    summary.add_error(line, HIGH_PRIORITY_LIMIT_ERROR)
+                continue
+            chunk.append(self._new_task(row))
+            if len(chunk) >= self.chunk_size:
+                await self._store(chunk, summary)
+                chunk = []
+
+        if chunk:
+            await self._store(chunk, summary)
+        return summary
+
+    @staticmethod
+    def _new_task(row: CreateTaskCommand) -> Task:
+        return Task.create(
+            title=row.title,
+            description=row.description,
+            priority=row.priority,
+            due_at=row.due_at,
+        )
+
+    async def _store_within_limit(self, task: Task, summary: ImportSummary) -> bool:
+        async with asyncio.timeout(self.chunk_timeout):
+            created = await self.repository.create_within_limit(
+                task, HIGH_PRIORITY_LIMIT
+            )
+        if created is None:
+            return False
+        summary.imported += 1
+        for listener in self.listeners:
+            listener.task_saved(created)
+        return True
+
+    async def _store(self, chunk: list[Task], summary: ImportSummary) -> None:
+        async with asyncio.timeout(self.chunk_timeout):
+            summary.imported += await self.repository.create_many(chunk)
+        for task in chunk:
+            for listener in self.listeners:
+                listener.task_saved(task)
@@ -1,11 +1,18 @@
+from typing import Sequence
+
 from src.domain.entities import Task
-from src.domain.repositories import TaskRepository
+from src.domain.repositories import TaskChangeListener, TaskRepository
 from src.application.commands import MarkTaskDoneCommand
 
 
 class MarkTaskDoneHandler:
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        listeners: Sequence[TaskChangeListener] = (),
+    ):
         self.repository = repository
+        self.listeners = listeners
 
     async def handle(self, command: MarkTaskDoneCommand) -> Task:
         task = await self.repository.get_by_id(command.task_id)
@@ -13,4 +20,7 @@ class MarkTaskDoneHandler:
             raise ValueError(f"Task with id {command.task_id} not found")
 
         task.mark_as_done()
-        return await self.repository.update(task)
+        saved = await self.repository.update(task)
+        for listener in self.listeners:
+            listener.task_saved(saved)
+        return saved
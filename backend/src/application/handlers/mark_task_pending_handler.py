@@ -1,16 +1,40 @@
-from src.domain.entities import Task
-from src.domain.repositories import TaskRepository
+from typing import Sequence
+
+from src.domain.entities import Priority, PriorityLimitExceededError, Task
+from src.domain.repositories import TaskChangeListener, TaskRepository
 from src.application.commands import MarkTaskPendingCommand
 
+from .create_task_handler import HIGH_PRIORITY_LIMIT
+
+HIGH_PRIORITY_REOPEN_ERROR = (
+    "Cannot mark task as pending. "
+    f"Maximum of {HIGH_PRIORITY_LIMIT} high priority tasks allowed"
+)
+
 
 class MarkTaskPendingHandler:
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        listeners: Sequence[TaskChangeListener] = (),
+    ):
         self.repository = repository
+        self.listeners = listeners
 
     async def handle(self, command: MarkTaskPendingCommand) -> Task:
         task = await self.repository.get_by_id(command.task_id)
         if not task:
             raise ValueError(f"Task with id {command.task_id} not found")
 
+        reopen = task.is_done and task.priority == Priority.HIGH
         task.mark_as_pending()
-        return await self.repository.update(task)
+
+        if reopen:
+            saved = await self.repository.update_within_limit(task, HIGH_PRIORITY_LIMIT)
+            if saved is None:
+                raise PriorityLimitExceededError(HIGH_PRIORITY_REOPEN_ERROR)
+        else:
+            saved = await self.repository.update(task)
+        for listener in self.listeners:
+            listener.task_saved(saved)
+        return saved
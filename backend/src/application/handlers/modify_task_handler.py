@@ -1,28 +1,46 @@
-from src.domain.entities import Priority, Task
-from src.domain.repositories import TaskRepository
+from typing import Sequence
+
+from src.domain.entities import Priority, PriorityLimitExceededError, Task
+from src.domain.repositories import TaskChangeListener, TaskRepository
 from src.application.commands import ModifyTaskCommand
 
+from .create_task_handler import HIGH_PRIORITY_LIMIT
+
+HIGH_PRIORITY_UPGRADE_ERROR = (
+    "Cannot modify task to high priority. "
+    f"Maximum of {HIGH_PRIORITY_LIMIT} high priority tasks allowed"
+)
+
 
 class ModifyTaskHandler:
-    def __init__(self, repository: TaskRepository):
+    def __init__(
+        self,
+        repository: TaskRepository,
+        listeners: Sequence[TaskChangeListener] = (),
+    ):
         self.repository = repository
+        self.listeners = listeners
 
     async def handle(self, command: ModifyTaskCommand) -> Task:
         task = await self.repository.get_by_id(command.task_id)
         if not task:
             raise ValueError(f"Task with id {command.task_id} not found")
 
-        if command.priority == Priority.HIGH and task.priority != Priority.HIGH:
-            high_priority_count = await self.repository.count_by_priority(Priority.HIGH)
-            if high_priority_count >= 5:
-                raise ValueError(
-                    "Cannot modify task to high priority. Maximum of 5 high priority tasks allowed"
-                )
-
+        upgrade = command.priority == Priority.HIGH and task.priority != Priority.HIGH
         task.update(
             title=command.title,
             description=command.description,
             priority=command.priority,
+            due_at=command.due_at,
+            clear_due_at=command.clear_due_at,
         )
 
-        return await self.repository.update(task)
+        if upgrade:
+            saved = await self.repository.update_within_limit(task, HIGH_PRIORITY_LIMIT)
+            if saved is None:
+                raise PriorityLimitExceededError(HIGH_PRIORITY_UPGRADE_ERROR)
+        else:
+            saved = await self.repository.update(task)
+        for listener in self.listeners:
+            listener.task_saved(saved)
+        return saved
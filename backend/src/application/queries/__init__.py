@@ -1,4 +1,13 @@
 from .get_all_tasks_query import GetAllTasksQuery
+from .get_task_analytics_query import GetTaskAnalyticsQuery
+from .get_task_stats_query import GetTaskStatsQuery
 from .get_tasks_by_status_query import GetTasksByStatusQuery
+from .get_top_pending_tasks_query import GetTopPendingTasksQuery
 
-__all__ = ["GetAllTasksQuery", "GetTasksByStatusQuery"]
+__all__ = [
+    "GetAllTasksQuery",
+    "GetTasksByStatusQuery",
+    "GetTaskStatsQuery",
+    "GetTaskAnalyticsQuery",
+    "GetTopPendingTasksQuery",
+]
@@ -3,4 +3,4 @@ from dataclasses import dataclass
 
 @dataclass
 class GetAllTasksQuery:
-    pass
+    include_archived: bool = True
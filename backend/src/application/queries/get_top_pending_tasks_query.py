@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class GetTopPendingTasksQuery:
+    limit: int = 10
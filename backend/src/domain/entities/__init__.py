@@ -1,3 +1,26 @@
-from .task import Priority, Task
+from .ids import uuid7
+from .import_summary import ImportLineError, ImportSummary
+from .task import Priority, PriorityLimitExceededError, Task
+from .task_analytics import (
+    BacklogAgeBucket,
+    DailyThroughput,
+    LeadTime,
+    TaskAnalytics,
+)
+from .task_stats import TaskStats
+from .task_view import TaskView
 
-__all__ = ["Task", "Priority"]
+__all__ = [
+    "Task",
+    "TaskView",
+    "TaskStats",
+    "TaskAnalytics",
+    "DailyThroughput",
+    "LeadTime",
+    "BacklogAgeBucket",
+    "Priority",
+    "PriorityLimitExceededError",
+    "ImportLineError",
+    "ImportSummary",
+    "uuid7",
+]
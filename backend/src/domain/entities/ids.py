@@ -0,0 +1,35 @@
+import os
+import time
+from threading import Lock
+from uuid import UUID
+
+_lock = Lock()
+_last_millis = 0
+_counter = 0
+
+
+def uuid7() -> UUID:
+    """A time-ordered UUID (RFC 9562 version 7).
+
+    The top 48 bits are the Unix time in milliseconds, so new ids sort after
+    older ones and inserts land at the right-hand edge of the primary key
+    index. Within one millisecond the 12-bit ``rand_a`` field is a counter
+    seeded at random, which keeps ids from this process strictly increasing.
+    """
+    global _last_millis, _counter
+    with _lock:
+        millis = time.time_ns() // 1_000_000
+        if millis > _last_millis:
+            _last_millis = millis
+            _counter = int.from_bytes(os.urandom(2)) & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                # Counter exhausted: borrow the next millisecond.
+                _last_millis += 1
+                _counter = 0
+        millis, counter = _last_millis, _counter
+    random_bits = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+    return UUID(
+        int=(millis << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random_bits
+    )
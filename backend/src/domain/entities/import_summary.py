@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class ImportLineError:
+    line: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportSummary:
+    """Outcome of a bulk import; only the first ``max_errors`` errors are kept."""
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportLineError] = field(default_factory=list)
+    max_errors: int = 1000
+
+    def add_error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(ImportLineError(line, message))
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 from datetime import datetime, UTC
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from .ids import uuid7
 
 
 class Priority(Enum):
@@ -11,7 +13,11 @@ class Priority(Enum):
     HIGH = "high"
 
 
-@dataclass
+class PriorityLimitExceededError(ValueError):
+    """A write would leave more pending tasks of one priority than allowed."""
+
+
+@dataclass(slots=True)
 class Task:
     id: UUID
     title: str
@@ -19,35 +25,47 @@ class Task:
     priority: Priority
     is_done: bool = False
     is_archived: bool = False
-    created_at: Optional[datetime] = (None,)
-    updated_at: Optional[datetime] = (None,)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    due_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now(UTC)
         if self.updated_at is None:
-            self.updated_at = datetime.now(UTC)
+            self.updated_at = self.created_at
 
     @classmethod
-    def create(cls, title: str, description: str, priority: Priority) -> "Task":
+    def create(
+        cls,
+        title: str,
+        description: str,
+        priority: Priority,
+        due_at: Optional[datetime] = None,
+    ) -> "Task":
+        now = datetime.now(UTC)
         return cls(
-            id=uuid4(),
+            id=uuid7(),
             title=title,
             description=description,
             priority=priority,
             is_done=False,
             is_archived=False,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=now,
+            updated_at=now,
+            due_at=due_at,
         )
 
     def mark_as_done(self) -> None:
         self.is_done = True
         self.updated_at = datetime.now(UTC)
+        self.completed_at = self.updated_at
 
     def mark_as_pending(self) -> None:
         self.is_done = False
         self.updated_at = datetime.now(UTC)
+        self.completed_at = None
 
     def archive(self) -> None:
         if not self.is_done:
@@ -60,6 +78,8 @@ class Task:
         title: Optional[str] = None,
         description: Optional[str] = None,
         priority: Optional[Priority] = None,
+        due_at: Optional[datetime] = None,
+        clear_due_at: bool = False,
     ) -> None:
         if title is not None:
             self.title = title
@@ -67,4 +87,8 @@ class Task:
             self.description = description
         if priority is not None:
             self.priority = priority
+        if due_at is not None:
+            self.due_at = due_at
+        elif clear_due_at:
+            self.due_at = None
         self.updated_at = datetime.now(UTC)
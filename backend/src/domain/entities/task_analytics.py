@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from .task import Priority
+
+
+@dataclass(frozen=True, slots=True)
+class DailyThroughput:
+    day: date
+    created: int
+    completed: int
+
+
+@dataclass(frozen=True, slots=True)
+class LeadTime:
+    """Hours from creation to done for tasks of one priority completed in the window."""
+
+    priority: Priority
+    completed: int
+    mean_hours: Optional[float]
+    p50_hours: Optional[float]
+    p90_hours: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
+class BacklogAgeBucket:
+    """Pending tasks created between ``min_days`` and ``max_days`` days ago."""
+
+    min_days: int
+    max_days: Optional[int]
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class TaskAnalytics:
+    days: int
+    throughput: list[DailyThroughput]
+    lead_time: list[LeadTime]
+    backlog_age: list[BacklogAgeBucket]
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from .task import Priority
+
+
+@dataclass(frozen=True, slots=True)
+class TaskStats:
+    pending: int
+    done: int
+    archived: int
+    pending_by_priority: dict[Priority, int]
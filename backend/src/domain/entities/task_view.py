@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from .task import Priority
+
+
+class TaskView(NamedTuple):
+    """Immutable read model returned by list queries.
+
+    A named tuple rather than a frozen dataclass: it has no ``__dict__`` and
+    builds several times faster, which matters when a list query
+    materialises thousands of rows. Fields follow the column order of the
+    ``tasks`` table so repositories can build views positionally.
+    """
+
+    id: UUID
+    title: str
+    description: str
+    priority: Priority
+    is_done: bool
+    is_archived: bool
+    created_at: datetime
+    updated_at: datetime
+    due_at: Optional[datetime] = None
@@ -1,3 +1,11 @@
+from .task_analytics_source import TaskAnalyticsSource
+from .task_change_listener import TaskChangeListener
+from .task_index import TaskIndex
 from .task_repository import TaskRepository
 
-__all__ = ["TaskRepository"]
+__all__ = [
+    "TaskRepository",
+    "TaskIndex",
+    "TaskChangeListener",
+    "TaskAnalyticsSource",
+]
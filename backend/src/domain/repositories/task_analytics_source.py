@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from ..entities import TaskAnalytics
+
+
+class TaskAnalyticsSource(ABC):
+    """Computes throughput, lead-time and backlog-age rollups over all tasks."""
+
+    @abstractmethod
+    async def analytics(self, days: int) -> TaskAnalytics:
+        pass
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from ..entities import Task
+
+
+class TaskChangeListener(ABC):
+    """Notified by command handlers after a task change has been persisted."""
+
+    @abstractmethod
+    def task_saved(self, task: Task) -> None:
+        pass
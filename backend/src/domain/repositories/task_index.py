@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from uuid import UUID
+
+from ..entities import Priority
+from .task_change_listener import TaskChangeListener
+
+
+class TaskIndex(TaskChangeListener):
+    """In-process read index answering aggregate queries without the database."""
+
+    @property
+    @abstractmethod
+    def is_ready(self) -> bool:
+        pass
+
+    @abstractmethod
+    def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        pass
+
+    @abstractmethod
+    def count_pending_by_priority(self) -> dict[Priority, int]:
+        pass
+
+    @abstractmethod
+    def top_pending(self, limit: int) -> list[UUID]:
+        pass
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from uuid import UUID
 
-from ..entities import Priority, Task
+from ..entities import Priority, Task, TaskView
 
 
 class TaskRepository(ABC):
@@ -10,22 +10,55 @@ class TaskRepository(ABC):
     async def create(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def create_many(self, tasks: list[Task]) -> int:
+        """Insert new tasks in one transaction and return how many were stored."""
+        pass
+
+    @abstractmethod
+    async def create_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        """Insert ``task`` unless ``limit`` pending tasks already have its priority.
+
+        The check and the insert are one atomic step, so concurrent callers
+        cannot both take the last slot. Returns ``None`` when the limit is
+        reached.
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, task_id: UUID) -> Optional[Task]:
         pass
 
     @abstractmethod
-    async def get_all(self) -> list[Task]:
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[TaskView]:
+        pass
+
+    @abstractmethod
+    async def get_all(self, include_archived: bool = True) -> list[TaskView]:
         pass
 
     @abstractmethod
-    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[Task]:
+    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[TaskView]:
         pass
 
     @abstractmethod
     async def update(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def update_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        """Save ``task`` unless that would leave more than ``limit`` pending tasks
+        with its priority, checked atomically like ``create_within_limit``.
+
+        Returns ``None`` when the limit is reached and raises ``ValueError``
+        when the task does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def archive(self, task: Task) -> Task:
+        pass
+
     @abstractmethod
     async def delete(self, task_id: UUID) -> bool:
         pass
@@ -33,3 +66,7 @@ class TaskRepository(ABC):
     @abstractmethod
     async def count_by_priority(self, priority: Priority) -> int:
         pass
+
+    @abstractmethod
+    async def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        pass
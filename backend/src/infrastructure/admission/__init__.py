@@ -0,0 +1,3 @@
+from .concurrency_limiter import AdmissionRejected, ConcurrencyLimiter
+
+__all__ = ["AdmissionRejected", "ConcurrencyLimiter"]
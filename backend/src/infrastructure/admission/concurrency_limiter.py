@@ -0,0 +1,104 @@
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import AsyncIterator, Optional
+
+
+class AdmissionRejected(Exception):
+    """Raised instead of queueing a request that would not start in time."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+    """Runs at most ``limit`` operations at once, with a bounded FIFO queue.
+
+    A request joins the queue only if its estimated wait, based on the
+    queue length and a moving average of recent service times, fits in
+    ``queue_timeout``. Otherwise it is rejected right away. A request that
+    is still queued when ``queue_timeout`` runs out is rejected too.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        max_queue: int,
+        queue_timeout: float,
+        smoothing: float = 0.2,
+    ):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.smoothing = smoothing
+        self.active = 0
+        self.service_seconds = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def estimated_wait(self) -> float:
+        """Seconds until a request joining the queue now would start."""
+        return (self.queued + 1) / self.limit * self.service_seconds
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self.estimated_wait()))
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.release(perf_counter() - start)
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if self.queued >= self.max_queue:
+            raise AdmissionRejected("queue_full", self._retry_after())
+        if self.estimated_wait() > self.queue_timeout:
+            raise AdmissionRejected("deadline", self._retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await waiter
+        except BaseException as error:
+            # Timed out or cancelled just after release() handed us the slot.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            if isinstance(error, TimeoutError):
+                raise AdmissionRejected("timeout", self._retry_after()) from None
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self, service_seconds: Optional[float] = None) -> None:
+        """Free a slot, recording how long it was held when known."""
+        if service_seconds is not None:
+            self._record(service_seconds)
+        # The slot passes straight to the next waiter, so ``active`` only
+        # drops when nobody is queued.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _record(self, seconds: float) -> None:
+        if self.service_seconds == 0.0:
+            self.service_seconds = seconds
+        else:
+            self.service_seconds += self.smoothing * (seconds - self.service_seconds)
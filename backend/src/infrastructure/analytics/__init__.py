@@ -0,0 +1,37 @@
+"""Throughput, lead-time and backlog-age analytics.
+
+NumPy is only imported when analytics are first computed. With more than
+one worker, ``analytics_cache`` shares its data version through the
+``ANALYTICS_VERSION_FILE`` counter.
+"""
+
+from .cache import AnalyticsCache
+from .in_memory_task_analytics import InMemoryTaskAnalytics
+from .provider import task_analytics_scope
+from .sqlite_task_analytics import SQLiteTaskAnalytics
+
+__all__ = [
+    "AnalyticsCache",
+    "InMemoryTaskAnalytics",
+    "SQLiteTaskAnalytics",
+    "analytics_cache",
+    "task_analytics_scope",
+]
+
+
+def _create_analytics_cache() -> AnalyticsCache:
+    from src.infrastructure.config import settings
+
+    counter = None
+    if settings.workers > 1:
+        from src.infrastructure.coordination import SharedVersionCounter
+
+        counter = SharedVersionCounter(settings.analytics_version_file)
+    return AnalyticsCache(counter, settings.analytics_cache_seconds)
+
+
+def __getattr__(name: str):
+    if name == "analytics_cache":
+        cache = globals()["analytics_cache"] = _create_analytics_cache()
+        return cache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
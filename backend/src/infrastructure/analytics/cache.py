@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from src.domain.entities import Task, TaskAnalytics
+from src.domain.repositories import TaskChangeListener
+from src.infrastructure.coordination import SharedVersionCounter
+
+
+class AnalyticsCache(TaskChangeListener):
+    """Computed analytics kept until the task data changes.
+
+    Command handlers notify the cache of every saved task, which bumps a
+    data version: a plain integer in a single worker, or a counter shared
+    by all workers when ``counter`` is given. A cached result is served
+    while the version it was computed at is still current and it is at most
+    ``max_age_seconds`` old; the age limit moves the day window and backlog
+    ages along while nothing is written. Concurrent misses wait for one
+    computation instead of each running the query.
+    """
+
+    def __init__(
+        self,
+        counter: Optional[SharedVersionCounter] = None,
+        max_age_seconds: float = 60.0,
+    ):
+        self.counter = counter
+        self.max_age_seconds = max_age_seconds
+        self._local_version = 0
+        # days -> (data version, monotonic time computed, analytics)
+        self._entries: dict[int, tuple[int, float, TaskAnalytics]] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def version(self) -> int:
+        if self.counter is not None:
+            return self.counter.read()
+        return self._local_version
+
+    def task_saved(self, task: Task) -> None:
+        if self.counter is not None:
+            self.counter.bump()
+        else:
+            self._local_version += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get(
+        self, days: int, compute: Callable[[], Awaitable[TaskAnalytics]]
+    ) -> TaskAnalytics:
+        cached = self._lookup(days)
+        if cached is not None:
+            return cached
+        async with self._lock:
+            cached = self._lookup(days)
+            if cached is not None:
+                return cached
+            # Read before computing: a write that lands meanwhile leaves the
+            # entry one version behind, so the next request recomputes.
+            version = self.version
+            analytics = await compute()
+            self._entries[days] = (version, time.monotonic(), analytics)
+            return analytics
+
+    def _lookup(self, days: int) -> Optional[TaskAnalytics]:
+        entry = self._entries.get(days)
+        if entry is None:
+            return None
+        version, computed_at, analytics = entry
+        if version != self.version:
+            return None
+        if time.monotonic() - computed_at > self.max_age_seconds:
+            return None
+        return analytics
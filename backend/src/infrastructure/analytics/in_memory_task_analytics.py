@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+from src.domain.entities import TaskAnalytics
+from src.domain.repositories import TaskAnalyticsSource
+from src.infrastructure.database.types import PRIORITY_CODES, EpochMicros
+from src.infrastructure.repositories import InMemoryTaskRepository
+
+from .cache import AnalyticsCache
+
+_micros = EpochMicros().process_bind_param
+
+
+class InMemoryTaskAnalytics(TaskAnalyticsSource):
+    """Analytics over ``InMemoryTaskRepository``, in the rows ``COLUMNS_SQL`` returns."""
+
+    def __init__(self, repository: InMemoryTaskRepository, cache: AnalyticsCache):
+        self.repository = repository
+        self.cache = cache
+
+    async def analytics(self, days: int) -> TaskAnalytics:
+        return await self.cache.get(days, lambda: self._compute(days))
+
+    async def _compute(self, days: int) -> TaskAnalytics:
+        from .rollups import roll_up
+
+        # Read on the event loop, where no write can interleave.
+        rows = [
+            (
+                PRIORITY_CODES[view.priority],
+                int(view.is_done),
+                int(view.is_archived),
+                _micros(view.created_at, None),
+                _micros(completed_at or view.updated_at, None) if view.is_done else -1,
+            )
+            for view, completed_at in self.repository.with_completed_at()
+        ]
+        return await asyncio.to_thread(roll_up, [rows], time.time_ns() // 1000, days)
@@ -0,0 +1,33 @@
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator
+
+from src.domain.repositories import TaskAnalyticsSource, TaskRepository
+from src.infrastructure.repositories import (
+    InMemoryTaskRepository,
+    ShardedSQLiteTaskRepository,
+    SQLiteTaskRepository,
+)
+
+from .cache import AnalyticsCache
+from .in_memory_task_analytics import InMemoryTaskAnalytics
+from .sqlite_task_analytics import SQLiteTaskAnalytics
+
+
+@asynccontextmanager
+async def task_analytics_scope(
+    repository: TaskRepository, cache: AnalyticsCache
+) -> AsyncIterator[TaskAnalyticsSource]:
+    """Analytics over the data ``repository`` stores, whichever backend it is."""
+    if isinstance(repository, InMemoryTaskRepository):
+        yield InMemoryTaskAnalytics(repository, cache)
+    elif isinstance(repository, SQLiteTaskRepository):
+        yield SQLiteTaskAnalytics([repository.session], cache)
+    elif isinstance(repository, ShardedSQLiteTaskRepository):
+        async with AsyncExitStack() as stack:
+            sessions = [
+                await stack.enter_async_context(shard.async_session())
+                for shard in repository.shards
+            ]
+            yield SQLiteTaskAnalytics(sessions, cache)
+    else:
+        raise TypeError(f"No analytics for {type(repository).__name__}")
@@ -0,0 +1,94 @@
+from datetime import date, timedelta
+from itertools import chain
+
+import numpy as np
+
+from src.domain.entities import (
+    BacklogAgeBucket,
+    DailyThroughput,
+    LeadTime,
+    Priority,
+    TaskAnalytics,
+)
+from src.infrastructure.database.types import PRIORITY_CODES
+
+DAY_MICROS = 86_400_000_000
+HOUR_MICROS = 3_600_000_000
+
+# Lower edges, in days, of the backlog age buckets; the last is open-ended.
+BACKLOG_AGE_DAYS = (0, 1, 7, 30, 90, 365)
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+# One row per task, every value an integer: priority code, is_done,
+# is_archived, created_at and completed_at in epoch microseconds (-1 while
+# pending). Tasks completed before completed_at existed use updated_at.
+COLUMNS_SQL = " UNION ALL ".join(
+    "SELECT priority, is_done, is_archived, created_at, "
+    "CASE WHEN is_done THEN COALESCE(completed_at, updated_at) ELSE -1 END "
+    f"FROM {table} WHERE created_at IS NOT NULL"
+    for table in ("tasks", "archived_tasks")
+)
+COLUMN_COUNT = 5
+
+
+def compute_task_analytics(columns: np.ndarray, now: int, days: int) -> TaskAnalytics:
+    """Roll up an ``(n, 5)`` int64 array of ``COLUMNS_SQL`` rows.
+
+    Daily counts cover the ``days`` UTC days up to and including the one
+    holding ``now`` (epoch microseconds); lead times cover the tasks
+    completed in that window. Every aggregate is a vectorized pass over a
+    column, so the cost is a few milliseconds per million tasks.
+    """
+    priority, is_done, is_archived, created, completed = columns.T
+    done = is_done.astype(bool)
+    first_day = now // DAY_MICROS - days + 1
+
+    created_day = created // DAY_MICROS - first_day
+    created_day = created_day[(created_day >= 0) & (created_day < days)]
+    completed_day = completed // DAY_MICROS - first_day
+    completed_in_window = done & (completed_day >= 0) & (completed_day < days)
+    created_counts = np.bincount(created_day, minlength=days)
+    completed_counts = np.bincount(completed_day[completed_in_window], minlength=days)
+    throughput = [
+        DailyThroughput(
+            _EPOCH_DATE + timedelta(days=int(first_day) + offset),
+            int(created_counts[offset]),
+            int(completed_counts[offset]),
+        )
+        for offset in range(days)
+    ]
+
+    lead_hours = (completed - created)[completed_in_window] / HOUR_MICROS
+    lead_priority = priority[completed_in_window]
+    lead_time = []
+    for member in reversed(Priority):
+        hours = lead_hours[lead_priority == PRIORITY_CODES[member]]
+        if hours.size:
+            p50, p90 = np.percentile(hours, [50, 90])
+            stats = float(hours.mean()), float(p50), float(p90)
+        else:
+            stats = None, None, None
+        lead_time.append(LeadTime(member, int(hours.size), *stats))
+
+    pending = ~done & ~is_archived.astype(bool)
+    edges = np.array(BACKLOG_AGE_DAYS[1:], dtype=np.int64) * DAY_MICROS
+    buckets = np.searchsorted(edges, now - created[pending], side="right")
+    bucket_counts = np.bincount(buckets, minlength=len(BACKLOG_AGE_DAYS))
+    upper = (*BACKLOG_AGE_DAYS[1:], None)
+    backlog_age = [
+        BacklogAgeBucket(low, high, int(count))
+        for low, high, count in zip(BACKLOG_AGE_DAYS, upper, bucket_counts)
+    ]
+    return TaskAnalytics(days, throughput, lead_time, backlog_age)
+
+
+def roll_up(results: list[list], now: int, days: int) -> TaskAnalytics:
+    """``compute_task_analytics`` over row lists of ``COLUMN_COUNT`` integers."""
+    count = sum(len(rows) for rows in results)
+    values = np.fromiter(
+        chain.from_iterable(chain.from_iterable(results)),
+        np.int64,
+        count * COLUMN_COUNT,
+    )
+    return compute_task_analytics(values.reshape(-1, COLUMN_COUNT), now, days)
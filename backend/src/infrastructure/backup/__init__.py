@@ -0,0 +1,17 @@
+from .online_backup import (
+    BackupInProgressError,
+    BackupManager,
+    BackupProgress,
+    SnapshotInfo,
+    backup_manager,
+    stepped_backup,
+)
+
+__all__ = [
+    "BackupInProgressError",
+    "BackupManager",
+    "BackupProgress",
+    "SnapshotInfo",
+    "backup_manager",
+    "stepped_backup",
+]
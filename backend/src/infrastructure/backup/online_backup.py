@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy.engine import make_url
+
+from src.infrastructure.config import settings
+
+logger = logging.getLogger(__name__)
+
+_NAME = re.compile(r"^[A-Za-z0-9_-]+-\d+\.db$")
+_UNSAFE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+class BackupInProgressError(RuntimeError):
+    """Raised when a backup is requested while another one is still copying."""
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotInfo:
+    name: str
+    size_bytes: int
+    created_at: float
+
+
+@dataclass
+class BackupProgress:
+    name: str
+    state: str = "running"
+    pages_total: int = 0
+    pages_copied: int = 0
+    restarts: int = 0
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def percent(self) -> float:
+        if self.state == "done":
+            return 100.0
+        if not self.pages_total:
+            return 0.0
+        return round(100.0 * self.pages_copied / self.pages_total, 1)
+
+
+def stepped_backup(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    pages_per_step: int,
+    step_sleep: float,
+    max_restarts: int,
+    on_step: Optional[Callable[[int, int, int], None]] = None,
+) -> int:
+    """Copy ``source`` into ``target`` and return how often the copy restarted.
+
+    SQLite's backup API copies ``pages_per_step`` pages at a time with a
+    ``step_sleep`` pause in between, so writers only wait for one step. A
+    write from another connection restarts the copy; after ``max_restarts``
+    the rest is copied in one step instead. ``on_step`` receives the pages
+    copied, the total and the restarts so far after every step.
+    """
+    copied, restarts = 0, 0
+
+    def report(status: int, remaining: int, total: int) -> None:
+        nonlocal copied, restarts
+        # Every step copies at least one page, so a count that did not grow
+        # means the copy started over.
+        restarted = total - remaining <= copied
+        restarts += restarted
+        copied = total - remaining
+        if on_step is not None:
+            on_step(copied, total, restarts)
+        if restarted and restarts > max_restarts:
+            raise _TooManyRestarts
+
+    try:
+        source.backup(target, pages=pages_per_step, progress=report, sleep=step_sleep)
+    except _TooManyRestarts:
+        # Writes keep invalidating the copy; finish it under one read
+        # transaction rather than never finishing.
+        copied = 0
+        source.backup(target, pages=-1, progress=report)
+    return restarts
+
+
+def sqlite_file_path(database_url: str) -> Path:
+    path = make_url(database_url).database
+    if not path or path == ":memory:" or path.startswith("file:"):
+        raise ValueError("Online backup needs a SQLite database file")
+    return Path(path)
+
+
+class BackupManager:
+    """Online snapshots of the SQLite database with a bounded ring on disk.
+
+    The copy runs ``stepped_backup`` on its own read-only connection in a
+    worker thread, so the event loop keeps serving. Snapshots are
+    named ``<database>-<epoch µs>.db``, written to a ``.partial`` file and
+    renamed once complete; beyond ``keep`` the oldest are removed. Characters
+    of the database name other than letters, digits, ``_`` and ``-`` become
+    ``_``.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        directory: str,
+        keep: int,
+        pages_per_step: int = 256,
+        step_sleep: float = 0.005,
+        max_restarts: int = 3,
+    ):
+        self.database_url = database_url
+        self.directory = Path(directory)
+        self.keep = keep
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self.max_restarts = max_restarts
+        self.progress: Optional[BackupProgress] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self.progress is not None and self.progress.state == "running"
+
+    def start(self) -> BackupProgress:
+        """Begin a backup in the background and return its live progress."""
+        progress = self._begin()
+        self._task = asyncio.create_task(self._run(progress))
+        return progress
+
+    async def run(self) -> BackupProgress:
+        """Take a backup and wait for it; failures are reported in the result."""
+        progress = self._begin()
+        await self._run(progress)
+        return progress
+
+    def snapshots(self) -> list[SnapshotInfo]:
+        if not self.directory.exists():
+            return []
+        return [self._info(path) for path in reversed(self._files())]
+
+    def path_for(self, name: str) -> Optional[Path]:
+        # Names come from URLs; only plain file names in the ring are served.
+        if not _NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def _begin(self) -> BackupProgress:
+        if self.running:
+            raise BackupInProgressError(f"Backup {self.progress.name} is running")
+        source = sqlite_file_path(self.database_url)
+        # Names must match _NAME to be listed, served and trimmed later.
+        stem = _UNSAFE.sub("_", source.stem)
+        self.progress = BackupProgress(f"{stem}-{time.time_ns() // 1_000}.db")
+        return self.progress
+
+    async def _run(self, progress: BackupProgress) -> None:
+        try:
+            await asyncio.to_thread(self._copy, progress)
+        except Exception as error:
+            progress.state = "failed"
+            progress.error = str(error) or type(error).__name__
+            logger.exception("Backup %s failed", progress.name)
+        else:
+            progress.state = "done"
+            logger.info(
+                "Backup %s finished: %d pages, %d restarts",
+                progress.name,
+                progress.pages_total,
+                progress.restarts,
+            )
+        finally:
+            progress.finished_at = time.time()
+
+    def _copy(self, progress: BackupProgress) -> None:
+        source_path = sqlite_file_path(self.database_url).resolve()
+        if not source_path.is_file():
+            raise FileNotFoundError(f"Database file {source_path} does not exist")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target_path = self.directory / progress.name
+        partial = target_path.with_name(progress.name + ".partial")
+
+        def report(copied: int, total: int, restarts: int) -> None:
+            progress.pages_copied, progress.pages_total = copied, total
+            progress.restarts = restarts
+
+        source = sqlite3.connect(f"{source_path.as_uri()}?mode=ro", uri=True)
+        target = sqlite3.connect(partial)
+        try:
+            stepped_backup(
+                source,
+                target,
+                self.pages_per_step,
+                self.step_sleep,
+                self.max_restarts,
+                report,
+            )
+            (check,) = target.execute("PRAGMA quick_check").fetchone()
+            if check != "ok":
+                raise sqlite3.DatabaseError(f"Snapshot failed quick_check: {check}")
+        except BaseException:
+            target.close()
+            partial.unlink(missing_ok=True)
+            raise
+        finally:
+            source.close()
+        target.close()
+        os.replace(partial, target_path)
+        progress.size_bytes = target_path.stat().st_size
+        self._trim()
+
+    def _files(self) -> list[Path]:
+        return sorted(
+            (path for path in self.directory.glob("*.db") if _NAME.match(path.name)),
+            key=lambda path: int(path.stem.rsplit("-", 1)[1]),
+        )
+
+    def _trim(self) -> None:
+        files = self._files()
+        for path in files[: max(len(files) - self.keep, 0)]:
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _info(path: Path) -> SnapshotInfo:
+        stat = path.stat()
+        return SnapshotInfo(path.name, stat.st_size, stat.st_mtime)
+
+
+backup_manager = BackupManager(
+    settings.database_url,
+    settings.backup_dir,
+    settings.backup_keep,
+    settings.backup_pages_per_step,
+    settings.backup_step_sleep_ms / 1000,
+)
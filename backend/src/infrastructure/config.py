@@ -0,0 +1,226 @@
+import os
+from dataclasses import dataclass
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: str = "sqlite+aiosqlite:///./tasks.db"
+    task_repository: str = "sqlite"
+    database_shards: int = 4
+    database_shard_url_template: str = "sqlite+aiosqlite:///./tasks-shard-{shard}.db"
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+    idempotency_cache_size: int = 10_000
+    idempotency_purge_batch_size: int = 500
+    idempotency_purge_interval_seconds: int = 300
+    archive_migration_chunk_size: int = 500
+    migration_chunk_size: int = 1000
+    migrate_heavy_on_startup: bool = False
+    task_index_enabled: bool = False
+    dev_mode: bool = False
+    sql_statement_budget: int = 10
+    sql_repeated_statement_limit: int = 3
+    profiling_enabled: bool = False
+    profiling_token: str = ""
+    admin_token: str = ""
+    profiling_sample_rate: float = 0.0
+    profile_dir: str = "./profiles"
+    profile_ring_size: int = 20
+    trace_sample_rate: float = 0.0
+    trace_exporter: str = "jsonl"
+    trace_file: str = "./traces.jsonl"
+    workers: int = 1
+    cache_version_file: str = "./tasks.cache-version"
+    cache_change_log_size: int = 4096
+    jobs_lock_file: str = "./tasks.jobs-lock"
+    sqlite_wal: bool = False
+    sqlite_busy_timeout_ms: int = 5000
+    admission_enabled: bool = True
+    read_concurrency: int = 64
+    read_queue_size: int = 256
+    command_concurrency: int = 4
+    command_queue_size: int = 64
+    admission_queue_timeout_seconds: float = 2.0
+    db_timeout_seconds: float = 5.0
+    import_chunk_size: int = 500
+    import_max_line_bytes: int = 64 * 1024
+    import_max_errors: int = 1000
+    backup_dir: str = "./backups"
+    backup_keep: int = 7
+    backup_interval_seconds: int = 0
+    backup_pages_per_step: int = 256
+    backup_step_sleep_ms: float = 5.0
+    maintenance_interval_seconds: int = 6 * 60 * 60
+    maintenance_idle_seconds: int = 60
+    maintenance_vacuum_pages: int = 256
+    maintenance_analysis_limit: int = 400
+    report_dir: str = "./reports"
+    report_workers: int = 2
+    report_max_jobs: int = 8
+    report_max_bytes: int = 64 * 1024 * 1024
+    report_disk_bytes: int = 512 * 1024 * 1024
+    report_retention_seconds: float = 7 * 24 * 60 * 60
+    analytics_cache_seconds: float = 60.0
+    analytics_version_file: str = "./tasks.analytics-version"
+    reminders_enabled: bool = True
+    reminder_window_seconds: float = 3600.0
+    reminder_batch_size: int = 1000
+    reminder_lookback_seconds: float = 300.0
+    reminder_lock_file: str = "./tasks.reminders-lock"
+    reminder_version_file: str = "./tasks.reminders-version"
+    reminder_change_log_size: int = 4096
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            database_url=os.environ.get("DATABASE_URL", cls.database_url),
+            task_repository=os.environ.get("TASK_REPOSITORY", cls.task_repository),
+            database_shards=_env_int("DATABASE_SHARDS", cls.database_shards),
+            database_shard_url_template=os.environ.get(
+                "DATABASE_SHARD_URL_TEMPLATE", cls.database_shard_url_template
+            ),
+            idempotency_ttl_seconds=_env_int(
+                "IDEMPOTENCY_TTL_SECONDS", cls.idempotency_ttl_seconds
+            ),
+            idempotency_cache_size=_env_int(
+                "IDEMPOTENCY_CACHE_SIZE", cls.idempotency_cache_size
+            ),
+            idempotency_purge_batch_size=_env_int(
+                "IDEMPOTENCY_PURGE_BATCH_SIZE", cls.idempotency_purge_batch_size
+            ),
+            idempotency_purge_interval_seconds=_env_int(
+                "IDEMPOTENCY_PURGE_INTERVAL_SECONDS",
+                cls.idempotency_purge_interval_seconds,
+            ),
+            archive_migration_chunk_size=_env_int(
+                "ARCHIVE_MIGRATION_CHUNK_SIZE", cls.archive_migration_chunk_size
+            ),
+            migration_chunk_size=_env_int(
+                "MIGRATION_CHUNK_SIZE", cls.migration_chunk_size
+            ),
+            migrate_heavy_on_startup=_env_bool(
+                "MIGRATE_HEAVY_ON_STARTUP", cls.migrate_heavy_on_startup
+            ),
+            task_index_enabled=_env_bool("TASK_INDEX_ENABLED", cls.task_index_enabled),
+            dev_mode=_env_bool("DEV_MODE", cls.dev_mode),
+            sql_statement_budget=_env_int(
+                "SQL_STATEMENT_BUDGET", cls.sql_statement_budget
+            ),
+            sql_repeated_statement_limit=_env_int(
+                "SQL_REPEATED_STATEMENT_LIMIT", cls.sql_repeated_statement_limit
+            ),
+            profiling_enabled=_env_bool("PROFILING_ENABLED", cls.profiling_enabled),
+            profiling_token=os.environ.get("PROFILING_TOKEN", cls.profiling_token),
+            admin_token=os.environ.get("ADMIN_TOKEN", cls.admin_token),
+            profiling_sample_rate=_env_float(
+                "PROFILING_SAMPLE_RATE", cls.profiling_sample_rate
+            ),
+            profile_dir=os.environ.get("PROFILE_DIR", cls.profile_dir),
+            profile_ring_size=_env_int("PROFILE_RING_SIZE", cls.profile_ring_size),
+            trace_sample_rate=_env_float("TRACE_SAMPLE_RATE", cls.trace_sample_rate),
+            trace_exporter=os.environ.get("TRACE_EXPORTER", cls.trace_exporter),
+            trace_file=os.environ.get("TRACE_FILE", cls.trace_file),
+            workers=_env_int("WORKERS", cls.workers),
+            cache_version_file=os.environ.get(
+                "CACHE_VERSION_FILE", cls.cache_version_file
+            ),
+            cache_change_log_size=_env_int(
+                "CACHE_CHANGE_LOG_SIZE", cls.cache_change_log_size
+            ),
+            jobs_lock_file=os.environ.get("JOBS_LOCK_FILE", cls.jobs_lock_file),
+            sqlite_wal=_env_bool("SQLITE_WAL", cls.sqlite_wal),
+            sqlite_busy_timeout_ms=_env_int(
+                "SQLITE_BUSY_TIMEOUT_MS", cls.sqlite_busy_timeout_ms
+            ),
+            admission_enabled=_env_bool("ADMISSION_ENABLED", cls.admission_enabled),
+            read_concurrency=_env_int("READ_CONCURRENCY", cls.read_concurrency),
+            read_queue_size=_env_int("READ_QUEUE_SIZE", cls.read_queue_size),
+            command_concurrency=_env_int(
+                "COMMAND_CONCURRENCY", cls.command_concurrency
+            ),
+            command_queue_size=_env_int("COMMAND_QUEUE_SIZE", cls.command_queue_size),
+            admission_queue_timeout_seconds=_env_float(
+                "ADMISSION_QUEUE_TIMEOUT_SECONDS", cls.admission_queue_timeout_seconds
+            ),
+            db_timeout_seconds=_env_float("DB_TIMEOUT_SECONDS", cls.db_timeout_seconds),
+            import_chunk_size=_env_int("IMPORT_CHUNK_SIZE", cls.import_chunk_size),
+            import_max_line_bytes=_env_int(
+                "IMPORT_MAX_LINE_BYTES", cls.import_max_line_bytes
+            ),
+            import_max_errors=_env_int("IMPORT_MAX_ERRORS", cls.import_max_errors),
+            backup_dir=os.environ.get("BACKUP_DIR", cls.backup_dir),
+            backup_keep=_env_int("BACKUP_KEEP", cls.backup_keep),
+            backup_interval_seconds=_env_int(
+                "BACKUP_INTERVAL_SECONDS", cls.backup_interval_seconds
+            ),
+            backup_pages_per_step=_env_int(
+                "BACKUP_PAGES_PER_STEP", cls.backup_pages_per_step
+            ),
+            backup_step_sleep_ms=_env_float(
+                "BACKUP_STEP_SLEEP_MS", cls.backup_step_sleep_ms
+            ),
+            maintenance_interval_seconds=_env_int(
+                "MAINTENANCE_INTERVAL_SECONDS", cls.maintenance_interval_seconds
+            ),
+            maintenance_idle_seconds=_env_int(
+                "MAINTENANCE_IDLE_SECONDS", cls.maintenance_idle_seconds
+            ),
+            maintenance_vacuum_pages=_env_int(
+                "MAINTENANCE_VACUUM_PAGES", cls.maintenance_vacuum_pages
+            ),
+            maintenance_analysis_limit=_env_int(
+                "MAINTENANCE_ANALYSIS_LIMIT", cls.maintenance_analysis_limit
+            ),
+            report_dir=os.environ.get("REPORT_DIR", cls.report_dir),
+            report_workers=_env_int("REPORT_WORKERS", cls.report_workers),
+            report_max_jobs=_env_int("REPORT_MAX_JOBS", cls.report_max_jobs),
+            report_max_bytes=_env_int("REPORT_MAX_BYTES", cls.report_max_bytes),
+            report_disk_bytes=_env_int("REPORT_DISK_BYTES", cls.report_disk_bytes),
+            report_retention_seconds=_env_float(
+                "REPORT_RETENTION_SECONDS", cls.report_retention_seconds
+            ),
+            analytics_cache_seconds=_env_float(
+                "ANALYTICS_CACHE_SECONDS", cls.analytics_cache_seconds
+            ),
+            analytics_version_file=os.environ.get(
+                "ANALYTICS_VERSION_FILE", cls.analytics_version_file
+            ),
+            reminders_enabled=_env_bool("REMINDERS_ENABLED", cls.reminders_enabled),
+            reminder_window_seconds=_env_float(
+                "REMINDER_WINDOW_SECONDS", cls.reminder_window_seconds
+            ),
+            reminder_batch_size=_env_int(
+                "REMINDER_BATCH_SIZE", cls.reminder_batch_size
+            ),
+            reminder_lookback_seconds=_env_float(
+                "REMINDER_LOOKBACK_SECONDS", cls.reminder_lookback_seconds
+            ),
+            reminder_lock_file=os.environ.get(
+                "REMINDER_LOCK_FILE", cls.reminder_lock_file
+            ),
+            reminder_version_file=os.environ.get(
+                "REMINDER_VERSION_FILE", cls.reminder_version_file
+            ),
+            reminder_change_log_size=_env_int(
+                "REMINDER_CHANGE_LOG_SIZE", cls.reminder_change_log_size
+            ),
+        )
+
+
+settings = Settings.from_env()
@@ -0,0 +1,5 @@
+from .change_log import SharedChangeLog
+from .leader_lock import LeaderLock, run_as_leader
+from .version_counter import SharedVersionCounter
+
+__all__ = ["LeaderLock", "SharedChangeLog", "SharedVersionCounter", "run_as_leader"]
@@ -0,0 +1,85 @@
+import fcntl
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+_VERSION = struct.Struct("<Q")
+
+
+class SharedChangeLog:
+    """A version counter plus the last ``capacity`` change records, shared
+    by every process that maps the same file.
+
+    The file starts with the current version, followed by a ring of slots
+    that each hold the version they were written at and a fixed-size
+    payload. ``read`` is one unlocked load, as with
+    ``SharedVersionCounter``. ``append`` writes the slot and then the
+    version under an exclusive ``flock``, and ``since`` reads under a shared
+    one, so a reader never sees a half-written record.
+    """
+
+    def __init__(self, path: str, record_size: int, capacity: int = 4096):
+        self.path = Path(path)
+        self.record_size = record_size
+        self.capacity = capacity
+        self._slot = struct.Struct(f"<Q{record_size}s")
+        size = _VERSION.size + capacity * self._slot.size
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < size:
+                    os.ftruncate(fd, size)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self._map = mmap.mmap(fd, size)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def read(self) -> int:
+        return _VERSION.unpack_from(self._map)[0]
+
+    def append(self, record: bytes) -> int:
+        """Store ``record`` as the next version and return that version."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            version = _VERSION.unpack_from(self._map)[0] + 1
+            self._slot.pack_into(self._map, self._offset(version), version, record)
+            _VERSION.pack_into(self._map, 0, version)
+            return version
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def since(self, version: int) -> Optional[tuple[int, list[bytes]]]:
+        """Return the current version and the records written after ``version``.
+
+        ``None`` means some of them have already been overwritten.
+        """
+        fcntl.flock(self._fd, fcntl.LOCK_SH)
+        try:
+            current = _VERSION.unpack_from(self._map)[0]
+            if current - version > self.capacity or current < version:
+                return None
+            records = []
+            for expected in range(version + 1, current + 1):
+                written, record = self._slot.unpack_from(
+                    self._map, self._offset(expected)
+                )
+                if written != expected:
+                    return None
+                records.append(record)
+            return current, records
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, version: int) -> int:
+        return _VERSION.size + (version % self.capacity) * self._slot.size
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
@@ -0,0 +1,68 @@
+import asyncio
+import fcntl
+import os
+from pathlib import Path
+from typing import Awaitable, Callable
+
+
+class LeaderLock:
+    """Elects one process among those sharing ``path`` to run a singleton job.
+
+    ``try_acquire`` takes an exclusive, non-blocking ``flock`` and keeps it
+    until ``release`` or process exit, so when the leader dies the lock is
+    free for the next process that tries.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        return self._lock(fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def acquire(self) -> None:
+        """Wait until the lock is free; blocks the calling thread."""
+        self._lock(fcntl.LOCK_EX)
+
+    def _lock(self, operation: int) -> bool:
+        if self._fd is not None:
+            return True
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, operation)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+async def run_as_leader(
+    lock: LeaderLock,
+    job: Callable[[], Awaitable[None]],
+    retry_seconds: float = 5.0,
+) -> None:
+    """Run ``job`` once this process holds ``lock``, checking every ``retry_seconds``.
+
+    Processes that lose the election stay on standby and take over when the
+    leader exits and the lock is freed.
+    """
+    while not lock.try_acquire():
+        await asyncio.sleep(retry_seconds)
+    try:
+        await job()
+    finally:
+        lock.release()
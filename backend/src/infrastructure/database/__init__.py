@@ -1,4 +1,21 @@
+from .archive_migration import move_archived_tasks
 from .database import Base, Database, database
-from .models import TaskModel
+from .maintenance import DatabaseMaintenance, MaintenanceStep, database_maintenance
+from .migrations import MigrationRequiredError, migrate, migrate_on_startup
+from .models import ArchivedTaskModel, IdempotencyKeyModel, TaskModel
 
-__all__ = ["Database", "database", "Base", "TaskModel"]
+__all__ = [
+    "Database",
+    "database",
+    "Base",
+    "TaskModel",
+    "ArchivedTaskModel",
+    "IdempotencyKeyModel",
+    "move_archived_tasks",
+    "DatabaseMaintenance",
+    "MaintenanceStep",
+    "database_maintenance",
+    "MigrationRequiredError",
+    "migrate",
+    "migrate_on_startup",
+]
@@ -0,0 +1,39 @@
+import asyncio
+
+from sqlalchemy import delete, insert, select
+
+from .database import Database
+from .models import ArchivedTaskModel, TaskModel
+
+
+async def move_archived_tasks(database: Database, chunk_size: int = 500) -> int:
+    """Move archived rows still sitting in ``tasks`` into ``archived_tasks``.
+
+    Each chunk is copied and deleted in its own short transaction, yielding
+    to the event loop in between so API writers are never blocked for long.
+    Returns the number of rows moved.
+    """
+    columns = [column.name for column in TaskModel.__table__.columns]
+    moved = 0
+    while True:
+        async with database.engine.begin() as conn:
+            result = await conn.execute(
+                select(TaskModel.id)
+                .where(TaskModel.is_archived.is_(True))
+                .limit(chunk_size)
+            )
+            ids = result.scalars().all()
+            if ids:
+                await conn.execute(
+                    insert(ArchivedTaskModel).from_select(
+                        columns,
+                        select(*TaskModel.__table__.columns).where(
+                            TaskModel.id.in_(ids)
+                        ),
+                    )
+                )
+                await conn.execute(delete(TaskModel).where(TaskModel.id.in_(ids)))
+        moved += len(ids)
+        if len(ids) < chunk_size:
+            return moved
+        await asyncio.sleep(0)
@@ -1,26 +1,80 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from functools import cached_property
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
+from ..config import settings
+from ..observability import instrument_engine
+
 
 class Base(DeclarativeBase):
     pass
 
 
+def sqlite_pragmas() -> dict[str, str]:
+    """Per-connection SQLite settings; WAL lets readers run beside a writer."""
+    pragmas = {"busy_timeout": str(settings.sqlite_busy_timeout_ms)}
+    if settings.sqlite_wal or settings.workers > 1:
+        pragmas["journal_mode"] = "WAL"
+        pragmas["synchronous"] = "NORMAL"
+    return pragmas
+
+
 class Database:
-    def __init__(self, database_url: str = "sqlite+aiosqlite:///./tasks.db"):
-        self.engine = create_async_engine(database_url, echo=True)
-        self.async_session = async_sessionmaker(self.engine, expire_on_commit=False)
+    def __init__(
+        self,
+        database_url: str = "sqlite+aiosqlite:///./tasks.db",
+        pragmas: Optional[dict[str, str]] = None,
+    ):
+        self.database_url = database_url
+        self.pragmas = sqlite_pragmas() if pragmas is None else pragmas
+
+    # The engine (and with it the DBAPI driver) is created on first use
+    # rather than at import, which keeps ``import main`` cheap and gives
+    # every worker process its own connection pool.
+    @cached_property
+    def engine(self) -> AsyncEngine:
+        engine = create_async_engine(self.database_url, echo=True)
+        instrument_engine(engine)
+        if self.pragmas and engine.dialect.name == "sqlite":
+            event.listen(engine.sync_engine, "connect", self._apply_pragmas)
+        return engine
+
+    def _apply_pragmas(self, dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    @cached_property
+    def async_session(self) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(self.engine, expire_on_commit=False)
 
     async def create_tables(self):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    async def warm_up(self) -> None:
+        """Open a pooled connection so the first request does not pay for it."""
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
     async def get_session(self) -> AsyncSession:
         async with self.async_session() as session:
             yield session
 
     async def close(self):
-        await self.engine.dispose()
+        if "engine" in self.__dict__:
+            await self.engine.dispose()
 
 
-database = Database()
+database = Database(settings.database_url)
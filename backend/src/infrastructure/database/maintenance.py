@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ..config import settings
+from ..observability import (
+    db_maintenance_duration_seconds,
+    db_maintenance_last_run_timestamp_seconds,
+    db_transactions_total,
+)
+from .database import Database, database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceStep:
+    name: str
+    started_at: float
+    duration_seconds: float
+    detail: str
+
+
+def _activity() -> tuple[float, float]:
+    # Every pooled transaction ends in a commit (writes) or a rollback
+    # (reads closed by their session), so these two move with any traffic.
+    return db_transactions_total.value("commit"), db_transactions_total.value(
+        "rollback"
+    )
+
+
+class DatabaseMaintenance:
+    """Keeps the SQLite file compact and its planner statistics fresh.
+
+    Each run does three steps, in short statements that never hold the
+    write lock for long:
+
+    - ``PRAGMA optimize`` with ``analysis_limit``, which re-analyzes only
+      tables whose statistics have drifted, sampling at most that many rows
+      per index;
+    - ``PRAGMA incremental_vacuum`` in steps of ``vacuum_pages`` pages, with
+      a pause between steps, until the free list is empty (only when the
+      database uses ``auto_vacuum=INCREMENTAL``);
+    - ``PRAGMA wal_checkpoint(PASSIVE)`` in WAL mode, which copies what it
+      can without waiting for readers or writers.
+
+    ``run_periodically`` runs it every ``interval`` seconds, and earlier once
+    the database has seen writes and then ``idle_seconds`` without any
+    transaction.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        interval: float,
+        idle_seconds: float,
+        vacuum_pages: int = 256,
+        analysis_limit: int = 400,
+        step_sleep: float = 0.01,
+        tick: float = 5.0,
+    ):
+        self.database = database
+        self.interval = interval
+        self.idle_seconds = idle_seconds
+        self.vacuum_pages = vacuum_pages
+        self.analysis_limit = analysis_limit
+        self.step_sleep = step_sleep
+        self.tick = tick
+        self.last_run: dict[str, MaintenanceStep] = {}
+        self._lock = asyncio.Lock()
+
+    async def run(self) -> list[MaintenanceStep]:
+        """Run every step once and return their timings."""
+        async with self._lock:
+            return [
+                await self._timed("optimize", self.optimize),
+                await self._timed("incremental_vacuum", self.incremental_vacuum),
+                await self._timed("wal_checkpoint", self.checkpoint),
+            ]
+
+    async def optimize(self) -> str:
+        async with self.database.engine.connect() as conn:
+            await conn.exec_driver_sql(f"PRAGMA analysis_limit={self.analysis_limit}")
+            await conn.exec_driver_sql("PRAGMA optimize")
+            await conn.commit()
+        return f"analysis_limit={self.analysis_limit}"
+
+    async def incremental_vacuum(self) -> str:
+        async with self.database.engine.connect() as conn:
+            if await self._pragma(conn, "auto_vacuum") != 2:
+                return "skipped: auto_vacuum is not INCREMENTAL"
+            free = before = await self._pragma(conn, "freelist_count")
+            driver = (await conn.get_raw_connection()).driver_connection
+            steps = 0
+            while free:
+                # The pragma frees one page per row it steps through, which
+                # SQLAlchemy would not fetch, so it runs on the driver. Each
+                # statement is its own short write transaction.
+                async with driver.execute(
+                    f"PRAGMA incremental_vacuum({self.vacuum_pages})"
+                ) as cursor:
+                    await cursor.fetchall()
+                steps += 1
+                remaining = await self._pragma(conn, "freelist_count")
+                if remaining >= free:
+                    break
+                free = remaining
+                await asyncio.sleep(self.step_sleep)
+        return f"freed {before - free} pages in {steps} steps"
+
+    async def checkpoint(self) -> str:
+        async with self.database.engine.connect() as conn:
+            if await self._pragma(conn, "journal_mode") != "wal":
+                return "skipped: journal_mode is not WAL"
+            result = await conn.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)")
+            busy, logged, checkpointed = result.one()
+        return f"checkpointed {checkpointed} of {logged} frames, busy={busy}"
+
+    async def run_periodically(self) -> None:
+        last_run = time.monotonic()
+        seen = _activity()
+        quiet_since = last_run
+        written = False
+        while True:
+            await asyncio.sleep(self.tick)
+            now = time.monotonic()
+            activity = _activity()
+            if activity != seen:
+                written = written or activity[0] != seen[0]
+                seen, quiet_since = activity, now
+            due = now - last_run >= self.interval
+            idle = written and now - quiet_since >= self.idle_seconds
+            if not (due or idle):
+                continue
+            try:
+                await self.run()
+            except Exception:
+                logger.exception("Database maintenance failed")
+            last_run = quiet_since = time.monotonic()
+            seen, written = _activity(), False
+
+    async def _timed(self, name: str, step) -> MaintenanceStep:
+        started_at = time.time()
+        start = time.perf_counter()
+        detail = await step()
+        result = MaintenanceStep(name, started_at, time.perf_counter() - start, detail)
+        self.last_run[name] = result
+        db_maintenance_duration_seconds.set(result.duration_seconds, name)
+        db_maintenance_last_run_timestamp_seconds.set(started_at, name)
+        logger.info(
+            "Maintenance %s took %.1f ms: %s",
+            name,
+            result.duration_seconds * 1000,
+            detail,
+        )
+        return result
+
+    @staticmethod
+    async def _pragma(conn: AsyncConnection, name: str) -> Optional[object]:
+        return (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar()
+
+
+database_maintenance = DatabaseMaintenance(
+    database,
+    settings.maintenance_interval_seconds,
+    settings.maintenance_idle_seconds,
+    settings.maintenance_vacuum_pages,
+    settings.maintenance_analysis_limit,
+)
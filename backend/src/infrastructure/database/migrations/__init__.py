@@ -0,0 +1,21 @@
+from .migration import Migration
+from .runner import (
+    LATEST_VERSION,
+    MigrationRequiredError,
+    current_version,
+    migrate,
+    migrate_on_startup,
+    pending_migrations,
+)
+from .steps import MIGRATIONS
+
+__all__ = [
+    "LATEST_VERSION",
+    "MIGRATIONS",
+    "Migration",
+    "MigrationRequiredError",
+    "current_version",
+    "migrate",
+    "migrate_on_startup",
+    "pending_migrations",
+]
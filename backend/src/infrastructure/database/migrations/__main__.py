@@ -0,0 +1,63 @@
+"""Inspect and apply schema migrations ahead of a deploy.
+
+Run from the backend directory::
+
+    python -m src.infrastructure.database.migrations status
+    python -m src.infrastructure.database.migrations upgrade --chunk-size 5000
+
+Without ``--database-url`` the configured database is used, plus every
+shard when ``TASK_REPOSITORY=sharded``.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from src.infrastructure.config import settings
+
+from ..database import Database
+from .runner import current_version, migrate, pending_migrations
+
+
+def _database_urls(args: argparse.Namespace) -> list[str]:
+    if args.database_url:
+        return args.database_url
+    urls = [settings.database_url]
+    if settings.task_repository == "sharded":
+        urls += [
+            settings.database_shard_url_template.format(shard=shard)
+            for shard in range(settings.database_shards)
+        ]
+    return urls
+
+
+async def run(args: argparse.Namespace) -> None:
+    for url in _database_urls(args):
+        database = Database(url)
+        database.engine.echo = False
+        try:
+            if args.command == "upgrade":
+                applied = await migrate(database, args.chunk_size)
+                print(f"{url}: applied {len(applied)} migration(s)")
+            version = await current_version(database)
+            pending = pending_migrations(version)
+            print(f"{url}: version {version}, {len(pending)} pending")
+            for migration in pending:
+                kind = "heavy" if migration.heavy else "light"
+                print(f"  {migration.version} {migration.name} ({kind})")
+        finally:
+            await database.close()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=("status", "upgrade"))
+    parser.add_argument("--database-url", action="append")
+    parser.add_argument("--chunk-size", type=int, default=settings.migration_chunk_size)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from ..database import Database
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One ordered schema step.
+
+    ``apply`` receives the database and a chunk size and must be safe to
+    re-run, since a crash between applying a step and recording its version
+    repeats it. Light steps finish in milliseconds and run at startup.
+    Heavy steps (backfills, index builds) touch every row and are meant to
+    be run ahead of a deploy with the migration CLI.
+    """
+
+    version: int
+    name: str
+    apply: Callable[["Database", int], Awaitable[None]]
+    heavy: bool = False
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Sequence
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import make_url
+
+from src.infrastructure.coordination import LeaderLock
+
+from ..database import Database
+from .migration import Migration
+from .steps import MIGRATIONS
+
+logger = logging.getLogger(__name__)
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+class MigrationRequiredError(RuntimeError):
+    """Raised at startup when heavy migrations have not been run yet."""
+
+
+async def _has_table(database: Database, name: str) -> bool:
+    async with database.engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": name},
+        )
+        return result.first() is not None
+
+
+async def current_version(database: Database) -> int:
+    if not await _has_table(database, schema_version.name):
+        return 0
+    async with database.engine.connect() as conn:
+        result = await conn.execute(select(func.max(schema_version.c.version)))
+        return result.scalar() or 0
+
+
+def pending_migrations(
+    version: int, migrations: Sequence[Migration] = MIGRATIONS
+) -> list[Migration]:
+    return [migration for migration in migrations if migration.version > version]
+
+
+@asynccontextmanager
+async def _migration_lock(database: Database) -> AsyncIterator[None]:
+    """Hold an exclusive lock on ``<database file>.migrate-lock``.
+
+    Workers started together would otherwise apply the same pending step
+    twice. An in-memory database cannot be shared, so it needs no lock.
+    """
+    path = make_url(database.database_url).database
+    if not path or path == ":memory:" or path.startswith("file:"):
+        yield
+        return
+    lock = LeaderLock(f"{path}.migrate-lock")
+    await asyncio.to_thread(lock.acquire)
+    try:
+        yield
+    finally:
+        lock.release()
+
+
+async def migrate(
+    database: Database,
+    chunk_size: int = 1000,
+    include_heavy: bool = True,
+    migrations: Sequence[Migration] = MIGRATIONS,
+) -> list[Migration]:
+    """Apply pending migrations in order and return the ones applied.
+
+    With ``include_heavy=False`` it stops at the first heavy step, because
+    later steps may depend on it. Concurrent runs against the same file
+    take turns, and a later one only applies what is still pending.
+    """
+    async with _migration_lock(database):
+        async with database.engine.begin() as conn:
+            await conn.run_sync(schema_version.create, checkfirst=True)
+
+        # Read under the lock: another process may have just migrated.
+        version = await current_version(database)
+        applied = []
+        for migration in pending_migrations(version, migrations):
+            if migration.heavy and not include_heavy:
+                break
+            logger.info("Applying migration %d: %s", migration.version, migration.name)
+            await migration.apply(database, chunk_size)
+            async with database.engine.begin() as conn:
+                await conn.execute(
+                    insert(schema_version).values(
+                        version=migration.version, name=migration.name
+                    )
+                )
+            applied.append(migration)
+    return applied
+
+
+async def migrate_on_startup(
+    database: Database,
+    chunk_size: int = 1000,
+    heavy_on_startup: bool = False,
+    migrations: Sequence[Migration] = MIGRATIONS,
+) -> list[Migration]:
+    """Bring the schema up to date, or fail fast if that needs the CLI.
+
+    An up-to-date database costs one version lookup. Light steps are applied
+    in place. Heavy steps only run here on a brand-new database, where there
+    are no rows to touch, or when ``heavy_on_startup`` is set.
+    """
+    version = await current_version(database)
+    if version >= migrations[-1].version:
+        return []
+
+    fresh = version == 0 and not await _has_table(database, "tasks")
+    applied = await migrate(
+        database,
+        chunk_size,
+        include_heavy=fresh or heavy_on_startup,
+        migrations=migrations,
+    )
+    remaining = pending_migrations(await current_version(database), migrations)
+    if remaining:
+        names = ", ".join(f"{m.version} ({m.name})" for m in remaining)
+        raise MigrationRequiredError(
+            f"Pending heavy migrations: {names}. Run "
+            "`python -m src.infrastructure.database.migrations upgrade` first."
+        )
+    return applied
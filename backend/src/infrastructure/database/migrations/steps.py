@@ -0,0 +1,340 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    text,
+)
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.sql import func
+
+from src.domain.entities import Priority
+
+from .migration import Migration
+
+logger = logging.getLogger(__name__)
+
+# Priority is stored by enum name; ranks order HIGH before MEDIUM before LOW.
+PRIORITY_RANK_SQL = (
+    "CASE {column} WHEN 'HIGH' THEN 3 WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 1 ELSE 0 END"
+)
+
+TASK_TABLES = ("tasks", "archived_tasks")
+
+# From version 8 priority is stored as its rank; names from older writers
+# still map to it.
+PRIORITY_CODE_SQL = (
+    "CASE {column} WHEN 'HIGH' THEN 3 WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 1 "
+    "ELSE {column} END"
+)
+
+# 'YYYY-MM-DD HH:MM:SS[.ffffff]' UTC text to epoch microseconds. Padding with
+# zeros makes a missing or short fraction read as its microseconds.
+EPOCH_MICROS_SQL = (
+    "CASE typeof({column}) WHEN 'text' THEN "
+    "CAST(strftime('%s', substr({column}, 1, 19)) AS INTEGER) * 1000000 "
+    "+ CAST(substr({column} || '000000', 21, 6) AS INTEGER) ELSE {column} END"
+)
+
+NOW_MICROS_SQL = "(CAST((julianday('now') - 2440587.5) * 86400000000 AS INTEGER))"
+
+LIST_INDEXES = {
+    "tasks": (
+        "ix_tasks_status_rank_created",
+        "is_done, is_archived, priority_rank, created_at",
+    ),
+    "archived_tasks": (
+        "ix_archived_tasks_status_rank_created",
+        "is_done, priority_rank, created_at",
+    ),
+}
+
+
+def _baseline_metadata() -> MetaData:
+    # A frozen copy of the schema as it was before migrations existed, so
+    # later changes to the ORM models never leak into version 1.
+    metadata = MetaData()
+
+    def task_columns():
+        return [
+            Column("id", String(36), primary_key=True, index=True),
+            Column("title", String(255), nullable=False),
+            Column("description", String(1000), nullable=False),
+            Column("priority", SQLEnum(Priority), nullable=False),
+            Column("is_done", Boolean, nullable=False),
+            Column("is_archived", Boolean, nullable=False),
+            Column("created_at", DateTime(timezone=True), server_default=func.now()),
+            Column("updated_at", DateTime(timezone=True), server_default=func.now()),
+        ]
+
+    for name in TASK_TABLES:
+        Table(name, metadata, *task_columns())
+    Table(
+        "idempotency_keys",
+        metadata,
+        Column("key", String(255), primary_key=True),
+        Column("request_hash", String(64), nullable=False),
+        Column("status_code", Integer, nullable=False),
+        Column("response_body", Text, nullable=False),
+        Column("expires_at", Integer, nullable=False, index=True),
+    )
+    return metadata
+
+
+async def create_baseline_schema(database, chunk_size: int) -> None:
+    # checkfirst keeps databases created by the old create_all() untouched.
+    async with database.engine.begin() as conn:
+        await conn.run_sync(_baseline_metadata().create_all, checkfirst=True)
+
+
+async def add_priority_rank(database, chunk_size: int) -> None:
+    async with database.engine.begin() as conn:
+        for table in TASK_TABLES:
+            result = await conn.execute(text(f"PRAGMA table_info({table})"))
+            if "priority_rank" not in {row[1] for row in result}:
+                await conn.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN priority_rank INTEGER")
+                )
+            # Writers that predate the column (the old release during a
+            # rolling deploy) leave it NULL; the triggers fill it in.
+            rank = PRIORITY_RANK_SQL.format(column="NEW.priority")
+            await conn.execute(
+                text(
+                    f"CREATE TRIGGER IF NOT EXISTS {table}_priority_rank_insert "
+                    f"AFTER INSERT ON {table} WHEN NEW.priority_rank IS NULL "
+                    f"BEGIN UPDATE {table} SET priority_rank = {rank} "
+                    f"WHERE id = NEW.id; END"
+                )
+            )
+            await conn.execute(
+                text(
+                    f"CREATE TRIGGER IF NOT EXISTS {table}_priority_rank_update "
+                    f"AFTER UPDATE OF priority ON {table} "
+                    f"WHEN NEW.priority_rank IS NOT {rank} "
+                    f"BEGIN UPDATE {table} SET priority_rank = {rank} "
+                    f"WHERE id = NEW.id; END"
+                )
+            )
+
+
+async def backfill_priority_rank(database, chunk_size: int) -> None:
+    # Short transactions of ``chunk_size`` rows keep the write lock free for
+    # API writers between chunks, so this can run while the service is up.
+    rank = PRIORITY_RANK_SQL.format(column="priority")
+    for table in TASK_TABLES:
+        while True:
+            async with database.engine.begin() as conn:
+                result = await conn.execute(
+                    text(
+                        f"UPDATE {table} SET priority_rank = {rank} "
+                        f"WHERE rowid IN (SELECT rowid FROM {table} "
+                        f"WHERE priority_rank IS NULL LIMIT :chunk_size)"
+                    ),
+                    {"chunk_size": chunk_size},
+                )
+            if result.rowcount < chunk_size:
+                break
+            await asyncio.sleep(0)
+
+
+async def create_list_indexes(database, chunk_size: int) -> None:
+    # SQLite has no online or chunked CREATE INDEX: each build is one
+    # statement that holds the write lock while it sorts the whole table.
+    # Like migration 8, this step is for the CLI before the deploy, not for
+    # a live database (it only runs at startup on a new, empty one).
+    async with database.engine.begin() as conn:
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_tasks_status_rank_created "
+                "ON tasks (is_done, is_archived, priority_rank, created_at)"
+            )
+        )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_archived_tasks_status_rank_created "
+                "ON archived_tasks (is_done, priority_rank, created_at)"
+            )
+        )
+
+
+async def enable_incremental_vacuum(database, chunk_size: int) -> None:
+    # auto_vacuum can only change with a full VACUUM, which rewrites the
+    # file under the write lock; afterwards maintenance can return free pages
+    # a few at a time with ``PRAGMA incremental_vacuum``.
+    async with database.engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if (await conn.exec_driver_sql("PRAGMA auto_vacuum")).scalar() == 2:
+            return
+        await conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+        await conn.exec_driver_sql("VACUUM")
+
+
+async def drop_redundant_id_indexes(database, chunk_size: int) -> None:
+    # The primary key already has its own unique index.
+    async with database.engine.begin() as conn:
+        for table in TASK_TABLES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_id"))
+
+
+async def convert_ids_to_blobs(database, chunk_size: int) -> None:
+    # SQLite never coerces a BLOB into a TEXT-affinity column, so the
+    # 16-byte ids fit the existing ``VARCHAR(36)`` columns without a table
+    # rebuild. Rows are walked by rowid in short transactions; ids that are
+    # not UUIDs are left as they are.
+    skipped = 0
+    for table in TASK_TABLES:
+        last_rowid = 0
+        while True:
+            async with database.engine.begin() as conn:
+                result = await conn.execute(
+                    text(
+                        f"SELECT rowid, id FROM {table} WHERE rowid > :last "
+                        "AND typeof(id) = 'text' ORDER BY rowid LIMIT :chunk_size"
+                    ),
+                    {"last": last_rowid, "chunk_size": chunk_size},
+                )
+                rows = result.all()
+                updates = []
+                for rowid, task_id in rows:
+                    try:
+                        updates.append({"id": UUID(task_id).bytes, "rowid": rowid})
+                    except ValueError:
+                        skipped += 1
+                if updates:
+                    await conn.execute(
+                        text(f"UPDATE {table} SET id = :id WHERE rowid = :rowid"),
+                        updates,
+                    )
+            if len(rows) < chunk_size:
+                break
+            last_rowid = rows[-1][0]
+            await asyncio.sleep(0)
+    if skipped:
+        logger.warning("Left %d task ids that are not UUIDs as text", skipped)
+
+
+async def store_integer_timestamps_and_priorities(database, chunk_size: int) -> None:
+    # Column types only change by rebuilding the table, so each table is
+    # copied into one with INTEGER timestamps and priority, converting on
+    # the way, and swapped in. Like VACUUM this holds the write lock for
+    # the whole copy, which is why it runs from the CLI.
+    columns = (
+        "id, title, description, priority, is_done, is_archived, "
+        "priority_rank, created_at, updated_at"
+    )
+    converted = ", ".join(
+        [
+            "id, title, description",
+            PRIORITY_CODE_SQL.format(column="priority"),
+            "is_done, is_archived, priority_rank",
+            EPOCH_MICROS_SQL.format(column="created_at"),
+            EPOCH_MICROS_SQL.format(column="updated_at"),
+        ]
+    )
+    async with database.engine.begin() as conn:
+        for table in TASK_TABLES:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table}_new"))
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {table}_new ("
+                    "id BLOB NOT NULL PRIMARY KEY, "
+                    "title VARCHAR(255) NOT NULL, "
+                    "description VARCHAR(1000) NOT NULL, "
+                    "priority SMALLINT NOT NULL, "
+                    "is_done BOOLEAN NOT NULL, "
+                    "is_archived BOOLEAN NOT NULL, "
+                    "priority_rank INTEGER, "
+                    f"created_at BIGINT DEFAULT {NOW_MICROS_SQL}, "
+                    f"updated_at BIGINT DEFAULT {NOW_MICROS_SQL})"
+                )
+            )
+            await conn.execute(
+                text(
+                    f"INSERT INTO {table}_new ({columns}) "
+                    f"SELECT {converted} FROM {table}"
+                )
+            )
+            await conn.execute(text(f"DROP TABLE {table}"))
+            await conn.execute(text(f"ALTER TABLE {table}_new RENAME TO {table}"))
+            name, indexed = LIST_INDEXES[table]
+            await conn.execute(text(f"CREATE INDEX {name} ON {table} ({indexed})"))
+            # Writers from older releases still get priority_rank filled in.
+            rank = PRIORITY_CODE_SQL.format(column="NEW.priority")
+            await conn.execute(
+                text(
+                    f"CREATE TRIGGER {table}_priority_rank_insert "
+                    f"AFTER INSERT ON {table} WHEN NEW.priority_rank IS NULL "
+                    f"BEGIN UPDATE {table} SET priority_rank = {rank} "
+                    f"WHERE id = NEW.id; END"
+                )
+            )
+            await conn.execute(
+                text(
+                    f"CREATE TRIGGER {table}_priority_rank_update "
+                    f"AFTER UPDATE OF priority ON {table} "
+                    f"WHEN NEW.priority_rank IS NOT {rank} "
+                    f"BEGIN UPDATE {table} SET priority_rank = {rank} "
+                    f"WHERE id = NEW.id; END"
+                )
+            )
+
+
+async def add_completed_at(database, chunk_size: int) -> None:
+    # Tasks done before this version keep NULL; readers fall back to their
+    # updated_at, which is when they were last changed.
+    async with database.engine.begin() as conn:
+        for table in TASK_TABLES:
+            result = await conn.execute(text(f"PRAGMA table_info({table})"))
+            if "completed_at" not in {row[1] for row in result}:
+                await conn.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN completed_at BIGINT")
+                )
+
+
+async def add_due_at(database, chunk_size: int) -> None:
+    # The new column is NULL everywhere, so the partial index starts empty
+    # and building it is one quick pass over the table.
+    async with database.engine.begin() as conn:
+        for table in TASK_TABLES:
+            result = await conn.execute(text(f"PRAGMA table_info({table})"))
+            if "due_at" not in {row[1] for row in result}:
+                await conn.execute(
+                    text(f"ALTER TABLE {table} ADD COLUMN due_at BIGINT")
+                )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_tasks_pending_due ON tasks "
+                "(due_at, id) WHERE is_done = 0 AND due_at IS NOT NULL"
+            )
+        )
+
+
+MIGRATIONS = (
+    Migration(1, "baseline schema", create_baseline_schema),
+    Migration(2, "add tasks.priority_rank", add_priority_rank),
+    Migration(3, "backfill tasks.priority_rank", backfill_priority_rank, heavy=True),
+    Migration(
+        4, "index task lists by status and rank", create_list_indexes, heavy=True
+    ),
+    Migration(
+        5, "enable incremental auto-vacuum", enable_incremental_vacuum, heavy=True
+    ),
+    Migration(6, "drop redundant task id indexes", drop_redundant_id_indexes),
+    Migration(7, "store task ids as 16-byte blobs", convert_ids_to_blobs, heavy=True),
+    Migration(
+        8,
+        "store timestamps and priorities as integers",
+        store_integer_timestamps_and_priorities,
+        heavy=True,
+    ),
+    Migration(9, "add completed_at to tasks", add_completed_at),
+    Migration(10, "add tasks.due_at with a pending-due index", add_due_at),
+)
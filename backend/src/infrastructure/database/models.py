@@ -1,27 +1,76 @@
-import uuid
+from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, Column, DateTime, String
-from sqlalchemy import Enum as SQLEnum
-from sqlalchemy.sql import func
+from sqlalchemy import Boolean, Column, Index, Integer, String, Text, text
 
-from ...domain.entities import Priority
+from ...domain.entities import uuid7
 from .database import Base
+from .types import BinaryUUID, EpochMicros, PriorityCode
 
 
-def generate_uuid():
-    return str(uuid.uuid4())
+def _now() -> datetime:
+    return datetime.now(UTC)
 
 
-class TaskModel(Base):
-    __tablename__ = "tasks"
-
-    id = Column(String(36), primary_key=True, default=generate_uuid, index=True)
+class TaskColumns:
+    # 16-byte, time-ordered ids; the primary key is the only index on them.
+    id = Column(BinaryUUID, primary_key=True, default=uuid7)
     title = Column(String(255), nullable=False)
     description = Column(String(1000), nullable=False)
-    priority = Column(SQLEnum(Priority), nullable=False)
+    priority = Column(PriorityCode, nullable=False)
     is_done = Column(Boolean, default=False, nullable=False)
     is_archived = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    # Numeric priority (HIGH=3 .. LOW=1) so list queries can sort by index.
+    priority_rank = Column(Integer)
+    # Epoch microseconds: list queries sort and compare plain integers.
+    created_at = Column(EpochMicros, default=_now)
+    updated_at = Column(EpochMicros, default=_now, onupdate=_now)
+    completed_at = Column(EpochMicros)
+    due_at = Column(EpochMicros)
+
+
+class TaskModel(TaskColumns, Base):
+    """Active tasks: everything that has not been archived yet."""
+
+    __tablename__ = "tasks"
+
+    __table_args__ = (
+        Index(
+            "ix_tasks_status_rank_created",
+            "is_done",
+            "is_archived",
+            "priority_rank",
+            "created_at",
+        ),
+        # Only pending tasks with a due date, in the order reminders fire.
+        Index(
+            "ix_tasks_pending_due",
+            "due_at",
+            "id",
+            sqlite_where=text("is_done = 0 AND due_at IS NOT NULL"),
+        ),
     )
+
+
+class ArchivedTaskModel(TaskColumns, Base):
+    """Cold store for archived tasks, kept out of the hot ``tasks`` table."""
+
+    __tablename__ = "archived_tasks"
+
+    __table_args__ = (
+        Index(
+            "ix_archived_tasks_status_rank_created",
+            "is_done",
+            "priority_rank",
+            "created_at",
+        ),
+    )
+
+
+class IdempotencyKeyModel(Base):
+    __tablename__ = "idempotency_keys"
+
+    key = Column(String(255), primary_key=True)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=False)
+    response_body = Column(Text, nullable=False)
+    expires_at = Column(Integer, nullable=False, index=True)
@@ -0,0 +1,117 @@
+from datetime import UTC, datetime, timedelta
+from typing import Optional, Sequence, Union
+from uuid import UUID
+
+from sqlalchemy import BigInteger, LargeBinary, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+from ...domain.entities import Priority
+
+# Stored priority codes; they equal ``priority_rank``, so HIGH sorts first
+# in descending order.
+PRIORITY_CODES = {Priority.LOW: 1, Priority.MEDIUM: 2, Priority.HIGH: 3}
+_PRIORITIES = {code: priority for priority, code in PRIORITY_CODES.items()}
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=UTC)
+
+
+class BinaryUUID(TypeDecorator):
+    """A UUID stored as its 16 raw bytes instead of 36 characters of text.
+
+    Binds accept ``UUID`` objects or their string form. Rows still holding
+    text ids (written before the ids migration ran) read back as well.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[Union[UUID, str]], dialect
+    ) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = UUID(value)
+        return value.bytes
+
+    def process_result_value(
+        self, value: Optional[Union[bytes, str]], dialect
+    ) -> Optional[UUID]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return UUID(value)
+        return UUID(bytes=value)
+
+
+class EpochMicros(TypeDecorator):
+    """A timestamp stored as integer microseconds since the Unix epoch.
+
+    Integers sort and compare without string work and read back with one
+    ``timedelta`` addition instead of parsing. Aware datetimes are converted
+    to UTC and naive ones are taken as UTC; results are naive UTC, like the
+    ``DateTime`` columns this replaces. Legacy ISO text still reads.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            delta = value - _EPOCH
+        else:
+            delta = value - _EPOCH_UTC
+        return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+    def process_result_value(
+        self, value: Optional[Union[int, str]], dialect
+    ) -> Optional[datetime]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return datetime.fromisoformat(value).replace(tzinfo=None)
+        return _EPOCH + timedelta(microseconds=value)
+
+
+def epoch_micros_to_datetimes(values: Sequence[Optional[int]]) -> list:
+    """Decode a whole column of ``EpochMicros`` values at once.
+
+    numpy converts integers to naive datetimes several times faster than a
+    Python call per value; a column holding NULLs or legacy text falls back
+    to ``EpochMicros`` value by value.
+    """
+    import numpy as np  # deferred: a heavy import that startup does not need
+
+    try:
+        micros = np.array(values, dtype=np.int64)
+    except (TypeError, ValueError, OverflowError):
+        process = EpochMicros().process_result_value
+        return [process(value, None) for value in values]
+    return micros.astype("datetime64[us]").astype(object).tolist()
+
+
+class PriorityCode(TypeDecorator):
+    """A ``Priority`` stored as its small-integer code (LOW=1 .. HIGH=3).
+
+    Legacy rows holding the enum name still read.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Priority], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return PRIORITY_CODES[value]
+
+    def process_result_value(
+        self, value: Optional[Union[int, str]], dialect
+    ) -> Optional[Priority]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return Priority[value]
+        return _PRIORITIES[value]
@@ -0,0 +1,15 @@
+from .idempotency_store import (
+    IdempotencyCache,
+    IdempotencyStore,
+    StoredResponse,
+    idempotency_cache,
+    purge_expired_keys,
+)
+
+__all__ = [
+    "IdempotencyCache",
+    "IdempotencyStore",
+    "StoredResponse",
+    "idempotency_cache",
+    "purge_expired_keys",
+]
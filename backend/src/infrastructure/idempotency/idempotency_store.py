@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import Database
+from src.infrastructure.database.models import IdempotencyKeyModel
+from src.infrastructure.observability import cache_requests_total
+
+# Status of a claimed key whose response has not been stored yet.
+PENDING_STATUS = 0
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    request_hash: str
+    status_code: int
+    body: str
+    expires_at: int
+
+    @property
+    def pending(self) -> bool:
+        return self.status_code == PENDING_STATUS
+
+
+class IdempotencyCache:
+    """Process-wide LRU in front of the idempotency table.
+
+    Stored responses never change once written, so entries only leave the
+    cache when they expire or are evicted by newer keys.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, StoredResponse] = OrderedDict()
+
+    def get(self, key: str, now: int) -> Optional[StoredResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            cache_requests_total.inc("idempotency", "miss")
+            return None
+        cache_requests_total.inc("idempotency", "hit")
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: StoredResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+idempotency_cache = IdempotencyCache(settings.idempotency_cache_size)
+
+
+class IdempotencyStore:
+    def __init__(
+        self,
+        session: AsyncSession,
+        cache: IdempotencyCache = idempotency_cache,
+        ttl_seconds: int = settings.idempotency_ttl_seconds,
+    ):
+        self.session = session
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def fingerprint(method: str, path: str, body: str = "") -> str:
+        digest = hashlib.sha256()
+        for part in (method, path, body):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> Optional[StoredResponse]:
+        now = int(time.time())
+        entry = self.cache.get(key, now)
+        if entry is not None:
+            return entry
+
+        result = await self.session.execute(
+            select(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.key == key)
+            .where(IdempotencyKeyModel.expires_at > now)
+        )
+        model = result.scalar_one_or_none()
+        if not model:
+            return None
+
+        entry = StoredResponse(
+            request_hash=model.request_hash,
+            status_code=model.status_code,
+            body=model.response_body,
+            expires_at=model.expires_at,
+        )
+        if not entry.pending:
+            self.cache.put(key, entry)
+        return entry
+
+    async def claim(self, key: str, request_hash: str) -> Optional[StoredResponse]:
+        """Reserve ``key`` for this request before it runs.
+
+        Returns ``None`` once the key is ours, or the live entry that holds
+        it. The pending row is written in the session's open transaction
+        and not committed here: a command that commits through the same
+        session commits it together with its own writes, so a request that
+        wrote nothing leaves no claim behind. A concurrent request with the
+        same key waits on SQLite's write lock and then finds the row.
+        """
+        stored = await self.get(key)
+        if stored is not None:
+            return stored
+
+        now = int(time.time())
+        values = {
+            "request_hash": request_hash,
+            "status_code": PENDING_STATUS,
+            "response_body": "",
+            "expires_at": now + self.ttl_seconds,
+        }
+        # An expired row that has not been purged yet is taken over in
+        # place; a live one belongs to another request.
+        statement = sqlite_insert(IdempotencyKeyModel).values(key=key, **values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[IdempotencyKeyModel.key],
+            set_=values,
+            where=IdempotencyKeyModel.expires_at <= now,
+        ).returning(IdempotencyKeyModel.key)
+        result = await self.session.execute(statement)
+        if result.first() is not None:
+            return None
+        return await self.get(key)
+
+    async def complete(
+        self, key: str, status_code: int, body: str
+    ) -> Optional[StoredResponse]:
+        """Store the response for a key claimed by this request."""
+        now = int(time.time())
+        result = await self.session.execute(
+            update(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.key == key)
+            .where(IdempotencyKeyModel.status_code == PENDING_STATUS)
+            .values(
+                status_code=status_code,
+                response_body=body,
+                expires_at=now + self.ttl_seconds,
+            )
+            .returning(IdempotencyKeyModel.request_hash)
+        )
+        request_hash = result.scalar_one_or_none()
+        await self.session.commit()
+        if request_hash is None:
+            return None
+        entry = StoredResponse(request_hash, status_code, body, now + self.ttl_seconds)
+        self.cache.put(key, entry)
+        return entry
+
+    async def release(self, key: str) -> None:
+        """Give up a claim after the command was refused without writing."""
+        await self.session.rollback()
+        await self.session.execute(
+            delete(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.key == key)
+            .where(IdempotencyKeyModel.status_code == PENDING_STATUS)
+        )
+        await self.session.commit()
+
+    async def purge_expired(self, batch_size: int) -> int:
+        now = int(time.time())
+        expired_keys = (
+            select(IdempotencyKeyModel.key)
+            .where(IdempotencyKeyModel.expires_at <= now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            delete(IdempotencyKeyModel).where(IdempotencyKeyModel.key.in_(expired_keys))
+        )
+        await self.session.commit()
+        return result.rowcount or 0
+
+
+async def purge_expired_keys(
+    database: Database,
+    batch_size: int = settings.idempotency_purge_batch_size,
+) -> int:
+    """Delete expired keys one short transaction at a time.
+
+    Each batch commits separately and yields to the event loop, so writers
+    are never blocked behind one large DELETE.
+    """
+    purged = 0
+    while True:
+        async with database.async_session() as session:
+            deleted = await IdempotencyStore(session).purge_expired(batch_size)
+        purged += deleted
+        if deleted < batch_size:
+            return purged
+        await asyncio.sleep(0)
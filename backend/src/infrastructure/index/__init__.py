@@ -0,0 +1,59 @@
+"""Columnar task index.
+
+NumPy is only imported when the index is first used, so processes running
+with ``TASK_INDEX_ENABLED`` off never pay for it at startup. With more than
+one worker, ``task_index`` is wrapped in a ``VersionedTaskIndex`` sharing
+the ``CACHE_VERSION_FILE`` change log.
+"""
+
+import importlib
+
+_LAZY = {
+    "ColumnarTaskIndex": ".columnar_task_index",
+    "VersionedTaskIndex": ".versioned_task_index",
+    "load_task_index": ".loader",
+    "reload_task_index": ".loader",
+}
+
+__all__ = [
+    "ColumnarTaskIndex",
+    "VersionedTaskIndex",
+    "task_index",
+    "load_task_index",
+    "reload_task_index",
+]
+
+
+def _create_task_index():
+    from src.infrastructure.config import settings
+
+    from .columnar_task_index import ColumnarTaskIndex
+
+    if settings.workers <= 1:
+        return ColumnarTaskIndex()
+
+    from src.infrastructure.coordination import SharedChangeLog
+
+    from .loader import reload_task_index
+    from .versioned_task_index import CHANGE_RECORD, VersionedTaskIndex
+
+    return VersionedTaskIndex(
+        ColumnarTaskIndex(),
+        SharedChangeLog(
+            settings.cache_version_file,
+            CHANGE_RECORD.size,
+            settings.cache_change_log_size,
+        ),
+        reload_task_index,
+    )
+
+
+def __getattr__(name: str):
+    if name == "task_index":
+        index = globals()["task_index"] = _create_task_index()
+        return index
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,213 @@
+from datetime import UTC, datetime
+from typing import Iterable, Optional, Union
+from uuid import UUID
+
+import numpy as np
+
+from src.domain.entities import Priority, Task, TaskView
+from src.domain.repositories import TaskIndex
+
+PRIORITY_RANK = {Priority.LOW: 1, Priority.MEDIUM: 2, Priority.HIGH: 3}
+PRIORITY_BY_RANK = {rank: priority for priority, rank in PRIORITY_RANK.items()}
+
+LIVE = 1
+DONE = 2
+ARCHIVED = 4
+
+# Top-k sorts on one int64 key: priority rank above the creation time.
+_RANK_SHIFT = 56
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# What one row stores: priority rank, status bits, created_at and
+# updated_at micros.
+RowValues = tuple[int, int, int, int]
+
+
+def _epoch_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return 0
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class ColumnarTaskIndex(TaskIndex):
+    """Column-oriented in-memory copy of the task table.
+
+    Each task occupies one row across four NumPy columns (priority rank,
+    status bits, and creation and update times in epoch microseconds), with
+    a dict mapping task ids to rows. Counts, filters and top-k are answered
+    with vectorized operations over the columns; freed rows are reused by
+    later inserts. A row is never overwritten by values updated earlier than
+    the ones it holds, so changes may arrive out of order.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._priority = np.zeros(capacity, dtype=np.int8)
+        self._status = np.zeros(capacity, dtype=np.uint8)
+        self._created = np.zeros(capacity, dtype=np.int64)
+        self._updated = np.zeros(capacity, dtype=np.int64)
+        self._ids: list[Optional[UUID]] = [None] * capacity
+        self._rows: dict[UUID, int] = {}
+        self._free: list[int] = []
+        self._size = 0
+        self._ready = False
+        # Changes seen between begin_load() and load(), replayed afterwards.
+        self._changes: Optional[list[tuple[UUID, Optional[RowValues]]]] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def begin_load(self) -> None:
+        """Start buffering changes until the following ``load`` call."""
+        self._changes = []
+
+    def load(self, tasks: Iterable[Union[Task, TaskView]]) -> None:
+        tasks = list(tasks)
+        capacity = max(len(tasks) * 2, 1024)
+        self._priority = np.fromiter(
+            (PRIORITY_RANK[task.priority] for task in tasks),
+            dtype=np.int8,
+            count=len(tasks),
+        )
+        self._status = np.fromiter(
+            (self._status_bits(task) for task in tasks),
+            dtype=np.uint8,
+            count=len(tasks),
+        )
+        self._created = np.fromiter(
+            (_epoch_micros(task.created_at) for task in tasks),
+            dtype=np.int64,
+            count=len(tasks),
+        )
+        self._updated = np.fromiter(
+            (_epoch_micros(task.updated_at) for task in tasks),
+            dtype=np.int64,
+            count=len(tasks),
+        )
+        self._ids = [task.id for task in tasks]
+        self._rows = {task_id: row for row, task_id in enumerate(self._ids)}
+        self._free = []
+        self._size = len(tasks)
+        self._grow(capacity)
+        changes, self._changes = self._changes or [], None
+        for task_id, values in changes:
+            if values is None:
+                self.remove(task_id)
+            else:
+                self.set_row(task_id, values)
+        self._ready = True
+
+    @classmethod
+    def row_values(cls, task: Union[Task, TaskView]) -> RowValues:
+        return (
+            PRIORITY_RANK[task.priority],
+            cls._status_bits(task),
+            _epoch_micros(task.created_at),
+            _epoch_micros(task.updated_at),
+        )
+
+    def task_saved(self, task: Task) -> None:
+        self.set_row(task.id, self.row_values(task))
+
+    def set_row(self, task_id: UUID, values: RowValues) -> None:
+        """Insert or overwrite the row of ``task_id`` with ``row_values`` output."""
+        if self._changes is not None:
+            self._changes.append((task_id, values))
+            return
+        row = self._rows.get(task_id)
+        if row is None:
+            row = self._allocate()
+            self._rows[task_id] = row
+            self._ids[row] = task_id
+        elif self._updated[row] > values[3]:
+            return
+        (
+            self._priority[row],
+            self._status[row],
+            self._created[row],
+            self._updated[row],
+        ) = values
+
+    def remove(self, task_id: UUID) -> bool:
+        if self._changes is not None:
+            self._changes.append((task_id, None))
+            return task_id in self._rows
+        row = self._rows.pop(task_id, None)
+        if row is None:
+            return False
+        self._status[row] = 0
+        self._ids[row] = None
+        self._free.append(row)
+        return True
+
+    def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        status = self._status[: self._size]
+        return int(np.count_nonzero(status == self._wanted(is_done, is_archived)))
+
+    def count_pending_by_priority(self) -> dict[Priority, int]:
+        live = slice(0, self._size)
+        pending = (self._status[live] & (LIVE | DONE)) == LIVE
+        counts = np.bincount(self._priority[live][pending], minlength=4)
+        return {
+            priority: int(counts[rank]) for rank, priority in PRIORITY_BY_RANK.items()
+        }
+
+    def filter(self, is_done: bool, is_archived: bool) -> list[UUID]:
+        rows = np.flatnonzero(
+            self._status[: self._size] == self._wanted(is_done, is_archived)
+        )
+        return self._ids_in_list_order(rows)
+
+    def top_pending(self, limit: int) -> list[UUID]:
+        if limit <= 0:
+            return []
+        rows = np.flatnonzero(self._status[: self._size] == LIVE)
+        if len(rows) > limit:
+            keys = self._sort_keys(rows)
+            rows = rows[np.argpartition(-keys, limit - 1)[:limit]]
+        return self._ids_in_list_order(rows)
+
+    def _sort_keys(self, rows: np.ndarray) -> np.ndarray:
+        ranks = self._priority[rows].astype(np.int64)
+        return (ranks << _RANK_SHIFT) + self._created[rows]
+
+    def _ids_in_list_order(self, rows: np.ndarray) -> list[UUID]:
+        ordered = rows[np.argsort(-self._sort_keys(rows), kind="stable")]
+        ids = self._ids
+        return [ids[row] for row in ordered.tolist()]
+
+    @staticmethod
+    def _wanted(is_done: bool, is_archived: bool) -> int:
+        return LIVE | (DONE if is_done else 0) | (ARCHIVED if is_archived else 0)
+
+    @staticmethod
+    def _status_bits(task: Union[Task, TaskView]) -> int:
+        return (
+            LIVE | (DONE if task.is_done else 0) | (ARCHIVED if task.is_archived else 0)
+        )
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size == len(self._priority):
+            self._grow(max(self._size * 2, 1024))
+        row = self._size
+        self._size += 1
+        return row
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self._priority)
+        if extra <= 0:
+            return
+        self._priority = np.concatenate([self._priority, np.zeros(extra, np.int8)])
+        self._status = np.concatenate([self._status, np.zeros(extra, np.uint8)])
+        self._created = np.concatenate([self._created, np.zeros(extra, np.int64)])
+        self._updated = np.concatenate([self._updated, np.zeros(extra, np.int64)])
+        self._ids.extend([None] * extra)
@@ -0,0 +1,28 @@
+from typing import Union
+
+from src.domain.repositories import TaskRepository
+from src.infrastructure.database import database
+from src.infrastructure.repositories import task_repository_scope
+
+from .columnar_task_index import ColumnarTaskIndex
+from .versioned_task_index import VersionedTaskIndex
+
+
+async def load_task_index(
+    index: Union[ColumnarTaskIndex, VersionedTaskIndex], repository: TaskRepository
+) -> int:
+    """Build ``index`` from every stored task, archived ones included.
+
+    Safe to run while the API is serving: changes saved during the load are
+    buffered by the index and replayed on top of the snapshot.
+    """
+    index.begin_load()
+    tasks = await repository.get_all(include_archived=True)
+    index.load(tasks)
+    return len(tasks)
+
+
+async def reload_task_index(index: VersionedTaskIndex) -> int:
+    """Load ``index`` again through a fresh session of the configured backend."""
+    async with task_repository_scope(database) as repository:
+        return await load_task_index(index, repository)
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import struct
+from typing import Awaitable, Callable, Iterable, Optional, Union
+from uuid import UUID
+
+from src.domain.entities import Priority, Task, TaskView
+from src.domain.repositories import TaskIndex
+from src.infrastructure.coordination import SharedChangeLog
+
+from .columnar_task_index import ColumnarTaskIndex
+
+logger = logging.getLogger(__name__)
+
+# Task id, priority rank (0 for a removal), status bits, created_at and
+# updated_at micros.
+CHANGE_RECORD = struct.Struct("<16sbBqq")
+
+
+class VersionedTaskIndex(TaskIndex):
+    """Keeps one worker's task index coherent with writes made by other workers.
+
+    Every local change is appended to a change log shared by all workers,
+    as the row values the index stores. A read compares the log's version
+    with the one the index has applied, which costs one memory load. When
+    other workers have written since, their records are applied as deltas,
+    ``O(changes)``. Workers append after their commit, so two updates of
+    one task can reach the log out of commit order; the record carries the
+    task's ``updated_at`` and the index keeps whichever row is newer. Only
+    when the log has already overwritten some of them
+    does the index report itself not ready (so handlers fall back to the
+    database) and reload in the background.
+    """
+
+    def __init__(
+        self,
+        index: ColumnarTaskIndex,
+        log: SharedChangeLog,
+        reload: Callable[["VersionedTaskIndex"], Awaitable[int]],
+    ):
+        self.index = index
+        self.log = log
+        self.reload = reload
+        self._version: Optional[int] = None
+        self._loading_version: Optional[int] = None
+        self._reload_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        if self.log.read() != self._version and not self._catch_up():
+            self._schedule_reload()
+            return False
+        return self.index.is_ready
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def begin_load(self) -> None:
+        self._loading_version = self.log.read()
+        self.index.begin_load()
+
+    def load(self, tasks: Iterable[Union[Task, TaskView]]) -> None:
+        self.index.load(tasks)
+        self._version, self._loading_version = self._loading_version, None
+
+    def task_saved(self, task: Task) -> None:
+        values = self.index.row_values(task)
+        self.index.set_row(task.id, values)
+        self._local_change(CHANGE_RECORD.pack(task.id.bytes, *values))
+
+    def remove(self, task_id: UUID) -> bool:
+        removed = self.index.remove(task_id)
+        self._local_change(CHANGE_RECORD.pack(task_id.bytes, 0, 0, 0, 0))
+        return removed
+
+    def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        return self.index.count_by_status(is_done, is_archived)
+
+    def count_pending_by_priority(self) -> dict[Priority, int]:
+        return self.index.count_pending_by_priority()
+
+    def top_pending(self, limit: int) -> list[UUID]:
+        return self.index.top_pending(limit)
+
+    def _local_change(self, record: bytes) -> None:
+        # The index already holds this change, so it stays current unless
+        # another worker appended in between.
+        version = self.log.append(record)
+        if self._loading_version is not None:
+            if version == self._loading_version + 1:
+                self._loading_version = version
+        elif self._version is not None and version == self._version + 1:
+            self._version = version
+
+    def _catch_up(self) -> bool:
+        """Apply other workers' changes; ``False`` if a reload is needed."""
+        if self._version is None or self._loading_version is not None:
+            return False
+        changes = self.log.since(self._version)
+        if changes is None:
+            return False
+        version, records = changes
+        # Our own records among them are already applied; applying them
+        # again, or a record older than the row, leaves the row as it is.
+        for record in records:
+            task_id, rank, *values = CHANGE_RECORD.unpack(record)
+            if rank:
+                self.index.set_row(UUID(bytes=task_id), (rank, *values))
+            else:
+                self.index.remove(UUID(bytes=task_id))
+        self._version = version
+        return True
+
+    def _schedule_reload(self) -> None:
+        if self._loading_version is not None:
+            return
+        if self._reload_task is not None and not self._reload_task.done():
+            return
+        self._reload_task = asyncio.get_running_loop().create_task(self._reload())
+
+    async def _reload(self) -> None:
+        try:
+            await self.reload(self)
+        except Exception:
+            self._loading_version = None
+            logger.exception("Failed to reload the task index")
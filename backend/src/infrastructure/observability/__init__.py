@@ -0,0 +1,69 @@
+from .engine_events import instrument_engine
+from .metrics import (
+    CallbackGauge,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    admission_queued_requests,
+    admission_rejections_total,
+    cache_requests_total,
+    db_maintenance_duration_seconds,
+    db_maintenance_last_run_timestamp_seconds,
+    db_pool_checkout_wait_seconds,
+    db_pool_connections_in_use,
+    db_statements_total,
+    db_transactions_total,
+    handler_duration_seconds,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    registry,
+    reminders_fired_total,
+    reminders_scheduled,
+)
+from .profiling import ProfileInfo, ProfileStore, profile_store
+from .sql_budget import QueryStats, current_query_stats, track_queries
+from .tracing import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    Span,
+    Trace,
+    Tracer,
+    tracer,
+)
+
+__all__ = [
+    "CallbackGauge",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "InMemorySpanExporter",
+    "JsonlSpanExporter",
+    "MetricsRegistry",
+    "ProfileInfo",
+    "ProfileStore",
+    "QueryStats",
+    "Span",
+    "Trace",
+    "Tracer",
+    "admission_queued_requests",
+    "admission_rejections_total",
+    "cache_requests_total",
+    "current_query_stats",
+    "db_maintenance_duration_seconds",
+    "db_maintenance_last_run_timestamp_seconds",
+    "db_pool_checkout_wait_seconds",
+    "db_pool_connections_in_use",
+    "db_statements_total",
+    "db_transactions_total",
+    "handler_duration_seconds",
+    "http_request_duration_seconds",
+    "http_requests_in_flight",
+    "instrument_engine",
+    "profile_store",
+    "registry",
+    "reminders_fired_total",
+    "reminders_scheduled",
+    "track_queries",
+    "tracer",
+]
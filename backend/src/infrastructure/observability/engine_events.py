@@ -0,0 +1,130 @@
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from .metrics import (
+    db_pool_checkout_wait_seconds,
+    db_pool_connections_in_use,
+    db_statements_total,
+    db_transactions_total,
+)
+from .sql_budget import current_query_stats
+from .tracing import tracer
+
+_KNOWN_STATEMENTS = frozenset(
+    {"SELECT", "INSERT", "UPDATE", "DELETE", "PRAGMA", "CREATE", "DROP", "WITH"}
+)
+
+# When the current session transaction started asking for a connection.
+_checkout_requested: ContextVar[Optional[float]] = ContextVar(
+    "checkout_requested", default=None
+)
+
+
+def _statement_keyword(statement: str) -> str:
+    # The first word, looked for in a short prefix so long statements are
+    # not copied.
+    head = statement.lstrip()[:7].split(None, 1)
+    keyword = head[0].upper() if head else ""
+    return keyword if keyword in _KNOWN_STATEMENTS else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    keyword = _statement_keyword(statement)
+    db_statements_total.inc(keyword)
+    if current_query_stats() is not None:
+        conn.info["query_started"] = perf_counter()
+    if tracer.current_trace() is not None:
+        conn.info["trace_span"] = tracer.start_span(
+            "db.statement", statement=keyword, sql=statement[:500]
+        )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = conn.info.pop("trace_span", None)
+    if span is not None:
+        tracer.end_span(span)
+    stats = current_query_stats()
+    if stats is None:
+        return
+    started = conn.info.pop("query_started", None)
+    elapsed = perf_counter() - started if started is not None else 0.0
+    # SELECTs report -1; their rows are counted by _on_orm_execute.
+    stats.record(statement, max(cursor.rowcount, 0), elapsed)
+
+
+def _on_orm_execute(state):
+    stats = current_query_stats()
+    if stats is None or state.is_insert or state.is_update or state.is_delete:
+        return None
+    result = state.invoke_statement()
+    if not getattr(result, "returns_rows", True):
+        return result
+    # Freezing buffers the rows, which the aiosqlite adapter has done anyway.
+    frozen = result.freeze()
+    stats.rows += len(frozen.data)
+    return frozen()
+
+
+def _on_commit(conn):
+    db_transactions_total.inc("commit")
+
+
+def _on_rollback(conn):
+    db_transactions_total.inc("rollback")
+
+
+def _on_transaction_create(session, transaction):
+    if transaction.parent is None:
+        _checkout_requested.set(perf_counter())
+
+
+def _on_transaction_end(session, transaction):
+    if transaction.parent is None:
+        _checkout_requested.set(None)
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    db_pool_connections_in_use.inc()
+    requested = _checkout_requested.get()
+    if requested is not None:
+        _checkout_requested.set(None)
+        db_pool_checkout_wait_seconds.observe(perf_counter() - requested)
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    db_pool_connections_in_use.dec()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Feed statement, transaction and pool metrics from one engine.
+
+    Listeners only bump in-process counters, so they add well under a
+    microsecond to each statement. Per-statement timing and row counts are
+    only taken while ``track_queries`` is active.
+
+    Pools have no event for a checkout that starts waiting, so the wait is
+    timed from the session transaction that asks for a connection to the
+    pool's ``checkout`` event. Session listeners are registered once, for
+    every ``Session``.
+    """
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "commit", _on_commit)
+    event.listen(sync_engine, "rollback", _on_rollback)
+
+    pool = sync_engine.pool
+    event.listen(pool, "checkout", _on_checkout)
+    event.listen(pool, "checkin", _on_checkin)
+
+    if not event.contains(Session, "do_orm_execute", _on_orm_execute):
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
+        event.listen(Session, "after_transaction_create", _on_transaction_create)
+        event.listen(Session, "after_transaction_end", _on_transaction_end)
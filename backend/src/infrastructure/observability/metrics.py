@@ -0,0 +1,338 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Iterator, Optional
+
+# Seconds; tuned for an API whose requests mostly finish within a few ms.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+    @abstractmethod
+    def _samples(self) -> list[str]: ...
+
+    @abstractmethod
+    def reset(self) -> None: ...
+
+
+class Counter(Metric):
+    """Monotonic count per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def values(self) -> dict[LabelValues, float]:
+        """A copy of the current value of every label set."""
+        return dict(self._values)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+    def reset(self) -> None:
+        self._values.clear()
+
+
+class Gauge(Counter):
+    """Current value per label set; may go up and down."""
+
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+
+class CallbackGauge(Metric):
+    """Gauge whose samples are computed from other state at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], dict[LabelValues, float]],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(value)}"
+            for labels, value in sorted(self.callback().items())
+        ]
+
+    def reset(self) -> None:
+        pass
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    """Fixed-bucket latency histogram per label set.
+
+    ``observe`` is one ``bisect`` plus three increments; cumulative bucket
+    counts are only computed when ``/metrics`` is scraped.
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - start, *labels)
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series.count if series else 0
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), series.counts):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_format_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_number(series.sum)}")
+            lines.append(f"{self.name}_count{label_text} {series.count}")
+        return lines
+
+    def reset(self) -> None:
+        self._series.clear()
+
+
+class MetricsRegistry:
+    """Process-local collection of metrics rendered in Prometheus text format."""
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+registry = MetricsRegistry()
+
+http_requests_in_flight = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being served.")
+)
+http_request_duration_seconds = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method, route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+handler_duration_seconds = registry.register(
+    Histogram(
+        "handler_duration_seconds",
+        "Command and query handler latency.",
+        ("handler", "outcome"),
+    )
+)
+db_statements_total = registry.register(
+    Counter(
+        "db_statements_total",
+        "SQL statements executed, by leading keyword.",
+        ("statement",),
+    )
+)
+db_transactions_total = registry.register(
+    Counter(
+        "db_transactions_total",
+        "Database transactions finished, by outcome.",
+        ("outcome",),
+    )
+)
+db_pool_checkout_wait_seconds = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled database connection.",
+    )
+)
+db_pool_connections_in_use = registry.register(
+    Gauge("db_pool_connections_in_use", "Pooled connections currently checked out.")
+)
+db_maintenance_duration_seconds = registry.register(
+    Gauge(
+        "db_maintenance_duration_seconds",
+        "Duration of the last database maintenance run, by step.",
+        ("step",),
+    )
+)
+db_maintenance_last_run_timestamp_seconds = registry.register(
+    Gauge(
+        "db_maintenance_last_run_timestamp_seconds",
+        "Unix time the last database maintenance run started, by step.",
+        ("step",),
+    )
+)
+admission_rejections_total = registry.register(
+    Counter(
+        "admission_rejections_total",
+        "Requests shed with 503 by route class and reason.",
+        ("route_class", "reason"),
+    )
+)
+admission_queued_requests = registry.register(
+    Gauge(
+        "admission_queued_requests",
+        "Requests waiting for a concurrency slot, by route class.",
+        ("route_class",),
+    )
+)
+reminders_fired_total = registry.register(
+    Counter("reminders_fired_total", "Task due-date reminders fired.")
+)
+reminders_scheduled = registry.register(
+    Gauge(
+        "reminders_scheduled",
+        "Reminders loaded into the scheduler's heap, stale entries included.",
+    )
+)
+cache_requests_total = registry.register(
+    Counter(
+        "cache_requests_total",
+        "Cache lookups by cache and result (hit or miss).",
+        ("cache", "result"),
+    )
+)
+
+
+def _cache_hit_ratios() -> dict[LabelValues, float]:
+    totals: dict[str, list[float]] = {}
+    for (cache, result), value in cache_requests_total.values().items():
+        hits_and_lookups = totals.setdefault(cache, [0, 0])
+        hits_and_lookups[1] += value
+        if result == "hit":
+            hits_and_lookups[0] += value
+    return {
+        (cache,): hits / lookups for cache, (hits, lookups) in totals.items() if lookups
+    }
+
+
+cache_hit_ratio = registry.register(
+    CallbackGauge(
+        "cache_hit_ratio",
+        "Share of cache lookups answered from the cache since start-up.",
+        ("cache",),
+        _cache_hit_ratios,
+    )
+)
@@ -0,0 +1,80 @@
+import cProfile
+import io
+import pstats
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.infrastructure.config import settings
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9]+")
+_NAME = re.compile(r"^[A-Za-z0-9_-]+\.prof$")
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileInfo:
+    name: str
+    size_bytes: int
+    created_at: float
+
+
+class ProfileStore:
+    """Bounded ring of cProfile dumps on disk.
+
+    Files are named ``<epoch µs>-<method>-<path>.prof`` so sorting by name
+    sorts by age; once more than ``max_files`` exist the oldest are removed.
+    The dumps are standard ``pstats`` files, readable by ``snakeviz`` or
+    ``flameprof`` for a flame view.
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def save(self, profile: cProfile.Profile, method: str, path: str) -> ProfileInfo:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        slug = _UNSAFE.sub("_", path).strip("_") or "root"
+        name = f"{time.time_ns() // 1_000}-{method}-{slug[:80]}.prof"
+        target = self.directory / name
+        profile.dump_stats(target)
+        self._trim()
+        return self._info(target)
+
+    def profiles(self) -> list[ProfileInfo]:
+        if not self.directory.exists():
+            return []
+        return [self._info(path) for path in reversed(self._files())]
+
+    def path_for(self, name: str) -> Optional[Path]:
+        # Names come from URLs; only plain file names in the ring are served.
+        if not _NAME.match(name):
+            return None
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def summary(self, name: str, limit: int = 50) -> Optional[str]:
+        path = self.path_for(name)
+        if path is None:
+            return None
+        output = io.StringIO()
+        stats = pstats.Stats(str(path), stream=output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return output.getvalue()
+
+    def _files(self) -> list[Path]:
+        return sorted(self.directory.glob("*.prof"))
+
+    def _trim(self) -> None:
+        files = self._files()
+        for path in files[: max(len(files) - self.max_files, 0)]:
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _info(path: Path) -> ProfileInfo:
+        stat = path.stat()
+        return ProfileInfo(path.name, stat.st_size, stat.st_mtime)
+
+
+profile_store = ProfileStore(settings.profile_dir, settings.profile_ring_size)
@@ -0,0 +1,57 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """SQL work done while a ``track_queries`` block was active."""
+
+    statements: int = 0
+    rows: int = 0
+    db_seconds: float = 0.0
+    by_statement: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, rows: int, seconds: float) -> None:
+        self.statements += 1
+        self.rows += rows
+        self.db_seconds += seconds
+        self.by_statement[statement] += 1
+
+    def repeated(self, limit: int) -> list[tuple[str, int]]:
+        """Statements run more than ``limit`` times: the N+1 signature."""
+        return [
+            (statement, count)
+            for statement, count in self.by_statement.most_common()
+            if count > limit
+        ]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statement, row and timing totals for the enclosed block.
+
+    Blocks nest: when one ends, its totals are added to the enclosing
+    block, so a test can wrap several requests that each track their own.
+    """
+    stats = QueryStats()
+    parent = _current.get()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        if parent is not None:
+            parent.statements += stats.statements
+            parent.rows += stats.rows
+            parent.db_seconds += stats.db_seconds
+            parent.by_statement.update(stats.by_statement)
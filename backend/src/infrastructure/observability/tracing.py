@@ -0,0 +1,228 @@
+import json
+import logging
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional, Protocol
+
+from src.infrastructure.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    start_ns: int
+    duration_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Trace:
+    trace_id: str
+    root: Span
+    spans: list[Span] = field(default_factory=list)
+    # Spans left open for whoever sends the response to close.
+    open_spans: list[Span] = field(default_factory=list)
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+    def flush(self) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keeps the most recent finished spans in memory, e.g. for tests."""
+
+    def __init__(self, max_spans: int = 10_000):
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+    def flush(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class JsonlSpanExporter:
+    """Appends one JSON object per span to a local file, a trace at a time.
+
+    ``export`` only queues the spans; a daemon thread, started on the first
+    export, serializes and appends them, so the event loop never waits on
+    the file. When ``max_pending`` traces are already queued, new ones are
+    dropped rather than blocking. ``flush`` waits until the queue is written.
+    """
+
+    def __init__(self, path: str, max_pending: int = 1024):
+        self.path = Path(path)
+        self.dropped = 0
+        self._queue: queue.Queue[list[Span]] = queue.Queue(max_pending)
+        self._lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+
+    def export(self, spans: list[Span]) -> None:
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._write, name="span-exporter", daemon=True
+                    )
+                    self._writer.start()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def _write(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                lines = "".join(
+                    json.dumps(asdict(span), default=str) + "\n"
+                    for spans in batch
+                    for span in spans
+                )
+                with self.path.open("a", encoding="utf-8") as file:
+                    file.write(lines)
+            except OSError:
+                logger.exception("Could not write spans to %s", self.path)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Tracer:
+    """Minimal span tracer with head sampling.
+
+    ``trace`` opens the root span of a request and decides once whether it
+    is sampled. Inside an unsampled or missing trace, ``span`` is a no-op,
+    so instrumented code costs one context variable lookup. The spans of a
+    sampled trace are handed to the exporter together when the root ends.
+    """
+
+    def __init__(self, exporter: SpanExporter, sample_rate: float):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def flush(self) -> None:
+        """Wait until every exported span has been written."""
+        self.exporter.flush()
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    @staticmethod
+    def new_trace_id() -> str:
+        return _new_id(128)
+
+    @staticmethod
+    def current_trace() -> Optional[Trace]:
+        return _current_trace.get()
+
+    @contextmanager
+    def trace(
+        self, name: str, trace_id: Optional[str] = None, **attributes
+    ) -> Iterator[Optional[Trace]]:
+        if random.random() >= self.sample_rate:
+            yield None
+            return
+        root = Span(
+            trace_id or self.new_trace_id(),
+            _new_id(64),
+            None,
+            name,
+            time.time_ns(),
+            attributes=attributes,
+        )
+        trace = Trace(root.trace_id, root, [root])
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(root)
+        try:
+            yield trace
+        finally:
+            self.end_span(root)
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            self.exporter.export(trace.spans)
+
+    def start_span(self, name: str, **attributes) -> Optional[Span]:
+        """Open a child of the current span without making it current."""
+        trace = _current_trace.get()
+        if trace is None:
+            return None
+        parent = _current_span.get()
+        span = Span(
+            trace.trace_id,
+            _new_id(64),
+            parent.span_id if parent else None,
+            name,
+            time.time_ns(),
+            attributes=attributes,
+        )
+        trace.spans.append(span)
+        return span
+
+    @staticmethod
+    def end_span(span: Span, end_ns: Optional[int] = None) -> None:
+        span.duration_ns = (end_ns or time.time_ns()) - span.start_ns
+
+    def record_span(self, name: str, start_ns: int, **attributes) -> Optional[Span]:
+        """Add an already finished child span that started at ``start_ns``."""
+        span = self.start_span(name, **attributes)
+        if span is not None:
+            span.start_ns = start_ns
+            self.end_span(span)
+        return span
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Optional[Span]]:
+        span = self.start_span(name, **attributes)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+
+def _exporter_from_settings() -> SpanExporter:
+    if settings.trace_exporter == "memory":
+        return InMemorySpanExporter()
+    return JsonlSpanExporter(settings.trace_file)
+
+
+tracer = Tracer(_exporter_from_settings(), settings.trace_sample_rate)
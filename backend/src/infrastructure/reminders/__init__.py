@@ -0,0 +1,48 @@
+"""Due-date reminders for the SQLite task store.
+
+With more than one worker, ``reminder_scheduler`` runs in whichever worker
+holds ``REMINDER_LOCK_FILE`` and learns of the others' writes through the
+``REMINDER_VERSION_FILE`` change log.
+"""
+
+from .scheduler import Reminder, ReminderScheduler, log_reminder
+
+__all__ = [
+    "Reminder",
+    "ReminderScheduler",
+    "log_reminder",
+    "reminder_scheduler",
+]
+
+
+def _create_reminder_scheduler() -> ReminderScheduler:
+    from src.infrastructure.config import settings
+    from src.infrastructure.database import database
+
+    log = leader_lock = None
+    if settings.workers > 1:
+        from src.infrastructure.coordination import LeaderLock, SharedChangeLog
+
+        from .scheduler import CHANGE_RECORD
+
+        log = SharedChangeLog(
+            settings.reminder_version_file,
+            CHANGE_RECORD.size,
+            settings.reminder_change_log_size,
+        )
+        leader_lock = LeaderLock(settings.reminder_lock_file)
+    return ReminderScheduler(
+        database,
+        window_seconds=settings.reminder_window_seconds,
+        batch_size=settings.reminder_batch_size,
+        lookback_seconds=settings.reminder_lookback_seconds,
+        log=log,
+        leader_lock=leader_lock,
+    )
+
+
+def __getattr__(name: str):
+    if name == "reminder_scheduler":
+        scheduler = globals()["reminder_scheduler"] = _create_reminder_scheduler()
+        return scheduler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,327 @@
+import asyncio
+import contextlib
+import heapq
+import logging
+import struct
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import bindparam, text
+
+from src.domain.entities import Task
+from src.domain.repositories import TaskChangeListener
+from src.infrastructure.coordination import LeaderLock, SharedChangeLog
+from src.infrastructure.database import Database
+from src.infrastructure.database.types import EpochMicros
+from src.infrastructure.observability import (
+    reminders_fired_total,
+    reminders_scheduled,
+)
+
+logger = logging.getLogger(__name__)
+
+SECOND_MICROS = 1_000_000
+RETRY_SECONDS = 10.0
+
+# Sorts after every id, so a cursor of (t, _MAX_ID) means "due after t".
+_MAX_ID = b"\xff" * 16
+
+# Keyset page over the partial index ix_tasks_pending_due, in firing order.
+_WINDOW_SQL = text(
+    "SELECT id, title, due_at FROM tasks "
+    "WHERE is_done = 0 AND due_at IS NOT NULL "
+    "AND (due_at, id) > (:after_due, :after_id) AND due_at <= :until "
+    "ORDER BY due_at, id LIMIT :limit"
+)
+
+# The current state of tasks another worker changed, by primary key.
+_CHANGED_SQL = text(
+    "SELECT id, title, due_at FROM tasks "
+    "WHERE is_done = 0 AND due_at IS NOT NULL AND id IN :ids"
+).bindparams(bindparam("ids", expanding=True))
+
+# Task id, whether it is pending with a due date, and that due date.
+CHANGE_RECORD = struct.Struct("<16s?q")
+
+_micros = EpochMicros().process_bind_param
+_datetime = EpochMicros().process_result_value
+
+
+@dataclass(frozen=True, slots=True)
+class Reminder:
+    task_id: UUID
+    title: str
+    due_at: datetime
+
+
+def log_reminder(reminder: Reminder) -> None:
+    logger.info(
+        "Task %s (%s) is due at %s",
+        reminder.task_id,
+        reminder.title,
+        reminder.due_at.isoformat(),
+    )
+
+
+class ReminderScheduler(TaskChangeListener):
+    """Fires a reminder when a pending task reaches its ``due_at``.
+
+    Only the next ``window_seconds`` of due tasks are held in memory: a
+    min-heap of ``(due_at, id)`` plus a dict of the current due time and
+    title per task. The window is read from SQLite ``batch_size`` rows at a
+    time with a keyset query over the partial ``ix_tasks_pending_due``
+    index, and read again only when the loaded horizon gets within half a
+    window of now, so the table is never scanned.
+
+    Command handlers report every saved task. A change inside the loaded
+    horizon updates the dict and pushes a heap entry, ``O(log n)``; the old
+    entry is skipped when it surfaces. Done, archived and undated tasks
+    leave the dict, and changes beyond the horizon are picked up by a later
+    read. Times already past are not rescheduled.
+
+    With several workers, ``leader_lock`` lets one of them run the
+    scheduler, and every worker appends ``(id, due_at)`` for its writes to
+    the shared ``log``. The scheduler reads the others' records as deltas:
+    the tasks whose change can touch the loaded window, because they are
+    scheduled or now fall inside it, are read again by primary key. The
+    row read is the latest commit whatever order the records were appended
+    in. Only when the log has overwritten records not yet seen is the
+    window read again from scratch.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        window_seconds: float = 3600,
+        batch_size: int = 1000,
+        lookback_seconds: float = 300,
+        tick_seconds: float = 1.0,
+        log: Optional[SharedChangeLog] = None,
+        leader_lock: Optional[LeaderLock] = None,
+        on_reminder: Sequence[Callable[[Reminder], None]] = (log_reminder,),
+        clock: Callable[[], float] = time.time,
+    ):
+        self.database = database
+        self.window = int(window_seconds * SECOND_MICROS)
+        self.batch_size = batch_size
+        self.lookback = int(lookback_seconds * SECOND_MICROS)
+        self.tick_seconds = tick_seconds
+        self.log = log
+        self.leader_lock = leader_lock
+        self.on_reminder = list(on_reminder)
+        self.clock = clock
+        self._heap: list[tuple[int, bytes]] = []
+        self._scheduled: dict[bytes, tuple[int, str]] = {}
+        # Every pending task with (due_at, id) up to here is in _scheduled;
+        # None until the first read.
+        self._horizon: Optional[tuple[int, bytes]] = None
+        # Reminders due up to here have fired.
+        self._fired_through = 0
+        self._started = False
+        self._version: Optional[int] = None
+        self._loading_version: Optional[int] = None
+        # Changes seen while a read is in flight, replayed after it.
+        self._changes: Optional[list[tuple[bytes, Optional[tuple[int, str]]]]] = None
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def task_saved(self, task: Task) -> None:
+        entry = None
+        if not task.is_done and not task.is_archived and task.due_at is not None:
+            entry = (_micros(task.due_at, None), task.title)
+        key = task.id.bytes
+        if self.log is not None:
+            due_at = entry[0] if entry is not None else 0
+            self._local_change(
+                self.log.append(CHANGE_RECORD.pack(key, entry is not None, due_at))
+            )
+        if self._changes is not None:
+            self._changes.append((key, entry))
+        self._apply(key, entry)
+
+    async def run(self) -> None:
+        """Fire reminders until cancelled."""
+        try:
+            while True:
+                try:
+                    delay = await self.step()
+                except Exception:
+                    logger.exception("Reminder scheduler failed; retrying")
+                    delay = RETRY_SECONDS
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+        finally:
+            if self.leader_lock is not None:
+                self.leader_lock.release()
+
+    async def step(self) -> float:
+        """Read the window if needed, fire what is due, return seconds to sleep."""
+        self._wakeup.clear()
+        if self.leader_lock is not None and not self.leader_lock.held:
+            if not self.leader_lock.try_acquire():
+                return self.tick_seconds
+        if not self._started:
+            # Reminders missed while no scheduler ran, up to the lookback.
+            self._started = True
+            self._fired_through = self._now() - self.lookback
+        if self.log is not None and self.log.read() != self._version:
+            if not await self._catch_up():
+                self._reset()
+        now = self._now()
+        if now >= self._next_read():
+            await self._read_window(now)
+        self._fire(now)
+        return self._delay(now)
+
+    def _now(self) -> int:
+        return int(self.clock() * SECOND_MICROS)
+
+    def _reset(self) -> None:
+        self._heap.clear()
+        self._scheduled.clear()
+        self._horizon = None
+        reminders_scheduled.set(0)
+
+    def _next_read(self) -> int:
+        if self._horizon is None:
+            return 0
+        if len(self._scheduled) < self.batch_size:
+            # Read ahead while half a window is still loaded.
+            return self._horizon[0] - self.window // 2
+        # A full batch is loaded; read on once it has fired.
+        return self._horizon[0]
+
+    async def _read_window(self, now: int) -> None:
+        """Read up to ``batch_size`` due tasks past the horizon."""
+        after_due, after_id = self._horizon or (self._fired_through, _MAX_ID)
+        until = now + self.window
+        if self.log is not None:
+            self._loading_version = self.log.read()
+        self._changes = []
+        try:
+            async with self.database.engine.connect() as conn:
+                result = await conn.execute(
+                    _WINDOW_SQL,
+                    {
+                        "after_due": after_due,
+                        "after_id": after_id,
+                        "until": until,
+                        "limit": self.batch_size,
+                    },
+                )
+                rows = result.all()
+        except BaseException:
+            # Writes by other workers may have been missed; start over.
+            self._version = None
+            raise
+        finally:
+            changes, self._changes = self._changes, None
+            version, self._loading_version = self._loading_version, None
+        if self.log is not None:
+            self._version = version
+
+        for task_id, title, due_at in rows:
+            self._scheduled[task_id] = (due_at, title)
+            self._heap.append((due_at, task_id))
+        heapq.heapify(self._heap)
+        if len(rows) == self.batch_size:
+            self._horizon = (rows[-1][2], rows[-1][0])
+        else:
+            self._horizon = (until, _MAX_ID)
+        for key, entry in changes:
+            self._apply(key, entry)
+        reminders_scheduled.set(len(self._heap))
+
+    async def _catch_up(self) -> bool:
+        """Apply other workers' changes; ``False`` if the window must be re-read."""
+        if self._version is None or self._horizon is None:
+            return False
+        changes = self.log.since(self._version)
+        if changes is None:
+            return False
+        version, records = changes
+        keys = set()
+        for record in records:
+            key, has_due, due_at = CHANGE_RECORD.unpack(record)
+            if key in self._scheduled or (
+                has_due
+                and self._fired_through < due_at
+                and (due_at, key) <= self._horizon
+            ):
+                keys.add(key)
+        if keys:
+            self._changes = []
+            try:
+                async with self.database.engine.connect() as conn:
+                    result = await conn.execute(_CHANGED_SQL, {"ids": list(keys)})
+                    rows = result.all()
+            finally:
+                local, self._changes = self._changes, None
+            current = {task_id: (due_at, title) for task_id, title, due_at in rows}
+            for key in keys:
+                self._apply(key, current.get(key))
+            # Saves made here while the read was in flight are newer.
+            for key, entry in local:
+                self._apply(key, entry)
+        self._version = version
+        return True
+
+    def _apply(self, key: bytes, entry: Optional[tuple[int, str]]) -> None:
+        if self._horizon is None:
+            # Nothing read yet; the first read sees this change in SQLite.
+            return
+        if (
+            entry is None
+            or entry[0] <= self._fired_through
+            or (entry[0], key) > self._horizon
+        ):
+            self._scheduled.pop(key, None)
+            return
+        self._scheduled[key] = entry
+        heapq.heappush(self._heap, (entry[0], key))
+        if len(self._heap) > 2 * len(self._scheduled) + self.batch_size:
+            # Drop the entries that changes have left behind.
+            self._heap = [(due, key) for key, (due, _) in self._scheduled.items()]
+            heapq.heapify(self._heap)
+        reminders_scheduled.set(len(self._heap))
+        if self._heap[0] == (entry[0], key):
+            self._wakeup.set()
+
+    def _fire(self, now: int) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            due, key = heapq.heappop(self._heap)
+            entry = self._scheduled.get(key)
+            if entry is None or entry[0] != due:
+                continue
+            del self._scheduled[key]
+            reminder = Reminder(UUID(bytes=key), entry[1], _datetime(due, None))
+            reminders_fired_total.inc()
+            for callback in self.on_reminder:
+                try:
+                    callback(reminder)
+                except Exception:
+                    logger.exception("Reminder callback failed for %s", reminder)
+        if self._horizon is not None:
+            self._fired_through = max(self._fired_through, min(now, self._horizon[0]))
+        reminders_scheduled.set(len(self._heap))
+
+    def _delay(self, now: int) -> float:
+        wake_at = now + int(self.tick_seconds * SECOND_MICROS)
+        if self._heap:
+            wake_at = min(wake_at, self._heap[0][0])
+        wake_at = min(wake_at, self._next_read())
+        return max(0.0, (wake_at - now) / SECOND_MICROS)
+
+    def _local_change(self, version: int) -> None:
+        # Our own write moves the log by one; anything else means
+        # another worker wrote too.
+        if self._loading_version is not None:
+            if version == self._loading_version + 1:
+                self._loading_version = version
+        elif self._version is not None and version == self._version + 1:
+            self._version = version
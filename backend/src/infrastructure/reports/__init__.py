@@ -0,0 +1,11 @@
+from .renderers import ReportKind, ReportTooLargeError
+from .report_jobs import ReportJob, ReportJobs, ReportQueueFullError, report_jobs
+
+__all__ = [
+    "ReportJob",
+    "ReportJobs",
+    "ReportKind",
+    "ReportQueueFullError",
+    "ReportTooLargeError",
+    "report_jobs",
+]
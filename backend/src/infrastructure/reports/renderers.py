@@ -0,0 +1,270 @@
+import csv
+import html
+import json
+import os
+import sqlite3
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Iterator, TextIO
+
+from src.domain.entities import Priority
+from src.infrastructure.backup import stepped_backup
+from src.infrastructure.database.types import BinaryUUID, EpochMicros, PriorityCode
+
+TASK_TABLES = ("tasks", "archived_tasks")
+TASK_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "status",
+    "created_at",
+    "updated_at",
+)
+STATUSES = ("pending", "done", "archived")
+
+
+class ReportKind(str, Enum):
+    TASKS_CSV = "tasks-csv"
+    PRIORITY_SUMMARY = "priority-summary"
+    TASKS_HTML = "tasks-html"
+
+
+class ReportTooLargeError(RuntimeError):
+    """Raised in the worker when a report outgrows its size limit."""
+
+
+class _LimitedWriter:
+    # Counts what goes through to the file and stops the render as soon as
+    # the limit is passed, rather than finding out after the disk filled.
+    def __init__(self, file: TextIO, max_bytes: int):
+        self.file = file
+        self.max_bytes = max_bytes
+        self.written = 0
+
+    def write(self, text: str) -> None:
+        self.written += len(text.encode())
+        if self.written > self.max_bytes:
+            raise ReportTooLargeError(
+                f"Report is larger than the {self.max_bytes} byte limit"
+            )
+        self.file.write(text)
+
+
+def _status(is_done: int, is_archived: int) -> str:
+    if is_archived:
+        return "archived"
+    return "done" if is_done else "pending"
+
+
+def _timestamp(value) -> str:
+    moment = EpochMicros().process_result_value(value, None)
+    return moment.isoformat() if moment else ""
+
+
+def _task_rows(connection: sqlite3.Connection) -> Iterator[tuple]:
+    task_id = BinaryUUID().process_result_value
+    priority = PriorityCode().process_result_value
+    for table in TASK_TABLES:
+        cursor = connection.execute(
+            "SELECT id, title, description, priority, is_done, is_archived, "
+            f"created_at, updated_at FROM {table} "
+            "ORDER BY priority_rank DESC, created_at DESC"
+        )
+        for row in cursor:
+            yield (
+                str(task_id(row[0], None)),
+                row[1],
+                row[2],
+                priority(row[3], None).value,
+                _status(row[4], row[5]),
+                _timestamp(row[6]),
+                _timestamp(row[7]),
+            )
+
+
+def _summary(connection: sqlite3.Connection) -> dict:
+    priority = PriorityCode().process_result_value
+    priorities = {
+        member.value: {**dict.fromkeys(STATUSES, 0), "total": 0}
+        for member in reversed(Priority)
+    }
+    oldest: dict[str, int] = {}
+    for table in TASK_TABLES:
+        rows = connection.execute(
+            "SELECT priority, is_done, is_archived, count(*), "
+            "min(CASE WHEN is_done = 0 THEN created_at END) "
+            f"FROM {table} GROUP BY priority, is_done, is_archived"
+        )
+        for code, is_done, is_archived, count, first_pending in rows:
+            name = priority(code, None).value
+            priorities[name][_status(is_done, is_archived)] += count
+            priorities[name]["total"] += count
+            if first_pending is not None:
+                oldest[name] = min(oldest.get(name, first_pending), first_pending)
+    for name, counts in priorities.items():
+        counts["oldest_pending_created_at"] = (
+            _timestamp(oldest[name]) if name in oldest else None
+        )
+    return {
+        "total": sum(counts["total"] for counts in priorities.values()),
+        "priorities": priorities,
+    }
+
+
+def render_tasks_csv(connection: sqlite3.Connection, out: _LimitedWriter) -> int:
+    writer = csv.writer(out)
+    writer.writerow(TASK_COLUMNS)
+    rows = 0
+    for row in _task_rows(connection):
+        writer.writerow(row)
+        rows += 1
+    return rows
+
+
+def render_priority_summary(connection: sqlite3.Connection, out: _LimitedWriter) -> int:
+    summary = _summary(connection)
+    out.write(json.dumps(summary, indent=2))
+    out.write("\n")
+    return len(summary["priorities"])
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Task report</title>
+<style>
+@page { size: A4 landscape; margin: 12mm; }
+body { font: 9pt/1.3 sans-serif; color: #111; }
+table { border-collapse: collapse; width: 100%; margin-bottom: 16pt; }
+th, td { border: 0.5pt solid #999; padding: 2pt 4pt; text-align: left;
+         vertical-align: top; }
+th { background: #eee; }
+td.number { text-align: right; }
+thead { display: table-header-group; }
+tr { break-inside: avoid; }
+</style>
+</head>
+<body>
+"""
+
+
+def render_tasks_html(connection: sqlite3.Connection, out: _LimitedWriter) -> int:
+    """A self-contained page laid out for printing or HTML-to-PDF tools."""
+    escape = html.escape
+    summary = _summary(connection)
+    out.write(_HTML_HEAD)
+    out.write(
+        f"<h1>Task report</h1>\n<p>Generated {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())}, "
+        f"{summary['total']} tasks.</p>\n"
+    )
+    out.write("<h2>By priority</h2>\n<table>\n<thead><tr><th>Priority</th>")
+    out.write("".join(f"<th>{status.title()}</th>" for status in STATUSES))
+    out.write("<th>Total</th><th>Oldest pending</th></tr></thead>\n<tbody>\n")
+    for name, counts in summary["priorities"].items():
+        cells = "".join(
+            f'<td class="number">{counts[key]}</td>' for key in (*STATUSES, "total")
+        )
+        oldest = counts["oldest_pending_created_at"] or ""
+        out.write(f"<tr><td>{name}</td>{cells}<td>{oldest}</td></tr>\n")
+    out.write("</tbody>\n</table>\n<h2>Tasks</h2>\n<table>\n<thead><tr>")
+    out.write("".join(f"<th>{escape(column)}</th>" for column in TASK_COLUMNS))
+    out.write("</tr></thead>\n<tbody>\n")
+    rows = 0
+    for row in _task_rows(connection):
+        out.write(
+            "<tr>" + "".join(f"<td>{escape(value)}</td>" for value in row) + "</tr>\n"
+        )
+        rows += 1
+    out.write("</tbody>\n</table>\n</body>\n</html>\n")
+    return rows
+
+
+RENDERERS: dict[ReportKind, Callable[[sqlite3.Connection, _LimitedWriter], int]] = {
+    ReportKind.TASKS_CSV: render_tasks_csv,
+    ReportKind.PRIORITY_SUMMARY: render_priority_summary,
+    ReportKind.TASKS_HTML: render_tasks_html,
+}
+
+MEDIA_TYPES = {
+    ReportKind.TASKS_CSV: ("text/csv", "csv"),
+    ReportKind.PRIORITY_SUMMARY: ("application/json", "json"),
+    ReportKind.TASKS_HTML: ("text/html", "html"),
+}
+
+
+def _connect_read_only(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def snapshot_bytes(database_path: str) -> int:
+    """Disk space ``render_report`` needs for its snapshot of the database.
+
+    A database in WAL mode is read in place, so it needs none.
+    """
+    connection = _connect_read_only(Path(database_path))
+    try:
+        (journal_mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+        if journal_mode.lower() == "wal":
+            return 0
+        (page_count,) = connection.execute("PRAGMA page_count").fetchone()
+        (page_size,) = connection.execute("PRAGMA page_size").fetchone()
+        return page_count * page_size
+    finally:
+        connection.close()
+
+
+def render_report(
+    kind: str,
+    database_path: str,
+    output_path: str,
+    max_bytes: int,
+    pages_per_step: int = 256,
+    step_sleep: float = 0.005,
+    max_restarts: int = 3,
+) -> int:
+    """Render one report into ``output_path`` and return its row count.
+
+    Runs in a worker process, on a read-only connection that sees one
+    consistent state however long the render takes. In WAL mode that is a
+    single read transaction on the database itself: readers do not block
+    writers there, so no copy is needed. Otherwise an open read transaction
+    would hold writers off for the whole render, so the database is first
+    copied with ``stepped_backup`` into a private snapshot beside the
+    output, and the render reads the snapshot. The output is written to a ``.partial`` file and renamed once
+    complete.
+    """
+    output = Path(output_path)
+    snapshot = output.with_name(output.name + ".snapshot")
+    partial = output.with_name(output.name + ".partial")
+    try:
+        connection = _connect_read_only(Path(database_path))
+        try:
+            (journal_mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+            if journal_mode.lower() == "wal":
+                connection.execute("BEGIN")
+            else:
+                try:
+                    target = sqlite3.connect(snapshot)
+                    try:
+                        stepped_backup(
+                            connection, target, pages_per_step, step_sleep, max_restarts
+                        )
+                    finally:
+                        target.close()
+                finally:
+                    connection.close()
+                connection = _connect_read_only(snapshot)
+            with open(partial, "w", encoding="utf-8", newline="") as file:
+                rows = RENDERERS[ReportKind(kind)](
+                    connection, _LimitedWriter(file, max_bytes)
+                )
+        finally:
+            connection.close()
+        os.replace(partial, output)
+        return rows
+    finally:
+        snapshot.unlink(missing_ok=True)
+        partial.unlink(missing_ok=True)
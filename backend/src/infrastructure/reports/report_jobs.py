@@ -0,0 +1,258 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+from src.infrastructure.backup.online_backup import sqlite_file_path
+from src.infrastructure.config import settings
+
+from .renderers import (
+    MEDIA_TYPES,
+    ReportKind,
+    ReportTooLargeError,
+    render_report,
+    snapshot_bytes,
+)
+
+logger = logging.getLogger(__name__)
+
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ReportQueueFullError(RuntimeError):
+    """Raised when a report is requested while ``max_jobs`` are unfinished."""
+
+
+@dataclass
+class ReportJob:
+    id: str
+    kind: ReportKind
+    state: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    rows: Optional[int] = None
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.kind][0]
+
+    @property
+    def filename(self) -> str:
+        return f"{self.kind.value}-{self.id}.{MEDIA_TYPES[self.kind][1]}"
+
+
+class ReportJobs:
+    """Renders reports in a process pool so the event loop keeps serving.
+
+    A request enqueues a job and gets its id back at once. At most
+    ``workers`` jobs render at the same time, each in a worker process
+    reading its own snapshot of the database; at most ``max_jobs`` may be
+    queued or running in this process, beyond which new requests are
+    refused. A report that grows past ``max_bytes`` fails. Finished reports
+    stay on disk until they take more than ``disk_bytes`` together, then
+    the oldest are removed and their jobs marked ``expired``. The snapshots
+    of running jobs count against ``disk_bytes`` as well: room is made for
+    each one before its copy starts, and a job whose snapshot alone would
+    not fit fails. Snapshots are copied ``pages_per_step`` pages at a time
+    with ``step_sleep`` seconds in between.
+
+    Each job's state is kept as JSON in ``<id>.job`` next to its output, so any
+    worker process of the app can answer for it and results outlive a
+    restart. ``retention_seconds`` after a job finishes, its state file and
+    any output left are removed, and the job is no longer known. That
+    sweep reads every state file, so it runs in a thread.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        directory: str,
+        workers: int = 2,
+        max_jobs: int = 8,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_bytes: int = 512 * 1024 * 1024,
+        pages_per_step: int = 256,
+        step_sleep: float = 0.005,
+        retention_seconds: float = 7 * 24 * 60 * 60,
+    ):
+        self.database_url = database_url
+        self.directory = Path(directory)
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.max_bytes = max_bytes
+        self.disk_bytes = disk_bytes
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self.retention_seconds = retention_seconds
+        self._snapshot_bytes = 0
+        self._active: dict[str, ReportJob] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._slots = asyncio.Semaphore(workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def submit(self, kind: ReportKind) -> ReportJob:
+        """Queue a report and return its job; rendering starts in the background."""
+        source = sqlite_file_path(self.database_url)
+        if len(self._active) >= self.max_jobs:
+            raise ReportQueueFullError(
+                f"{len(self._active)} reports are already queued or running"
+            )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        job = ReportJob(uuid4().hex, ReportKind(kind))
+        self._active[job.id] = job
+        self._save(job)
+        task = asyncio.create_task(self._run(job, source))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        if job_id in self._active:
+            return self._active[job_id]
+        # Ids come from URLs; only well-formed ones reach the file system.
+        if not _JOB_ID.match(job_id):
+            return None
+        return self._load(self._state_path(job_id))
+
+    def path_for(self, job: ReportJob) -> Optional[Path]:
+        if job.state != "done":
+            return None
+        path = self._output_path(job)
+        return path if path.is_file() else None
+
+    async def close(self) -> None:
+        """Cancel unfinished jobs and stop the worker processes."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Forking a process that runs an event loop and driver threads
+            # is unsafe, so workers start fresh and import only the renderer.
+            self._executor = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    async def _run(self, job: ReportJob, source: Path) -> None:
+        output = self._output_path(job)
+        reserved = 0
+        try:
+            async with self._slots:
+                job.state, job.started_at = "running", time.time()
+                self._save(job)
+                needed = await asyncio.to_thread(snapshot_bytes, str(source))
+                if needed > self.disk_bytes:
+                    raise ReportTooLargeError(
+                        f"A {needed} byte snapshot does not fit the "
+                        f"{self.disk_bytes} byte disk limit"
+                    )
+                reserved = needed
+                self._snapshot_bytes += reserved
+                await asyncio.to_thread(self._trim)
+                job.rows = await asyncio.get_running_loop().run_in_executor(
+                    self._pool(),
+                    render_report,
+                    job.kind.value,
+                    str(source),
+                    str(output),
+                    self.max_bytes,
+                    self.pages_per_step,
+                    self.step_sleep,
+                )
+        except asyncio.CancelledError:
+            job.state, job.error = "failed", "Cancelled before it finished"
+            raise
+        except Exception as error:
+            job.state = "failed"
+            job.error = str(error) or type(error).__name__
+            logger.warning(
+                "Report %s (%s) failed: %s", job.id, job.kind.value, job.error
+            )
+        else:
+            job.state = "done"
+            job.size_bytes = output.stat().st_size
+            logger.info(
+                "Report %s (%s) finished: %d rows, %d bytes",
+                job.id,
+                job.kind.value,
+                job.rows,
+                job.size_bytes,
+            )
+        finally:
+            job.finished_at = time.time()
+            self._save(job)
+            del self._active[job.id]
+            self._snapshot_bytes -= reserved
+        await asyncio.to_thread(self._trim)
+
+    def _trim(self) -> None:
+        # A job that never finished, because its process died, is dated
+        # from its creation.
+        cutoff = time.time() - self.retention_seconds
+        done = []
+        for job in map(self._load, self.directory.glob("*.job")):
+            if job is None:
+                continue
+            if (job.finished_at or job.created_at) < cutoff:
+                self._output_path(job).unlink(missing_ok=True)
+                self._state_path(job.id).unlink(missing_ok=True)
+            elif job.state == "done":
+                done.append(job)
+        done.sort(key=lambda job: job.finished_at or 0)
+        total = self._snapshot_bytes + sum(job.size_bytes or 0 for job in done)
+        for job in done:
+            if total <= self.disk_bytes:
+                break
+            self._output_path(job).unlink(missing_ok=True)
+            total -= job.size_bytes or 0
+            job.state = "expired"
+            self._save(job)
+
+    def _output_path(self, job: ReportJob) -> Path:
+        return self.directory / f"{job.id}.{MEDIA_TYPES[job.kind][1]}"
+
+    def _state_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.job"
+
+    def _save(self, job: ReportJob) -> None:
+        path = self._state_path(job.id)
+        partial = path.with_name(path.name + ".partial")
+        partial.write_text(json.dumps({**asdict(job), "kind": job.kind.value}))
+        os.replace(partial, path)
+
+    @staticmethod
+    def _load(path: Path) -> Optional[ReportJob]:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        return ReportJob(**{**data, "kind": ReportKind(data["kind"])})
+
+
+report_jobs = ReportJobs(
+    settings.database_url,
+    settings.report_dir,
+    settings.report_workers,
+    settings.report_max_jobs,
+    settings.report_max_bytes,
+    settings.report_disk_bytes,
+    settings.backup_pages_per_step,
+    settings.backup_step_sleep_ms / 1000,
+    settings.report_retention_seconds,
+)
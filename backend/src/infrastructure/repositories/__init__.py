@@ -1,3 +1,21 @@
+from .in_memory_task_repository import InMemoryTaskRepository
+from .provider import (
+    get_sharded_task_repository,
+    memory_task_repository,
+    task_repository_for_session,
+    task_repository_scope,
+)
+from .sharded_sqlite_task_repository import ShardedSQLiteTaskRepository
 from .sqlite_task_repository import SQLiteTaskRepository
+from .traced_task_repository import TracedTaskRepository
 
-__all__ = ["SQLiteTaskRepository"]
+__all__ = [
+    "SQLiteTaskRepository",
+    "InMemoryTaskRepository",
+    "ShardedSQLiteTaskRepository",
+    "TracedTaskRepository",
+    "get_sharded_task_repository",
+    "memory_task_repository",
+    "task_repository_for_session",
+    "task_repository_scope",
+]
@@ -0,0 +1,176 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import UTC, datetime
+from typing import Iterator, Optional
+from uuid import UUID
+
+from src.domain.entities import Priority, Task, TaskView
+from src.domain.repositories import TaskRepository
+
+PRIORITY_RANK = {Priority.HIGH: 3, Priority.MEDIUM: 2, Priority.LOW: 1}
+
+StatusKey = tuple[bool, bool]
+SortKey = tuple[int, float, UUID]
+
+
+def _sort_key(view: TaskView) -> SortKey:
+    created_at = view.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    return PRIORITY_RANK[view.priority], created_at.timestamp(), view.id
+
+
+class InMemoryTaskRepository(TaskRepository):
+    """Process-local task storage for ephemeral deployments and fast tests.
+
+    Tasks are kept as immutable ``TaskView`` snapshots in a dict keyed by id.
+    Every ``(is_done, is_archived)`` view has its own list of sort keys kept
+    in ascending ``(priority, created_at)`` order, so list queries are a
+    reversed walk over one list and counts are ``len`` calls. Pending tasks
+    are also counted per priority as they are written. Completion times,
+    which list queries do not return, are kept beside the views.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._tasks: dict[UUID, TaskView] = {}
+        self._completed_at: dict[UUID, datetime] = {}
+        self._keys: dict[UUID, SortKey] = {}
+        self._by_status: dict[StatusKey, list[SortKey]] = {
+            (is_done, is_archived): []
+            for is_done in (False, True)
+            for is_archived in (False, True)
+        }
+        self._pending_by_priority = dict.fromkeys(Priority, 0)
+
+    def _snapshot(self, task: Task) -> TaskView:
+        now = datetime.now(UTC)
+        return TaskView(
+            task.id,
+            task.title,
+            task.description,
+            task.priority,
+            task.is_done,
+            task.is_archived,
+            task.created_at or now,
+            task.updated_at or now,
+            task.due_at,
+        )
+
+    def _insert(self, view: TaskView, completed_at: Optional[datetime]) -> None:
+        key = _sort_key(view)
+        self._tasks[view.id] = view
+        if completed_at is not None:
+            self._completed_at[view.id] = completed_at
+        self._keys[view.id] = key
+        insort(self._by_status[view.is_done, view.is_archived], key)
+        if not view.is_done:
+            self._pending_by_priority[view.priority] += 1
+
+    def _remove(self, task_id: UUID) -> Optional[TaskView]:
+        view = self._tasks.pop(task_id, None)
+        if view is None:
+            return None
+        key = self._keys.pop(task_id)
+        self._completed_at.pop(task_id, None)
+        keys = self._by_status[view.is_done, view.is_archived]
+        del keys[bisect_left(keys, key)]
+        if not view.is_done:
+            self._pending_by_priority[view.priority] -= 1
+        return view
+
+    def _entity(self, view: TaskView) -> Task:
+        return Task(*view, completed_at=self._completed_at.get(view.id))
+
+    def _views(self, keys: list[SortKey]) -> list[TaskView]:
+        tasks = self._tasks
+        return [tasks[key[2]] for key in reversed(keys)]
+
+    async def create(self, task: Task) -> Task:
+        if task.id in self._tasks:
+            raise ValueError(f"Task with id {task.id} already exists")
+        view = self._snapshot(task)
+        self._insert(view, task.completed_at)
+        return self._entity(view)
+
+    async def create_many(self, tasks: list[Task]) -> int:
+        ids = {task.id for task in tasks}
+        if len(ids) != len(tasks) or not ids.isdisjoint(self._tasks):
+            raise ValueError("Tasks to create must have new, distinct ids")
+        for task in tasks:
+            self._insert(self._snapshot(task), task.completed_at)
+        return len(tasks)
+
+    def _exceeds_limit(
+        self, task: Task, limit: int, previous: Optional[TaskView] = None
+    ) -> bool:
+        if task.is_done:
+            return False
+        pending = self._pending_by_priority[task.priority]
+        if previous is not None and not previous.is_done:
+            pending -= previous.priority == task.priority
+        return pending >= limit
+
+    # Nothing below awaits between the check and the write, so no other
+    # coroutine can take the last slot in between.
+    async def create_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        if self._exceeds_limit(task, limit):
+            return None
+        return await self.create(task)
+
+    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
+        view = self._tasks.get(task_id)
+        return self._entity(view) if view else None
+
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[TaskView]:
+        tasks = self._tasks
+        return [tasks[task_id] for task_id in task_ids if task_id in tasks]
+
+    async def get_all(self, include_archived: bool = True) -> list[TaskView]:
+        statuses = [(False, False), (True, False)]
+        if include_archived:
+            statuses += [(False, True), (True, True)]
+        merged = heapq.merge(
+            *(reversed(self._by_status[status]) for status in statuses),
+            reverse=True,
+        )
+        tasks = self._tasks
+        return [tasks[key[2]] for key in merged]
+
+    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[TaskView]:
+        return self._views(self._by_status[is_done, is_archived])
+
+    async def update(self, task: Task) -> Task:
+        if self._remove(task.id) is None:
+            raise ValueError(f"Task with id {task.id} not found")
+        view = self._snapshot(task)
+        self._insert(view, task.completed_at)
+        return self._entity(view)
+
+    async def update_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        previous = self._tasks.get(task.id)
+        if previous is None:
+            raise ValueError(f"Task with id {task.id} not found")
+        if self._exceeds_limit(task, limit, previous):
+            return None
+        return await self.update(task)
+
+    async def archive(self, task: Task) -> Task:
+        return await self.update(task)
+
+    async def delete(self, task_id: UUID) -> bool:
+        return self._remove(task_id) is not None
+
+    async def count_by_priority(self, priority: Priority) -> int:
+        return self._pending_by_priority[priority]
+
+    async def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        return len(self._by_status[is_done, is_archived])
+
+    def with_completed_at(self) -> Iterator[tuple[TaskView, Optional[datetime]]]:
+        """Every stored task with the time it was marked done, for analytics."""
+        completed_at = self._completed_at
+        for task_id, view in self._tasks.items():
+            yield view, completed_at.get(task_id)
@@ -0,0 +1,52 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.repositories import TaskRepository
+from src.infrastructure.config import settings
+from src.infrastructure.database import Database
+
+from .in_memory_task_repository import InMemoryTaskRepository
+from .sharded_sqlite_task_repository import ShardedSQLiteTaskRepository
+from .sqlite_task_repository import SQLiteTaskRepository
+
+REPOSITORY_BACKENDS = ("sqlite", "memory", "sharded")
+
+memory_task_repository = InMemoryTaskRepository()
+
+_sharded_task_repository: Optional[ShardedSQLiteTaskRepository] = None
+
+
+def get_sharded_task_repository() -> ShardedSQLiteTaskRepository:
+    """Create the shard engines on first use, from ``DATABASE_SHARDS``."""
+    global _sharded_task_repository
+    if _sharded_task_repository is None:
+        _sharded_task_repository = ShardedSQLiteTaskRepository(
+            [
+                Database(settings.database_shard_url_template.format(shard=shard))
+                for shard in range(settings.database_shards)
+            ]
+        )
+    return _sharded_task_repository
+
+
+def task_repository_for_session(session: AsyncSession) -> TaskRepository:
+    """Return the configured ``TASK_REPOSITORY`` backend for one request."""
+    if settings.task_repository == "memory":
+        return memory_task_repository
+    if settings.task_repository == "sharded":
+        return get_sharded_task_repository()
+    if settings.task_repository == "sqlite":
+        return SQLiteTaskRepository(session)
+    raise ValueError(
+        f"Unknown TASK_REPOSITORY {settings.task_repository!r}, "
+        f"expected one of {', '.join(REPOSITORY_BACKENDS)}"
+    )
+
+
+@asynccontextmanager
+async def task_repository_scope(database: Database) -> AsyncIterator[TaskRepository]:
+    """Open the configured backend outside of a request, e.g. at startup."""
+    async with database.async_session() as session:
+        yield task_repository_for_session(session)
@@ -0,0 +1,233 @@
+import asyncio
+import heapq
+import zlib
+from collections import defaultdict
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities import Priority, Task, TaskView
+from src.domain.repositories import TaskRepository
+from src.infrastructure.database import Database, migrate_on_startup
+
+from .sqlite_task_repository import SQLiteTaskRepository, _list_order
+
+
+class ShardedSQLiteTaskRepository(TaskRepository):
+    """Tasks spread over several SQLite files by a hash of the task id.
+
+    Every shard is a full ``SQLiteTaskRepository`` schema with its own
+    engine and its own write lock, so writes to different shards run in
+    parallel. List queries fan out to all shards and k-way merge the
+    already sorted per-shard results.
+
+    Pending tasks per priority are counted once from all shards and then
+    adjusted in memory by every write, which keeps ``count_by_priority``
+    (and the high-priority limit built on it) exact and O(1) without a
+    cross-shard query. The counters assume this process is the only writer.
+    """
+
+    def __init__(self, shards: list[Database]):
+        if not shards:
+            raise ValueError("At least one shard is required")
+        self.shards = shards
+        self._write_locks = [asyncio.Lock() for _ in shards]
+        self._counter_lock = asyncio.Lock()
+        self._pending_by_priority: Optional[dict[Priority, int]] = None
+
+    def shard_index(self, task_id: UUID) -> int:
+        # crc32 spreads time-ordered ids as well as random ones.
+        return zlib.crc32(task_id.bytes) % len(self.shards)
+
+    async def _on_shard(self, index: int, operation):
+        async with self.shards[index].async_session() as session:
+            return await operation(SQLiteTaskRepository(session))
+
+    async def _on_all_shards(self, operation) -> list:
+        return await asyncio.gather(
+            *(self._on_shard(index, operation) for index in range(len(self.shards)))
+        )
+
+    async def _write(
+        self,
+        task_id: UUID,
+        new_state: Optional[Task],
+        operation,
+        limit: Optional[int] = None,
+        must_exist: bool = False,
+    ):
+        counts = await self._pending_counts()
+        index = self.shard_index(task_id)
+        async with self._write_locks[index]:
+            async with self.shards[index].async_session() as session:
+                repository = SQLiteTaskRepository(session)
+                previous = await repository.get_by_id(task_id)
+                if must_exist and previous is None:
+                    raise ValueError(f"Task with id {task_id} not found")
+                # The counters move before the write and roll back if it
+                # fails, so a concurrent count never misses an in-flight task.
+                # The limit is checked against them in the same step, which
+                # makes it atomic across shards.
+                delta = self._pending_delta(previous, new_state)
+                if limit is not None and self._exceeds(counts, delta, limit):
+                    return None
+                self._apply(counts, delta, 1)
+                try:
+                    return await operation(repository)
+                except BaseException:
+                    self._apply(counts, delta, -1)
+                    raise
+
+    async def _pending_counts(self) -> dict[Priority, int]:
+        if self._pending_by_priority is None:
+            async with self._counter_lock:
+                if self._pending_by_priority is None:
+                    counts = dict.fromkeys(Priority, 0)
+                    for priority in Priority:
+                        per_shard = await self._on_all_shards(
+                            lambda repository: repository.count_by_priority(priority)
+                        )
+                        counts[priority] = sum(per_shard)
+                    self._pending_by_priority = counts
+        return self._pending_by_priority
+
+    @staticmethod
+    def _pending_delta(
+        previous: Optional[Task], current: Optional[Task]
+    ) -> list[tuple[Priority, int]]:
+        delta = []
+        if previous is not None and not previous.is_done:
+            delta.append((previous.priority, -1))
+        if current is not None and not current.is_done:
+            delta.append((current.priority, 1))
+        return delta
+
+    @staticmethod
+    def _exceeds(
+        counts: dict[Priority, int], delta: list[tuple[Priority, int]], limit: int
+    ) -> bool:
+        after = dict(counts)
+        for priority, change in delta:
+            after[priority] += change
+        return any(change > 0 and after[priority] > limit for priority, change in delta)
+
+    @staticmethod
+    def _apply(
+        counts: dict[Priority, int], delta: list[tuple[Priority, int]], sign: int
+    ) -> None:
+        for priority, change in delta:
+            counts[priority] += sign * change
+
+    async def migrate(self, heavy_on_startup: bool = False) -> None:
+        await asyncio.gather(
+            *(
+                migrate_on_startup(shard, heavy_on_startup=heavy_on_startup)
+                for shard in self.shards
+            )
+        )
+
+    async def close(self) -> None:
+        await asyncio.gather(*(shard.close() for shard in self.shards))
+
+    async def create(self, task: Task) -> Task:
+        return await self._write(
+            task.id, task, lambda repository: repository.create(task)
+        )
+
+    async def create_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        return await self._write(
+            task.id, task, lambda repository: repository.create(task), limit
+        )
+
+    async def create_many(self, tasks: list[Task]) -> int:
+        grouped: dict[int, list[Task]] = defaultdict(list)
+        for task in tasks:
+            grouped[self.shard_index(task.id)].append(task)
+        counts = await self._pending_counts()
+
+        async def create_on_shard(index: int, shard_tasks: list[Task]) -> int:
+            delta = [
+                change
+                for task in shard_tasks
+                for change in self._pending_delta(None, task)
+            ]
+            async with self._write_locks[index]:
+                self._apply(counts, delta, 1)
+                try:
+                    return await self._on_shard(
+                        index, lambda repository: repository.create_many(shard_tasks)
+                    )
+                except BaseException:
+                    self._apply(counts, delta, -1)
+                    raise
+
+        created = await asyncio.gather(
+            *(create_on_shard(index, group) for index, group in grouped.items())
+        )
+        return sum(created)
+
+    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
+        return await self._on_shard(
+            self.shard_index(task_id),
+            lambda repository: repository.get_by_id(task_id),
+        )
+
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[TaskView]:
+        grouped: dict[int, list[UUID]] = defaultdict(list)
+        for task_id in task_ids:
+            grouped[self.shard_index(task_id)].append(task_id)
+
+        results = await asyncio.gather(
+            *(
+                self._on_shard(
+                    index, lambda repository, ids=ids: repository.get_by_ids(ids)
+                )
+                for index, ids in grouped.items()
+            )
+        )
+        found = {view.id: view for views in results for view in views}
+        return [found[task_id] for task_id in task_ids if task_id in found]
+
+    async def get_all(self, include_archived: bool = True) -> list[TaskView]:
+        per_shard = await self._on_all_shards(
+            lambda repository: repository.get_all(include_archived)
+        )
+        return list(heapq.merge(*per_shard, key=_list_order, reverse=True))
+
+    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[TaskView]:
+        per_shard = await self._on_all_shards(
+            lambda repository: repository.get_by_status(is_done, is_archived)
+        )
+        return list(heapq.merge(*per_shard, key=_list_order, reverse=True))
+
+    async def update(self, task: Task) -> Task:
+        return await self._write(
+            task.id, task, lambda repository: repository.update(task)
+        )
+
+    async def update_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        return await self._write(
+            task.id,
+            task,
+            lambda repository: repository.update(task),
+            limit,
+            must_exist=True,
+        )
+
+    async def archive(self, task: Task) -> Task:
+        return await self._write(
+            task.id, task, lambda repository: repository.archive(task)
+        )
+
+    async def delete(self, task_id: UUID) -> bool:
+        return await self._write(
+            task_id, None, lambda repository: repository.delete(task_id)
+        )
+
+    async def count_by_priority(self, priority: Priority) -> int:
+        return (await self._pending_counts())[priority]
+
+    async def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        per_shard = await self._on_all_shards(
+            lambda repository: repository.count_by_status(is_done, is_archived)
+        )
+        return sum(per_shard)
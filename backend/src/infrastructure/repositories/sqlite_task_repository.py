@@ -1,21 +1,54 @@
+import heapq
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import case, func, select
+from sqlalchemy import (
+    BigInteger,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    type_coerce,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.entities import Priority, Task
+from src.domain.entities import Priority, Task, TaskView
 from src.domain.repositories import TaskRepository
-from src.infrastructure.database.models import TaskModel
+from src.infrastructure.database.models import (
+    ArchivedTaskModel,
+    TaskColumns,
+    TaskModel,
+)
+from src.infrastructure.database.types import (
+    PRIORITY_CODES,
+    epoch_micros_to_datetimes,
+)
+
+# The stored priority code doubles as the sort rank.
+PRIORITY_RANK = PRIORITY_CODES
+
+
+def _list_order(task: TaskView):
+    return PRIORITY_RANK.get(task.priority, 0), task.created_at
 
 
 class SQLiteTaskRepository(TaskRepository):
+    """Task storage split into a hot ``tasks`` table and a cold archive.
+
+    Archived tasks live in ``archived_tasks`` and are only read when a
+    caller explicitly asks for them, so active-task queries and the
+    high-priority count never scan the archive.
+    """
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    def _to_entity(self, model: TaskModel) -> Task:
+    def _to_entity(self, model: TaskColumns) -> Task:
         return Task(
-            id=UUID(model.id),
+            id=model.id,
             title=model.title,
             description=model.description,
             priority=model.priority,
@@ -23,19 +56,63 @@ class SQLiteTaskRepository(TaskRepository):
             is_archived=model.is_archived,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            due_at=model.due_at,
+            completed_at=model.completed_at,
         )
 
-    def _to_model(self, entity: Task) -> TaskModel:
-        return TaskModel(
-            id=str(entity.id),
-            title=entity.title,
-            description=entity.description,
-            priority=entity.priority,
-            is_done=entity.is_done,
-            is_archived=entity.is_archived,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
+    def _to_row(self, entity: Task) -> dict:
+        return {
+            "id": entity.id,
+            "title": entity.title,
+            "description": entity.description,
+            "priority": entity.priority,
+            "is_done": entity.is_done,
+            "is_archived": entity.is_archived,
+            "priority_rank": PRIORITY_RANK[entity.priority],
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+            "due_at": entity.due_at,
+            "completed_at": entity.completed_at,
+        }
+
+    def _to_model(self, entity: Task, model_class=TaskModel) -> TaskColumns:
+        return model_class(**self._to_row(entity))
+
+    def _to_views(self, rows) -> list[TaskView]:
+        # Timestamps arrive as raw integers and are decoded a column at a
+        # time, which is cheaper than a type conversion per value.
+        columns = list(zip(*rows))
+        if not columns:
+            return []
+        columns[6] = epoch_micros_to_datetimes(columns[6])
+        columns[7] = epoch_micros_to_datetimes(columns[7])
+        columns[8] = epoch_micros_to_datetimes(columns[8])
+        return [TaskView(*row) for row in zip(*columns)]
+
+    def _ordered(self, model_class):
+        # Selecting plain columns skips ORM identity-map bookkeeping; list
+        # queries build immutable views straight from the result rows.
+        return select(
+            model_class.id,
+            model_class.title,
+            model_class.description,
+            model_class.priority,
+            model_class.is_done,
+            model_class.is_archived,
+            type_coerce(model_class.created_at, BigInteger).label("created_at"),
+            type_coerce(model_class.updated_at, BigInteger).label("updated_at"),
+            type_coerce(model_class.due_at, BigInteger).label("due_at"),
+        ).order_by(model_class.priority_rank.desc(), model_class.created_at.desc())
+
+    async def _find_model(self, task_id: UUID) -> Optional[TaskColumns]:
+        for model_class in (TaskModel, ArchivedTaskModel):
+            result = await self.session.execute(
+                select(model_class).where(model_class.id == task_id)
+            )
+            model = result.scalar_one_or_none()
+            if model:
+                return model
+        return None
 
     async def create(self, task: Task) -> Task:
         model = self._to_model(task)
@@ -44,68 +121,173 @@ class SQLiteTaskRepository(TaskRepository):
         await self.session.refresh(model)
         return self._to_entity(model)
 
-    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
+    async def create_many(self, tasks: list[Task]) -> int:
+        # One executemany and one commit for the whole batch, without the
+        # per-row refresh ``create`` does.
+        if not tasks:
+            return 0
+        await self.session.execute(
+            insert(TaskModel), [self._to_row(task) for task in tasks]
+        )
+        await self.session.commit()
+        return len(tasks)
+
+    @staticmethod
+    def _pending_count(priority: Priority, exclude_id: Optional[UUID] = None):
+        # A task marked pending after it was archived stays in the archive,
+        # so both tables count. The archive's rows are found through its
+        # status index and are rarely more than a handful.
+        counts = []
+        for model_class, condition in (
+            (TaskModel, TaskModel.priority == priority),
+            (
+                ArchivedTaskModel,
+                ArchivedTaskModel.priority_rank == PRIORITY_RANK[priority],
+            ),
+        ):
+            pending = (
+                select(func.count())
+                .select_from(model_class)
+                .where(model_class.is_done.is_(False))
+                .where(condition)
+            )
+            if exclude_id is not None:
+                pending = pending.where(model_class.id != exclude_id)
+            counts.append(pending.scalar_subquery())
+        return counts[0] + counts[1]
+
+    def _within_limit(self, task: Task, limit: int):
+        # Evaluated inside the INSERT or UPDATE itself, so the count and the
+        # write happen under one write lock with no gap between them.
+        if task.is_done:
+            return literal(True)
+        return self._pending_count(task.priority, task.id) < limit
+
+    async def create_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        # INSERT ... SELECT <values> WHERE (SELECT count(*) ...) < limit
+        # RETURNING *: one round trip instead of a count, an insert and a
+        # refresh.
+        table = TaskModel.__table__
+        row = self._to_row(task)
+        values = select(
+            *(literal(value, table.c[name].type) for name, value in row.items())
+        ).where(self._within_limit(task, limit))
         result = await self.session.execute(
-            select(TaskModel).where(TaskModel.id == str(task_id))
+            insert(table).from_select(list(row), values).returning(*table.c)
         )
-        model = result.scalar_one_or_none()
+        created = result.first()
+        await self.session.commit()
+        return self._to_entity(created) if created else None
+
+    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
+        model = await self._find_model(task_id)
         return self._to_entity(model) if model else None
 
-    async def get_all(self) -> list[Task]:
-        priority_order = case(
-            (TaskModel.priority == Priority.HIGH, 3),
-            (TaskModel.priority == Priority.MEDIUM, 2),
-            (TaskModel.priority == Priority.LOW, 1),
-            else_=0,
-        )
-        result = await self.session.execute(
-            select(TaskModel).order_by(
-                priority_order.desc(), TaskModel.created_at.desc()
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[TaskView]:
+        found = {}
+        for model_class in (TaskModel, ArchivedTaskModel):
+            missing = [key for key in task_ids if key not in found]
+            if not missing:
+                break
+            result = await self.session.execute(
+                self._ordered(model_class).where(model_class.id.in_(missing))
             )
-        )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
-
-    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[Task]:
-        priority_order = case(
-            (TaskModel.priority == Priority.HIGH, 3),
-            (TaskModel.priority == Priority.MEDIUM, 2),
-            (TaskModel.priority == Priority.LOW, 1),
-            else_=0,
-        )
+            found.update((view.id, view) for view in self._to_views(result))
+        return [found[key] for key in task_ids if key in found]
+
+    async def get_all(self, include_archived: bool = True) -> list[TaskView]:
+        statement = self._ordered(TaskModel)
+        if not include_archived:
+            statement = statement.where(TaskModel.is_archived.is_(False))
+        result = await self.session.execute(statement)
+        tasks = self._to_views(result)
+        if not include_archived:
+            return tasks
+
+        result = await self.session.execute(self._ordered(ArchivedTaskModel))
+        archived = self._to_views(result)
+        return list(heapq.merge(tasks, archived, key=_list_order, reverse=True))
+
+    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[TaskView]:
         result = await self.session.execute(
-            select(TaskModel)
+            self._ordered(TaskModel)
             .where(TaskModel.is_done == is_done)
             .where(TaskModel.is_archived == is_archived)
-            .order_by(priority_order.desc(), TaskModel.created_at.desc())
         )
-        models = result.scalars().all()
-        return [self._to_entity(model) for model in models]
+        tasks = self._to_views(result)
+        if not is_archived:
+            return tasks
 
-    async def update(self, task: Task) -> Task:
+        # Rows archived before the archive table existed stay in ``tasks``
+        # until ``move_archived_tasks`` reaches them.
         result = await self.session.execute(
-            select(TaskModel).where(TaskModel.id == str(task.id))
+            self._ordered(ArchivedTaskModel).where(ArchivedTaskModel.is_done == is_done)
         )
-        model = result.scalar_one_or_none()
+        archived = self._to_views(result)
+        return list(heapq.merge(tasks, archived, key=_list_order, reverse=True))
+
+    async def update(self, task: Task) -> Task:
+        model = await self._find_model(task.id)
         if not model:
             raise ValueError(f"Task with id {task.id} not found")
 
         model.title = task.title
         model.description = task.description
         model.priority = task.priority
+        model.priority_rank = PRIORITY_RANK[task.priority]
         model.is_done = task.is_done
         model.is_archived = task.is_archived
         model.updated_at = task.updated_at
+        model.due_at = task.due_at
+        model.completed_at = task.completed_at
 
         await self.session.commit()
         await self.session.refresh(model)
         return self._to_entity(model)
 
-    async def delete(self, task_id: UUID) -> bool:
+    async def update_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        row = self._to_row(task)
+        del row["id"]
+        for model_class in (TaskModel, ArchivedTaskModel):
+            table = model_class.__table__
+            result = await self.session.execute(
+                update(table)
+                .where(table.c.id == task.id)
+                .where(self._within_limit(task, limit))
+                .values(row)
+                .returning(*table.c)
+            )
+            updated = result.first()
+            if updated is None:
+                # Only a refused update pays for telling "over the limit"
+                # apart from "not in this table".
+                found = await self.session.execute(
+                    select(exists().where(table.c.id == task.id))
+                )
+                if not found.scalar():
+                    continue
+            await self.session.commit()
+            # The ORM copy loaded by get_by_id no longer matches the row.
+            self.session.expire_all()
+            return self._to_entity(updated) if updated else None
+        raise ValueError(f"Task with id {task.id} not found")
+
+    async def archive(self, task: Task) -> Task:
         result = await self.session.execute(
-            select(TaskModel).where(TaskModel.id == str(task_id))
+            delete(TaskModel).where(TaskModel.id == task.id)
         )
-        model = result.scalar_one_or_none()
+        if not result.rowcount:
+            # Already in the archive store.
+            return await self.update(task)
+
+        model = self._to_model(task, ArchivedTaskModel)
+        self.session.add(model)
+        await self.session.commit()
+        await self.session.refresh(model)
+        return self._to_entity(model)
+
+    async def delete(self, task_id: UUID) -> bool:
+        model = await self._find_model(task_id)
         if not model:
             return False
 
@@ -114,9 +296,19 @@ class SQLiteTaskRepository(TaskRepository):
         return True
 
     async def count_by_priority(self, priority: Priority) -> int:
-        result = await self.session.execute(
-            select(func.count(TaskModel.id))
-            .where(TaskModel.priority == priority)
-            .where(TaskModel.is_done.is_(False))
-        )
+        result = await self.session.execute(select(self._pending_count(priority)))
         return result.scalar() or 0
+
+    async def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        model_classes = [TaskModel]
+        if is_archived:
+            model_classes.append(ArchivedTaskModel)
+        total = 0
+        for model_class in model_classes:
+            result = await self.session.execute(
+                select(func.count(model_class.id))
+                .where(model_class.is_done == is_done)
+                .where(model_class.is_archived == is_archived)
+            )
+            total += result.scalar() or 0
+        return total
@@ -0,0 +1,69 @@
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities import Priority, Task, TaskView
+from src.domain.repositories import TaskRepository
+from src.infrastructure.observability import tracer
+
+
+class TracedTaskRepository(TaskRepository):
+    """Wraps another repository and opens a ``repository.*`` span per call."""
+
+    def __init__(self, inner: TaskRepository):
+        self.inner = inner
+
+    async def create(self, task: Task) -> Task:
+        with tracer.span("repository.create"):
+            return await self.inner.create(task)
+
+    async def create_many(self, tasks: list[Task]) -> int:
+        with tracer.span("repository.create_many", count=len(tasks)):
+            return await self.inner.create_many(tasks)
+
+    async def create_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        with tracer.span("repository.create_within_limit", limit=limit):
+            return await self.inner.create_within_limit(task, limit)
+
+    async def get_by_id(self, task_id: UUID) -> Optional[Task]:
+        with tracer.span("repository.get_by_id"):
+            return await self.inner.get_by_id(task_id)
+
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[TaskView]:
+        with tracer.span("repository.get_by_ids", count=len(task_ids)):
+            return await self.inner.get_by_ids(task_ids)
+
+    async def get_all(self, include_archived: bool = True) -> list[TaskView]:
+        with tracer.span("repository.get_all", include_archived=include_archived):
+            return await self.inner.get_all(include_archived)
+
+    async def get_by_status(self, is_done: bool, is_archived: bool) -> list[TaskView]:
+        with tracer.span(
+            "repository.get_by_status", is_done=is_done, is_archived=is_archived
+        ):
+            return await self.inner.get_by_status(is_done, is_archived)
+
+    async def update(self, task: Task) -> Task:
+        with tracer.span("repository.update"):
+            return await self.inner.update(task)
+
+    async def update_within_limit(self, task: Task, limit: int) -> Optional[Task]:
+        with tracer.span("repository.update_within_limit", limit=limit):
+            return await self.inner.update_within_limit(task, limit)
+
+    async def archive(self, task: Task) -> Task:
+        with tracer.span("repository.archive"):
+            return await self.inner.archive(task)
+
+    async def delete(self, task_id: UUID) -> bool:
+        with tracer.span("repository.delete"):
+            return await self.inner.delete(task_id)
+
+    async def count_by_priority(self, priority: Priority) -> int:
+        with tracer.span("repository.count_by_priority", priority=priority.value):
+            return await self.inner.count_by_priority(priority)
+
+    async def count_by_status(self, is_done: bool, is_archived: bool) -> int:
+        with tracer.span(
+            "repository.count_by_status", is_done=is_done, is_archived=is_archived
+        ):
+            return await self.inner.count_by_status(is_done, is_archived)
@@ -1,3 +1,23 @@
+from .admission_middleware import AdmissionMiddleware
+from .admin_router import router as admin_router
+from .metrics_middleware import MetricsMiddleware
+from .metrics_router import router as metrics_router
+from .profiling_middleware import ProfilingMiddleware
+from .report_router import router as report_router
+from .sql_budget_middleware import SQLBudgetMiddleware
 from .task_router import router as task_router
+from .traced_route import TracedRoute
+from .tracing_middleware import TracingMiddleware
 
-__all__ = ["task_router"]
+__all__ = [
+    "AdmissionMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "SQLBudgetMiddleware",
+    "TracedRoute",
+    "TracingMiddleware",
+    "admin_router",
+    "metrics_router",
+    "report_router",
+    "task_router",
+]
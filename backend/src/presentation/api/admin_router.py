@@ -0,0 +1,181 @@
+import hmac
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
+from fastapi.responses import FileResponse, PlainTextResponse
+
+from src.infrastructure.backup import (
+    BackupInProgressError,
+    BackupManager,
+    backup_manager,
+)
+from src.infrastructure.config import settings
+from src.infrastructure.database import DatabaseMaintenance, database_maintenance
+from src.infrastructure.observability import ProfileStore, profile_store
+from src.presentation.schemas import (
+    BackupProgressResponse,
+    MaintenanceStepResponse,
+    ProfileResponse,
+    SnapshotResponse,
+)
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def get_profile_store() -> ProfileStore:
+    return profile_store
+
+
+def get_backup_manager() -> BackupManager:
+    return backup_manager
+
+
+def get_database_maintenance() -> DatabaseMaintenance:
+    return database_maintenance
+
+
+def get_profiling_token() -> str:
+    return settings.profiling_token
+
+
+def get_admin_token() -> str:
+    return settings.admin_token
+
+
+def _check_token(given: Optional[str], expected: str, detail: str) -> None:
+    # With no token configured the endpoints stay closed.
+    if not expected or not hmac.compare_digest(
+        (given or "").encode(), expected.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+def require_profiling_token(
+    x_profile_token: Optional[str] = Header(None),
+    profiling_token: str = Depends(get_profiling_token),
+) -> None:
+    _check_token(x_profile_token, profiling_token, "Invalid profiling token")
+
+
+def require_admin_token(
+    x_admin_token: Optional[str] = Header(None),
+    admin_token: str = Depends(get_admin_token),
+) -> None:
+    # Backups are full copies of the database, so they need their own token
+    # rather than the one handed out for collecting profiles.
+    _check_token(x_admin_token, admin_token, "Invalid admin token")
+
+
+@router.get(
+    "/profiles",
+    response_model=list[ProfileResponse],
+    dependencies=[Depends(require_profiling_token)],
+)
+async def list_profiles(store: ProfileStore = Depends(get_profile_store)):
+    return [ProfileResponse.model_validate(info) for info in store.profiles()]
+
+
+@router.get("/profiles/{name}", dependencies=[Depends(require_profiling_token)])
+async def get_profile(
+    name: str,
+    output: str = Query("prof", alias="format", pattern="^(prof|text)$"),
+    store: ProfileStore = Depends(get_profile_store),
+) -> Response:
+    if output == "text":
+        summary = store.summary(name)
+        if summary is not None:
+            return PlainTextResponse(summary)
+    else:
+        path = store.path_for(name)
+        if path is not None:
+            return FileResponse(
+                path, media_type="application/octet-stream", filename=name
+            )
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail=f"Profile {name} not found"
+    )
+
+
+@router.post(
+    "/backups",
+    response_model=BackupProgressResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(require_admin_token)],
+)
+async def start_backup(manager: BackupManager = Depends(get_backup_manager)):
+    try:
+        progress = manager.start()
+    except BackupInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return BackupProgressResponse.model_validate(progress)
+
+
+@router.get(
+    "/backups",
+    response_model=list[SnapshotResponse],
+    dependencies=[Depends(require_admin_token)],
+)
+async def list_backups(manager: BackupManager = Depends(get_backup_manager)):
+    return [SnapshotResponse.model_validate(info) for info in manager.snapshots()]
+
+
+@router.get(
+    "/backups/progress",
+    response_model=BackupProgressResponse,
+    dependencies=[Depends(require_admin_token)],
+)
+async def get_backup_progress(manager: BackupManager = Depends(get_backup_manager)):
+    if manager.progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No backup has been taken"
+        )
+    return BackupProgressResponse.model_validate(manager.progress)
+
+
+@router.get("/backups/{name}", dependencies=[Depends(require_admin_token)])
+async def download_backup(
+    name: str, manager: BackupManager = Depends(get_backup_manager)
+) -> Response:
+    path = manager.path_for(name)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Backup {name} not found"
+        )
+    return FileResponse(path, media_type="application/vnd.sqlite3", filename=name)
+
+
+@router.get(
+    "/maintenance",
+    response_model=list[MaintenanceStepResponse],
+    dependencies=[Depends(require_admin_token)],
+)
+async def get_maintenance(
+    maintenance: DatabaseMaintenance = Depends(get_database_maintenance),
+):
+    return [
+        MaintenanceStepResponse.model_validate(step)
+        for step in maintenance.last_run.values()
+    ]
+
+
+@router.post(
+    "/maintenance",
+    response_model=list[MaintenanceStepResponse],
+    dependencies=[Depends(require_admin_token)],
+)
+async def run_maintenance(
+    maintenance: DatabaseMaintenance = Depends(get_database_maintenance),
+):
+    return [
+        MaintenanceStepResponse.model_validate(step) for step in await maintenance.run()
+    ]
@@ -0,0 +1,87 @@
+import json
+from time import perf_counter
+from typing import Optional
+
+from src.infrastructure.admission import AdmissionRejected, ConcurrencyLimiter
+from src.infrastructure.config import settings
+from src.infrastructure.observability import (
+    admission_queued_requests,
+    admission_rejections_total,
+)
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class AdmissionMiddleware:
+    """Caps concurrent reads and commands separately and sheds the excess.
+
+    Commands (``POST``, ``PUT``, ``PATCH``, ``DELETE``) all queue for
+    SQLite's single write lock, so they get a small limit of their own and
+    cannot starve reads. A request that cannot start within the queue
+    deadline gets ``503`` with ``Retry-After`` instead of waiting until
+    the client has given up. Paths under ``exempt_prefixes`` (metrics and
+    admin) always pass.
+    """
+
+    def __init__(
+        self,
+        app,
+        reads: Optional[ConcurrencyLimiter] = None,
+        commands: Optional[ConcurrencyLimiter] = None,
+        exempt_prefixes: tuple[str, ...] = ("/metrics", "/admin"),
+    ):
+        self.app = app
+        self.limiters = {
+            "read": reads
+            or ConcurrencyLimiter(
+                settings.read_concurrency,
+                settings.read_queue_size,
+                settings.admission_queue_timeout_seconds,
+            ),
+            "command": commands
+            or ConcurrencyLimiter(
+                settings.command_concurrency,
+                settings.command_queue_size,
+                settings.admission_queue_timeout_seconds,
+            ),
+        }
+        self.exempt_prefixes = exempt_prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = "read" if scope["method"] in READ_METHODS else "command"
+        limiter = self.limiters[route_class]
+        admission_queued_requests.inc(route_class)
+        try:
+            await limiter.acquire()
+        except AdmissionRejected as rejected:
+            admission_rejections_total.inc(route_class, rejected.reason)
+            await self._reject(send, rejected.retry_after)
+            return
+        finally:
+            admission_queued_requests.dec(route_class)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(perf_counter() - start)
+
+    @staticmethod
+    async def _reject(send, retry_after: int) -> None:
+        body = json.dumps({"detail": "Server is busy, retry later"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
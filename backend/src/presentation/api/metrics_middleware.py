@@ -0,0 +1,44 @@
+from time import perf_counter
+
+from src.infrastructure.observability import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording in-flight requests and route latency.
+
+    Latency is labelled with the matched route template (``/tasks/{task_id}``)
+    rather than the raw path, so task ids never become label values.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            http_request_duration_seconds.observe(
+                perf_counter() - start,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status_code),
+            )
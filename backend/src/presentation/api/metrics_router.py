@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from src.infrastructure.observability import registry
+
+router = APIRouter(tags=["observability"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(content=registry.render(), media_type=registry.content_type)
@@ -0,0 +1,93 @@
+import cProfile
+import hmac
+import logging
+import random
+from typing import Optional
+
+from src.infrastructure.config import settings
+from src.infrastructure.observability import ProfileInfo, ProfileStore, profile_store
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile-token"
+
+
+class ProfilingMiddleware:
+    """Profiles single requests on demand and stores them in a ``ProfileStore``.
+
+    A request is profiled when it carries ``X-Profile-Token`` with the
+    configured token, or when it is picked by ``sample_rate``. The profile
+    covers everything the request runs (router, handler and repository),
+    and its name is returned in ``X-Profile-Id``. Only one request is
+    profiled at a time; cProfile cannot nest, and concurrent requests would
+    blur the result. The middleware is only installed when profiling is
+    enabled, so there is no cost otherwise.
+    """
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore = profile_store,
+        token: str = settings.profiling_token,
+        sample_rate: float = settings.profiling_sample_rate,
+    ):
+        self.app = app
+        self.store = store
+        self.token = token.encode()
+        self.sample_rate = sample_rate
+        self._active = False
+
+    def _wants_profile(self, scope) -> bool:
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self.token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active or not self._wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profile = cProfile.Profile()
+        response_start = None
+        saved = False
+
+        def save() -> Optional[ProfileInfo]:
+            nonlocal saved
+            profile.disable()
+            saved = True
+            try:
+                return self.store.save(profile, scope["method"], scope["path"])
+            except OSError:
+                logger.exception("Failed to store request profile")
+                return None
+
+        async def hold_response_start(message):
+            nonlocal response_start
+            # The profile id is only known once the request has finished,
+            # so the start message waits for the final body chunk.
+            if message["type"] == "http.response.start":
+                response_start = message
+                return
+            if response_start is not None:
+                if not message.get("more_body", False):
+                    info = save()
+                    if info is not None:
+                        response_start["headers"] = [
+                            *response_start.get("headers", []),
+                            (b"x-profile-id", info.name.encode()),
+                        ]
+                await send(response_start)
+                response_start = None
+            await send(message)
+
+        try:
+            profile.enable()
+            await self.app(scope, receive, hold_response_start)
+        finally:
+            if not saved:
+                # Streamed or failed responses are still kept, without a header.
+                save()
+            self._active = False
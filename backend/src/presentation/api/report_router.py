@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import FileResponse
+
+from src.infrastructure.reports import (
+    ReportJob,
+    ReportJobs,
+    ReportQueueFullError,
+    report_jobs,
+)
+from src.presentation.schemas import ReportJobResponse, ReportRequest
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+def get_report_jobs() -> ReportJobs:
+    return report_jobs
+
+
+def _find_job(job_id: str, jobs: ReportJobs) -> ReportJob:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Report job {job_id} not found",
+        )
+    return job
+
+
+@router.post(
+    "/",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def create_report(
+    request: ReportRequest, jobs: ReportJobs = Depends(get_report_jobs)
+):
+    try:
+        job = jobs.submit(request.kind)
+    except ReportQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ReportJobResponse.model_validate(job)
+
+
+@router.get("/{job_id}", response_model=ReportJobResponse)
+async def get_report(job_id: str, jobs: ReportJobs = Depends(get_report_jobs)):
+    return ReportJobResponse.model_validate(_find_job(job_id, jobs))
+
+
+@router.get("/{job_id}/result")
+async def download_report(
+    job_id: str, jobs: ReportJobs = Depends(get_report_jobs)
+) -> Response:
+    job = _find_job(job_id, jobs)
+    path = jobs.path_for(job)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Report job {job_id} is {job.state}",
+        )
+    return FileResponse(path, media_type=job.media_type, filename=job.filename)
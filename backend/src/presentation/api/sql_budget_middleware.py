@@ -0,0 +1,68 @@
+import logging
+
+from src.infrastructure.config import settings
+from src.infrastructure.observability import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class SQLBudgetMiddleware:
+    """Counts SQL statements, rows and database time for every request.
+
+    In dev mode the totals are returned as ``X-DB-Statements``,
+    ``X-DB-Rows`` and ``X-DB-Time-Ms`` response headers. Requests over the
+    statement budget, or that repeat one statement more often than allowed
+    (an N+1 loop), are logged as warnings.
+    """
+
+    def __init__(
+        self,
+        app,
+        budget: int = settings.sql_statement_budget,
+        repeated_limit: int = settings.sql_repeated_statement_limit,
+        headers: bool = settings.dev_mode,
+    ):
+        self.app = app
+        self.budget = budget
+        self.repeated_limit = repeated_limit
+        self.headers = headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_headers(message):
+                if self.headers and message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-db-statements", str(stats.statements).encode()),
+                        (b"x-db-rows", str(stats.rows).encode()),
+                        (b"x-db-time-ms", f"{stats.db_seconds * 1000:.3f}".encode()),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+
+        self._check(scope, stats)
+
+    def _check(self, scope, stats) -> None:
+        if stats.statements > self.budget:
+            logger.warning(
+                "%s %s ran %d SQL statements (budget %d, %.1f ms)",
+                scope["method"],
+                scope["path"],
+                stats.statements,
+                self.budget,
+                stats.db_seconds * 1000,
+            )
+        for statement, count in stats.repeated(self.repeated_limit):
+            logger.warning(
+                "%s %s ran the same statement %d times (possible N+1): %s",
+                scope["method"],
+                scope["path"],
+                count,
+                " ".join(statement.split())[:200],
+            )
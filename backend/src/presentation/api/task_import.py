@@ -0,0 +1,148 @@
+import csv
+from typing import AsyncIterator, Optional
+
+from pydantic import ValidationError
+
+from src.application.commands import CreateTaskCommand, ImportRow
+from src.presentation.schemas import TaskCreateRequest
+
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json-lines": "ndjson",
+}
+
+CSV_COLUMNS = ("title", "description", "priority")
+
+
+def import_format_for(content_type: str) -> Optional[str]:
+    return IMPORT_FORMATS.get(content_type.split(";")[0].strip().lower())
+
+
+async def _lines(
+    stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[tuple[int, Optional[bytes]]]:
+    """Split a byte stream into numbered lines without reading it whole.
+
+    A line longer than ``max_line_bytes`` is discarded as it streams in and
+    reported as ``None``, so one bad line cannot exhaust memory.
+    """
+    buffer = b""
+    number = 0
+    too_long = False
+    async for chunk in stream:
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for raw in complete:
+            number += 1
+            if too_long or len(raw) > max_line_bytes:
+                too_long = False
+                yield number, None
+            else:
+                yield number, raw.removesuffix(b"\r")
+        if len(buffer) > max_line_bytes:
+            too_long = True
+            buffer = b""
+    if buffer or too_long:
+        yield number + 1, None if too_long else buffer.removesuffix(b"\r")
+
+
+def _to_command(request: TaskCreateRequest) -> CreateTaskCommand:
+    return CreateTaskCommand(
+        title=request.title,
+        description=request.description,
+        priority=request.priority,
+        due_at=request.due_at,
+    )
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+async def ndjson_rows(
+    stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[ImportRow]:
+    """One JSON object per line, validated as a ``TaskCreateRequest``."""
+    async for number, raw in _lines(stream, max_line_bytes):
+        if raw is None:
+            yield number, f"Line is longer than {max_line_bytes} bytes"
+        elif raw.strip():
+            try:
+                yield number, _to_command(TaskCreateRequest.model_validate_json(raw))
+            except ValidationError as error:
+                yield number, _describe(error)
+
+
+async def csv_rows(
+    stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[ImportRow]:
+    """CSV with a header row naming at least ``title``, ``description``, ``priority``.
+
+    Quoted fields may span lines; a record is complete once its quotes
+    balance. Errors are reported against the record's first line. An empty
+    field in any other column, such as ``due_at``, counts as not given.
+    """
+    header: Optional[list[str]] = None
+    pending: list[str] = []
+    pending_bytes = 0
+    start = 0
+    async for number, raw in _lines(stream, max_line_bytes):
+        if raw is not None:
+            try:
+                text = raw.decode("utf-8-sig" if number == 1 else "utf-8")
+            except UnicodeDecodeError:
+                raw = None
+        if raw is None or pending_bytes + len(raw) > max_line_bytes:
+            if header is None:
+                raise ValueError("CSV header line could not be read")
+            yield start or number, f"Record is longer than {max_line_bytes} bytes"
+            pending, pending_bytes, start = [], 0, 0
+            continue
+        if not pending:
+            if not text.strip():
+                continue
+            start = number
+        pending.append(text)
+        pending_bytes += len(raw)
+        if sum(part.count('"') for part in pending) % 2:
+            continue  # inside a quoted field that continues on the next line
+
+        record = next(csv.reader(["\n".join(pending)]))
+        pending, pending_bytes = [], 0
+        if header is None:
+            header = [name.strip().lower() for name in record]
+            missing = [name for name in CSV_COLUMNS if name not in header]
+            if missing:
+                raise ValueError(f"CSV header is missing {', '.join(missing)}")
+            continue
+        if len(record) != len(header):
+            yield start, f"Expected {len(header)} fields, got {len(record)}"
+            continue
+        try:
+            request = TaskCreateRequest.model_validate(
+                {
+                    name: value
+                    for name, value in zip(header, record)
+                    if value or name in CSV_COLUMNS
+                }
+            )
+        except ValidationError as error:
+            yield start, _describe(error)
+        else:
+            yield start, _to_command(request)
+
+    if pending:
+        yield start, "Quoted field is not closed before the end of the file"
+
+
+def parse_import(
+    import_format: str, stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[ImportRow]:
+    if import_format == "csv":
+        return csv_rows(stream, max_line_bytes)
+    return ndjson_rows(stream, max_line_bytes)
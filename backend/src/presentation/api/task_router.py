@@ -1,11 +1,24 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.commands import (
     ArchiveTaskCommand,
     CreateTaskCommand,
+    ImportTasksCommand,
     MarkTaskDoneCommand,
     MarkTaskPendingCommand,
     ModifyTaskCommand,
@@ -14,17 +27,53 @@ from src.application.handlers import (
     ArchiveTaskHandler,
     CreateTaskHandler,
     GetAllTasksHandler,
+    GetTaskAnalyticsHandler,
     GetTasksByStatusHandler,
+    GetTaskStatsHandler,
+    GetTopPendingTasksHandler,
+    ImportTasksHandler,
     MarkTaskDoneHandler,
     MarkTaskPendingHandler,
     ModifyTaskHandler,
 )
-from src.application.queries import GetAllTasksQuery, GetTasksByStatusQuery
+from src.application.queries import (
+    GetAllTasksQuery,
+    GetTaskAnalyticsQuery,
+    GetTasksByStatusQuery,
+    GetTaskStatsQuery,
+    GetTopPendingTasksQuery,
+)
+from src.domain.entities import PriorityLimitExceededError
+from src.domain.repositories import (
+    TaskAnalyticsSource,
+    TaskChangeListener,
+    TaskIndex,
+    TaskRepository,
+)
+from src.infrastructure import analytics
+from src.infrastructure.config import settings
 from src.infrastructure.database import database
-from src.infrastructure.repositories import SQLiteTaskRepository
-from src.presentation.schemas import TaskCreateRequest, TaskResponse, TaskUpdateRequest
+from src.infrastructure.idempotency import IdempotencyStore
+from src.infrastructure import index as task_indexes
+from src.infrastructure import reminders
+from src.infrastructure.observability import handler_duration_seconds, tracer
+from src.infrastructure.repositories import (
+    TracedTaskRepository,
+    task_repository_for_session,
+)
+from src.presentation.schemas import (
+    TaskCreateRequest,
+    TaskImportResponse,
+    TaskAnalyticsResponse,
+    TaskResponse,
+    TaskStatsResponse,
+    TaskUpdateRequest,
+)
+
+from .task_import import import_format_for, parse_import
+from .traced_route import TracedRoute
 
-router = APIRouter(prefix="/tasks", tags=["tasks"])
+router = APIRouter(prefix="/tasks", tags=["tasks"], route_class=TracedRoute)
 
 
 async def get_db_session():
@@ -32,39 +81,201 @@ async def get_db_session():
         yield session
 
 
-@router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-async def create_task(
-    task_data: TaskCreateRequest, db: AsyncSession = Depends(get_db_session)
+def get_task_repository(
+    db: AsyncSession = Depends(get_db_session),
+) -> TaskRepository:
+    repository = task_repository_for_session(db)
+    return TracedTaskRepository(repository) if tracer.enabled else repository
+
+
+def get_task_index() -> Optional[TaskIndex]:
+    return task_indexes.task_index if settings.task_index_enabled else None
+
+
+def get_analytics_cache() -> analytics.AnalyticsCache:
+    return analytics.analytics_cache
+
+
+def get_reminder_scheduler() -> Optional[reminders.ReminderScheduler]:
+    if settings.reminders_enabled and settings.task_repository == "sqlite":
+        return reminders.reminder_scheduler
+    return None
+
+
+def get_task_listeners(
+    index: Optional[TaskIndex] = Depends(get_task_index),
+    analytics_cache: analytics.AnalyticsCache = Depends(get_analytics_cache),
+    scheduler: Optional[reminders.ReminderScheduler] = Depends(get_reminder_scheduler),
+) -> list[TaskChangeListener]:
+    listeners = [index, analytics_cache, scheduler]
+    return [listener for listener in listeners if listener is not None]
+
+
+async def get_task_analytics_source(
+    db: AsyncSession = Depends(get_db_session),
+    analytics_cache: analytics.AnalyticsCache = Depends(get_analytics_cache),
 ):
+    repository = task_repository_for_session(db)
+    async with analytics.task_analytics_scope(repository, analytics_cache) as source:
+        yield source
+
+
+async def _handle(handler, message, timed: bool = True):
+    # The timeout cancels the handler's pending database call, so the
+    # session is closed and its connection returned to the pool right away.
+    # Long-running handlers pass ``timed=False`` and time their own calls.
+    # A command may already be committed when the timeout fires, so the 503
+    # leaves its outcome unknown. Commands are therefore timed only when
+    # they carry an Idempotency-Key, which makes the retry safe.
+    start = perf_counter()
+    outcome = "error"
     try:
-        repository = SQLiteTaskRepository(db)
-        handler = CreateTaskHandler(repository)
-        command = CreateTaskCommand(
-            title=task_data.title,
-            description=task_data.description,
-            priority=task_data.priority,
+        with tracer.span(f"handler.{type(handler).__name__}"):
+            async with asyncio.timeout(settings.db_timeout_seconds if timed else None):
+                result = await handler.handle(message)
+        outcome = "ok"
+        return result
+    except TimeoutError:
+        outcome = "timeout"
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database did not respond in time",
+            headers={"Retry-After": "1"},
         )
-        task = await handler.handle(command)
-        return TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            priority=task.priority,
-            is_done=task.is_done,
-            is_archived=task.is_archived,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
+    finally:
+        handler_duration_seconds.observe(
+            perf_counter() - start, type(handler).__name__, outcome
+        )
+
+
+async def _run_idempotent(
+    db: AsyncSession,
+    idempotency_key: Optional[str],
+    request_hash: str,
+    status_code: int,
+    execute: Callable[[], Awaitable[TaskResponse]],
+):
+    if not idempotency_key:
+        return await execute()
+
+    store = IdempotencyStore(db)
+    stored = await store.claim(idempotency_key, request_hash)
+    if stored is not None:
+        if stored.request_hash != request_hash:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Idempotency-Key was already used for a different request",
+            )
+        if stored.pending:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"},
+            )
+        return Response(
+            content=stored.body,
+            status_code=stored.status_code,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
         )
+    if settings.task_repository != "sqlite":
+        # The command does not commit through this session, so the claim
+        # has to be visible to other requests before it runs.
+        await db.commit()
+
+    try:
+        response = await execute()
+    except Exception as e:
+        if not (
+            isinstance(e, HTTPException)
+            and e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        ):
+            # Refused or failed: let a retry run again rather than leave a
+            # pending claim behind for the key's whole TTL. After a timeout
+            # the outcome is unknown and the claim stays.
+            await store.release(idempotency_key)
+        raise
+    await store.complete(idempotency_key, status_code, response.model_dump_json())
+    return response
+
+
+@router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    task_data: TaskCreateRequest,
+    db: AsyncSession = Depends(get_db_session),
+    repository: TaskRepository = Depends(get_task_repository),
+    listeners: list[TaskChangeListener] = Depends(get_task_listeners),
+    idempotency_key: Optional[str] = Header(None),
+):
+    async def execute() -> TaskResponse:
+        try:
+            handler = CreateTaskHandler(repository, listeners)
+            command = CreateTaskCommand(
+                title=task_data.title,
+                description=task_data.description,
+                priority=task_data.priority,
+                due_at=task_data.due_at,
+            )
+            task = await _handle(handler, command, timed=idempotency_key is not None)
+            return TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                priority=task.priority,
+                is_done=task.is_done,
+                is_archived=task.is_archived,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                due_at=task.due_at,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return await _run_idempotent(
+        db,
+        idempotency_key,
+        IdempotencyStore.fingerprint("POST", "/tasks/", task_data.model_dump_json()),
+        status.HTTP_201_CREATED,
+        execute,
+    )
+
+
+@router.post("/import", response_model=TaskImportResponse)
+async def import_tasks(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(None),
+    repository: TaskRepository = Depends(get_task_repository),
+    listeners: list[TaskChangeListener] = Depends(get_task_listeners),
+):
+    import_format = format or import_format_for(request.headers.get("content-type", ""))
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass ?format=",
+        )
+    handler = ImportTasksHandler(
+        repository,
+        listeners,
+        chunk_size=settings.import_chunk_size,
+        chunk_timeout=settings.db_timeout_seconds,
+        max_errors=settings.import_max_errors,
+    )
+    rows = parse_import(import_format, request.stream(), settings.import_max_line_bytes)
+    try:
+        summary = await _handle(handler, ImportTasksCommand(rows=rows), timed=False)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskImportResponse.model_validate(summary)
 
 
 @router.get("/", response_model=list[TaskResponse])
-async def get_all_tasks(db: AsyncSession = Depends(get_db_session)):
-    repository = SQLiteTaskRepository(db)
+async def get_all_tasks(
+    include_archived: bool = True,
+    repository: TaskRepository = Depends(get_task_repository),
+):
     handler = GetAllTasksHandler(repository)
-    query = GetAllTasksQuery()
-    tasks = await handler.handle(query)
+    query = GetAllTasksQuery(include_archived=include_archived)
+    tasks = await _handle(handler, query)
     return [
         TaskResponse(
             id=task.id,
@@ -75,6 +286,7 @@ async def get_all_tasks(db: AsyncSession = Depends(get_db_session)):
             is_archived=task.is_archived,
             created_at=task.created_at,
             updated_at=task.updated_at,
+            due_at=task.due_at,
         )
         for task in tasks
     ]
@@ -82,12 +294,11 @@ async def get_all_tasks(db: AsyncSession = Depends(get_db_session)):
 
 @router.get("/status/{is_done}", response_model=list[TaskResponse])
 async def get_tasks_by_status(
-    is_done: bool, db: AsyncSession = Depends(get_db_session)
+    is_done: bool, repository: TaskRepository = Depends(get_task_repository)
 ):
-    repository = SQLiteTaskRepository(db)
     handler = GetTasksByStatusHandler(repository)
     query = GetTasksByStatusQuery(is_done=is_done, is_archived=False)
-    tasks = await handler.handle(query)
+    tasks = await _handle(handler, query)
     return [
         TaskResponse(
             id=task.id,
@@ -98,49 +309,46 @@ async def get_tasks_by_status(
             is_archived=task.is_archived,
             created_at=task.created_at,
             updated_at=task.updated_at,
+            due_at=task.due_at,
         )
         for task in tasks
     ]
 
 
-@router.put("/{task_id}", response_model=TaskResponse)
-async def update_task(
-    task_id: UUID,
-    task_data: TaskUpdateRequest,
-    db: AsyncSession = Depends(get_db_session),
+@router.get("/stats", response_model=TaskStatsResponse)
+async def get_task_stats(
+    repository: TaskRepository = Depends(get_task_repository),
+    index: Optional[TaskIndex] = Depends(get_task_index),
 ):
+    handler = GetTaskStatsHandler(repository, index)
+    stats = await _handle(handler, GetTaskStatsQuery())
+    return TaskStatsResponse.model_validate(stats)
+
+
+@router.get("/analytics", response_model=TaskAnalyticsResponse)
+async def get_task_analytics(
+    days: int = Query(30, ge=1, le=365),
+    source: TaskAnalyticsSource = Depends(get_task_analytics_source),
+):
+    handler = GetTaskAnalyticsHandler(source)
     try:
-        repository = SQLiteTaskRepository(db)
-        handler = ModifyTaskHandler(repository)
-        command = ModifyTaskCommand(
-            task_id=task_id,
-            title=task_data.title,
-            description=task_data.description,
-            priority=task_data.priority,
-        )
-        task = await handler.handle(command)
-        return TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            priority=task.priority,
-            is_done=task.is_done,
-            is_archived=task.is_archived,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
+        result = await _handle(handler, GetTaskAnalyticsQuery(days=days), timed=False)
     except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return TaskAnalyticsResponse.model_validate(result)
 
 
-@router.patch("/{task_id}/done", response_model=TaskResponse)
-async def mark_task_done(task_id: UUID, db: AsyncSession = Depends(get_db_session)):
-    try:
-        repository = SQLiteTaskRepository(db)
-        handler = MarkTaskDoneHandler(repository)
-        command = MarkTaskDoneCommand(task_id=task_id)
-        task = await handler.handle(command)
-        return TaskResponse(
+@router.get("/top", response_model=list[TaskResponse])
+async def get_top_pending_tasks(
+    limit: int = Query(10, ge=1, le=100),
+    repository: TaskRepository = Depends(get_task_repository),
+    index: Optional[TaskIndex] = Depends(get_task_index),
+):
+    handler = GetTopPendingTasksHandler(repository, index)
+    query = GetTopPendingTasksQuery(limit=limit)
+    tasks = await _handle(handler, query)
+    return [
+        TaskResponse(
             id=task.id,
             title=task.title,
             description=task.description,
@@ -149,48 +357,168 @@ async def mark_task_done(task_id: UUID, db: AsyncSession = Depends(get_db_sessio
             is_archived=task.is_archived,
             created_at=task.created_at,
             updated_at=task.updated_at,
+            due_at=task.due_at,
         )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        for task in tasks
+    ]
+
+
+@router.put("/{task_id}", response_model=TaskResponse)
+async def update_task(
+    task_id: UUID,
+    task_data: TaskUpdateRequest,
+    db: AsyncSession = Depends(get_db_session),
+    repository: TaskRepository = Depends(get_task_repository),
+    listeners: list[TaskChangeListener] = Depends(get_task_listeners),
+    idempotency_key: Optional[str] = Header(None),
+):
+    async def execute() -> TaskResponse:
+        try:
+            handler = ModifyTaskHandler(repository, listeners)
+            command = ModifyTaskCommand(
+                task_id=task_id,
+                title=task_data.title,
+                description=task_data.description,
+                priority=task_data.priority,
+                due_at=task_data.due_at,
+                clear_due_at="due_at" in task_data.model_fields_set
+                and task_data.due_at is None,
+            )
+            task = await _handle(handler, command, timed=idempotency_key is not None)
+            return TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                priority=task.priority,
+                is_done=task.is_done,
+                is_archived=task.is_archived,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                due_at=task.due_at,
+            )
+        except PriorityLimitExceededError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return await _run_idempotent(
+        db,
+        idempotency_key,
+        # Only the fields sent: an explicit null due_at clears it, an
+        # omitted one keeps it.
+        IdempotencyStore.fingerprint(
+            "PUT", f"/tasks/{task_id}", task_data.model_dump_json(exclude_unset=True)
+        ),
+        status.HTTP_200_OK,
+        execute,
+    )
+
+
+@router.patch("/{task_id}/done", response_model=TaskResponse)
+async def mark_task_done(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+    repository: TaskRepository = Depends(get_task_repository),
+    listeners: list[TaskChangeListener] = Depends(get_task_listeners),
+    idempotency_key: Optional[str] = Header(None),
+):
+    async def execute() -> TaskResponse:
+        try:
+            handler = MarkTaskDoneHandler(repository, listeners)
+            command = MarkTaskDoneCommand(task_id=task_id)
+            task = await _handle(handler, command, timed=idempotency_key is not None)
+            return TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                priority=task.priority,
+                is_done=task.is_done,
+                is_archived=task.is_archived,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                due_at=task.due_at,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return await _run_idempotent(
+        db,
+        idempotency_key,
+        IdempotencyStore.fingerprint("PATCH", f"/tasks/{task_id}/done"),
+        status.HTTP_200_OK,
+        execute,
+    )
 
 
 @router.patch("/{task_id}/pending", response_model=TaskResponse)
-async def mark_task_pending(task_id: UUID, db: AsyncSession = Depends(get_db_session)):
-    try:
-        repository = SQLiteTaskRepository(db)
-        handler = MarkTaskPendingHandler(repository)
-        command = MarkTaskPendingCommand(task_id=task_id)
-        task = await handler.handle(command)
-        return TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            priority=task.priority,
-            is_done=task.is_done,
-            is_archived=task.is_archived,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+async def mark_task_pending(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+    repository: TaskRepository = Depends(get_task_repository),
+    listeners: list[TaskChangeListener] = Depends(get_task_listeners),
+    idempotency_key: Optional[str] = Header(None),
+):
+    async def execute() -> TaskResponse:
+        try:
+            handler = MarkTaskPendingHandler(repository, listeners)
+            command = MarkTaskPendingCommand(task_id=task_id)
+            task = await _handle(handler, command, timed=idempotency_key is not None)
+            return TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                priority=task.priority,
+                is_done=task.is_done,
+                is_archived=task.is_archived,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                due_at=task.due_at,
+            )
+        except PriorityLimitExceededError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return await _run_idempotent(
+        db,
+        idempotency_key,
+        IdempotencyStore.fingerprint("PATCH", f"/tasks/{task_id}/pending"),
+        status.HTTP_200_OK,
+        execute,
+    )
 
 
 @router.patch("/{task_id}/archive", response_model=TaskResponse)
-async def archive_task(task_id: UUID, db: AsyncSession = Depends(get_db_session)):
-    try:
-        repository = SQLiteTaskRepository(db)
-        handler = ArchiveTaskHandler(repository)
-        command = ArchiveTaskCommand(task_id=task_id)
-        task = await handler.handle(command)
-        return TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            priority=task.priority,
-            is_done=task.is_done,
-            is_archived=task.is_archived,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+async def archive_task(
+    task_id: UUID,
+    db: AsyncSession = Depends(get_db_session),
+    repository: TaskRepository = Depends(get_task_repository),
+    listeners: list[TaskChangeListener] = Depends(get_task_listeners),
+    idempotency_key: Optional[str] = Header(None),
+):
+    async def execute() -> TaskResponse:
+        try:
+            handler = ArchiveTaskHandler(repository, listeners)
+            command = ArchiveTaskCommand(task_id=task_id)
+            task = await _handle(handler, command, timed=idempotency_key is not None)
+            return TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                priority=task.priority,
+                is_done=task.is_done,
+                is_archived=task.is_archived,
+                created_at=task.created_at,
+                updated_at=task.updated_at,
+                due_at=task.due_at,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return await _run_idempotent(
+        db,
+        idempotency_key,
+        IdempotencyStore.fingerprint("PATCH", f"/tasks/{task_id}/archive"),
+        status.HTTP_200_OK,
+        execute,
+    )
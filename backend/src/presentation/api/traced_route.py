@@ -0,0 +1,39 @@
+import functools
+
+from fastapi.routing import APIRoute
+
+from src.infrastructure.observability import tracer
+
+
+def _traced(endpoint):
+    if getattr(endpoint, "is_traced", False):
+        # include_router() re-creates routes from the already wrapped endpoint.
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def traced_endpoint(*args, **kwargs):
+        trace = tracer.current_trace()
+        if trace is None:
+            return await endpoint(*args, **kwargs)
+
+        # Routing, body parsing and dependency injection (get_db_session,
+        # get_task_repository, ...) all ran between the request start and now.
+        tracer.record_span("request.dependencies", trace.root.start_ns)
+        with tracer.span(f"endpoint.{endpoint.__name__}"):
+            result = await endpoint(*args, **kwargs)
+        # FastAPI validates and serializes the result next; the span is
+        # closed by TracingMiddleware when the response starts.
+        serialize = tracer.start_span("response.serialize")
+        trace.open_spans.append(serialize)
+        return result
+
+    traced_endpoint.is_traced = True
+    return traced_endpoint
+
+
+class TracedRoute(APIRoute):
+    """``APIRoute`` that splits a traced request into dependency, endpoint
+    and serialization spans. Untraced requests pay one context lookup."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _traced(endpoint), **kwargs)
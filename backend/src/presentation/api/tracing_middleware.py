@@ -0,0 +1,42 @@
+from src.infrastructure.observability import Tracer, tracer as default_tracer
+
+
+class TracingMiddleware:
+    """Opens the root ``http.request`` span and returns ``X-Trace-Id``.
+
+    Every request gets a trace id on its response, sampled or not, so it
+    can be quoted in bug reports; only sampled requests record spans. The
+    middleware is installed only when ``TRACE_SAMPLE_RATE`` is above zero.
+    """
+
+    def __init__(self, app, tracer: Tracer = default_tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace_id = self.tracer.new_trace_id()
+        with self.tracer.trace(
+            "http.request", trace_id, method=scope["method"], path=scope["path"]
+        ) as trace:
+
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    if trace is not None:
+                        for span in trace.open_spans:
+                            self.tracer.end_span(span)
+                        trace.open_spans.clear()
+                        trace.root.attributes["status"] = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-trace-id", trace_id.encode()),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace_id)
+            route = scope.get("route")
+            if trace is not None and route is not None:
+                trace.root.attributes["route"] = route.path
@@ -1,8 +1,34 @@
+from .admin_schemas import (
+    BackupProgressResponse,
+    MaintenanceStepResponse,
+    ProfileResponse,
+    SnapshotResponse,
+)
+from .report_schemas import ReportJobResponse, ReportRequest
 from .task_schemas import (
     ErrorResponse,
+    ImportLineErrorResponse,
     TaskCreateRequest,
+    TaskImportResponse,
     TaskResponse,
+    TaskAnalyticsResponse,
+    TaskStatsResponse,
     TaskUpdateRequest,
 )
 
-__all__ = ["TaskCreateRequest", "TaskUpdateRequest", "TaskResponse", "ErrorResponse"]
+__all__ = [
+    "TaskCreateRequest",
+    "TaskUpdateRequest",
+    "TaskResponse",
+    "TaskStatsResponse",
+    "TaskAnalyticsResponse",
+    "TaskImportResponse",
+    "ImportLineErrorResponse",
+    "ErrorResponse",
+    "ProfileResponse",
+    "SnapshotResponse",
+    "BackupProgressResponse",
+    "MaintenanceStepResponse",
+    "ReportRequest",
+    "ReportJobResponse",
+]
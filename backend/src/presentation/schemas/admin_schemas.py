@@ -0,0 +1,43 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ProfileResponse(BaseModel):
+    name: str
+    size_bytes: int
+    created_at: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SnapshotResponse(BaseModel):
+    name: str
+    size_bytes: int
+    created_at: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BackupProgressResponse(BaseModel):
+    name: str
+    state: str
+    pages_total: int
+    pages_copied: int
+    percent: float
+    restarts: int
+    started_at: float
+    finished_at: Optional[float] = None
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MaintenanceStepResponse(BaseModel):
+    name: str
+    started_at: float
+    duration_seconds: float
+    detail: str
+
+    model_config = ConfigDict(from_attributes=True)
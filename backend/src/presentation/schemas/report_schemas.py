@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from src.infrastructure.reports import ReportKind
+
+
+class ReportRequest(BaseModel):
+    kind: ReportKind
+
+
+class ReportJobResponse(BaseModel):
+    id: str
+    kind: ReportKind
+    state: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    rows: Optional[int] = None
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
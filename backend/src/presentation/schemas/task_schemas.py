@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
@@ -13,6 +13,9 @@ class TaskCreateRequest(BaseModel):
         ..., min_length=1, max_length=1000, description="Task description"
     )
     priority: Priority = Field(..., description="Task priority (low, medium, high)")
+    due_at: Optional[datetime] = Field(
+        None, description="When a reminder fires; naive times are UTC"
+    )
 
 
 class TaskUpdateRequest(BaseModel):
@@ -25,6 +28,9 @@ class TaskUpdateRequest(BaseModel):
     priority: Optional[Priority] = Field(
         None, description="Task priority (low, medium, high)"
     )
+    due_at: Optional[datetime] = Field(
+        None, description="When a reminder fires; send null to clear it"
+    )
 
 
 class TaskResponse(BaseModel):
@@ -36,6 +42,66 @@ class TaskResponse(BaseModel):
     is_archived: bool
     created_at: datetime
     updated_at: datetime
+    due_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskStatsResponse(BaseModel):
+    pending: int
+    done: int
+    archived: int
+    pending_by_priority: dict[Priority, int]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DailyThroughputResponse(BaseModel):
+    day: date
+    created: int
+    completed: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeadTimeResponse(BaseModel):
+    priority: Priority
+    completed: int
+    mean_hours: Optional[float]
+    p50_hours: Optional[float]
+    p90_hours: Optional[float]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class BacklogAgeBucketResponse(BaseModel):
+    min_days: int
+    max_days: Optional[int]
+    count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskAnalyticsResponse(BaseModel):
+    days: int
+    throughput: list[DailyThroughputResponse]
+    lead_time: list[LeadTimeResponse]
+    backlog_age: list[BacklogAgeBucketResponse]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ImportLineErrorResponse(BaseModel):
+    line: int
+    message: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TaskImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: list[ImportLineErrorResponse]
 
     model_config = ConfigDict(from_attributes=True)
 
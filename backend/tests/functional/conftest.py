@@ -0,0 +1,92 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from main import app
+from src.infrastructure.database import Base, Database, migrate
+from src.infrastructure.idempotency import idempotency_cache
+from src.infrastructure.observability import (
+    QueryStats,
+    instrument_engine,
+    track_queries,
+)
+from src.infrastructure.repositories import memory_task_repository
+from src.presentation.api.task_router import get_db_session
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+instrument_engine(test_engine)
+TestingSessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, bind=test_engine
+)
+
+
+async def override_get_db():
+    async with TestingSessionLocal() as session:
+        yield session
+
+
+app.dependency_overrides[get_db_session] = override_get_db
+
+
+@pytest.fixture
+async def setup_database():
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    idempotency_cache.clear()
+    memory_task_repository.clear()
+
+
+@pytest.fixture
+async def empty_database(tmp_path):
+    """A SQLite database file with no schema, closed after the test."""
+    database = Database(f"sqlite+aiosqlite:///{tmp_path}/tasks.db")
+    database.engine.echo = False
+    yield database
+    await database.close()
+
+
+@pytest.fixture
+async def database(empty_database):
+    """``empty_database`` with every migration applied.
+
+    Modules that need rows in it override this fixture and request
+    ``database`` to build on it.
+    """
+    await migrate(empty_database)
+    return empty_database
+
+
+@pytest.fixture
+def query_budget():
+    """Fail the test when the wrapped requests run more SQL than allowed.
+
+    Usage::
+
+        with query_budget(4):
+            await client.patch(f"/tasks/{task_id}/done")
+    """
+
+    @contextmanager
+    def budget(max_statements: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        ran = "\n".join(
+            f"  {count}x {statement}" for statement, count in stats.by_statement.items()
+        )
+        assert stats.statements <= max_statements, (
+            f"{stats.statements} SQL statements ran, budget is {max_statements}:\n{ran}"
+        )
+
+    return budget
@@ -0,0 +1,116 @@
+import asyncio
+import dataclasses
+import sys
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.infrastructure.admission import ConcurrencyLimiter
+from src.infrastructure.config import settings
+from src.infrastructure.observability import admission_rejections_total
+from src.infrastructure.repositories import task_repository_for_session
+from src.presentation.api import AdmissionMiddleware, task_router
+from src.presentation.api.task_router import get_db_session, get_task_repository
+
+NEW_TASK = {"title": "Task", "description": "Description", "priority": "low"}
+
+
+class GatedRepository:
+    """Holds ``create`` until the test opens the gate."""
+
+    def __init__(self, repository, gate: asyncio.Event):
+        self.repository = repository
+        self.gate = gate
+
+    async def create(self, task):
+        await self.gate.wait()
+        return await self.repository.create(task)
+
+    def __getattr__(self, name):
+        return getattr(self.repository, name)
+
+
+@pytest.fixture
+def gate():
+    return asyncio.Event()
+
+
+@pytest.fixture
+async def client(setup_database, gate):
+    limited = FastAPI()
+    limited.include_router(task_router)
+
+    def gated_repository(db=Depends(get_db_session)):
+        return GatedRepository(task_repository_for_session(db), gate)
+
+    limited.dependency_overrides = {
+        **app.dependency_overrides,
+        get_task_repository: gated_repository,
+    }
+    limited.add_middleware(
+        AdmissionMiddleware,
+        reads=ConcurrencyLimiter(limit=4, max_queue=4, queue_timeout=1),
+        commands=ConcurrencyLimiter(limit=1, max_queue=0, queue_timeout=1),
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=limited), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+class TestAdmissionControl:
+    async def test_command_over_the_limit_is_shed_with_retry_after(self, client, gate):
+        rejected_before = admission_rejections_total.value("command", "queue_full")
+        first = asyncio.create_task(client.post("/tasks/", json=NEW_TASK))
+        await asyncio.sleep(0.05)
+
+        shed = await client.post("/tasks/", json=NEW_TASK)
+        read = await client.get("/tasks/")
+        gate.set()
+        created = await first
+
+        assert shed.status_code == 503
+        assert shed.headers["retry-after"] == "1"
+        assert read.status_code == 200
+        assert created.status_code == 201
+        assert (
+            admission_rejections_total.value("command", "queue_full")
+            == rejected_before + 1
+        )
+
+    async def test_slow_database_call_times_out_with_503(self, client, monkeypatch):
+        monkeypatch.setattr(
+            sys.modules["src.presentation.api.task_router"],
+            "settings",
+            dataclasses.replace(settings, db_timeout_seconds=0.05),
+        )
+
+        response = await client.post(
+            "/tasks/", json=NEW_TASK, headers={"Idempotency-Key": "slow"}
+        )
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.json() == {"detail": "Database did not respond in time"}
+
+        listed = await client.get("/tasks/")
+        assert listed.json() == []
+
+    async def test_command_without_idempotency_key_is_not_timed_out(
+        self, client, gate, monkeypatch
+    ):
+        monkeypatch.setattr(
+            sys.modules["src.presentation.api.task_router"],
+            "settings",
+            dataclasses.replace(settings, db_timeout_seconds=0.05),
+        )
+        slow = asyncio.create_task(client.post("/tasks/", json=NEW_TASK))
+        await asyncio.sleep(0.2)
+        gate.set()
+
+        response = await slow
+
+        assert response.status_code == 201
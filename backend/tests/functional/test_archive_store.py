@@ -0,0 +1,128 @@
+import pytest
+from fastapi import Depends
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import func, insert, select
+
+from main import app
+from src.domain.entities import Priority, Task
+from src.infrastructure.database import (
+    ArchivedTaskModel,
+    Database,
+    TaskModel,
+    move_archived_tasks,
+)
+from src.infrastructure.repositories import SQLiteTaskRepository
+from src.presentation.api.task_router import get_db_session, get_task_repository
+from tests.functional.conftest import TestingSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def sqlite_backend():
+    """These tests inspect SQLite tables, whatever TASK_REPOSITORY says."""
+
+    def sqlite_repository(db=Depends(get_db_session)):
+        return SQLiteTaskRepository(db)
+
+    app.dependency_overrides[get_task_repository] = sqlite_repository
+    yield
+    del app.dependency_overrides[get_task_repository]
+
+
+async def create_done_task(client: AsyncClient, title: str) -> str:
+    response = await client.post(
+        "/tasks/",
+        json={"title": title, "description": "Description", "priority": "low"},
+    )
+    task_id = response.json()["id"]
+    await client.patch(f"/tasks/{task_id}/done")
+    return task_id
+
+
+async def count_rows(model) -> int:
+    async with TestingSessionLocal() as session:
+        result = await session.execute(select(func.count()).select_from(model))
+        return result.scalar()
+
+
+@pytest.mark.asyncio
+class TestArchiveStore:
+    async def test_archive_moves_task_to_archive_table(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            task_id = await create_done_task(client, "Done Task")
+
+            response = await client.patch(f"/tasks/{task_id}/archive")
+
+            assert response.status_code == 200
+            assert response.json()["is_archived"] is True
+            assert await count_rows(TaskModel) == 0
+            assert await count_rows(ArchivedTaskModel) == 1
+
+    async def test_archived_tasks_only_listed_when_requested(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            archived_id = await create_done_task(client, "Archived Task")
+            await client.patch(f"/tasks/{archived_id}/archive")
+            await create_done_task(client, "Done Task")
+
+            everything = await client.get("/tasks/")
+            active = await client.get("/tasks/", params={"include_archived": False})
+            done = await client.get("/tasks/status/true")
+
+            assert [task["title"] for task in everything.json()] == [
+                "Done Task",
+                "Archived Task",
+            ]
+            assert [task["title"] for task in active.json()] == ["Done Task"]
+            assert [task["title"] for task in done.json()] == ["Done Task"]
+
+    async def test_archived_task_can_still_be_updated(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            task_id = await create_done_task(client, "Archived Task")
+            await client.patch(f"/tasks/{task_id}/archive")
+
+            response = await client.put(f"/tasks/{task_id}", json={"title": "Renamed"})
+
+            assert response.status_code == 200
+            assert response.json()["title"] == "Renamed"
+            assert response.json()["is_archived"] is True
+
+
+@pytest.mark.asyncio
+async def test_move_archived_tasks_in_chunks(tmp_path):
+    database = Database(f"sqlite+aiosqlite:///{tmp_path}/tasks.db")
+    await database.create_tables()
+    rows = []
+    for i in range(5):
+        task = Task.create(title=f"Task {i}", description="D", priority=Priority.LOW)
+        rows.append(
+            {
+                "id": str(task.id),
+                "title": task.title,
+                "description": task.description,
+                "priority": task.priority,
+                "is_done": True,
+                "is_archived": i < 4,
+                "created_at": task.created_at,
+                "updated_at": task.updated_at,
+            }
+        )
+    async with database.engine.begin() as conn:
+        await conn.execute(insert(TaskModel), rows)
+
+    moved = await move_archived_tasks(database, chunk_size=3)
+
+    async with database.async_session() as session:
+        active = await session.execute(select(func.count()).select_from(TaskModel))
+        archived = await session.execute(
+            select(func.count()).select_from(ArchivedTaskModel)
+        )
+    await database.close()
+
+    assert moved == 4
+    assert active.scalar() == 1
+    assert archived.scalar() == 4
@@ -0,0 +1,138 @@
+import asyncio
+import contextlib
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+
+from src.infrastructure.database import Database, DatabaseMaintenance, migrate
+from src.infrastructure.observability import (
+    db_maintenance_duration_seconds,
+    db_transactions_total,
+)
+from src.presentation.api import admin_router
+from src.presentation.api.admin_router import (
+    get_admin_token,
+    get_database_maintenance,
+)
+
+TOKEN = "secret"
+
+
+async def pragma(database: Database, name: str):
+    async with database.engine.connect() as conn:
+        return (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+
+
+async def fragment(database: Database, rows: int = 400) -> None:
+    async with database.engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO tasks (id, title, description, priority, is_done, "
+                "is_archived) SELECT hex(randomblob(16)), 'T', hex(randomblob(1000)), "
+                "'LOW', 0, 0 FROM (WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL "
+                "SELECT i + 1 FROM n WHERE i < :rows) SELECT i FROM n)"
+            ),
+            {"rows": rows},
+        )
+    async with database.engine.begin() as conn:
+        await conn.execute(text("DELETE FROM tasks"))
+
+
+class TestDatabaseMaintenance:
+    async def test_vacuums_free_pages_in_steps(self, database):
+        await fragment(database)
+        free = await pragma(database, "freelist_count")
+        maintenance = DatabaseMaintenance(
+            database, interval=3600, idle_seconds=60, vacuum_pages=64, step_sleep=0
+        )
+
+        steps = await maintenance.run()
+
+        assert [step.name for step in steps] == [
+            "optimize",
+            "incremental_vacuum",
+            "wal_checkpoint",
+        ]
+        assert free > 64
+        assert await pragma(database, "freelist_count") == 0
+        assert steps[1].detail.startswith(f"freed {free} pages in ")
+        assert steps[2].detail == "skipped: journal_mode is not WAL"
+        assert maintenance.last_run["optimize"].duration_seconds >= 0
+        assert db_maintenance_duration_seconds.value("incremental_vacuum") > 0
+
+    async def test_checkpoints_in_wal_mode(self, tmp_path):
+        database = Database(
+            f"sqlite+aiosqlite:///{tmp_path}/wal.db", pragmas={"journal_mode": "WAL"}
+        )
+        try:
+            await migrate(database)
+            await fragment(database, rows=50)
+            maintenance = DatabaseMaintenance(database, 3600, 60)
+
+            step = await maintenance._timed("wal_checkpoint", maintenance.checkpoint)
+        finally:
+            await database.close()
+
+        assert step.detail.startswith("checkpointed ")
+        assert step.detail.endswith("busy=0")
+
+    async def test_skips_vacuum_without_incremental_auto_vacuum(self, tmp_path):
+        database = Database(f"sqlite+aiosqlite:///{tmp_path}/plain.db")
+        try:
+            maintenance = DatabaseMaintenance(database, 3600, 60)
+
+            detail = await maintenance.incremental_vacuum()
+        finally:
+            await database.close()
+
+        assert detail == "skipped: auto_vacuum is not INCREMENTAL"
+
+    async def test_runs_early_once_idle_after_writes(self, database):
+        maintenance = DatabaseMaintenance(
+            database, interval=3600, idle_seconds=0.05, tick=0.01
+        )
+        task = asyncio.create_task(maintenance.run_periodically())
+        try:
+            await asyncio.sleep(0.1)
+            assert maintenance.last_run == {}
+
+            db_transactions_total.inc("commit")
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if len(maintenance.last_run) == 3:
+                    break
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        assert set(maintenance.last_run) == {
+            "optimize",
+            "incremental_vacuum",
+            "wal_checkpoint",
+        }
+
+    async def test_admin_runs_and_reports_maintenance(self, database):
+        maintenance = DatabaseMaintenance(database, 3600, 60)
+        app = FastAPI()
+        app.include_router(admin_router)
+        app.dependency_overrides = {
+            get_database_maintenance: lambda: maintenance,
+            get_admin_token: lambda: TOKEN,
+        }
+        headers = {"X-Admin-Token": TOKEN}
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            before = await client.get("/admin/maintenance", headers=headers)
+            ran = await client.post("/admin/maintenance", headers=headers)
+            after = await client.get("/admin/maintenance", headers=headers)
+            denied = await client.post("/admin/maintenance")
+
+        assert before.json() == []
+        assert ran.status_code == 200
+        assert [step["name"] for step in after.json()] == [
+            step["name"] for step in ran.json()
+        ]
+        assert denied.status_code == 403
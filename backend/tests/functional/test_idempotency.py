@@ -0,0 +1,222 @@
+import asyncio
+import dataclasses
+import sys
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from main import app
+from src.application.handlers import CreateTaskHandler
+from src.infrastructure.config import settings
+from src.infrastructure.idempotency import (
+    IdempotencyCache,
+    IdempotencyStore,
+    idempotency_cache,
+)
+from src.presentation.schemas import TaskCreateRequest
+from tests.functional.conftest import TestingSessionLocal
+
+TASK_PAYLOAD = {
+    "title": "Retried Task",
+    "description": "Sent twice by the gateway",
+    "priority": "high",
+}
+
+
+@pytest.mark.asyncio
+class TestIdempotency:
+    async def test_replayed_create_returns_stored_response(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            headers = {"Idempotency-Key": "create-1"}
+            first = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+
+            with patch.object(
+                CreateTaskHandler, "handle", side_effect=AssertionError
+            ) as handle:
+                second = await client.post(
+                    "/tasks/", json=TASK_PAYLOAD, headers=headers
+                )
+                handle.assert_not_called()
+
+            assert first.status_code == 201
+            assert second.status_code == 201
+            assert second.json() == first.json()
+            assert second.headers["Idempotent-Replayed"] == "true"
+
+            response = await client.get("/tasks/")
+            assert len(response.json()) == 1
+
+    async def test_replay_is_served_from_table_after_cache_loss(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            headers = {"Idempotency-Key": "create-2"}
+            first = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+            idempotency_cache.clear()
+
+            second = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+
+            assert second.json()["id"] == first.json()["id"]
+            assert len(idempotency_cache) == 1
+
+    async def test_key_reused_for_different_request_is_rejected(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            headers = {"Idempotency-Key": "create-3"}
+            await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+
+            response = await client.post(
+                "/tasks/",
+                json={**TASK_PAYLOAD, "title": "Another Task"},
+                headers=headers,
+            )
+
+            assert response.status_code == 422
+
+    async def test_replayed_mark_done(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            created = await client.post("/tasks/", json=TASK_PAYLOAD)
+            task_id = created.json()["id"]
+            headers = {"Idempotency-Key": "done-1"}
+
+            first = await client.patch(f"/tasks/{task_id}/done", headers=headers)
+            await client.patch(f"/tasks/{task_id}/pending")
+            second = await client.patch(f"/tasks/{task_id}/done", headers=headers)
+
+            assert second.json() == first.json()
+            assert second.headers["Idempotent-Replayed"] == "true"
+
+    async def test_failed_request_is_not_stored(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for i in range(5):
+                await client.post("/tasks/", json={**TASK_PAYLOAD, "title": f"T{i}"})
+
+            headers = {"Idempotency-Key": "create-4"}
+            response = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+
+            assert response.status_code == 400
+            assert len(idempotency_cache) == 0
+
+    async def test_key_claimed_by_a_request_in_flight_is_not_run_again(
+        self, setup_database
+    ):
+        request_hash = IdempotencyStore.fingerprint(
+            "POST", "/tasks/", TaskCreateRequest(**TASK_PAYLOAD).model_dump_json()
+        )
+        async with TestingSessionLocal() as session:
+            assert (
+                await IdempotencyStore(session).claim("create-5", request_hash) is None
+            )
+            await session.commit()
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            headers = {"Idempotency-Key": "create-5"}
+            response = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+            listed = await client.get("/tasks/")
+
+        assert response.status_code == 409
+        assert response.headers["Retry-After"] == "1"
+        assert listed.json() == []
+
+    async def test_timed_out_command_before_commit_leaves_key_free(
+        self, setup_database
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            headers = {"Idempotency-Key": "create-6"}
+            with patch.object(CreateTaskHandler, "handle", side_effect=TimeoutError):
+                timed_out = await client.post(
+                    "/tasks/", json=TASK_PAYLOAD, headers=headers
+                )
+            retried = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+
+        assert timed_out.status_code == 503
+        assert retried.status_code == 201
+
+    @pytest.mark.parametrize("backend", ["sqlite", "memory"])
+    async def test_failed_command_releases_the_key(
+        self, setup_database, monkeypatch, backend
+    ):
+        configured = dataclasses.replace(settings, task_repository=backend)
+        for module in (
+            "src.presentation.api.task_router",
+            "src.infrastructure.repositories.provider",
+        ):
+            monkeypatch.setattr(sys.modules[module], "settings", configured)
+        async with AsyncClient(
+            transport=ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            headers = {"Idempotency-Key": f"create-7-{backend}"}
+            with patch.object(CreateTaskHandler, "handle", side_effect=RuntimeError):
+                failed = await client.post(
+                    "/tasks/", json=TASK_PAYLOAD, headers=headers
+                )
+            retried = await client.post("/tasks/", json=TASK_PAYLOAD, headers=headers)
+
+        assert failed.status_code == 500
+        assert retried.status_code == 201
+
+    async def test_put_clearing_due_at_is_a_different_request(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            created = await client.post(
+                "/tasks/", json={**TASK_PAYLOAD, "due_at": "2030-01-02T03:04:05Z"}
+            )
+            url = f"/tasks/{created.json()['id']}"
+            headers = {"Idempotency-Key": "update-1"}
+            first = await client.put(url, json={"title": "New"}, headers=headers)
+            second = await client.put(
+                url, json={"title": "New", "due_at": None}, headers=headers
+            )
+
+        assert first.json()["due_at"] == "2030-01-02T03:04:05"
+        assert second.status_code == 422
+
+    async def test_purge_expired_removes_bounded_batches(self, setup_database):
+        async with TestingSessionLocal() as session:
+            expired = IdempotencyStore(
+                session, cache=IdempotencyCache(10), ttl_seconds=-1
+            )
+            live = IdempotencyStore(session, cache=IdempotencyCache(10))
+            for i in range(3):
+                await expired.claim(f"old-{i}", "hash")
+                await expired.complete(f"old-{i}", 201, "{}")
+            await live.claim("fresh", "hash")
+            await live.complete("fresh", 201, "{}")
+
+            assert await live.purge_expired(batch_size=2) == 2
+            assert await live.purge_expired(batch_size=2) == 1
+            assert await live.purge_expired(batch_size=2) == 0
+            assert await live.get("fresh") is not None
+
+
+async def test_concurrent_claims_run_the_command_once(database):
+    cache = IdempotencyCache(10)
+    async with (
+        database.async_session() as first,
+        database.async_session() as second,
+    ):
+        assert await IdempotencyStore(first, cache).claim("key", "hash") is None
+        # Blocks on the first claim's write lock until it commits.
+        waiting = asyncio.create_task(
+            IdempotencyStore(second, cache).claim("key", "hash")
+        )
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        await IdempotencyStore(first, cache).complete("key", 201, '{"id": 1}')
+        stored = await waiting
+
+    assert (stored.status_code, stored.body) == (201, '{"id": 1}')
@@ -0,0 +1,88 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.infrastructure.observability import (
+    db_pool_checkout_wait_seconds,
+    db_statements_total,
+    db_transactions_total,
+    handler_duration_seconds,
+    http_request_duration_seconds,
+    registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.mark.asyncio
+class TestMetricsAPI:
+    async def test_requests_are_recorded_by_route_template(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            created = await client.post(
+                "/tasks/",
+                json={"title": "Task", "description": "D", "priority": "low"},
+            )
+            task_id = created.json()["id"]
+            await client.patch(f"/tasks/{task_id}/done")
+            await client.get("/tasks/")
+
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert http_request_duration_seconds.count("POST", "/tasks/", "201") == 1
+        assert (
+            http_request_duration_seconds.count("PATCH", "/tasks/{task_id}/done", "200")
+            == 1
+        )
+        assert handler_duration_seconds.count("CreateTaskHandler", "ok") == 1
+        assert handler_duration_seconds.count("GetAllTasksHandler", "ok") == 1
+        assert db_statements_total.value("INSERT") >= 1
+        assert db_transactions_total.value("commit") >= 2
+        assert db_pool_checkout_wait_seconds.count() >= 3
+
+        body = response.text
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert (
+            'http_request_duration_seconds_count{method="POST",route="/tasks/",status="201"} 1'
+            in body
+        )
+        assert "http_requests_in_flight 1" in body
+
+    async def test_failed_handlers_are_labelled_as_errors(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.patch(
+                "/tasks/00000000-0000-0000-0000-000000000000/done"
+            )
+
+        assert response.status_code == 404
+        assert handler_duration_seconds.count("MarkTaskDoneHandler", "error") == 1
+        assert (
+            http_request_duration_seconds.count("PATCH", "/tasks/{task_id}/done", "404")
+            == 1
+        )
+
+    async def test_idempotency_cache_hit_ratio_is_exposed(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            payload = {"title": "Task", "description": "D", "priority": "low"}
+            headers = {"Idempotency-Key": "metrics-key"}
+            await client.post("/tasks/", json=payload, headers=headers)
+            await client.post("/tasks/", json=payload, headers=headers)
+
+            response = await client.get("/metrics")
+
+        assert (
+            'cache_requests_total{cache="idempotency",result="hit"} 1' in response.text
+        )
+        assert 'cache_hit_ratio{cache="idempotency"} 0.5' in response.text
@@ -0,0 +1,196 @@
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from src.domain.entities import Priority
+from src.infrastructure.database import Database
+from src.infrastructure.database.migrations import (
+    LATEST_VERSION,
+    MigrationRequiredError,
+    current_version,
+    migrate,
+    migrate_on_startup,
+)
+from src.infrastructure.database.migrations.__main__ import main as migrations_cli
+from src.infrastructure.database.migrations.steps import create_baseline_schema
+from src.infrastructure.observability import track_queries
+from src.infrastructure.repositories.sqlite_task_repository import SQLiteTaskRepository
+
+
+@pytest.fixture
+def database(empty_database):
+    # Each test migrates the database itself.
+    return empty_database
+
+
+async def fetch(database, sql, **params):
+    async with database.engine.connect() as conn:
+        return (await conn.execute(text(sql), params)).all()
+
+
+async def insert_legacy_task(database, task_id, priority):
+    # The columns a release without priority_rank would write.
+    async with database.engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO tasks (id, title, description, priority, is_done, "
+                "is_archived) VALUES (:id, 'T', 'D', :priority, 0, 0)"
+            ),
+            {"id": task_id, "priority": priority},
+        )
+
+
+@pytest.mark.asyncio
+class TestMigrations:
+    async def test_new_database_gets_every_migration_at_startup(self, database):
+        applied = await migrate_on_startup(database)
+
+        assert [migration.version for migration in applied] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+            6,
+            7,
+            8,
+            9,
+            10,
+        ]
+        assert await current_version(database) == LATEST_VERSION
+        indexes = await fetch(
+            database, "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+        assert ("ix_tasks_status_rank_created",) in indexes
+
+    async def test_concurrent_runs_apply_each_migration_once(self, database):
+        # Two workers starting at once, each with its own engine.
+        other = Database(database.database_url)
+        other.engine.echo = False
+        try:
+            results = await asyncio.gather(
+                migrate_on_startup(database), migrate_on_startup(other)
+            )
+        finally:
+            await other.close()
+
+        assert sorted(len(applied) for applied in results) == [0, LATEST_VERSION]
+        assert await current_version(database) == LATEST_VERSION
+
+    async def test_up_to_date_startup_is_a_version_check(self, database):
+        await migrate_on_startup(database)
+
+        with track_queries() as stats:
+            applied = await migrate_on_startup(database)
+
+        assert applied == []
+        assert stats.statements == 2
+
+    async def test_existing_database_needs_the_cli_for_heavy_steps(self, database):
+        await create_baseline_schema(database, 1000)
+        for i, priority in enumerate(["HIGH", "MEDIUM", "LOW", "LOW", "HIGH"]):
+            await insert_legacy_task(database, f"task-{i}", priority)
+
+        with pytest.raises(MigrationRequiredError, match="backfill"):
+            await migrate_on_startup(database)
+        assert await current_version(database) == 2
+
+        applied = await migrate(database, chunk_size=2)
+
+        assert [migration.version for migration in applied] == [3, 4, 5, 6, 7, 8, 9, 10]
+        ranks = await fetch(database, "SELECT id, priority_rank FROM tasks ORDER BY id")
+        assert ranks == [
+            ("task-0", 3),
+            ("task-1", 2),
+            ("task-2", 1),
+            ("task-3", 1),
+            ("task-4", 3),
+        ]
+        assert await migrate_on_startup(database) == []
+
+    async def test_text_ids_become_blobs_and_stay_readable(self, database):
+        await create_baseline_schema(database, 1000)
+        ids = [uuid4() for _ in range(5)]
+        for task_id in ids:
+            await insert_legacy_task(database, str(task_id), "LOW")
+        await insert_legacy_task(database, "not-a-uuid", "LOW")
+
+        await migrate(database, chunk_size=2)
+
+        stored = await fetch(database, "SELECT typeof(id) FROM tasks ORDER BY rowid")
+        assert [kind for (kind,) in stored] == ["blob"] * 5 + ["text"]
+        async with database.async_session() as session:
+            task = await SQLiteTaskRepository(session).get_by_id(ids[3])
+        assert task is not None and task.id == ids[3]
+
+    async def test_timestamps_and_priorities_become_integers(self, database):
+        await create_baseline_schema(database, 1000)
+        task_id = uuid4()
+        async with database.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO tasks (id, title, description, priority, is_done, "
+                    "is_archived, created_at, updated_at) VALUES (:id, 'T', 'D', "
+                    "'MEDIUM', 0, 0, '2025-03-04 05:06:07.123456', "
+                    "'2025-03-04 05:06:08')"
+                ),
+                {"id": str(task_id)},
+            )
+
+        await migrate(database)
+
+        stored = await fetch(
+            database,
+            "SELECT typeof(priority), priority, priority_rank, typeof(created_at), "
+            "created_at, updated_at FROM tasks",
+        )
+        assert stored == [
+            ("integer", 2, 2, "integer", 1741064767123456, 1741064768000000)
+        ]
+        async with database.async_session() as session:
+            task = await SQLiteTaskRepository(session).get_by_id(task_id)
+        assert task.priority == Priority.MEDIUM
+        assert task.created_at == datetime(2025, 3, 4, 5, 6, 7, 123456)
+        assert task.updated_at == datetime(2025, 3, 4, 5, 6, 8)
+
+    async def test_triggers_fill_rank_for_writers_without_the_column(self, database):
+        await migrate_on_startup(database)
+
+        await insert_legacy_task(database, "legacy", "MEDIUM")
+        assert await fetch(
+            database, "SELECT priority_rank FROM tasks WHERE id = 'legacy'"
+        ) == [(2,)]
+
+        async with database.engine.begin() as conn:
+            await conn.execute(
+                text("UPDATE tasks SET priority = 'HIGH' WHERE id = 'legacy'")
+            )
+        assert await fetch(
+            database, "SELECT priority_rank FROM tasks WHERE id = 'legacy'"
+        ) == [(3,)]
+
+    async def test_heavy_steps_can_be_allowed_at_startup(self, database):
+        await create_baseline_schema(database, 1000)
+        await insert_legacy_task(database, "legacy", "LOW")
+
+        await migrate_on_startup(database, heavy_on_startup=True)
+
+        assert await current_version(database) == LATEST_VERSION
+
+
+class TestMigrationsCLI:
+    def test_status_and_upgrade(self, tmp_path, capsys):
+        url = f"sqlite+aiosqlite:///{tmp_path}/cli.db"
+
+        migrations_cli(["status", "--database-url", url])
+        status = capsys.readouterr().out
+        migrations_cli(["upgrade", "--database-url", url, "--chunk-size", "10"])
+        upgrade = capsys.readouterr().out
+
+        assert f"{url}: version 0, {LATEST_VERSION} pending" in status
+        assert "backfill tasks.priority_rank (heavy)" in status
+        assert f"{url}: applied {LATEST_VERSION} migration(s)" in upgrade
+        assert f"{url}: version {LATEST_VERSION}, 0 pending" in upgrade
@@ -0,0 +1,145 @@
+import asyncio
+import sqlite3
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.backup import BackupManager
+from src.infrastructure.repositories import SQLiteTaskRepository
+from src.presentation.api import admin_router
+from src.presentation.api.admin_router import (
+    get_admin_token,
+    get_backup_manager,
+    get_profiling_token,
+)
+
+TOKEN = "secret"
+HEADERS = {"X-Admin-Token": TOKEN}
+
+
+def make_task(i: int) -> Task:
+    return Task.create(f"Task {i}", "x" * 500, Priority.LOW)
+
+
+@pytest.fixture
+async def database(database):
+    async with database.async_session() as session:
+        await SQLiteTaskRepository(session).create_many(
+            [make_task(i) for i in range(2000)]
+        )
+    return database
+
+
+def count_tasks(path) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute("SELECT count(*) FROM tasks").fetchone()[0]
+    finally:
+        connection.close()
+
+
+class TestOnlineBackup:
+    async def test_backup_runs_beside_writers(self, database, tmp_path):
+        manager = BackupManager(
+            database.database_url,
+            str(tmp_path / "backups"),
+            keep=2,
+            pages_per_step=8,
+            step_sleep=0.002,
+        )
+
+        backup = asyncio.create_task(manager.run())
+        written = 0
+        async with database.async_session() as session:
+            repository = SQLiteTaskRepository(session)
+            while not backup.done():
+                await repository.create(make_task(written))
+                written += 1
+                await asyncio.sleep(0.005)
+        progress = await backup
+
+        assert progress.state == "done", progress.error
+        assert written > 0
+        snapshot = count_tasks(manager.path_for(progress.name))
+        assert 2000 <= snapshot <= 2000 + written
+
+    async def test_admin_starts_and_reports_backups(self, database, tmp_path):
+        manager = BackupManager(
+            database.database_url, str(tmp_path / "backups"), keep=2
+        )
+        app = FastAPI()
+        app.include_router(admin_router)
+        app.dependency_overrides = {
+            get_backup_manager: lambda: manager,
+            get_admin_token: lambda: TOKEN,
+        }
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            assert (await client.post("/admin/backups")).status_code == 403
+            assert (
+                await client.get("/admin/backups/progress", headers=HEADERS)
+            ).status_code == 404
+
+            started = await client.post("/admin/backups", headers=HEADERS)
+            await manager._task
+            progress = await client.get("/admin/backups/progress", headers=HEADERS)
+            listed = await client.get("/admin/backups", headers=HEADERS)
+            name = started.json()["name"]
+            downloaded = await client.get(f"/admin/backups/{name}", headers=HEADERS)
+
+        assert started.status_code == 202
+        assert started.json()["state"] == "running"
+        assert progress.json()["state"] == "done"
+        assert progress.json()["percent"] == 100.0
+        assert [snapshot["name"] for snapshot in listed.json()] == [name]
+        assert downloaded.status_code == 200
+        assert downloaded.content.startswith(b"SQLite format 3\x00")
+
+    async def test_second_backup_is_refused_while_copying(self, database, tmp_path):
+        manager = BackupManager(
+            database.database_url, str(tmp_path / "backups"), keep=2
+        )
+        app = FastAPI()
+        app.include_router(admin_router)
+        app.dependency_overrides = {
+            get_backup_manager: lambda: manager,
+            get_admin_token: lambda: TOKEN,
+        }
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.post("/admin/backups", headers=HEADERS)
+            second = await client.post("/admin/backups", headers=HEADERS)
+            await manager._task
+
+        assert first.status_code == 202
+        assert second.status_code == 409
+
+    async def test_profiling_token_does_not_open_backups(self, database, tmp_path):
+        manager = BackupManager(
+            database.database_url, str(tmp_path / "backups"), keep=2
+        )
+        app = FastAPI()
+        app.include_router(admin_router)
+        app.dependency_overrides = {
+            get_backup_manager: lambda: manager,
+            get_admin_token: lambda: TOKEN,
+            get_profiling_token: lambda: "profiler",
+        }
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            with_profiling_token = await client.get(
+                "/admin/backups", headers={"X-Profile-Token": "profiler"}
+            )
+            as_admin_header = await client.get(
+                "/admin/backups", headers={"X-Admin-Token": "profiler"}
+            )
+            profiles = await client.get("/admin/profiles", headers=HEADERS)
+
+        assert with_profiling_token.status_code == 403
+        assert as_admin_header.status_code == 403
+        assert profiles.status_code == 403
@@ -0,0 +1,95 @@
+import pstats
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.infrastructure.observability import ProfileStore
+from src.presentation.api import ProfilingMiddleware, admin_router, task_router
+from src.presentation.api.admin_router import get_profile_store, get_profiling_token
+
+TOKEN = "secret"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(str(tmp_path / "profiles"), max_files=3)
+
+
+@pytest.fixture
+async def client(setup_database, store):
+    profiled = FastAPI()
+    profiled.include_router(task_router)
+    profiled.include_router(admin_router)
+    profiled.dependency_overrides = {
+        **app.dependency_overrides,
+        get_profile_store: lambda: store,
+        get_profiling_token: lambda: TOKEN,
+    }
+    profiled.add_middleware(ProfilingMiddleware, store=store, token=TOKEN)
+    async with AsyncClient(
+        transport=ASGITransport(app=profiled), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+class TestRequestProfiling:
+    async def test_requests_without_token_are_not_profiled(self, client, store):
+        response = await client.get("/tasks/")
+
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+        assert store.profiles() == []
+
+    async def test_wrong_token_is_ignored(self, client, store):
+        response = await client.get("/tasks/", headers={"X-Profile-Token": "nope"})
+
+        assert "x-profile-id" not in response.headers
+        assert store.profiles() == []
+
+    async def test_token_profiles_handler_and_repository(self, client, store):
+        response = await client.post(
+            "/tasks/",
+            json={"title": "Task", "description": "D", "priority": "low"},
+            headers={"X-Profile-Token": TOKEN},
+        )
+
+        assert response.status_code == 201
+        name = response.headers["x-profile-id"]
+        stats = pstats.Stats(str(store.path_for(name)))
+        functions = {function for _, _, function in stats.stats}
+        assert "create_task" in functions
+        assert "handle" in functions
+        assert "create" in functions
+
+    async def test_admin_lists_and_serves_profiles(self, client):
+        headers = {"X-Profile-Token": TOKEN}
+        name = (await client.get("/tasks/", headers=headers)).headers["x-profile-id"]
+
+        listed = await client.get("/admin/profiles", headers=headers)
+        raw = await client.get(f"/admin/profiles/{name}", headers=headers)
+        text = await client.get(
+            f"/admin/profiles/{name}", params={"format": "text"}, headers=headers
+        )
+
+        assert [profile["name"] for profile in listed.json()] == [name]
+        assert raw.status_code == 200
+        assert raw.headers["content-type"] == "application/octet-stream"
+        assert "cumulative" in text.text
+
+    async def test_admin_requires_token(self, client):
+        assert (await client.get("/admin/profiles")).status_code == 403
+        assert (
+            await client.get("/admin/profiles", headers={"X-Profile-Token": "nope"})
+        ).status_code == 403
+
+    async def test_unknown_or_unsafe_profile_names_are_not_found(self, client):
+        headers = {"X-Profile-Token": TOKEN}
+
+        missing = await client.get("/admin/profiles/1-GET-x.prof", headers=headers)
+        unsafe = await client.get("/admin/profiles/..%2Fsecret.prof", headers=headers)
+
+        assert missing.status_code == 404
+        assert unsafe.status_code == 404
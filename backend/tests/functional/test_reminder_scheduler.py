@@ -0,0 +1,250 @@
+import dataclasses
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.coordination import SharedChangeLog
+from src.infrastructure.observability import track_queries
+from src.infrastructure.reminders import ReminderScheduler
+from src.infrastructure.reminders.scheduler import CHANGE_RECORD
+from src.infrastructure.repositories.sqlite_task_repository import SQLiteTaskRepository
+
+NOW = datetime(2025, 6, 10, 12, 0, tzinfo=UTC)
+
+
+class Clock:
+    def __init__(self):
+        self.now = NOW
+
+    def __call__(self) -> float:
+        return self.now.timestamp()
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def fired():
+    return []
+
+
+@pytest.fixture
+def make_scheduler(database, clock, fired):
+    def make(**kwargs) -> ReminderScheduler:
+        return ReminderScheduler(
+            database,
+            window_seconds=3600,
+            lookback_seconds=60,
+            on_reminder=[lambda reminder: fired.append(reminder.title)],
+            clock=clock,
+            **kwargs,
+        )
+
+    return make
+
+
+async def add_task(database, title, due_in=None) -> Task:
+    due_at = NOW + timedelta(seconds=due_in) if due_in is not None else None
+    task = Task.create(
+        title=title, description="D", priority=Priority.LOW, due_at=due_at
+    )
+    async with database.async_session() as session:
+        return await SQLiteTaskRepository(session).create(task)
+
+
+async def save(database, scheduler, task: Task) -> None:
+    async with database.async_session() as session:
+        await SQLiteTaskRepository(session).update(task)
+    scheduler.task_saved(task)
+
+
+@pytest.mark.asyncio
+class TestReminderScheduler:
+    async def test_loads_only_the_next_window_and_fires_in_due_order(
+        self, database, clock, fired, make_scheduler
+    ):
+        await add_task(database, "later", due_in=20)
+        await add_task(database, "soon", due_in=10)
+        await add_task(database, "next hour", due_in=2 * 3600)
+        await add_task(database, "undated")
+        done = await add_task(database, "done", due_in=5)
+        done.mark_as_done()
+        async with database.async_session() as session:
+            await SQLiteTaskRepository(session).update(done)
+        scheduler = make_scheduler()
+
+        delay = await scheduler.step()
+        assert len(scheduler) == 2
+        assert delay == 1.0
+        clock.advance(15)
+        await scheduler.step()
+        assert fired == ["soon"]
+        clock.advance(10)
+        await scheduler.step()
+        assert fired == ["soon", "later"]
+        clock.advance(2 * 3600)
+        await scheduler.step()
+        assert fired == ["soon", "later", "next hour"]
+
+    async def test_reschedules_on_modify_done_and_archive(
+        self, database, clock, fired, make_scheduler
+    ):
+        moved = await add_task(database, "moved", due_in=5)
+        done = await add_task(database, "done", due_in=6)
+        archived = await add_task(database, "archived", due_in=7)
+        cleared = await add_task(database, "cleared", due_in=8)
+        scheduler = make_scheduler()
+        await scheduler.step()
+        assert len(scheduler) == 4
+
+        moved.update(due_at=NOW + timedelta(seconds=30))
+        await save(database, scheduler, moved)
+        done.mark_as_done()
+        await save(database, scheduler, done)
+        archived.mark_as_done()
+        archived.archive()
+        await save(database, scheduler, archived)
+        cleared.update(clear_due_at=True)
+        await save(database, scheduler, cleared)
+        added = await add_task(database, "added", due_in=9)
+        scheduler.task_saved(added)
+
+        with track_queries() as stats:
+            clock.advance(10)
+            await scheduler.step()
+            assert fired == ["added"]
+            clock.advance(30)
+            await scheduler.step()
+
+        assert fired == ["added", "moved"]
+        assert stats.statements == 0
+        assert len(scheduler) == 0
+
+    async def test_changes_beyond_the_window_wait_for_a_later_read(
+        self, database, clock, fired, make_scheduler
+    ):
+        task = await add_task(database, "task", due_in=10)
+        scheduler = make_scheduler()
+        await scheduler.step()
+
+        task.update(due_at=NOW + timedelta(hours=2))
+        await save(database, scheduler, task)
+        assert len(scheduler) == 0
+        clock.advance(2 * 3600)
+        await scheduler.step()
+
+        assert fired == ["task"]
+
+    async def test_reads_the_window_in_batches(
+        self, database, clock, fired, make_scheduler
+    ):
+        for second in range(1, 6):
+            await add_task(database, f"task {second}", due_in=second)
+        scheduler = make_scheduler(batch_size=2)
+
+        await scheduler.step()
+        assert len(scheduler) == 2
+        clock.advance(5)
+        for _ in range(3):
+            await scheduler.step()
+
+        assert fired == [f"task {second}" for second in range(1, 6)]
+
+    async def test_fires_reminders_missed_within_the_lookback(
+        self, database, fired, make_scheduler
+    ):
+        await add_task(database, "missed long ago", due_in=-3600)
+        await add_task(database, "just missed", due_in=-30)
+
+        await make_scheduler().step()
+
+        assert fired == ["just missed"]
+
+    async def test_writes_in_another_worker_are_applied_as_deltas(
+        self, database, clock, fired, make_scheduler, tmp_path
+    ):
+        path = str(tmp_path / "reminders-version")
+        scheduler = make_scheduler(log=SharedChangeLog(path, CHANGE_RECORD.size))
+        other_worker = make_scheduler(log=SharedChangeLog(path, CHANGE_RECORD.size))
+        await scheduler.step()
+
+        own = await add_task(database, "own", due_in=10)
+        scheduler.task_saved(own)
+        with track_queries() as stats:
+            await scheduler.step()
+        assert stats.statements == 0
+
+        other = await add_task(database, "other", due_in=20)
+        other_worker.task_saved(other)
+        later = await add_task(database, "next day", due_in=24 * 3600)
+        other_worker.task_saved(later)
+        with track_queries() as stats:
+            await scheduler.step()
+        # One lookup by id for the task inside the window, no window read.
+        assert stats.statements == 1
+        assert len(scheduler) == 2
+
+        clock.advance(30)
+        await scheduler.step()
+
+        assert fired == ["own", "other"]
+        scheduler.log.close()
+        other_worker.log.close()
+
+    async def test_records_out_of_commit_order_keep_the_latest_state(
+        self, database, clock, fired, make_scheduler, tmp_path
+    ):
+        path = str(tmp_path / "reminders-version")
+        scheduler = make_scheduler(log=SharedChangeLog(path, CHANGE_RECORD.size))
+        first = make_scheduler(log=SharedChangeLog(path, CHANGE_RECORD.size))
+        second = make_scheduler(log=SharedChangeLog(path, CHANGE_RECORD.size))
+        task = await add_task(database, "task")
+        await scheduler.step()
+
+        task.update(due_at=NOW + timedelta(seconds=10))
+        async with database.async_session() as session:
+            await SQLiteTaskRepository(session).update(task)
+        stale = dataclasses.replace(task)
+        task.mark_as_done()
+        async with database.async_session() as session:
+            await SQLiteTaskRepository(session).update(task)
+        # The later commit reaches the log first.
+        second.task_saved(task)
+        first.task_saved(stale)
+        await scheduler.step()
+        clock.advance(30)
+        await scheduler.step()
+
+        assert len(scheduler) == 0
+        assert fired == []
+        for worker in (scheduler, first, second):
+            worker.log.close()
+
+    async def test_changes_beyond_the_log_reload_the_window(
+        self, database, clock, fired, make_scheduler, tmp_path
+    ):
+        path = str(tmp_path / "reminders-version")
+        scheduler = make_scheduler(
+            log=SharedChangeLog(path, CHANGE_RECORD.size, capacity=2)
+        )
+        other_worker = make_scheduler(
+            log=SharedChangeLog(path, CHANGE_RECORD.size, capacity=2)
+        )
+        await scheduler.step()
+
+        for second in range(1, 4):
+            task = await add_task(database, f"task {second}", due_in=second)
+            other_worker.task_saved(task)
+        await scheduler.step()
+        clock.advance(5)
+        await scheduler.step()
+
+        assert fired == ["task 1", "task 2", "task 3"]
+        scheduler.log.close()
+        other_worker.log.close()
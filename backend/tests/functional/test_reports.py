@@ -0,0 +1,289 @@
+import asyncio
+import csv
+import io
+import json
+import sqlite3
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.reports import (
+    ReportJobs,
+    ReportKind,
+    ReportQueueFullError,
+    ReportTooLargeError,
+)
+from src.infrastructure.reports.renderers import render_report, snapshot_bytes
+from src.infrastructure.repositories import SQLiteTaskRepository
+from src.presentation.api import report_router
+from src.presentation.api.report_router import get_report_jobs
+
+
+@pytest.fixture
+async def database(database):
+    tasks = [
+        Task.create('Quote "<b>" & co, ltd', "Line one\nline two", Priority.HIGH),
+        Task.create("Pending low", "D", Priority.LOW),
+        Task.create("Done medium", "D", Priority.MEDIUM),
+        Task.create("Archived low", "D", Priority.LOW),
+    ]
+    tasks[2].mark_as_done()
+    tasks[3].mark_as_done()
+    tasks[3].archive()
+    async with database.async_session() as session:
+        repository = SQLiteTaskRepository(session)
+        for task in tasks[:3]:
+            await repository.create(task)
+        created = await repository.create(tasks[3])
+        await repository.archive(created)
+    return database
+
+
+@pytest.fixture
+def database_path(database, tmp_path):
+    return str(tmp_path / "tasks.db")
+
+
+async def wait_for(jobs: ReportJobs, job_id: str, timeout: float = 30.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while (job := jobs.get(job_id)).state in ("queued", "running"):
+        assert asyncio.get_running_loop().time() < deadline, job
+        await asyncio.sleep(0.05)
+    return job
+
+
+class TestRenderers:
+    def test_tasks_csv_has_every_task_with_its_status(self, database_path, tmp_path):
+        output = tmp_path / "tasks.csv"
+
+        rows = render_report("tasks-csv", database_path, str(output), 1 << 20)
+
+        records = list(csv.DictReader(io.StringIO(output.read_text())))
+        assert rows == len(records) == 4
+        assert [record["status"] for record in records] == [
+            "pending",
+            "done",
+            "pending",
+            "archived",
+        ]
+        assert records[0]["title"] == 'Quote "<b>" & co, ltd'
+        assert records[0]["description"] == "Line one\nline two"
+        assert records[0]["priority"] == "high"
+
+    def test_priority_summary_counts_by_status(self, database_path, tmp_path):
+        output = tmp_path / "summary.json"
+
+        render_report("priority-summary", database_path, str(output), 1 << 20)
+
+        summary = json.loads(output.read_text())
+        assert summary["total"] == 4
+        assert list(summary["priorities"]) == ["high", "medium", "low"]
+        low = summary["priorities"]["low"]
+        assert (low["pending"], low["done"], low["archived"], low["total"]) == (
+            1,
+            0,
+            1,
+            2,
+        )
+        assert summary["priorities"]["medium"]["oldest_pending_created_at"] is None
+
+    def test_html_escapes_task_text(self, database_path, tmp_path):
+        output = tmp_path / "tasks.html"
+
+        render_report("tasks-html", database_path, str(output), 1 << 20)
+
+        page = output.read_text()
+        assert "Quote &quot;&lt;b&gt;&quot; &amp; co, ltd" in page
+        assert "<b>" not in page
+        assert "@page" in page
+
+    def test_size_limit_stops_the_render_and_cleans_up(self, database_path, tmp_path):
+        output = tmp_path / "out" / "tasks.csv"
+        output.parent.mkdir()
+
+        with pytest.raises(ReportTooLargeError):
+            render_report("tasks-csv", database_path, str(output), 100)
+
+        assert list(output.parent.iterdir()) == []
+
+    def test_snapshot_is_copied_in_steps(self, database_path, tmp_path):
+        output = tmp_path / "tasks.csv"
+
+        rows = render_report(
+            "tasks-csv", database_path, str(output), 1 << 20, pages_per_step=1
+        )
+
+        assert rows == 4
+        assert snapshot_bytes(database_path) > 0
+        assert [path.name for path in tmp_path.glob("tasks.csv*")] == ["tasks.csv"]
+
+    def test_wal_database_is_read_in_place_beside_a_writer(
+        self, database_path, tmp_path
+    ):
+        writer = sqlite3.connect(database_path, isolation_level=None)
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("DELETE FROM tasks")
+        output = tmp_path / "tasks.csv"
+        try:
+            assert snapshot_bytes(database_path) == 0
+            rows = render_report("tasks-csv", database_path, str(output), 1 << 20)
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+        assert rows == 4
+        assert not output.with_name("tasks.csv.snapshot").exists()
+
+
+class TestReportJobs:
+    async def test_jobs_render_in_worker_processes(self, database, tmp_path):
+        jobs = ReportJobs(
+            database.database_url,
+            str(tmp_path / "reports"),
+            workers=1,
+            max_jobs=2,
+            max_bytes=1 << 20,
+            disk_bytes=1 << 20,
+        )
+        try:
+            first = jobs.submit(ReportKind.TASKS_CSV)
+            second = jobs.submit(ReportKind.PRIORITY_SUMMARY)
+            with pytest.raises(ReportQueueFullError):
+                jobs.submit(ReportKind.TASKS_HTML)
+
+            first = await wait_for(jobs, first.id)
+            second = await wait_for(jobs, second.id)
+
+            assert first.state == "done", first.error
+            assert first.rows == 4
+            assert jobs.path_for(first).read_text().startswith("id,title")
+            assert second.state == "done", second.error
+            assert json.loads(jobs.path_for(second).read_text())["total"] == 4
+            # Another process of the app reads the state from disk.
+            other = ReportJobs(database.database_url, str(tmp_path / "reports"))
+            assert other.get(first.id).state == "done"
+            assert other.get("../tasks") is None
+        finally:
+            await jobs.close()
+
+    async def test_oldest_results_expire_beyond_the_disk_budget(
+        self, database, database_path, tmp_path
+    ):
+        sample = tmp_path / "tasks.csv"
+        render_report("tasks-csv", database_path, str(sample), 1 << 20)
+        report_size = sample.stat().st_size
+        # Room for the snapshot of a running job plus one and a half reports.
+        jobs = ReportJobs(
+            database.database_url,
+            str(tmp_path / "reports"),
+            workers=1,
+            disk_bytes=snapshot_bytes(database_path) + report_size * 3 // 2,
+        )
+        try:
+            ids = []
+            for _ in range(3):
+                job = await wait_for(jobs, jobs.submit(ReportKind.TASKS_CSV).id)
+                assert job.state == "done", job.error
+                ids.append(job.id)
+
+            states = [jobs.get(job_id).state for job_id in ids]
+            # The third job's snapshot needed the room of the first result.
+            assert states == ["expired", "done", "done"]
+            assert all(
+                jobs.path_for(jobs.get(job_id)) is None
+                for job_id, state in zip(ids, states)
+                if state == "expired"
+            )
+        finally:
+            await jobs.close()
+
+    async def test_jobs_are_forgotten_after_the_retention_period(
+        self, database, tmp_path
+    ):
+        jobs = ReportJobs(
+            database.database_url,
+            str(tmp_path / "reports"),
+            workers=1,
+            retention_seconds=3600,
+        )
+        try:
+            old = await wait_for(jobs, jobs.submit(ReportKind.TASKS_CSV).id)
+            recent = await wait_for(jobs, jobs.submit(ReportKind.TASKS_CSV).id)
+            output = jobs.path_for(old)
+            old.finished_at -= 2 * 3600
+            jobs._save(old)
+
+            await asyncio.to_thread(jobs._trim)
+
+            assert jobs.get(old.id) is None
+            assert not output.exists()
+            assert jobs.path_for(jobs.get(recent.id)) is not None
+            assert sorted(path.name for path in (tmp_path / "reports").iterdir()) == [
+                jobs.path_for(recent).name,
+                f"{recent.id}.job",
+            ]
+        finally:
+            await jobs.close()
+
+    async def test_snapshot_larger_than_the_disk_budget_fails(
+        self, database, database_path, tmp_path
+    ):
+        jobs = ReportJobs(
+            database.database_url,
+            str(tmp_path / "reports"),
+            workers=1,
+            disk_bytes=snapshot_bytes(database_path) - 1,
+        )
+        try:
+            job = await wait_for(jobs, jobs.submit(ReportKind.TASKS_CSV).id)
+
+            assert job.state == "failed"
+            assert "disk limit" in job.error
+            assert jobs._snapshot_bytes == 0
+        finally:
+            await jobs.close()
+
+
+class TestReportAPI:
+    async def test_enqueue_poll_and_download(self, database, tmp_path):
+        jobs = ReportJobs(
+            database.database_url, str(tmp_path / "reports"), workers=1, max_bytes=1000
+        )
+        app = FastAPI()
+        app.include_router(report_router)
+        app.dependency_overrides = {get_report_jobs: lambda: jobs}
+        try:
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                created = await client.post("/reports/", json={"kind": "tasks-html"})
+                summary = await client.post(
+                    "/reports/", json={"kind": "priority-summary"}
+                )
+                invalid = await client.post("/reports/", json={"kind": "xlsx"})
+
+                assert created.status_code == 202
+                assert created.json()["state"] in ("queued", "running")
+                assert invalid.status_code == 422
+                too_large = await wait_for(jobs, created.json()["id"])
+                await wait_for(jobs, summary.json()["id"])
+
+                status = await client.get(f"/reports/{summary.json()['id']}")
+                result = await client.get(f"/reports/{summary.json()['id']}/result")
+                failed = await client.get(f"/reports/{too_large.id}/result")
+                missing = await client.get("/reports/0123/result")
+
+            assert status.json()["state"] == "done"
+            assert result.status_code == 200
+            assert result.headers["content-type"] == "application/json"
+            assert "priority-summary-" in result.headers["content-disposition"]
+            assert result.json()["total"] == 4
+            assert too_large.state == "failed"
+            assert "limit" in too_large.error
+            assert failed.status_code == 409
+            assert missing.status_code == 404
+        finally:
+            await jobs.close()
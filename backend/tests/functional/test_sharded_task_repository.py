@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.database import Database, TaskModel
+from src.infrastructure.repositories import ShardedSQLiteTaskRepository
+
+
+@pytest.fixture
+async def sharded(tmp_path):
+    repository = ShardedSQLiteTaskRepository(
+        [Database(f"sqlite+aiosqlite:///{tmp_path}/shard-{i}.db") for i in range(4)]
+    )
+    await repository.migrate()
+    yield repository
+    await repository.close()
+
+
+async def rows_per_shard(repository: ShardedSQLiteTaskRepository) -> list[int]:
+    counts = []
+    for shard in repository.shards:
+        async with shard.async_session() as session:
+            result = await session.execute(select(func.count(TaskModel.id)))
+            counts.append(result.scalar())
+    return counts
+
+
+@pytest.mark.asyncio
+class TestShardedSQLiteTaskRepository:
+    async def test_tasks_are_spread_over_shards(self, sharded):
+        tasks = [
+            Task.create(title=f"Task {i}", description="D", priority=Priority.LOW)
+            for i in range(40)
+        ]
+
+        await asyncio.gather(*(sharded.create(task) for task in tasks))
+
+        counts = await rows_per_shard(sharded)
+        assert sum(counts) == 40
+        assert all(count > 0 for count in counts)
+        for task in tasks:
+            assert (await sharded.get_by_id(task.id)).title == task.title
+
+    async def test_merge_keeps_global_order(self, sharded):
+        for i in range(30):
+            priority = list(Priority)[i % 3]
+            await sharded.create(
+                Task.create(title=f"Task {i}", description="D", priority=priority)
+            )
+
+        tasks = await sharded.get_all()
+
+        rank = {Priority.HIGH: 3, Priority.MEDIUM: 2, Priority.LOW: 1}
+        keys = [(rank[task.priority], task.created_at) for task in tasks]
+        assert keys == sorted(keys, reverse=True)
+
+    async def test_pending_counter_follows_writes(self, sharded):
+        tasks = [
+            Task.create(title=f"High {i}", description="D", priority=Priority.HIGH)
+            for i in range(5)
+        ]
+        await asyncio.gather(*(sharded.create(task) for task in tasks))
+        assert await sharded.count_by_priority(Priority.HIGH) == 5
+
+        tasks[0].mark_as_done()
+        await sharded.update(tasks[0])
+        tasks[1].update(priority=Priority.LOW)
+        await sharded.update(tasks[1])
+        await sharded.delete(tasks[2].id)
+
+        assert await sharded.count_by_priority(Priority.HIGH) == 2
+        assert await sharded.count_by_priority(Priority.LOW) == 1
+
+    async def test_failed_write_restores_counter(self, sharded):
+        task = Task.create(title="Missing", description="D", priority=Priority.HIGH)
+
+        with pytest.raises(ValueError):
+            await sharded.update(task)
+
+        assert await sharded.count_by_priority(Priority.HIGH) == 0
+
+    async def test_counter_is_seeded_from_existing_shards(self, sharded, tmp_path):
+        await sharded.create(
+            Task.create(title="High", description="D", priority=Priority.HIGH)
+        )
+
+        reopened = ShardedSQLiteTaskRepository(sharded.shards)
+
+        assert await reopened.count_by_priority(Priority.HIGH) == 1
@@ -0,0 +1,111 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.presentation.api import SQLBudgetMiddleware, task_router
+
+TASK = {"title": "Task", "description": "Description", "priority": "low"}
+
+
+def budget_app(**options) -> FastAPI:
+    budgeted = FastAPI()
+    budgeted.include_router(task_router)
+    budgeted.dependency_overrides = app.dependency_overrides
+    budgeted.add_middleware(SQLBudgetMiddleware, **options)
+    return budgeted
+
+
+@pytest.fixture
+async def client(setup_database):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+class TestStatementBudgets:
+    """Statement counts per endpoint; raise a budget only on purpose."""
+
+    async def test_create(self, client, query_budget):
+        with query_budget(3):
+            response = await client.post("/tasks/", json=TASK)
+        assert response.status_code == 201
+
+    async def test_high_priority_create_and_upgrade(self, client, query_budget):
+        with query_budget(1):
+            response = await client.post("/tasks/", json={**TASK, "priority": "high"})
+        assert response.status_code == 201
+
+        task_id = (await client.post("/tasks/", json=TASK)).json()["id"]
+        with query_budget(2):
+            response = await client.put(f"/tasks/{task_id}", json={"priority": "high"})
+        assert response.status_code == 200
+
+    async def test_list(self, client, query_budget):
+        await client.post("/tasks/", json=TASK)
+        with query_budget(2):
+            await client.get("/tasks/")
+        with query_budget(1):
+            await client.get("/tasks/", params={"include_archived": "false"})
+        with query_budget(1):
+            await client.get("/tasks/status/false")
+        with query_budget(1):
+            await client.get("/tasks/top")
+
+    async def test_stats(self, client, query_budget):
+        with query_budget(9):
+            await client.get("/tasks/stats")
+
+    async def test_commands(self, client, query_budget):
+        task_id = (await client.post("/tasks/", json=TASK)).json()["id"]
+
+        with query_budget(4):
+            await client.put(f"/tasks/{task_id}", json={"title": "New"})
+        with query_budget(4):
+            await client.patch(f"/tasks/{task_id}/done")
+        with query_budget(4):
+            await client.patch(f"/tasks/{task_id}/pending")
+        await client.patch(f"/tasks/{task_id}/done")
+        with query_budget(4):
+            await client.patch(f"/tasks/{task_id}/archive")
+
+    async def test_budget_failure_lists_statements(self, client, query_budget):
+        with pytest.raises(AssertionError, match="budget is 1"):
+            with query_budget(1):
+                await client.post("/tasks/", json=TASK)
+
+
+@pytest.mark.asyncio
+class TestSQLBudgetMiddleware:
+    async def test_dev_mode_adds_headers(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=budget_app(headers=True)),
+            base_url="http://test",
+        ) as client:
+            await client.post("/tasks/", json=TASK)
+            response = await client.get("/tasks/")
+
+        assert response.headers["x-db-statements"] == "2"
+        assert response.headers["x-db-rows"] == "1"
+        assert float(response.headers["x-db-time-ms"]) >= 0
+
+    async def test_headers_are_off_by_default(self, client):
+        response = await client.get("/tasks/")
+
+        assert "x-db-statements" not in response.headers
+
+    async def test_logs_requests_over_budget_and_repeats(self, setup_database, caplog):
+        async with AsyncClient(
+            transport=ASGITransport(app=budget_app(budget=5, repeated_limit=2)),
+            base_url="http://test",
+        ) as client:
+            with caplog.at_level(logging.WARNING):
+                await client.get("/tasks/stats")
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert any("ran 9 SQL statements (budget 5" in m for m in messages)
+        assert any("3 times (possible N+1)" in m for m in messages)
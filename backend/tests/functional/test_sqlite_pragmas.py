@@ -0,0 +1,29 @@
+from sqlalchemy import text
+
+from src.infrastructure.database import Database
+
+
+async def _pragma(database: Database, name: str):
+    async with database.engine.connect() as conn:
+        return (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+
+
+class TestSQLitePragmas:
+    async def test_pragmas_are_applied_to_every_connection(self, tmp_path):
+        database = Database(
+            f"sqlite+aiosqlite:///{tmp_path}/tasks.db",
+            pragmas={"journal_mode": "WAL", "busy_timeout": "1234"},
+        )
+        try:
+            assert await _pragma(database, "journal_mode") == "wal"
+            assert await _pragma(database, "busy_timeout") == 1234
+        finally:
+            await database.close()
+
+    async def test_single_worker_keeps_the_default_journal(self, tmp_path):
+        database = Database(f"sqlite+aiosqlite:///{tmp_path}/tasks.db")
+        try:
+            assert await _pragma(database, "journal_mode") == "delete"
+            assert await _pragma(database, "busy_timeout") == 5000
+        finally:
+            await database.close()
@@ -0,0 +1,20 @@
+import os
+
+from benchmarks.startup import measure_startup
+
+# Generous defaults so slow CI machines pass; tighten locally with the
+# environment variables to catch regressions early.
+IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "3000"))
+LIFESPAN_BUDGET_MS = float(os.environ.get("STARTUP_LIFESPAN_BUDGET_MS", "1000"))
+
+# Loaded in the background or on first use, never before serving.
+LAZY_MODULES = ("numpy", "src.infrastructure.index.columnar_task_index")
+
+
+class TestStartup:
+    def test_app_starts_within_budget_without_lazy_modules(self):
+        startup = measure_startup()
+
+        assert startup["import_ms"] < IMPORT_BUDGET_MS
+        assert startup["lifespan_ms"] < LIFESPAN_BUDGET_MS
+        assert not set(LAZY_MODULES) & set(startup["modules"])
@@ -0,0 +1,85 @@
+from datetime import datetime, UTC
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+
+from main import app
+from src.infrastructure.analytics import AnalyticsCache
+from src.presentation.api.task_router import get_analytics_cache
+
+from .conftest import test_engine
+
+
+@pytest.fixture
+def analytics_cache():
+    cache = AnalyticsCache()
+    app.dependency_overrides[get_analytics_cache] = lambda: cache
+    yield cache
+    del app.dependency_overrides[get_analytics_cache]
+
+
+@pytest.mark.asyncio
+class TestTaskAnalyticsAPI:
+    async def test_rollups_follow_commands(
+        self, setup_database, analytics_cache, query_budget
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            ids = []
+            for priority in ("high", "low", "low"):
+                response = await client.post(
+                    "/tasks/",
+                    json={"title": "T", "description": "D", "priority": priority},
+                )
+                ids.append(response.json()["id"])
+            await client.patch(f"/tasks/{ids[0]}/done")
+            await client.patch(f"/tasks/{ids[0]}/archive")
+
+            response = await client.get("/tasks/analytics", params={"days": 7})
+            with query_budget(0):
+                cached = await client.get("/tasks/analytics", params={"days": 7})
+            await client.patch(f"/tasks/{ids[1]}/done")
+            after_write = await client.get("/tasks/analytics", params={"days": 7})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert cached.json() == body
+        assert body["days"] == 7
+        assert len(body["throughput"]) == 7
+        today = body["throughput"][-1]
+        assert today["day"] == datetime.now(UTC).date().isoformat()
+        assert (today["created"], today["completed"]) == (3, 1)
+        lead = {entry["priority"]: entry for entry in body["lead_time"]}
+        assert lead["high"]["completed"] == 1
+        assert lead["high"]["p50_hours"] >= 0
+        assert lead["low"]["completed"] == 0
+        assert body["backlog_age"][0] == {"min_days": 0, "max_days": 1, "count": 2}
+        assert after_write.json()["throughput"][-1]["completed"] == 2
+        assert after_write.json()["backlog_age"][0]["count"] == 1
+
+    async def test_done_tasks_from_before_completed_at_use_updated_at(
+        self, setup_database, analytics_cache
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            created = await client.post(
+                "/tasks/", json={"title": "T", "description": "D", "priority": "low"}
+            )
+            await client.patch(f"/tasks/{created.json()['id']}/done")
+            async with test_engine.begin() as conn:
+                await conn.execute(text("UPDATE tasks SET completed_at = NULL"))
+
+            response = await client.get("/tasks/analytics")
+
+        assert response.json()["throughput"][-1]["completed"] == 1
+
+    async def test_window_is_validated(self, setup_database, analytics_cache):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/tasks/analytics", params={"days": 0})
+
+        assert response.status_code == 422
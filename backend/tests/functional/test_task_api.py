@@ -1,39 +1,9 @@
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import StaticPool
 
 from main import app
-from src.infrastructure.database import Base
-from src.presentation.api.task_router import get_db_session
-
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-test_engine = create_async_engine(
-    TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = async_sessionmaker(
-    autocommit=False, autoflush=False, bind=test_engine
-)
-
-
-async def override_get_db():
-    async with TestingSessionLocal() as session:
-        yield session
-
-
-app.dependency_overrides[get_db_session] = override_get_db
-
-
-@pytest.fixture
-async def setup_database():
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
 
 @pytest.mark.asyncio
@@ -114,3 +84,59 @@ class TestTaskAPI:
                 "Cannot create more than 5 tasks with high priority"
                 in response.json()["detail"]
             )
+
+    async def test_done_task_cannot_reopen_past_the_high_priority_limit(
+        self, setup_database
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            task = {"title": "Task", "description": "Description", "priority": "low"}
+            done = (await client.post("/tasks/", json=task)).json()
+            await client.patch(f"/tasks/{done['id']}/done")
+            for _ in range(5):
+                await client.post("/tasks/", json={**task, "priority": "high"})
+
+            upgraded = await client.put(
+                f"/tasks/{done['id']}", json={"priority": "high"}
+            )
+            reopened = await client.patch(f"/tasks/{done['id']}/pending")
+            stats = (await client.get("/tasks/stats")).json()
+
+            assert upgraded.status_code == 200
+            assert reopened.status_code == 400
+            assert "Maximum of 5" in reopened.json()["detail"]
+            assert stats["pending_by_priority"]["high"] == 5
+
+    async def test_due_at_is_set_moved_and_cleared(self, setup_database):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            created = await client.post(
+                "/tasks/",
+                json={
+                    "title": "Task",
+                    "description": "Description",
+                    "priority": "low",
+                    "due_at": "2030-01-02T03:04:05Z",
+                },
+            )
+            task_id = created.json()["id"]
+            moved = await client.put(
+                f"/tasks/{task_id}", json={"due_at": "2030-02-01T00:00:00Z"}
+            )
+            renamed = await client.put(f"/tasks/{task_id}", json={"title": "Renamed"})
+            cleared = await client.put(f"/tasks/{task_id}", json={"due_at": None})
+            listed = await client.get("/tasks/")
+
+        # Timestamps read back as naive UTC.
+        def due_at(response):
+            value = response.json()["due_at"]
+            return datetime.fromisoformat(value) if value is not None else None
+
+        assert created.status_code == 201
+        assert due_at(created) == datetime(2030, 1, 2, 3, 4, 5)
+        assert due_at(moved) == datetime(2030, 2, 1)
+        assert due_at(renamed) == datetime(2030, 2, 1)
+        assert due_at(cleared) is None
+        assert listed.json()[0]["due_at"] is None
@@ -0,0 +1,45 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from benchmarks.generate import Distribution, generate
+from src.infrastructure.database import ArchivedTaskModel, TaskModel
+from src.infrastructure.database.migrations import LATEST_VERSION, current_version
+from src.infrastructure.database import Database
+from src.infrastructure.repositories import SQLiteTaskRepository
+
+
+class TestTaskGenerator:
+    async def test_generated_tasks_load_through_the_repository(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path}/generated.db"
+
+        counts = await generate(url, 2000, Distribution(), seed=1, batch_size=500)
+
+        database = Database(url, pragmas={})
+        engine = create_async_engine(url)
+        try:
+            assert await current_version(database) == LATEST_VERSION
+            async with async_sessionmaker(engine)() as session:
+                hot = await session.scalar(select(func.count()).select_from(TaskModel))
+                archived = await session.scalar(
+                    select(func.count()).select_from(ArchivedTaskModel)
+                )
+                tasks = await SQLiteTaskRepository(session).get_all()
+            indexes = await _index_names(engine)
+        finally:
+            await engine.dispose()
+            await database.close()
+
+        assert hot + archived == counts.tasks == 2000
+        assert archived == counts.archived
+        assert len(tasks) == 2000
+        assert "ix_tasks_status_rank_created" in indexes
+        assert "ix_tasks_id" not in indexes
+        assert [task.id.version for task in tasks[:3]] == [7, 7, 7]
+
+
+async def _index_names(engine) -> set[str]:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+        return {name for (name,) in result}
@@ -0,0 +1,187 @@
+import dataclasses
+import sys
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.infrastructure.config import settings
+from src.presentation.api.task_import import csv_rows, ndjson_rows
+
+NDJSON = "application/x-ndjson"
+
+
+@pytest.fixture
+async def client(setup_database):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+class chunks:
+    """A request body arriving in the given pieces."""
+
+    def __init__(self, *parts: bytes):
+        self.parts = iter(parts)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            return next(self.parts)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+async def collect(rows):
+    return [
+        (line, row if isinstance(row, str) else row.title) async for line, row in rows
+    ]
+
+
+@pytest.mark.asyncio
+class TestTaskImportParsing:
+    async def test_ndjson_lines_split_across_chunks(self):
+        rows = ndjson_rows(
+            chunks(
+                b'{"title": "A", "description": "D", "prio',
+                b'rity": "low"}\r\n\n{"title": "", "description": "D", '
+                b'"priority": "low"}\n{"title": "C", "description": "D", '
+                b'"priority": "high"}',
+            ),
+            max_line_bytes=1024,
+        )
+
+        assert await collect(rows) == [
+            (1, "A"),
+            (3, "title: String should have at least 1 character"),
+            (4, "C"),
+        ]
+
+    async def test_overlong_lines_are_skipped_as_they_stream(self):
+        rows = ndjson_rows(
+            chunks(b'{"title": "' + b"x" * 40, b"x" * 40, b'"}\n{"title": "B"}\n'),
+            max_line_bytes=32,
+        )
+
+        result = await collect(rows)
+
+        assert result[0] == (1, "Line is longer than 32 bytes")
+        assert result[1][0] == 2
+
+    async def test_csv_quoted_fields_may_span_lines(self):
+        rows = csv_rows(
+            chunks(
+                b"\xef\xbb\xbftitle,description,priority\n",
+                b'A,"first line\nsecond, line",medium\n',
+                b"B,Description\n",
+                b"C,Description,urgent\n",
+            ),
+            max_line_bytes=1024,
+        )
+
+        result = await collect(rows)
+
+        assert result[0] == (2, "A")
+        assert result[1] == (4, "Expected 3 fields, got 2")
+        assert result[2][0] == 5
+        assert result[2][1].startswith("priority: Input should be")
+
+    async def test_csv_header_must_name_the_required_columns(self):
+        rows = csv_rows(chunks(b"name,priority\nA,low\n"), max_line_bytes=1024)
+
+        with pytest.raises(ValueError, match="missing title, description"):
+            await collect(rows)
+
+
+@pytest.mark.asyncio
+class TestTaskImportAPI:
+    async def test_import_ndjson_reports_per_line_errors(self, client):
+        body = (
+            b'{"title": "A", "description": "D", "priority": "low"}\n'
+            b"not json\n"
+            b'{"title": "B", "description": "D", "priority": "medium"}\n'
+        )
+
+        response = await client.post(
+            "/tasks/import", content=body, headers={"Content-Type": NDJSON}
+        )
+
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["imported"] == 2
+        assert summary["failed"] == 1
+        assert summary["errors"][0]["line"] == 2
+        listed = await client.get("/tasks/")
+        assert {task["title"] for task in listed.json()} == {"A", "B"}
+
+    async def test_imported_tasks_keep_their_due_date(self, client):
+        ndjson = (
+            b'{"title": "A", "description": "D", "priority": "low", '
+            b'"due_at": "2030-01-02T03:04:05Z"}\n'
+        )
+        csv = b"title,description,priority,due_at\nB,D,low,2030-02-03T04:05:06Z\nC,D,low,\n"
+
+        first = await client.post(
+            "/tasks/import", content=ndjson, headers={"Content-Type": NDJSON}
+        )
+        second = await client.post("/tasks/import?format=csv", content=csv)
+
+        assert first.json()["imported"] == 1
+        assert second.json() == {"imported": 2, "failed": 0, "errors": []}
+        listed = await client.get("/tasks/")
+        assert {task["title"]: task["due_at"] for task in listed.json()} == {
+            "A": "2030-01-02T03:04:05",
+            "B": "2030-02-03T04:05:06",
+            "C": None,
+        }
+
+    async def test_import_csv_in_small_chunks(self, client, monkeypatch):
+        monkeypatch.setattr(
+            sys.modules["src.presentation.api.task_router"],
+            "settings",
+            dataclasses.replace(settings, import_chunk_size=2),
+        )
+        lines = ["title,description,priority"]
+        lines += [f"Task {i},Description,low" for i in range(5)]
+
+        response = await client.post(
+            "/tasks/import",
+            content="\n".join(lines).encode(),
+            headers={"Content-Type": "text/csv; charset=utf-8"},
+        )
+
+        assert response.json() == {"imported": 5, "failed": 0, "errors": []}
+        assert len((await client.get("/tasks/")).json()) == 5
+
+    async def test_high_priority_rows_beyond_the_limit_are_rejected(self, client):
+        await client.post(
+            "/tasks/",
+            json={"title": "Existing", "description": "D", "priority": "high"},
+        )
+        body = "title,description,priority\n" + "".join(
+            f"High {i},D,high\n" for i in range(6)
+        )
+
+        response = await client.post("/tasks/import?format=csv", content=body.encode())
+
+        summary = response.json()
+        assert summary["imported"] == 4
+        assert [error["line"] for error in summary["errors"]] == [6, 7]
+        stats = (await client.get("/tasks/stats")).json()
+        assert stats["pending_by_priority"]["high"] == 5
+
+    async def test_unknown_content_type_is_rejected(self, client):
+        response = await client.post(
+            "/tasks/import", content=b"{}", headers={"Content-Type": "text/plain"}
+        )
+
+        assert response.status_code == 415
+
+    async def test_bad_csv_header_is_a_bad_request(self, client):
+        response = await client.post("/tasks/import?format=csv", content=b"name\nA\n")
+
+        assert response.status_code == 400
+        assert "missing title" in response.json()["detail"]
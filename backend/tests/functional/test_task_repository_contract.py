@@ -0,0 +1,315 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.analytics import AnalyticsCache, task_analytics_scope
+from src.infrastructure.database import Database, migrate
+from src.infrastructure.repositories import (
+    InMemoryTaskRepository,
+    ShardedSQLiteTaskRepository,
+    SQLiteTaskRepository,
+)
+from tests.functional.conftest import TestingSessionLocal
+
+
+@pytest.fixture(params=["sqlite", "memory", "sharded"])
+async def repository(request, setup_database, tmp_path):
+    if request.param == "memory":
+        yield InMemoryTaskRepository()
+        return
+    if request.param == "sharded":
+        sharded = ShardedSQLiteTaskRepository(
+            [Database(f"sqlite+aiosqlite:///{tmp_path}/shard-{i}.db") for i in range(3)]
+        )
+        await sharded.migrate()
+        yield sharded
+        await sharded.close()
+        return
+    async with TestingSessionLocal() as session:
+        yield SQLiteTaskRepository(session)
+
+
+def make_task(title: str, priority: Priority = Priority.LOW, minutes: int = 0) -> Task:
+    task = Task.create(title=title, description="Description", priority=priority)
+    task.created_at = datetime(2025, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes)
+    task.updated_at = task.created_at
+    return task
+
+
+async def create_archived(repository, title: str, minutes: int = 0) -> Task:
+    task = await repository.create(make_task(title, minutes=minutes))
+    task.mark_as_done()
+    task.archive()
+    return await repository.archive(task)
+
+
+@pytest.mark.asyncio
+class TestTaskRepositoryContract:
+    async def test_create_and_get_by_id(self, repository):
+        task = make_task("Task", Priority.MEDIUM)
+
+        created = await repository.create(task)
+        found = await repository.get_by_id(task.id)
+
+        assert created.id == task.id
+        assert found.title == "Task"
+        assert found.priority == Priority.MEDIUM
+        assert found.is_done is False
+
+    async def test_create_many(self, repository):
+        tasks = [make_task(f"Task {i}", Priority.HIGH, minutes=i) for i in range(3)]
+
+        created = await repository.create_many(tasks)
+
+        assert created == 3
+        assert [task.title for task in await repository.get_all()] == [
+            "Task 2",
+            "Task 1",
+            "Task 0",
+        ]
+        assert await repository.count_by_priority(Priority.HIGH) == 3
+        assert await repository.create_many([]) == 0
+
+    async def test_get_by_id_missing(self, repository):
+        assert await repository.get_by_id(uuid4()) is None
+
+    async def test_get_by_ids_keeps_requested_order(self, repository):
+        first = await repository.create(make_task("First"))
+        second = await repository.create(make_task("Second"))
+
+        found = await repository.get_by_ids([second.id, uuid4(), first.id])
+
+        assert [task.title for task in found] == ["Second", "First"]
+
+    async def test_get_all_orders_by_priority_then_newest(self, repository):
+        await repository.create(make_task("Old low", Priority.LOW, minutes=0))
+        await repository.create(make_task("High", Priority.HIGH, minutes=1))
+        await repository.create(make_task("New low", Priority.LOW, minutes=2))
+        await repository.create(make_task("Medium", Priority.MEDIUM, minutes=3))
+
+        tasks = await repository.get_all()
+
+        assert [task.title for task in tasks] == [
+            "High",
+            "Medium",
+            "New low",
+            "Old low",
+        ]
+
+    async def test_get_all_archived_only_when_requested(self, repository):
+        await repository.create(make_task("Active", minutes=1))
+        await create_archived(repository, "Archived", minutes=0)
+
+        everything = await repository.get_all()
+        active = await repository.get_all(include_archived=False)
+
+        assert [task.title for task in everything] == ["Active", "Archived"]
+        assert [task.title for task in active] == ["Active"]
+
+    async def test_get_by_status(self, repository):
+        await repository.create(make_task("Pending"))
+        done = await repository.create(make_task("Done"))
+        done.mark_as_done()
+        await repository.update(done)
+        await create_archived(repository, "Archived")
+
+        pending = await repository.get_by_status(is_done=False, is_archived=False)
+        completed = await repository.get_by_status(is_done=True, is_archived=False)
+        archived = await repository.get_by_status(is_done=True, is_archived=True)
+
+        assert [task.title for task in pending] == ["Pending"]
+        assert [task.title for task in completed] == ["Done"]
+        assert [task.title for task in archived] == ["Archived"]
+
+    async def test_update(self, repository):
+        task = await repository.create(make_task("Original"))
+        task.update(title="Renamed", priority=Priority.HIGH)
+
+        updated = await repository.update(task)
+        found = await repository.get_by_id(task.id)
+
+        assert updated.title == "Renamed"
+        assert found.title == "Renamed"
+        assert found.priority == Priority.HIGH
+
+    async def test_update_missing_raises(self, repository):
+        with pytest.raises(ValueError, match="not found"):
+            await repository.update(make_task("Missing"))
+
+    async def test_archived_task_stays_reachable(self, repository):
+        archived = await create_archived(repository, "Archived")
+
+        found = await repository.get_by_id(archived.id)
+        found.update(title="Renamed")
+        updated = await repository.update(found)
+
+        assert updated.is_archived is True
+        assert updated.title == "Renamed"
+
+    async def test_delete(self, repository):
+        task = await repository.create(make_task("Task"))
+
+        assert await repository.delete(task.id) is True
+        assert await repository.delete(task.id) is False
+        assert await repository.get_by_id(task.id) is None
+
+    async def test_count_by_priority_counts_pending_only(self, repository):
+        await repository.create(make_task("High 1", Priority.HIGH))
+        await repository.create(make_task("High 2", Priority.HIGH))
+        done = await repository.create(make_task("High done", Priority.HIGH))
+        done.mark_as_done()
+        await repository.update(done)
+
+        assert await repository.count_by_priority(Priority.HIGH) == 2
+        assert await repository.count_by_priority(Priority.LOW) == 0
+
+    async def test_archived_task_marked_pending_counts_toward_the_limit(
+        self, repository
+    ):
+        task = await repository.create(make_task("Archived", Priority.HIGH))
+        task.mark_as_done()
+        task.archive()
+        archived = await repository.archive(task)
+        archived.mark_as_pending()
+        await repository.update(archived)
+
+        refused = await repository.create_within_limit(
+            make_task("New", Priority.HIGH), 1
+        )
+        reopened = await repository.get_by_id(task.id)
+        reopened.update(title="Renamed")
+        kept = await repository.update_within_limit(reopened, 1)
+
+        assert await repository.count_by_priority(Priority.HIGH) == 1
+        assert refused is None
+        assert kept.title == "Renamed"
+
+    async def test_create_within_limit(self, repository):
+        first = await repository.create_within_limit(make_task("1", Priority.HIGH), 2)
+        await repository.create_within_limit(make_task("2", Priority.HIGH), 2)
+
+        refused = await repository.create_within_limit(make_task("3", Priority.HIGH), 2)
+        first.mark_as_done()
+        await repository.update(first)
+        reopened = await repository.create_within_limit(
+            make_task("4", Priority.HIGH), 2
+        )
+
+        assert first.title == "1"
+        assert refused is None
+        assert reopened.title == "4"
+        assert await repository.count_by_priority(Priority.HIGH) == 2
+        assert len(await repository.get_all()) == 3
+
+    async def test_update_within_limit(self, repository):
+        high = await repository.create(make_task("High", Priority.HIGH))
+        low = await repository.create(make_task("Low"))
+
+        low.update(priority=Priority.HIGH)
+        refused = await repository.update_within_limit(low, 1)
+        high.update(title="Still high")
+        kept = await repository.update_within_limit(high, 1)
+
+        assert refused is None
+        assert (await repository.get_by_id(low.id)).priority == Priority.LOW
+        assert kept.title == "Still high"
+        assert await repository.count_by_priority(Priority.HIGH) == 1
+        with pytest.raises(ValueError):
+            await repository.update_within_limit(make_task("Missing"), 1)
+
+    async def test_reopening_a_done_task_is_held_to_the_limit(self, repository):
+        await repository.create(make_task("High", Priority.HIGH))
+        done = make_task("Done")
+        done.mark_as_done()
+        await repository.create(done)
+
+        done.update(priority=Priority.HIGH)
+        upgraded = await repository.update_within_limit(done, 1)
+        upgraded.mark_as_pending()
+        refused = await repository.update_within_limit(upgraded, 1)
+
+        assert upgraded.priority == Priority.HIGH
+        assert refused is None
+        assert (await repository.get_by_id(done.id)).is_done is True
+        assert await repository.count_by_priority(Priority.HIGH) == 1
+
+    async def test_count_by_status(self, repository):
+        await repository.create(make_task("Pending"))
+        await create_archived(repository, "Archived")
+
+        assert await repository.count_by_status(False, False) == 1
+        assert await repository.count_by_status(True, False) == 0
+        assert await repository.count_by_status(True, True) == 1
+
+    async def test_analytics_cover_every_stored_task(self, repository):
+        await repository.create(make_task("Pending"))
+        done = await repository.create(make_task("Done", Priority.HIGH))
+        done.mark_as_done()
+        await repository.update(done)
+        await create_archived(repository, "Archived")
+
+        async with task_analytics_scope(repository, AnalyticsCache()) as source:
+            analytics = await source.analytics(days=1)
+
+        assert sum(bucket.count for bucket in analytics.backlog_age) == 1
+        completed = {lead.priority: lead.completed for lead in analytics.lead_time}
+        assert completed == {Priority.HIGH: 1, Priority.MEDIUM: 0, Priority.LOW: 1}
+        assert analytics.throughput[-1].completed == 2
+
+
+@pytest.fixture(params=["sqlite", "memory", "sharded"])
+async def session_per_call(request, tmp_path):
+    """A factory giving each concurrent caller its own repository and session."""
+    if request.param == "memory":
+        shared = InMemoryTaskRepository()
+
+        @asynccontextmanager
+        async def memory_repository():
+            yield shared
+
+        yield memory_repository
+        return
+    if request.param == "sharded":
+        sharded = ShardedSQLiteTaskRepository(
+            [Database(f"sqlite+aiosqlite:///{tmp_path}/shard-{i}.db") for i in range(3)]
+        )
+        await sharded.migrate()
+
+        @asynccontextmanager
+        async def sharded_repository():
+            yield sharded
+
+        yield sharded_repository
+        await sharded.close()
+        return
+    database = Database(f"sqlite+aiosqlite:///{tmp_path}/tasks.db")
+    database.engine.echo = False
+    await migrate(database)
+
+    @asynccontextmanager
+    async def sqlite_repository():
+        async with database.async_session() as session:
+            yield SQLiteTaskRepository(session)
+
+    yield sqlite_repository
+    await database.close()
+
+
+@pytest.mark.asyncio
+class TestPriorityLimitUnderConcurrency:
+    async def test_concurrent_creates_never_pass_the_limit(self, session_per_call):
+        async def create(i: int):
+            async with session_per_call() as repository:
+                return await repository.create_within_limit(
+                    make_task(f"High {i}", Priority.HIGH), 5
+                )
+
+        results = await asyncio.gather(*(create(i) for i in range(12)))
+
+        assert sum(result is not None for result in results) == 5
+        async with session_per_call() as repository:
+            assert await repository.count_by_priority(Priority.HIGH) == 5
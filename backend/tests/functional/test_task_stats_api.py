@@ -0,0 +1,64 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from main import app
+from src.infrastructure.index import ColumnarTaskIndex
+from src.presentation.api.task_router import get_task_index
+
+
+@pytest.fixture(params=["index", "repository"])
+def task_index(request):
+    index = None
+    if request.param == "index":
+        index = ColumnarTaskIndex()
+        index.load([])
+    app.dependency_overrides[get_task_index] = lambda: index
+    yield index
+    del app.dependency_overrides[get_task_index]
+
+
+@pytest.mark.asyncio
+class TestTaskStatsAPI:
+    async def test_stats_follow_commands(self, setup_database, task_index):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            ids = []
+            for priority in ("high", "high", "low", "medium"):
+                response = await client.post(
+                    "/tasks/",
+                    json={"title": "T", "description": "D", "priority": priority},
+                )
+                ids.append(response.json()["id"])
+            await client.patch(f"/tasks/{ids[2]}/done")
+            await client.patch(f"/tasks/{ids[3]}/done")
+            await client.patch(f"/tasks/{ids[3]}/archive")
+
+            response = await client.get("/tasks/stats")
+
+            assert response.status_code == 200
+            assert response.json() == {
+                "pending": 2,
+                "done": 1,
+                "archived": 1,
+                "pending_by_priority": {"low": 0, "medium": 0, "high": 2},
+            }
+
+    async def test_top_pending(self, setup_database, task_index):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            for title, priority in (
+                ("Low", "low"),
+                ("High", "high"),
+                ("Mid", "medium"),
+            ):
+                await client.post(
+                    "/tasks/",
+                    json={"title": title, "description": "D", "priority": priority},
+                )
+
+            response = await client.get("/tasks/top", params={"limit": 2})
+
+            assert response.status_code == 200
+            assert [task["title"] for task in response.json()] == ["High", "Mid"]
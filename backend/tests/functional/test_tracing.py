@@ -0,0 +1,82 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+from src.infrastructure.observability import InMemorySpanExporter, tracer
+from src.presentation.api import TracingMiddleware, task_router
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = InMemorySpanExporter()
+    monkeypatch.setattr(tracer, "exporter", exporter)
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    return exporter
+
+
+@pytest.fixture
+async def client(setup_database):
+    traced = FastAPI()
+    traced.include_router(task_router)
+    traced.dependency_overrides = app.dependency_overrides
+    traced.add_middleware(TracingMiddleware)
+    async with AsyncClient(
+        transport=ASGITransport(app=traced), base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+class TestTracing:
+    async def test_request_spans_are_nested_by_layer(self, client, exporter):
+        response = await client.post(
+            "/tasks/", json={"title": "Task", "description": "D", "priority": "high"}
+        )
+
+        assert response.status_code == 201
+        trace_id = response.headers["x-trace-id"]
+        spans = list(exporter.spans)
+        assert {span.trace_id for span in spans} == {trace_id}
+        by_name = {span.name: span for span in spans}
+        by_id = {span.span_id: span for span in spans}
+
+        def parent_name(name):
+            return by_id[by_name[name].parent_id].name
+
+        root = by_name["http.request"]
+        assert root.parent_id is None
+        assert root.attributes["route"] == "/tasks/"
+        assert root.attributes["status"] == 201
+        assert parent_name("request.dependencies") == "http.request"
+        assert parent_name("endpoint.create_task") == "http.request"
+        assert parent_name("response.serialize") == "http.request"
+        assert parent_name("handler.CreateTaskHandler") == "endpoint.create_task"
+        assert parent_name("repository.create_within_limit") == (
+            "handler.CreateTaskHandler"
+        )
+
+        statements = [span for span in spans if span.name == "db.statement"]
+        assert {by_id[span.parent_id].name for span in statements} == {
+            "repository.create_within_limit",
+        }
+        assert all(span.duration_ns >= 0 for span in spans)
+        assert root.duration_ns >= by_name["endpoint.create_task"].duration_ns
+
+    async def test_unsampled_requests_get_a_trace_id_but_no_spans(
+        self, client, exporter, monkeypatch
+    ):
+        monkeypatch.setattr(tracer, "sample_rate", 0.0)
+
+        response = await client.get("/tasks/")
+
+        assert len(response.headers["x-trace-id"]) == 32
+        assert list(exporter.spans) == []
+
+    async def test_each_request_gets_its_own_trace(self, client, exporter):
+        first = await client.get("/tasks/")
+        second = await client.get("/tasks/")
+
+        assert first.headers["x-trace-id"] != second.headers["x-trace-id"]
+        roots = [span for span in exporter.spans if span.name == "http.request"]
+        assert len(roots) == 2
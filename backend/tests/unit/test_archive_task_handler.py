@@ -33,7 +33,7 @@ class TestArchiveTaskHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = done_task
-        mock_repository.update.return_value = archived_task
+        mock_repository.archive.return_value = archived_task
 
         handler = ArchiveTaskHandler(mock_repository)
         command = ArchiveTaskCommand(task_id=task_id)
@@ -46,7 +46,7 @@ class TestArchiveTaskHandler:
         assert result.description == "Task Description"
         assert result.priority == Priority.MEDIUM
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_called_once_with(done_task)
+        mock_repository.archive.assert_called_once_with(done_task)
 
     @pytest.mark.asyncio
     async def test_archive_task_not_completed(self):
@@ -68,7 +68,7 @@ class TestArchiveTaskHandler:
             await handler.handle(command)
 
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_not_called()
+        mock_repository.archive.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_archive_task_not_found(self):
@@ -85,7 +85,7 @@ class TestArchiveTaskHandler:
             await handler.handle(command)
 
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_not_called()
+        mock_repository.archive.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_archive_task_preserves_properties(self):
@@ -111,7 +111,7 @@ class TestArchiveTaskHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = done_task
-        mock_repository.update.return_value = archived_task
+        mock_repository.archive.return_value = archived_task
 
         handler = ArchiveTaskHandler(mock_repository)
         command = ArchiveTaskCommand(task_id=task_id)
@@ -125,7 +125,7 @@ class TestArchiveTaskHandler:
         assert result.priority == Priority.HIGH
         assert result.id == task_id
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_called_once_with(done_task)
+        mock_repository.archive.assert_called_once_with(done_task)
 
     @pytest.mark.asyncio
     async def test_archive_task_updates_timestamp(self):
@@ -149,7 +149,7 @@ class TestArchiveTaskHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = done_task
-        mock_repository.update.return_value = archived_task
+        mock_repository.archive.return_value = archived_task
 
         handler = ArchiveTaskHandler(mock_repository)
         command = ArchiveTaskCommand(task_id=task_id)
@@ -160,7 +160,7 @@ class TestArchiveTaskHandler:
         assert result.created_at == original_creation_time  # Should not change
         assert result.updated_at >= original_creation_time  # Should be updated
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_called_once_with(done_task)
+        mock_repository.archive.assert_called_once_with(done_task)
 
     @pytest.mark.asyncio
     async def test_archive_task_with_all_priorities(self):
@@ -189,7 +189,7 @@ class TestArchiveTaskHandler:
 
             mock_repository = AsyncMock()
             mock_repository.get_by_id.return_value = done_task
-            mock_repository.update.return_value = archived_task
+            mock_repository.archive.return_value = archived_task
 
             handler = ArchiveTaskHandler(mock_repository)
             command = ArchiveTaskCommand(task_id=task_id)
@@ -200,7 +200,7 @@ class TestArchiveTaskHandler:
             assert result.is_done is True
             assert result.priority == priority
             mock_repository.get_by_id.assert_called_once_with(task_id)
-            mock_repository.update.assert_called_once_with(done_task)
+            mock_repository.archive.assert_called_once_with(done_task)
 
     @pytest.mark.asyncio
     async def test_archive_task_repository_error(self):
@@ -214,7 +214,7 @@ class TestArchiveTaskHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = done_task
-        mock_repository.update.side_effect = Exception("Database error")
+        mock_repository.archive.side_effect = Exception("Database error")
 
         handler = ArchiveTaskHandler(mock_repository)
         command = ArchiveTaskCommand(task_id=task_id)
@@ -223,7 +223,7 @@ class TestArchiveTaskHandler:
             await handler.handle(command)
 
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_called_once_with(done_task)
+        mock_repository.archive.assert_called_once_with(done_task)
 
     @pytest.mark.asyncio
     async def test_archive_task_business_rule_validation(self):
@@ -245,4 +245,4 @@ class TestArchiveTaskHandler:
         with pytest.raises(ValueError, match="Only completed tasks can be archived"):
             await handler.handle(command)
 
-        mock_repository.update.assert_not_called()  # Should not be called
+        mock_repository.archive.assert_not_called()  # Should not be called
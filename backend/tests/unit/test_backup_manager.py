@@ -0,0 +1,125 @@
+import sqlite3
+
+import pytest
+
+from src.infrastructure.backup import (
+    BackupInProgressError,
+    BackupManager,
+    BackupProgress,
+    stepped_backup,
+)
+from src.infrastructure.backup.online_backup import sqlite_file_path
+
+
+def make_database(path, rows: int = 50) -> str:
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE items (payload BLOB)")
+    connection.executemany("INSERT INTO items VALUES (randomblob(2000))", [()] * rows)
+    connection.commit()
+    connection.close()
+    return f"sqlite+aiosqlite:///{path}"
+
+
+class TestBackupManager:
+    async def test_snapshot_is_a_complete_copy(self, tmp_path):
+        manager = BackupManager(
+            make_database(tmp_path / "tasks.db"), str(tmp_path / "backups"), keep=3
+        )
+
+        progress = await manager.run()
+
+        assert progress.state == "done"
+        assert progress.percent == 100.0
+        assert progress.pages_copied == progress.pages_total > 0
+        snapshot = manager.path_for(progress.name)
+        assert progress.name.startswith("tasks-")
+        count = sqlite3.connect(snapshot).execute("SELECT count(*) FROM items")
+        assert count.fetchone() == (50,)
+        assert not list((tmp_path / "backups").glob("*.partial"))
+
+    async def test_keeps_only_the_newest_snapshots(self, tmp_path):
+        manager = BackupManager(
+            make_database(tmp_path / "tasks.db", rows=1),
+            str(tmp_path / "backups"),
+            keep=2,
+        )
+
+        names = [(await manager.run()).name for _ in range(4)]
+
+        assert [info.name for info in manager.snapshots()] == names[:1:-1]
+
+    async def test_dotted_database_names_stay_in_the_ring(self, tmp_path):
+        manager = BackupManager(
+            make_database(tmp_path / "tasks.prod.db", rows=1),
+            str(tmp_path / "backups"),
+            keep=1,
+        )
+
+        names = [(await manager.run()).name for _ in range(2)]
+
+        assert names[1].startswith("tasks_prod-")
+        assert [info.name for info in manager.snapshots()] == names[1:]
+        assert manager.path_for(names[1]) is not None
+        assert len(list((tmp_path / "backups").iterdir())) == 1
+
+    async def test_missing_database_is_reported_as_failed(self, tmp_path):
+        manager = BackupManager(
+            f"sqlite+aiosqlite:///{tmp_path}/missing.db", str(tmp_path), keep=2
+        )
+
+        progress = await manager.run()
+
+        assert progress.state == "failed"
+        assert "does not exist" in progress.error
+        assert manager.snapshots() == []
+
+    async def test_one_backup_at_a_time(self, tmp_path):
+        manager = BackupManager(
+            make_database(tmp_path / "tasks.db"), str(tmp_path / "backups"), keep=2
+        )
+        manager.start()
+
+        with pytest.raises(BackupInProgressError):
+            manager.start()
+        await manager._task
+        assert manager.progress.state == "done"
+
+    def test_only_file_databases_can_be_backed_up(self):
+        with pytest.raises(ValueError):
+            sqlite_file_path("sqlite+aiosqlite:///:memory:")
+        assert sqlite_file_path("sqlite+aiosqlite:///./tasks.db").name == "tasks.db"
+
+    def test_path_for_rejects_names_outside_the_ring(self, tmp_path):
+        manager = BackupManager("sqlite+aiosqlite:///./tasks.db", str(tmp_path), 2)
+        (tmp_path / "tasks-1.db").write_bytes(b"")
+
+        assert manager.path_for("tasks-1.db") == tmp_path / "tasks-1.db"
+        assert manager.path_for("../tasks-1.db") is None
+        assert manager.path_for("tasks-2.db") is None
+
+    def test_percent_follows_copied_pages(self):
+        progress = BackupProgress("tasks-1.db", pages_total=200, pages_copied=50)
+
+        assert progress.percent == 25.0
+
+
+class TestSteppedBackup:
+    def test_copy_that_keeps_restarting_finishes_in_one_step(self, tmp_path):
+        make_database(tmp_path / "tasks.db")
+        source = sqlite3.connect(tmp_path / "tasks.db")
+        writer = sqlite3.connect(tmp_path / "tasks.db", isolation_level=None)
+        target = sqlite3.connect(tmp_path / "copy.db")
+        steps = []
+
+        def write_between_steps(copied: int, total: int, restarts: int) -> None:
+            steps.append(restarts)
+            writer.execute("INSERT INTO items VALUES (randomblob(10))")
+
+        restarts = stepped_backup(source, target, 4, 0, 2, write_between_steps)
+
+        assert restarts == 3
+        assert steps[-1] == 3
+        copied = target.execute("SELECT count(*) FROM items").fetchone()[0]
+        assert copied >= 50
+        for connection in (source, writer, target):
+            connection.close()
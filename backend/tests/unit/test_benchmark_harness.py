@@ -0,0 +1,41 @@
+from benchmarks.harness import find_regressions, percentile, summarize
+
+
+class TestBenchmarkHarness:
+    def test_percentile_uses_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_summarize_reports_milliseconds_and_throughput(self):
+        result = summarize([0.001, 0.002, 0.003, 0.004], peak_bytes=2048)
+
+        assert result["iterations"] == 4
+        assert result["p50_ms"] == 2.0
+        assert result["p99_ms"] == 4.0
+        assert result["ops_per_sec"] == 400.0
+        assert result["peak_kib"] == 2.0
+
+    def test_find_regressions_flags_growth_beyond_threshold(self):
+        baseline = {"1000": {"get_all": {"p50_ms": 10.0, "p95_ms": 20.0}}}
+        results = {"1000": {"get_all": {"p50_ms": 13.0, "p95_ms": 21.0}}}
+
+        regressions = find_regressions(baseline, results, threshold=0.25)
+
+        assert len(regressions) == 1
+        assert "get_all p50_ms" in regressions[0]
+
+    def test_find_regressions_ignores_tiny_and_unknown_operations(self):
+        baseline = {"1000": {"get_by_id": {"p50_ms": 0.05, "peak_kib": 10.0}}}
+        results = {
+            "1000": {
+                "get_by_id": {"p50_ms": 0.1, "peak_kib": 11.0},
+                "new_operation": {"p50_ms": 100.0},
+            },
+            "5000": {"get_by_id": {"p50_ms": 100.0}},
+        }
+
+        assert find_regressions(baseline, results, threshold=0.25) == []
@@ -0,0 +1,37 @@
+from src.infrastructure.coordination import SharedChangeLog
+
+
+class TestSharedChangeLog:
+    def test_records_are_visible_through_another_mapping(self, tmp_path):
+        path = str(tmp_path / "log")
+        writer = SharedChangeLog(path, record_size=2, capacity=4)
+        reader = SharedChangeLog(path, record_size=2, capacity=4)
+
+        assert writer.append(b"ab") == 1
+        assert writer.append(b"cd") == 2
+
+        assert reader.read() == 2
+        assert reader.since(0) == (2, [b"ab", b"cd"])
+        assert reader.since(1) == (2, [b"cd"])
+        assert reader.since(2) == (2, [])
+        writer.close()
+        reader.close()
+
+    def test_overwritten_records_are_reported_missing(self, tmp_path):
+        log = SharedChangeLog(str(tmp_path / "log"), record_size=1, capacity=3)
+        for record in (b"a", b"b", b"c", b"d"):
+            log.append(record)
+
+        assert log.since(0) is None
+        assert log.since(1) == (4, [b"b", b"c", b"d"])
+        log.close()
+
+    def test_a_counter_file_keeps_its_version(self, tmp_path):
+        path = tmp_path / "log"
+        path.write_bytes((7).to_bytes(8, "little"))
+
+        log = SharedChangeLog(str(path), record_size=1, capacity=2)
+
+        assert log.read() == 7
+        assert log.since(6) is None
+        log.close()
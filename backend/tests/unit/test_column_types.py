@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+from src.domain.entities import Priority
+from src.infrastructure.database.types import (
+    EpochMicros,
+    PriorityCode,
+    epoch_micros_to_datetimes,
+)
+
+
+class TestEpochMicros:
+    def test_binds_microseconds_since_the_epoch(self):
+        column = EpochMicros()
+        moment = datetime(2025, 3, 4, 5, 6, 7, 123456, tzinfo=UTC)
+
+        assert column.process_bind_param(moment, None) == 1741064767123456
+        assert (
+            column.process_bind_param(moment.replace(tzinfo=None), None)
+            == 1741064767123456
+        )
+        assert (
+            column.process_bind_param(
+                moment.astimezone(timezone(timedelta(hours=2))), None
+            )
+            == 1741064767123456
+        )
+        assert column.process_bind_param(None, None) is None
+
+    def test_reads_naive_utc_from_integers_and_legacy_text(self):
+        column = EpochMicros()
+        expected = datetime(2025, 3, 4, 5, 6, 7, 123456)
+
+        assert column.process_result_value(1741064767123456, None) == expected
+        assert (
+            column.process_result_value("2025-03-04 05:06:07.123456", None) == expected
+        )
+        assert column.process_result_value(None, None) is None
+
+    def test_decodes_whole_columns(self):
+        expected = datetime(2025, 3, 4, 5, 6, 7, 123456)
+
+        assert epoch_micros_to_datetimes((1741064767123456, 0)) == [
+            expected,
+            datetime(1970, 1, 1),
+        ]
+        assert epoch_micros_to_datetimes(
+            (1741064767123456, None, "2025-03-04 05:06:07.123456")
+        ) == [expected, None, expected]
+
+
+class TestPriorityCode:
+    def test_codes_round_trip_in_rank_order(self):
+        column = PriorityCode()
+        codes = [column.process_bind_param(priority, None) for priority in Priority]
+
+        assert codes == [1, 2, 3]
+        assert [column.process_result_value(code, None) for code in codes] == list(
+            Priority
+        )
+
+    def test_reads_legacy_names(self):
+        assert PriorityCode().process_result_value("HIGH", None) == Priority.HIGH
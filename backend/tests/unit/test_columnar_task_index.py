@@ -0,0 +1,139 @@
+from datetime import UTC, datetime, timedelta
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.index import ColumnarTaskIndex
+
+
+def make_task(title: str, priority: Priority, minutes: int = 0) -> Task:
+    task = Task.create(title=title, description="Description", priority=priority)
+    task.created_at = datetime(2025, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes)
+    return task
+
+
+class TestColumnarTaskIndex:
+    def test_load_and_count(self):
+        pending_high = make_task("High", Priority.HIGH)
+        pending_low = make_task("Low", Priority.LOW)
+        done = make_task("Done", Priority.MEDIUM)
+        done.mark_as_done()
+        archived = make_task("Archived", Priority.HIGH)
+        archived.mark_as_done()
+        archived.archive()
+
+        index = ColumnarTaskIndex()
+        assert index.is_ready is False
+        index.load([pending_high, pending_low, done, archived])
+
+        assert index.is_ready is True
+        assert index.count_by_status(is_done=False, is_archived=False) == 2
+        assert index.count_by_status(is_done=True, is_archived=False) == 1
+        assert index.count_by_status(is_done=True, is_archived=True) == 1
+        assert index.count_pending_by_priority() == {
+            Priority.LOW: 1,
+            Priority.MEDIUM: 0,
+            Priority.HIGH: 1,
+        }
+
+    def test_task_saved_updates_existing_row(self):
+        task = make_task("Task", Priority.LOW)
+        index = ColumnarTaskIndex()
+        index.load([task])
+
+        task.mark_as_done()
+        index.task_saved(task)
+
+        assert len(index) == 1
+        assert index.count_by_status(is_done=False, is_archived=False) == 0
+        assert index.count_by_status(is_done=True, is_archived=False) == 1
+
+    def test_older_row_values_are_ignored(self):
+        task = make_task("Task", Priority.LOW)
+        stale = ColumnarTaskIndex.row_values(task)
+        task.mark_as_done()
+        index = ColumnarTaskIndex()
+        index.load([task])
+
+        index.set_row(task.id, stale)
+
+        assert index.count_by_status(is_done=False, is_archived=False) == 0
+        assert index.count_by_status(is_done=True, is_archived=False) == 1
+
+    def test_task_saved_grows_beyond_capacity(self):
+        index = ColumnarTaskIndex(capacity=2)
+        index.load([])
+
+        for i in range(3000):
+            index.task_saved(make_task(f"Task {i}", Priority.MEDIUM, minutes=i))
+
+        assert len(index) == 3000
+        assert index.count_pending_by_priority()[Priority.MEDIUM] == 3000
+
+    def test_filter_orders_by_priority_then_newest(self):
+        old_high = make_task("Old high", Priority.HIGH, minutes=0)
+        new_high = make_task("New high", Priority.HIGH, minutes=5)
+        low = make_task("Low", Priority.LOW, minutes=10)
+        done = make_task("Done", Priority.HIGH, minutes=20)
+        done.mark_as_done()
+
+        index = ColumnarTaskIndex()
+        index.load([low, old_high, done, new_high])
+
+        assert index.filter(is_done=False, is_archived=False) == [
+            new_high.id,
+            old_high.id,
+            low.id,
+        ]
+
+    def test_top_pending(self):
+        tasks = [
+            make_task(f"Task {i}", priority, minutes=i)
+            for i, priority in enumerate(
+                [Priority.LOW, Priority.HIGH, Priority.MEDIUM, Priority.HIGH]
+            )
+        ]
+        index = ColumnarTaskIndex()
+        index.load(tasks)
+
+        assert index.top_pending(2) == [tasks[3].id, tasks[1].id]
+        assert index.top_pending(10) == [
+            tasks[3].id,
+            tasks[1].id,
+            tasks[2].id,
+            tasks[0].id,
+        ]
+        assert index.top_pending(0) == []
+
+    def test_remove_frees_row_for_reuse(self):
+        first = make_task("First", Priority.LOW)
+        second = make_task("Second", Priority.LOW)
+        index = ColumnarTaskIndex()
+        index.load([first])
+
+        assert index.remove(first.id) is True
+        assert index.remove(first.id) is False
+        index.task_saved(second)
+
+        assert len(index) == 1
+        assert index.top_pending(5) == [second.id]
+
+    def test_changes_during_load_are_replayed(self):
+        stale = make_task("Stale", Priority.LOW)
+        loaded_stale = make_task("Stale", Priority.LOW)
+        loaded_stale.id = stale.id
+        removed = make_task("Removed", Priority.MEDIUM)
+        created = make_task("Created", Priority.HIGH)
+        index = ColumnarTaskIndex()
+
+        index.begin_load()
+        stale.mark_as_done()
+        index.task_saved(stale)
+        index.task_saved(created)
+        index.remove(removed.id)
+        assert index.is_ready is False
+
+        index.load([loaded_stale, removed])
+
+        assert index.is_ready is True
+        assert len(index) == 2
+        assert index.count_by_status(is_done=True, is_archived=False) == 1
+        assert index.count_pending_by_priority()[Priority.HIGH] == 1
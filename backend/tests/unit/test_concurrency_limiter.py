@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.admission import AdmissionRejected, ConcurrencyLimiter
+
+
+class TestConcurrencyLimiter:
+    async def test_admits_up_to_the_limit_without_waiting(self):
+        limiter = ConcurrencyLimiter(limit=2, max_queue=0, queue_timeout=1)
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        assert limiter.active == 2
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire()
+        assert rejected.value.reason == "queue_full"
+        assert rejected.value.retry_after >= 1
+
+    async def test_release_hands_the_slot_to_the_oldest_waiter(self):
+        limiter = ConcurrencyLimiter(limit=1, max_queue=2, queue_timeout=1)
+        await limiter.acquire()
+        order = []
+
+        async def wait(name):
+            await limiter.acquire()
+            order.append(name)
+
+        first = asyncio.create_task(wait("first"))
+        second = asyncio.create_task(wait("second"))
+        await asyncio.sleep(0)
+        assert limiter.queued == 2
+
+        limiter.release()
+        await first
+        limiter.release()
+        await second
+
+        assert order == ["first", "second"]
+        assert limiter.active == 1
+        assert limiter.queued == 0
+
+    async def test_waiter_is_rejected_when_the_queue_timeout_passes(self):
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1, queue_timeout=0.01)
+        await limiter.acquire()
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire()
+
+        assert rejected.value.reason == "timeout"
+        assert limiter.queued == 0
+        limiter.release()
+        assert limiter.active == 0
+
+    async def test_rejects_up_front_when_the_estimated_wait_is_too_long(self):
+        limiter = ConcurrencyLimiter(limit=1, max_queue=10, queue_timeout=0.5)
+        await limiter.acquire()
+        limiter.service_seconds = 1.0
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire()
+
+        assert rejected.value.reason == "deadline"
+        assert rejected.value.retry_after == 1
+
+    async def test_cancelled_waiter_does_not_leak_the_slot(self):
+        limiter = ConcurrencyLimiter(limit=1, max_queue=1, queue_timeout=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+        assert limiter.active == 0
+        assert limiter.queued == 0
+
+    async def test_slot_records_service_time(self):
+        limiter = ConcurrencyLimiter(limit=1, max_queue=0, queue_timeout=1)
+
+        async with limiter.slot():
+            await asyncio.sleep(0.01)
+
+        assert limiter.active == 0
+        assert limiter.service_seconds > 0
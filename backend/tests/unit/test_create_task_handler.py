@@ -1,18 +1,17 @@
-from unittest.mock import AsyncMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 
 from src.application.commands import CreateTaskCommand
 from src.application.handlers import CreateTaskHandler
-from src.domain.entities import Priority, Task
+from src.domain.entities import Priority, PriorityLimitExceededError, Task
 
 
 class TestCreateTaskHandler:
     @pytest.mark.asyncio
     async def test_create_task_success(self):
         mock_repository = AsyncMock()
-        mock_repository.count_by_priority.return_value = 2
-        mock_repository.create.return_value = Task.create(
+        mock_repository.create_within_limit.return_value = Task.create(
             title="Test Task", description="Test Description", priority=Priority.HIGH
         )
 
@@ -26,13 +25,14 @@ class TestCreateTaskHandler:
         assert result.title == "Test Task"
         assert result.description == "Test Description"
         assert result.priority == Priority.HIGH
-        mock_repository.count_by_priority.assert_called_once_with(Priority.HIGH)
-        mock_repository.create.assert_called_once()
+        mock_repository.create_within_limit.assert_called_once_with(ANY, 5)
+        mock_repository.count_by_priority.assert_not_called()
+        mock_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_task_high_priority_limit_exceeded(self):
         mock_repository = AsyncMock()
-        mock_repository.count_by_priority.return_value = 5
+        mock_repository.create_within_limit.return_value = None
 
         handler = CreateTaskHandler(mock_repository)
         command = CreateTaskCommand(
@@ -40,11 +40,12 @@ class TestCreateTaskHandler:
         )
 
         with pytest.raises(
-            ValueError, match="Cannot create more than 5 tasks with high priority"
+            PriorityLimitExceededError,
+            match="Cannot create more than 5 tasks with high priority",
         ):
             await handler.handle(command)
 
-        mock_repository.count_by_priority.assert_called_once_with(Priority.HIGH)
+        mock_repository.create_within_limit.assert_called_once_with(ANY, 5)
         mock_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -62,5 +63,23 @@ class TestCreateTaskHandler:
         result = await handler.handle(command)
 
         assert result.priority == Priority.LOW
-        mock_repository.count_by_priority.assert_not_called()
+        mock_repository.create_within_limit.assert_not_called()
         mock_repository.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_task_notifies_listeners(self):
+        created_task = Task.create(
+            title="Test Task", description="Test Description", priority=Priority.LOW
+        )
+        mock_repository = AsyncMock()
+        mock_repository.create.return_value = created_task
+        listener = MagicMock()
+
+        handler = CreateTaskHandler(mock_repository, [listener])
+        command = CreateTaskCommand(
+            title="Test Task", description="Test Description", priority=Priority.LOW
+        )
+
+        await handler.handle(command)
+
+        listener.task_saved.assert_called_once_with(created_task)
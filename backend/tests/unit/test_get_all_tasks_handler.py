@@ -284,3 +284,21 @@ class TestGetAllTasksHandler:
         # Query should remain unchanged (it's a simple dataclass with no fields)
         assert isinstance(original_query, GetAllTasksQuery)
         mock_repository.get_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_all_tasks_without_archived(self):
+        """Test that excluding archived tasks is passed to the repository"""
+        task = Task.create(
+            title="Active Task", description="Still active", priority=Priority.LOW
+        )
+
+        mock_repository = AsyncMock()
+        mock_repository.get_all.return_value = [task]
+
+        handler = GetAllTasksHandler(mock_repository)
+        query = GetAllTasksQuery(include_archived=False)
+
+        result = await handler.handle(query)
+
+        assert result == [task]
+        mock_repository.get_all.assert_called_once_with(False)
@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.handlers import GetTaskStatsHandler
+from src.application.queries import GetTaskStatsQuery
+from src.domain.entities import Priority
+
+
+class TestGetTaskStatsHandler:
+    @pytest.mark.asyncio
+    async def test_stats_from_index(self):
+        """Test that a ready index answers without touching the repository"""
+        mock_repository = AsyncMock()
+        mock_index = MagicMock(is_ready=True)
+        mock_index.count_by_status.side_effect = lambda is_done, is_archived: {
+            (False, False): 4,
+            (True, False): 3,
+            (True, True): 2,
+            (False, True): 0,
+        }[(is_done, is_archived)]
+        mock_index.count_pending_by_priority.return_value = {
+            Priority.LOW: 1,
+            Priority.MEDIUM: 1,
+            Priority.HIGH: 2,
+        }
+
+        handler = GetTaskStatsHandler(mock_repository, mock_index)
+        result = await handler.handle(GetTaskStatsQuery())
+
+        assert result.pending == 4
+        assert result.done == 3
+        assert result.archived == 2
+        assert result.pending_by_priority[Priority.HIGH] == 2
+        mock_repository.count_by_status.assert_not_called()
+        mock_repository.count_by_priority.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stats_from_repository_without_index(self):
+        """Test the repository fallback when no index is configured"""
+        mock_repository = AsyncMock()
+        mock_repository.count_by_status.return_value = 1
+        mock_repository.count_by_priority.return_value = 2
+
+        handler = GetTaskStatsHandler(mock_repository)
+        result = await handler.handle(GetTaskStatsQuery())
+
+        assert result.pending == 1
+        assert result.done == 1
+        assert result.archived == 2
+        assert result.pending_by_priority == {priority: 2 for priority in Priority}
+
+    @pytest.mark.asyncio
+    async def test_stats_from_repository_while_index_loads(self):
+        """Test that an index that is not ready yet is ignored"""
+        mock_repository = AsyncMock()
+        mock_repository.count_by_status.return_value = 0
+        mock_repository.count_by_priority.return_value = 0
+        mock_index = MagicMock(is_ready=False)
+
+        handler = GetTaskStatsHandler(mock_repository, mock_index)
+        await handler.handle(GetTaskStatsQuery())
+
+        mock_index.count_by_status.assert_not_called()
+        mock_repository.count_by_status.assert_called()
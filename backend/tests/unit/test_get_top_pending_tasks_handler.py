@@ -0,0 +1,45 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.handlers import GetTopPendingTasksHandler
+from src.application.queries import GetTopPendingTasksQuery
+from src.domain.entities import Priority, Task
+
+
+class TestGetTopPendingTasksHandler:
+    @pytest.mark.asyncio
+    async def test_top_pending_from_index(self):
+        """Test that the index picks ids and the repository loads them"""
+        task_ids = [uuid4(), uuid4()]
+        mock_index = MagicMock(is_ready=True)
+        mock_index.top_pending.return_value = task_ids
+        mock_repository = AsyncMock()
+        mock_repository.get_by_ids.return_value = ["first", "second"]
+
+        handler = GetTopPendingTasksHandler(mock_repository, mock_index)
+        result = await handler.handle(GetTopPendingTasksQuery(limit=2))
+
+        assert result == ["first", "second"]
+        mock_index.top_pending.assert_called_once_with(2)
+        mock_repository.get_by_ids.assert_called_once_with(task_ids)
+        mock_repository.get_by_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_top_pending_from_repository_without_index(self):
+        """Test the repository fallback truncates the pending list"""
+        tasks = [
+            Task.create(title=f"Task {i}", description="D", priority=Priority.LOW)
+            for i in range(5)
+        ]
+        mock_repository = AsyncMock()
+        mock_repository.get_by_status.return_value = tasks
+
+        handler = GetTopPendingTasksHandler(mock_repository)
+        result = await handler.handle(GetTopPendingTasksQuery(limit=3))
+
+        assert result == tasks[:3]
+        mock_repository.get_by_status.assert_called_once_with(
+            is_done=False, is_archived=False
+        )
@@ -0,0 +1,38 @@
+from uuid import UUID, uuid4
+
+from src.domain.entities import Priority, Task, uuid7
+from src.infrastructure.database.types import BinaryUUID
+
+
+class TestUUID7:
+    def test_ids_are_version_7_and_increase(self):
+        ids = [uuid7() for _ in range(10_000)]
+
+        assert {task_id.version for task_id in ids} == {7}
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_new_tasks_get_time_ordered_ids(self):
+        first = Task.create("A", "D", Priority.LOW)
+        second = Task.create("B", "D", Priority.LOW)
+
+        assert first.id.version == 7
+        assert first.id < second.id
+
+
+class TestBinaryUUID:
+    def test_binds_sixteen_bytes(self):
+        task_id = uuid4()
+        column = BinaryUUID()
+
+        assert column.process_bind_param(task_id, None) == task_id.bytes
+        assert column.process_bind_param(str(task_id), None) == task_id.bytes
+        assert column.process_bind_param(None, None) is None
+
+    def test_reads_blobs_and_legacy_text(self):
+        task_id = uuid4()
+        column = BinaryUUID()
+
+        assert column.process_result_value(task_id.bytes, None) == task_id
+        assert column.process_result_value(str(task_id), None) == task_id
+        assert isinstance(column.process_result_value(task_id.bytes, None), UUID)
@@ -0,0 +1,101 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.commands import CreateTaskCommand, ImportTasksCommand
+from src.application.handlers import ImportTasksHandler
+from src.domain.entities import ImportLineError, Priority
+
+
+def command(*rows):
+    async def stream():
+        for row in rows:
+            yield row
+
+    return ImportTasksCommand(rows=stream())
+
+
+def task(title: str, priority: Priority = Priority.LOW) -> CreateTaskCommand:
+    return CreateTaskCommand(title=title, description="Description", priority=priority)
+
+
+def repository(high_priority_slots: int = 5) -> AsyncMock:
+    mock_repository = AsyncMock()
+    slots = iter(range(high_priority_slots))
+    mock_repository.create_within_limit.side_effect = lambda task, limit: (
+        task if next(slots, None) is not None else None
+    )
+    mock_repository.create_many.side_effect = lambda tasks: len(tasks)
+    return mock_repository
+
+
+class TestImportTasksHandler:
+    @pytest.mark.asyncio
+    async def test_imports_in_chunks_and_notifies_listeners(self):
+        mock_repository = repository()
+        listener = MagicMock()
+        handler = ImportTasksHandler(mock_repository, [listener], chunk_size=2)
+
+        summary = await handler.handle(
+            command((1, task("A")), (2, task("B")), (3, task("C")))
+        )
+
+        assert summary.imported == 3
+        assert summary.failed == 0
+        chunks = [call.args[0] for call in mock_repository.create_many.call_args_list]
+        assert [[t.title for t in chunk] for chunk in chunks] == [["A", "B"], ["C"]]
+        assert listener.task_saved.call_count == 3
+        mock_repository.create_within_limit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_errors_are_reported_by_line(self):
+        handler = ImportTasksHandler(repository())
+
+        summary = await handler.handle(
+            command((1, task("A")), (2, "title: Field required"), (3, task("B")))
+        )
+
+        assert summary.imported == 2
+        assert summary.failed == 1
+        assert summary.errors == [ImportLineError(2, "title: Field required")]
+
+    @pytest.mark.asyncio
+    async def test_high_priority_rows_are_inserted_within_the_limit(self):
+        mock_repository = repository(high_priority_slots=2)
+        listener = MagicMock()
+        handler = ImportTasksHandler(mock_repository, [listener])
+
+        summary = await handler.handle(
+            command(
+                *((line, task(f"High {line}", Priority.HIGH)) for line in range(1, 5)),
+                (5, task("Low")),
+            )
+        )
+
+        assert summary.imported == 3
+        assert [error.line for error in summary.errors] == [3, 4]
+        assert summary.errors[0].message == (
+            "Cannot create more than 5 tasks with high priority"
+        )
+        # Rows after the first refusal fail without another query.
+        assert mock_repository.create_within_limit.call_count == 3
+        assert all(
+            call.args[1] == 5
+            for call in mock_repository.create_within_limit.call_args_list
+        )
+        assert [t.title for t in mock_repository.create_many.call_args.args[0]] == [
+            "Low"
+        ]
+        assert listener.task_saved.call_count == 3
+        mock_repository.count_by_priority.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_errors_beyond_the_limit_are_counted_not_kept(self):
+        handler = ImportTasksHandler(repository(), max_errors=2)
+
+        summary = await handler.handle(
+            command(*((line, "bad row") for line in range(1, 6)))
+        )
+
+        assert summary.failed == 5
+        assert len(summary.errors) == 2
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+from src.infrastructure.coordination import LeaderLock, run_as_leader
+
+
+class TestLeaderLock:
+    def test_only_one_holder_at_a_time(self, tmp_path):
+        path = str(tmp_path / "lock")
+        leader = LeaderLock(path)
+        follower = LeaderLock(path)
+
+        assert leader.try_acquire()
+        assert leader.try_acquire()
+        assert not follower.try_acquire()
+        assert not follower.held
+
+        leader.release()
+        assert not leader.held
+        assert follower.try_acquire()
+        follower.release()
+
+    def test_acquire_waits_for_the_holder(self, tmp_path):
+        path = str(tmp_path / "lock")
+        holder = LeaderLock(path)
+        waiter = LeaderLock(path)
+        holder.try_acquire()
+
+        thread = threading.Thread(target=waiter.acquire)
+        thread.start()
+        thread.join(0.05)
+        assert thread.is_alive()
+
+        holder.release()
+        thread.join(1)
+        assert waiter.held
+        waiter.release()
+
+    async def test_run_as_leader_runs_the_job_in_one_process_at_a_time(self, tmp_path):
+        path = str(tmp_path / "lock")
+        running = []
+
+        async def job(name: str):
+            running.append(name)
+            await asyncio.Event().wait()
+
+        leader = asyncio.create_task(
+            run_as_leader(LeaderLock(path), lambda: job("leader"), 0.01)
+        )
+        standby = asyncio.create_task(
+            run_as_leader(LeaderLock(path), lambda: job("standby"), 0.01)
+        )
+        await asyncio.sleep(0.05)
+        assert running == ["leader"]
+
+        leader.cancel()
+        await asyncio.gather(leader, return_exceptions=True)
+        await asyncio.sleep(0.05)
+        assert running == ["leader", "standby"]
+        standby.cancel()
+        await asyncio.gather(standby, return_exceptions=True)
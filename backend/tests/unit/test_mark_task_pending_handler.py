@@ -5,7 +5,7 @@ import pytest
 
 from src.application.commands import MarkTaskPendingCommand
 from src.application.handlers import MarkTaskPendingHandler
-from src.domain.entities import Priority, Task
+from src.domain.entities import Priority, PriorityLimitExceededError, Task
 
 
 class TestMarkTaskPendingHandler:
@@ -110,7 +110,7 @@ class TestMarkTaskPendingHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = done_task
-        mock_repository.update.return_value = pending_task
+        mock_repository.update_within_limit.return_value = pending_task
 
         handler = MarkTaskPendingHandler(mock_repository)
         command = MarkTaskPendingCommand(task_id=task_id)
@@ -124,7 +124,8 @@ class TestMarkTaskPendingHandler:
         assert result.is_archived is False  # Should not be archived
         assert result.id == task_id
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_called_once_with(done_task)
+        mock_repository.update_within_limit.assert_called_once_with(done_task, 5)
+        mock_repository.update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_mark_task_pending_updates_timestamp(self):
@@ -181,7 +182,7 @@ class TestMarkTaskPendingHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = high_priority_task
-        mock_repository.update.return_value = pending_task
+        mock_repository.update_within_limit.return_value = pending_task
 
         handler = MarkTaskPendingHandler(mock_repository)
         command = MarkTaskPendingCommand(task_id=task_id)
@@ -191,7 +192,34 @@ class TestMarkTaskPendingHandler:
         assert result.is_done is False
         assert result.priority == Priority.HIGH
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.update.assert_called_once_with(high_priority_task)
+        mock_repository.update_within_limit.assert_called_once_with(
+            high_priority_task, 5
+        )
+        mock_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mark_task_pending_high_priority_over_the_limit(self):
+        """Test that a done high priority task cannot reopen past the limit"""
+        task = Task.create(
+            title="High Priority Task",
+            description="This is urgent",
+            priority=Priority.HIGH,
+        )
+        task.mark_as_done()
+
+        mock_repository = AsyncMock()
+        mock_repository.get_by_id.return_value = task
+        mock_repository.update_within_limit.return_value = None
+        listener = AsyncMock()
+
+        handler = MarkTaskPendingHandler(mock_repository, [listener])
+        command = MarkTaskPendingCommand(task_id=task.id)
+
+        with pytest.raises(PriorityLimitExceededError, match="Maximum of 5"):
+            await handler.handle(command)
+
+        mock_repository.update.assert_not_called()
+        listener.task_saved.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_mark_task_pending_archived_task(self):
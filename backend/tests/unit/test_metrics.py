@@ -0,0 +1,102 @@
+import pytest
+
+from src.infrastructure.observability import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from src.infrastructure.observability.engine_events import _statement_keyword
+from src.infrastructure.observability.metrics import Metric
+
+
+class TestMetrics:
+    def test_counter_renders_labelled_samples(self):
+        counter = Counter("jobs_total", "Jobs run.", ("kind",))
+        counter.inc("import")
+        counter.inc("import", amount=2)
+        counter.inc('say "hi"')
+
+        lines = counter.render()
+
+        assert lines[0] == "# HELP jobs_total Jobs run."
+        assert lines[1] == "# TYPE jobs_total counter"
+        assert 'jobs_total{kind="import"} 3' in lines
+        assert 'jobs_total{kind="say \\"hi\\""} 1' in lines
+
+    def test_counter_values_are_a_copy(self):
+        counter = Counter("jobs_total", "Jobs run.", ("kind",))
+        counter.inc("import")
+
+        values = counter.values()
+        values[("import",)] = 5
+
+        assert counter.values() == {("import",): 1}
+
+    def test_metric_subclasses_must_render_and_reset(self):
+        class Incomplete(Metric):
+            type_name = "gauge"
+
+        with pytest.raises(TypeError):
+            Incomplete("incomplete", "Missing samples and reset.")
+
+    def test_gauge_goes_up_and_down(self):
+        gauge = Gauge("in_flight", "In flight.")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert gauge.value() == 1
+        assert "in_flight 1" in gauge.render()
+
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.1)
+        histogram.observe(0.5)
+        histogram.observe(3.0)
+
+        lines = histogram.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_sum 3.65" in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_histogram_time_records_even_on_error(self):
+        histogram = Histogram("work_seconds", "Work.", ("outcome",))
+
+        with pytest.raises(RuntimeError):
+            with histogram.time("error"):
+                raise RuntimeError("boom")
+
+        assert histogram.count("error") == 1
+
+    def test_registry_rejects_duplicate_names_and_resets(self):
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("events_total", "Events."))
+        counter.inc()
+
+        with pytest.raises(ValueError):
+            registry.register(Counter("events_total", "Events."))
+
+        registry.reset()
+        assert counter.value() == 0
+        assert registry.render().endswith("# TYPE events_total counter\n")
+
+    @pytest.mark.parametrize(
+        ("statement", "keyword"),
+        [
+            ("SELECT 1", "SELECT"),
+            ("  insert INTO tasks VALUES (1)", "INSERT"),
+            ("WITH x AS (SELECT 1) SELECT * FROM x", "WITH"),
+            ("DROP INDEX ix_tasks", "DROP"),
+            ("WITH\nx AS (SELECT 1) SELECT 1", "WITH"),
+            ("VACUUM", "OTHER"),
+            ("SELECTED", "OTHER"),
+            ("", "OTHER"),
+        ],
+    )
+    def test_statements_are_labelled_by_their_first_word(self, statement, keyword):
+        assert _statement_keyword(statement) == keyword
@@ -5,7 +5,7 @@ import pytest
 
 from src.application.commands import ModifyTaskCommand
 from src.application.handlers import ModifyTaskHandler
-from src.domain.entities import Priority, Task
+from src.domain.entities import Priority, PriorityLimitExceededError, Task
 
 
 class TestModifyTaskHandler:
@@ -47,7 +47,7 @@ class TestModifyTaskHandler:
         assert result.priority == Priority.MEDIUM
         mock_repository.get_by_id.assert_called_once_with(task_id)
         mock_repository.update.assert_called_once_with(existing_task)
-        mock_repository.count_by_priority.assert_not_called()
+        mock_repository.update_within_limit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_modify_task_partial_update(self):
@@ -98,8 +98,7 @@ class TestModifyTaskHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = existing_task
-        mock_repository.count_by_priority.return_value = 3
-        mock_repository.update.return_value = updated_task
+        mock_repository.update_within_limit.return_value = updated_task
 
         handler = ModifyTaskHandler(mock_repository)
         command = ModifyTaskCommand(task_id=task_id, priority=Priority.HIGH)
@@ -108,8 +107,8 @@ class TestModifyTaskHandler:
 
         assert result.priority == Priority.HIGH
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.count_by_priority.assert_called_once_with(Priority.HIGH)
-        mock_repository.update.assert_called_once_with(existing_task)
+        mock_repository.update_within_limit.assert_called_once_with(existing_task, 5)
+        mock_repository.update.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_modify_task_priority_to_high_limit_exceeded(self):
@@ -122,19 +121,19 @@ class TestModifyTaskHandler:
 
         mock_repository = AsyncMock()
         mock_repository.get_by_id.return_value = existing_task
-        mock_repository.count_by_priority.return_value = 5
+        mock_repository.update_within_limit.return_value = None
 
         handler = ModifyTaskHandler(mock_repository)
         command = ModifyTaskCommand(task_id=task_id, priority=Priority.HIGH)
 
         with pytest.raises(
-            ValueError,
+            PriorityLimitExceededError,
             match="Cannot modify task to high priority. Maximum of 5 high priority tasks allowed",
         ):
             await handler.handle(command)
 
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.count_by_priority.assert_called_once_with(Priority.HIGH)
+        mock_repository.update_within_limit.assert_called_once_with(existing_task, 5)
         mock_repository.update.assert_not_called()
 
     @pytest.mark.asyncio
@@ -163,7 +162,7 @@ class TestModifyTaskHandler:
 
         assert result.title == "Updated Task"
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.count_by_priority.assert_not_called()
+        mock_repository.update_within_limit.assert_not_called()
         mock_repository.update.assert_called_once_with(existing_task)
 
     @pytest.mark.asyncio
@@ -236,5 +235,5 @@ class TestModifyTaskHandler:
 
         assert result.priority == Priority.LOW
         mock_repository.get_by_id.assert_called_once_with(task_id)
-        mock_repository.count_by_priority.assert_not_called()
+        mock_repository.update_within_limit.assert_not_called()
         mock_repository.update.assert_called_once_with(existing_task)
@@ -0,0 +1,44 @@
+import cProfile
+
+from src.infrastructure.observability import ProfileStore
+
+
+def profile_something() -> cProfile.Profile:
+    profile = cProfile.Profile()
+    profile.enable()
+    sum(range(100))
+    profile.disable()
+    return profile
+
+
+class TestProfileStore:
+    def test_keeps_only_the_newest_profiles(self, tmp_path):
+        store = ProfileStore(str(tmp_path), max_files=2)
+
+        names = [
+            store.save(profile_something(), "GET", f"/tasks/{i}").name for i in range(4)
+        ]
+
+        assert [info.name for info in store.profiles()] == names[:1:-1]
+        assert len(list(tmp_path.glob("*.prof"))) == 2
+
+    def test_names_are_sanitized(self, tmp_path):
+        store = ProfileStore(str(tmp_path), max_files=5)
+
+        info = store.save(profile_something(), "PATCH", "/tasks/../../etc/done")
+
+        assert info.name.endswith("-PATCH-tasks_etc_done.prof")
+        assert store.path_for(info.name) == tmp_path / info.name
+        assert store.path_for("../" + info.name) is None
+
+    def test_summary_is_a_pstats_report(self, tmp_path):
+        store = ProfileStore(str(tmp_path), max_files=5)
+        info = store.save(profile_something(), "GET", "/")
+
+        summary = store.summary(info.name)
+
+        assert "function calls" in summary
+        assert store.summary("missing.prof") is None
+
+    def test_empty_store_lists_nothing(self, tmp_path):
+        assert ProfileStore(str(tmp_path / "none"), max_files=5).profiles() == []
@@ -0,0 +1,14 @@
+import pytest
+
+import serve
+
+
+class TestServe:
+    @pytest.mark.parametrize("backend", ["memory", "sharded"])
+    def test_per_process_backends_reject_several_workers(self, monkeypatch, backend):
+        monkeypatch.setenv("TASK_REPOSITORY", backend)
+
+        with pytest.raises(SystemExit) as exit_info:
+            serve.main(["--workers", "2"])
+
+        assert exit_info.value.code == 2
@@ -0,0 +1,49 @@
+from benchmarks.startup import group_import_times, module_group, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   sqlalchemy.util
+import time:       300 |        420 | sqlalchemy
+import time:        50 |         50 |     src.infrastructure.config
+import time:        80 |        130 |   src.infrastructure.database.models
+import time:        40 |        170 | src.infrastructure.database
+some unrelated line
+"""
+
+
+class TestStartupReport:
+    def test_parse_importtime_skips_header_and_other_lines(self):
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [record.module for record in records] == [
+            "sqlalchemy.util",
+            "sqlalchemy",
+            "src.infrastructure.config",
+            "src.infrastructure.database.models",
+            "src.infrastructure.database",
+        ]
+        assert records[1].self_us == 300
+        assert records[1].cumulative_us == 420
+
+    def test_module_group_keeps_app_subpackages(self):
+        assert module_group("sqlalchemy.orm.session") == "sqlalchemy"
+        assert module_group("src.infrastructure.database.models") == (
+            "src.infrastructure.database"
+        )
+        assert module_group("src.infrastructure.database.models", depth=2) == (
+            "src.infrastructure"
+        )
+
+    def test_group_import_times_sums_self_time_slowest_first(self):
+        groups = group_import_times(parse_importtime(IMPORTTIME_OUTPUT))
+
+        assert groups == {
+            "sqlalchemy": 420,
+            "src.infrastructure.database": 120,
+            "src.infrastructure.config": 50,
+        }
+        assert list(groups) == [
+            "sqlalchemy",
+            "src.infrastructure.database",
+            "src.infrastructure.config",
+        ]
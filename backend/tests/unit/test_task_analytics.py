@@ -0,0 +1,172 @@
+import asyncio
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.application.handlers import GetTaskAnalyticsHandler
+from src.application.queries import GetTaskAnalyticsQuery
+from src.domain.entities import Priority, Task, TaskAnalytics
+from src.infrastructure.analytics import AnalyticsCache
+from src.infrastructure.analytics.rollups import (
+    DAY_MICROS,
+    HOUR_MICROS,
+    compute_task_analytics,
+)
+from src.infrastructure.coordination import SharedVersionCounter
+
+# 2025-06-10 12:00 UTC
+NOW = (date(2025, 6, 10) - date(1970, 1, 1)).days * DAY_MICROS + 12 * HOUR_MICROS
+
+HIGH, MEDIUM, LOW = 3, 2, 1
+
+
+def rows(*tasks: tuple) -> np.ndarray:
+    return np.array(tasks, dtype=np.int64).reshape(-1, 5)
+
+
+def hours_ago(hours: float) -> int:
+    return NOW - int(hours * HOUR_MICROS)
+
+
+class TestComputeTaskAnalytics:
+    def test_daily_created_and_completed_counts(self):
+        columns = rows(
+            (LOW, 0, 0, hours_ago(1), -1),
+            (LOW, 1, 0, hours_ago(30), hours_ago(2)),
+            (HIGH, 1, 1, hours_ago(30), hours_ago(26)),
+            # Created before the window, completed inside it.
+            (MEDIUM, 1, 0, hours_ago(24 * 10), hours_ago(1)),
+        )
+
+        analytics = compute_task_analytics(columns, NOW, days=3)
+
+        assert [day.day for day in analytics.throughput] == [
+            date(2025, 6, 8),
+            date(2025, 6, 9),
+            date(2025, 6, 10),
+        ]
+        assert [(day.created, day.completed) for day in analytics.throughput] == [
+            (0, 0),
+            (2, 1),
+            (1, 2),
+        ]
+
+    def test_lead_time_by_priority_for_tasks_completed_in_window(self):
+        columns = rows(
+            (HIGH, 1, 0, hours_ago(10), hours_ago(8)),
+            (HIGH, 1, 1, hours_ago(10), hours_ago(6)),
+            (HIGH, 1, 0, hours_ago(10), hours_ago(4)),
+            (LOW, 1, 0, hours_ago(24 * 9), hours_ago(24 * 8)),
+        )
+
+        analytics = compute_task_analytics(columns, NOW, days=7)
+
+        by_priority = {lead.priority: lead for lead in analytics.lead_time}
+        assert list(by_priority) == [Priority.HIGH, Priority.MEDIUM, Priority.LOW]
+        high = by_priority[Priority.HIGH]
+        assert (high.completed, high.mean_hours, high.p50_hours) == (3, 4.0, 4.0)
+        assert high.p90_hours == pytest.approx(5.6)
+        assert by_priority[Priority.LOW].completed == 0
+        assert by_priority[Priority.LOW].mean_hours is None
+
+    def test_backlog_age_buckets_count_pending_tasks_only(self):
+        columns = rows(
+            (LOW, 0, 0, hours_ago(2), -1),
+            (LOW, 0, 0, hours_ago(24 * 3), -1),
+            (LOW, 0, 0, hours_ago(24 * 400), -1),
+            (LOW, 1, 0, hours_ago(24 * 3), hours_ago(1)),
+        )
+
+        analytics = compute_task_analytics(columns, NOW, days=30)
+
+        assert [
+            (bucket.min_days, bucket.max_days, bucket.count)
+            for bucket in analytics.backlog_age
+        ] == [
+            (0, 1, 1),
+            (1, 7, 1),
+            (7, 30, 0),
+            (30, 90, 0),
+            (90, 365, 0),
+            (365, None, 1),
+        ]
+
+    def test_no_tasks(self):
+        analytics = compute_task_analytics(rows(), NOW, days=2)
+
+        assert [day.created for day in analytics.throughput] == [0, 0]
+        assert all(lead.completed == 0 for lead in analytics.lead_time)
+        assert sum(bucket.count for bucket in analytics.backlog_age) == 0
+
+
+class Computation:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self) -> TaskAnalytics:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return TaskAnalytics(self.calls, [], [], [])
+
+
+def make_task() -> Task:
+    return Task.create(title="T", description="D", priority=Priority.LOW)
+
+
+class TestAnalyticsCache:
+    async def test_served_from_cache_until_a_task_is_saved(self):
+        cache = AnalyticsCache()
+        compute = Computation()
+
+        first = await cache.get(30, compute)
+        again = await cache.get(30, compute)
+        other_window = await cache.get(7, compute)
+        cache.task_saved(make_task())
+        after_write = await cache.get(30, compute)
+
+        assert again is first
+        assert other_window is not first
+        assert after_write.days == 3
+        assert compute.calls == 3
+
+    async def test_concurrent_misses_compute_once(self):
+        cache = AnalyticsCache()
+        compute = Computation()
+
+        results = await asyncio.gather(*(cache.get(30, compute) for _ in range(5)))
+
+        assert compute.calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_entries_expire_after_max_age(self):
+        cache = AnalyticsCache(max_age_seconds=0)
+        compute = Computation()
+
+        await cache.get(30, compute)
+        await asyncio.sleep(0.01)
+        await cache.get(30, compute)
+
+        assert compute.calls == 2
+
+    async def test_writes_in_another_worker_invalidate(self, tmp_path):
+        path = str(tmp_path / "analytics-version")
+        cache = AnalyticsCache(SharedVersionCounter(path))
+        other_worker = AnalyticsCache(SharedVersionCounter(path))
+        compute = Computation()
+
+        await cache.get(30, compute)
+        other_worker.task_saved(make_task())
+        await cache.get(30, compute)
+
+        assert compute.calls == 2
+        cache.counter.close()
+        other_worker.counter.close()
+
+
+class TestGetTaskAnalyticsHandler:
+    async def test_rejects_an_empty_window(self):
+        handler = GetTaskAnalyticsHandler(source=None)
+
+        with pytest.raises(ValueError, match="days"):
+            await handler.handle(GetTaskAnalyticsQuery(days=0))
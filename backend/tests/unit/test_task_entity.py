@@ -1,6 +1,9 @@
 from datetime import datetime
+from uuid import uuid4
 
-from src.domain.entities import Priority, Task
+import pytest
+
+from src.domain.entities import Priority, Task, TaskView
 
 
 class TestTaskEntity:
@@ -26,6 +29,7 @@ class TestTaskEntity:
 
         assert task.is_done is True
         assert task.updated_at > original_updated_at
+        assert task.completed_at == task.updated_at
 
     def test_mark_as_pending(self):
         task = Task.create(
@@ -42,6 +46,7 @@ class TestTaskEntity:
 
         assert task.is_done is False
         assert task.updated_at > original_updated_at
+        assert task.completed_at is None
 
     def test_update_task(self):
         task = Task.create(
@@ -58,3 +63,46 @@ class TestTaskEntity:
         assert task.description == "Original Description"
         assert task.priority == Priority.HIGH
         assert task.updated_at > original_updated_at
+
+    def test_default_timestamps(self):
+        task = Task(
+            id=uuid4(), title="Test Task", description="Test", priority=Priority.LOW
+        )
+
+        assert isinstance(task.created_at, datetime)
+        assert task.updated_at == task.created_at
+
+    def test_create_uses_single_timestamp(self):
+        task = Task.create(
+            title="Test Task", description="Test Description", priority=Priority.LOW
+        )
+
+        assert task.created_at == task.updated_at
+
+    def test_task_has_no_instance_dict(self):
+        task = Task.create(
+            title="Test Task", description="Test Description", priority=Priority.LOW
+        )
+
+        assert not hasattr(task, "__dict__")
+
+
+class TestTaskView:
+    def test_task_view_is_immutable(self):
+        task = Task.create(
+            title="Test Task", description="Test Description", priority=Priority.LOW
+        )
+        view = TaskView(
+            task.id,
+            task.title,
+            task.description,
+            task.priority,
+            task.is_done,
+            task.is_archived,
+            task.created_at,
+            task.updated_at,
+        )
+
+        with pytest.raises(AttributeError):
+            view.title = "Changed"
+        assert not hasattr(view, "__dict__")
@@ -0,0 +1,64 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from benchmarks.generate import Distribution, GeneratedCounts, generate_batches
+from src.domain.entities import Priority
+
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def rows(count, distribution=Distribution(), seed=0, batch_size=1000):
+    hot, archived = [], []
+    for batch_hot, batch_archived in generate_batches(
+        count, distribution, seed, batch_size, now=NOW
+    ):
+        hot.extend(batch_hot)
+        archived.extend(batch_archived)
+    return hot, archived
+
+
+class TestTaskGenerator:
+    def test_same_seed_generates_the_same_tasks(self):
+        assert rows(2500, seed=7) == rows(2500, seed=7)
+        assert rows(2500, seed=7) != rows(2500, seed=8)
+
+    def test_archived_tasks_are_done_and_kept_apart(self):
+        hot, archived = rows(3000)
+
+        assert len(hot) + len(archived) == 3000
+        assert archived and all(row[5] and row[6] for row in archived)
+        assert not any(row[6] for row in hot)
+
+    def test_pending_high_priority_tasks_are_capped(self):
+        distribution = Distribution(
+            priorities={Priority.HIGH: 1, Priority.LOW: 1},
+            statuses={"pending": 1},
+            max_pending_high=5,
+        )
+
+        hot, _ = rows(1000, distribution)
+
+        assert sum(row[3] == 3 for row in hot) == 5
+        assert sum(row[3] == 1 for row in hot) == 995
+
+    def test_rows_are_in_storage_format(self):
+        distribution = Distribution(days=1)
+        hot, _ = rows(500, distribution)
+        task_id, _, _, priority, rank, _, _, created_at, updated_at = hot[0]
+
+        assert UUID(bytes=task_id).version == 7
+        assert int.from_bytes(task_id[:6]) == created_at // 1000
+        assert priority in (1, 2, 3)
+        assert rank == priority
+        end = (NOW - datetime(1970, 1, 1, tzinfo=UTC)) // timedelta(microseconds=1)
+        for value in (created_at, updated_at):
+            assert end - 86_400 * 1_000_000 <= value <= end
+        assert updated_at >= created_at
+
+    def test_counts_are_collected_across_batches(self):
+        counts = GeneratedCounts()
+        for _ in generate_batches(2500, Distribution(), batch_size=1000, counts=counts):
+            pass
+
+        assert counts.tasks == 2500
+        assert sum(counts.by_priority.values()) == 2500
@@ -0,0 +1,71 @@
+import json
+
+from src.infrastructure.observability import (
+    InMemorySpanExporter,
+    JsonlSpanExporter,
+    Tracer,
+)
+
+
+class TestTracer:
+    def test_spans_outside_a_trace_are_no_ops(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.span("orphan") as span:
+            assert span is None
+
+        assert tracer.start_span("orphan") is None
+        assert list(exporter.spans) == []
+
+    def test_nested_spans_share_the_trace_and_link_parents(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.trace("root", "a" * 32) as trace:
+            with tracer.span("outer") as outer:
+                with tracer.span("inner", key="value") as inner:
+                    pass
+
+        assert [span.name for span in exporter.spans] == ["root", "outer", "inner"]
+        assert {span.trace_id for span in exporter.spans} == {"a" * 32}
+        assert outer.parent_id == trace.root.span_id
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"key": "value"}
+        assert tracer.current_trace() is None
+
+    def test_zero_sample_rate_records_nothing(self):
+        exporter = InMemorySpanExporter()
+        tracer = Tracer(exporter, sample_rate=0.0)
+
+        with tracer.trace("root") as trace:
+            with tracer.span("child"):
+                pass
+
+        assert trace is None
+        assert not tracer.enabled
+        assert list(exporter.spans) == []
+
+    def test_jsonl_exporter_writes_one_line_per_span(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(JsonlSpanExporter(str(path)), sample_rate=1.0)
+
+        with tracer.trace("root"):
+            with tracer.span("child"):
+                pass
+        tracer.flush()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["name"] for record in records] == ["root", "child"]
+        assert records[1]["parent_id"] == records[0]["span_id"]
+
+    def test_jsonl_write_errors_stay_in_the_writer_thread(self, tmp_path):
+        exporter = JsonlSpanExporter(str(tmp_path / "missing" / "traces.jsonl"))
+        tracer = Tracer(exporter, sample_rate=1.0)
+
+        with tracer.trace("root"):
+            pass
+        tracer.flush()
+
+        assert exporter._writer.is_alive()
+        assert not (tmp_path / "missing").exists()
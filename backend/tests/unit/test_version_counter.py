@@ -0,0 +1,42 @@
+import multiprocessing
+
+from src.infrastructure.coordination import SharedVersionCounter
+
+
+def _bump(path: str, times: int) -> None:
+    counter = SharedVersionCounter(path)
+    for _ in range(times):
+        counter.bump()
+    counter.close()
+
+
+class TestSharedVersionCounter:
+    def test_new_file_starts_at_zero(self, tmp_path):
+        counter = SharedVersionCounter(str(tmp_path / "version"))
+
+        assert counter.read() == 0
+        counter.close()
+
+    def test_bump_is_visible_through_another_mapping(self, tmp_path):
+        path = str(tmp_path / "version")
+        writer = SharedVersionCounter(path)
+        reader = SharedVersionCounter(path)
+
+        assert writer.bump() == 1
+        assert writer.bump() == 2
+        assert reader.read() == 2
+        writer.close()
+        reader.close()
+
+    def test_concurrent_processes_never_lose_increments(self, tmp_path):
+        path = str(tmp_path / "version")
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=_bump, args=(path, 200)) for _ in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        counter = SharedVersionCounter(path)
+        assert counter.read() == 800
+        counter.close()
@@ -0,0 +1,155 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from src.domain.entities import Priority, Task
+from src.infrastructure.coordination import SharedChangeLog
+from src.infrastructure.index import ColumnarTaskIndex, VersionedTaskIndex
+from src.infrastructure.index.versioned_task_index import CHANGE_RECORD
+
+
+def make_task(title: str, priority: Priority = Priority.LOW) -> Task:
+    return Task.create(title=title, description="Description", priority=priority)
+
+
+class Worker:
+    """One worker's index over a task table shared by every worker."""
+
+    def __init__(self, log_path: str, table: dict, capacity: int = 16):
+        self.table = table
+        self.reloads = 0
+        self.index = VersionedTaskIndex(
+            ColumnarTaskIndex(),
+            SharedChangeLog(log_path, CHANGE_RECORD.size, capacity),
+            self.reload,
+        )
+
+    async def reload(self, index: VersionedTaskIndex) -> int:
+        self.reloads += 1
+        index.begin_load()
+        index.load(self.table.values())
+        return len(self.table)
+
+    def save(self, task: Task) -> None:
+        self.table[task.id] = task
+        self.index.task_saved(task)
+
+    async def settle(self) -> None:
+        if self.index._reload_task is not None:
+            await self.index._reload_task
+
+
+@pytest.fixture
+def workers(tmp_path):
+    table = {}
+    path = str(tmp_path / "version")
+    return Worker(path, table), Worker(path, table)
+
+
+class TestVersionedTaskIndex:
+    async def test_not_ready_until_loaded(self, workers):
+        first, _ = workers
+
+        assert first.index.is_ready is False
+        await first.settle()
+
+        assert first.reloads == 1
+        assert first.index.is_ready is True
+
+    async def test_local_writes_keep_the_index_current(self, workers):
+        first, _ = workers
+        first.index.is_ready
+        await first.settle()
+
+        first.save(make_task("Local", Priority.HIGH))
+
+        assert first.index.is_ready is True
+        assert first.index.count_pending_by_priority()[Priority.HIGH] == 1
+        assert first.reloads == 1
+
+    async def test_remote_writes_are_applied_as_deltas(self, workers):
+        first, second = workers
+        for worker in workers:
+            worker.index.is_ready
+            await worker.settle()
+
+        remote = make_task("Remote", Priority.HIGH)
+        second.save(remote)
+        removed = make_task("Removed")
+        second.save(removed)
+        second.index.remove(removed.id)
+        remote.mark_as_done()
+        second.save(remote)
+
+        assert first.index.is_ready is True
+        assert first.reloads == 1
+        assert first.index.count_by_status(is_done=True, is_archived=False) == 1
+        assert first.index.count_by_status(is_done=False, is_archived=False) == 0
+        assert len(first.index) == 1
+
+    async def test_local_write_after_remote_write(self, workers):
+        first, second = workers
+        for worker in workers:
+            worker.index.is_ready
+            await worker.settle()
+
+        second.save(make_task("Remote"))
+        first.save(make_task("Local"))
+
+        assert first.index.is_ready is True
+        assert first.reloads == 1
+        assert first.index.count_by_status(is_done=False, is_archived=False) == 2
+
+    async def test_records_out_of_commit_order_keep_the_latest_state(self, workers):
+        first, second = workers
+        for worker in workers:
+            worker.index.is_ready
+            await worker.settle()
+        task = make_task("Shared")
+        stale = replace(task)
+        task.mark_as_done()
+
+        second.save(task)
+        second.index.task_saved(stale)
+
+        assert first.index.is_ready is True
+        assert first.reloads == 1
+        assert first.index.count_by_status(is_done=True, is_archived=False) == 1
+        assert first.index.count_by_status(is_done=False, is_archived=False) == 0
+
+    async def test_falls_back_to_a_reload_when_the_log_has_moved_on(self, tmp_path):
+        table = {}
+        path = str(tmp_path / "version")
+        first, second = Worker(path, table, capacity=4), Worker(path, table, capacity=4)
+        for worker in (first, second):
+            worker.index.is_ready
+            await worker.settle()
+
+        for i in range(5):
+            second.save(make_task(f"Remote {i}"))
+
+        assert first.index.is_ready is False
+        await first.settle()
+        assert first.reloads == 2
+        assert first.index.is_ready is True
+        assert first.index.count_by_status(is_done=False, is_archived=False) == 5
+
+    async def test_failed_reload_is_retried(self, tmp_path):
+        calls = []
+
+        async def failing_reload(index):
+            calls.append(index)
+            raise RuntimeError("database unavailable")
+
+        index = VersionedTaskIndex(
+            ColumnarTaskIndex(),
+            SharedChangeLog(str(tmp_path / "version"), CHANGE_RECORD.size),
+            failing_reload,
+        )
+
+        assert index.is_ready is False
+        await asyncio.sleep(0)
+        assert index.is_ready is False
+        await asyncio.sleep(0)
+        assert len(calls) == 2